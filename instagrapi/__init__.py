@@ -10,7 +10,9 @@ from instagrapi.mixins.account import AccountMixin
 from instagrapi.mixins.album import DownloadAlbumMixin, UploadAlbumMixin
 from instagrapi.mixins.attestation import DeviceAttestationMixin
 from instagrapi.mixins.auth import LoginMixin
+from instagrapi.mixins.batch import BatchMixin
 from instagrapi.mixins.bloks import BloksMixin
+from instagrapi.mixins.cache import CacheMixin
 from instagrapi.mixins.challenge import ChallengeResolveMixin
 from instagrapi.mixins.clip import ClipMixin, DownloadClipMixin, UploadClipMixin
 from instagrapi.mixins.collection import CollectionMixin
@@ -102,6 +104,8 @@ class Client(
     QuickSnapMixin,
     FundraiserMixin,
     RealtimeMixin,
+    CacheMixin,
+    BatchMixin,
 ):
     proxy = None
 
@@ -124,6 +128,17 @@ class Client(
         self.timezone_offset = kwargs.pop("timezone_offset", -14400)
         self.timezone_name = kwargs.pop("timezone_name", "")
         self.push_disabled = kwargs.pop("push_disabled", True)
+        pacer = kwargs.pop("pacer", None)
+        retry_policy = kwargs.pop("retry_policy", None)
+        circuit_breaker = kwargs.pop("circuit_breaker", None)
+        page_sizer = kwargs.pop("page_sizer", None)
+        proxy_pool = kwargs.pop("proxy_pool", None)
+        proxy_pool_key = kwargs.pop("proxy_pool_key", None)
+        cache = kwargs.pop("cache", None)
+        cache_backend = kwargs.pop("cache_backend", None)
+        cache_hits = kwargs.pop("cache_hits", "copy")
+        validation = kwargs.pop("validation", "strict")
+        self.pool_manager = kwargs.pop("pool_manager", None)
 
         super().__init__(**kwargs)
 
@@ -131,8 +146,18 @@ class Client(
         self.override_app_version = override_app_version
         self.logger = logger
         self.delay_range = delay_range
+        self.set_pacer(pacer)
+        self.set_retry_policy(retry_policy)
+        self.set_circuit_breaker(circuit_breaker)
+        self.set_page_sizer(page_sizer)
+        self.set_validation(validation)
+        self.set_cache(cache)
+        self.set_cache_backend(cache_backend)
+        self.set_cache_hits(cache_hits)
 
         self.set_proxy(proxy)
+        if proxy_pool is not None:
+            self.set_proxy_pool(proxy_pool, proxy_pool_key)
 
         self.init()
 
@@ -151,8 +176,20 @@ class Client(
             self.public.proxies = self.private.proxies = proxies
             if hasattr(self, "graphql"):
                 self.graphql.proxies = proxies
+            self._remount_shared_pools()
             return True
+        self.proxy = None
         self.public.proxies = self.private.proxies = {}
         if hasattr(self, "graphql"):
             self.graphql.proxies = {}
+        self._remount_shared_pools()
         return False
+
+    def _remount_shared_pools(self):
+        # Shared pools are keyed by proxy, so switching proxies switches adapters
+        if self.pool_manager is None:
+            return
+        self._configure_private_session_retry()
+        if self.public_transport != "curl":
+            self._configure_public_session_retry()
+        self._configure_graphql_session_pool()
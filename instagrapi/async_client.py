@@ -0,0 +1,628 @@
+import asyncio
+import json
+import random
+import time
+from json.decoder import JSONDecodeError
+from typing import Dict, List, Optional, Tuple
+
+from instagrapi import Client, config
+from instagrapi.exceptions import (
+    ChallengeRequired,
+    CircuitOpenError,
+    ClientBadRequestError,
+    ClientConnectionError,
+    ClientError,
+    ClientGraphqlError,
+    ClientIncompleteReadError,
+    ClientJSONDecodeError,
+    ClientLoginRequired,
+    ClientNotFoundError,
+    ClientRequestTimeout,
+    MediaNotFound,
+    StoryNotFound,
+    UserNotFound,
+)
+from instagrapi.extractors import (
+    extract_direct_thread,
+    extract_media_v1,
+    extract_story_v1,
+    extract_user_v1,
+)
+from instagrapi.types import DirectThread, Media, Story, User
+from instagrapi.utils.concurrency import AsyncSingleFlight
+from instagrapi.utils.pacing import (
+    PRIVATE_GRAPHQL_FAMILY,
+    PUBLIC_FAMILY,
+    endpoint_family,
+)
+
+PRIVATE_CONTENT_TYPE = "application/x-www-form-urlencoded; charset=UTF-8"
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as exc:
+        raise RuntimeError("AsyncClient requires the optional async extra: pip install instagrapi[async]") from exc
+    return httpx
+
+
+def _query_params(params: Optional[Dict]) -> Optional[Dict]:
+    """Encode query values the way ``requests`` does (``True`` -> ``"True"``, ``None`` dropped)"""
+    if not params:
+        return params
+    return {
+        key: value if isinstance(value, (str, bytes, list, tuple)) else str(value)
+        for key, value in params.items()
+        if value is not None
+    }
+
+
+def _header_values(headers: Dict) -> Dict:
+    """Drop ``None`` header values, as ``requests`` does when merging session headers"""
+    return {key: value for key, value in headers.items() if value is not None}
+
+
+def _error_json(exc: BaseException) -> Dict:
+    """JSON of the response ``exc`` was raised for"""
+    return getattr(exc, "last_json", None) or {}
+
+
+class AsyncClient:
+    """
+    Asyncio counterpart of :class:`instagrapi.Client`
+
+    ``private_request``, ``public_request``, ``public_graphql_request`` and
+    ``private_graphql_request`` are coroutines running on ``httpx.AsyncClient``,
+    so thousands of sessions can share one event loop instead of one thread each.
+
+    Session state (cookies, device, uuids, authorization, caches, pacer) lives in a
+    wrapped synchronous ``Client``: header building, request signing and error
+    classification are the same code paths, and attributes that are not defined
+    here (``user_id``, ``get_settings``, ``set_proxy``...) are read from it. Login
+    and challenge flows stay synchronous; load saved settings or call
+    ``await asyncio.to_thread(cl.client.login, ...)`` once per session.
+
+    Requires the optional ``async`` extra (``pip install instagrapi[async]``).
+
+    Parameters
+    ----------
+    client: Client, optional
+        Client holding the session state, a new one is built from ``kwargs`` when omitted
+    http_options: dict, optional
+        Extra ``httpx.AsyncClient`` arguments (``limits``, ``timeout``, ``transport``...)
+    """
+
+    def __init__(self, client: Optional[Client] = None, http_options: Optional[Dict] = None, **kwargs):
+        self.client = client if client is not None else Client(**kwargs)
+        self.http_options = dict(http_options or {})
+        self._private_http = None
+        self._public_http = None
+        self._proxy = None
+        self._inflight = AsyncSingleFlight()
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    async def _coalesce(self, key, fn, *args, **kwargs):
+        if not self.client.request_coalescing:
+            return await fn(*args, **kwargs)
+        return (await self._inflight.do(key, fn, *args, **kwargs))[0]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pools"""
+        for http in (self._private_http, self._public_http):
+            if http is not None:
+                await http.aclose()
+        self._private_http = self._public_http = None
+
+    def _http(self, session):
+        """Return the ``httpx.AsyncClient`` sharing ``session`` cookies, rebuilt when the proxy changes"""
+        httpx = _import_httpx()
+        proxy = (self.client.private.proxies or {}).get("https")
+        if proxy != self._proxy:
+            # Old clients are left to the garbage collector: closing them here
+            # would break requests that are still in flight on another task.
+            self._private_http = self._public_http = None
+            self._proxy = proxy
+        attr = "_private_http" if session is self.client.private else "_public_http"
+        http = getattr(self, attr)
+        if http is None:
+            http = httpx.AsyncClient(
+                cookies=session.cookies,
+                proxy=proxy,
+                verify=self.client.tls_verify,
+                follow_redirects=True,
+                **self.http_options,
+            )
+            setattr(self, attr, http)
+        return http
+
+    async def _pace_request(self, family: str) -> float:
+        if self.client.pacer is None:
+            self.client.set_pacer()
+        delay = self.client.pacer.reserve(family)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    async def _call_guarded(self, family: str, send, *args, **kwargs):
+        client = self.client
+        breaker, pool, proxy = client.circuit_breaker, client.proxy_pool, client.proxy
+        if breaker is None and (pool is None or not proxy):
+            return await send(*args, **kwargs)
+        if breaker is not None:
+            breaker.before(family, proxy)
+        try:
+            result = await send(*args, **kwargs)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(family, proxy, e)
+            if pool is not None and proxy and pool.record(proxy, exc=e):
+                client._rotate_proxy(proxy)
+            raise
+        if breaker is not None:
+            breaker.record(family, proxy)
+        if pool is not None and proxy:
+            pool.record(proxy, latency=client._response_elapsed(family))
+        return result
+
+    async def _send(self, session, method: str, url: str, headers: Dict, params=None, data=None, timeout=None):
+        httpx = _import_httpx()
+        http = self._http(session)
+        content = None
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+        options = {}
+        if timeout is not None:
+            # an explicit None would disable the timeouts set in http_options
+            options["timeout"] = timeout
+        try:
+            return await http.request(
+                method,
+                url,
+                params=_query_params(params),
+                data=data,
+                content=content,
+                headers=_header_values(headers),
+                **options,
+            )
+        except httpx.RemoteProtocolError as e:
+            raise ClientIncompleteReadError("{} {}".format(e.__class__.__name__, str(e))) from e
+        except httpx.TransportError as e:
+            raise ClientConnectionError("{e.__class__.__name__} {e}".format(e=e)) from e
+
+    async def _send_private_request(
+        self,
+        endpoint,
+        data=None,
+        params=None,
+        login=False,
+        with_signature=True,
+        headers=None,
+        extra_sig=None,
+        domain: str = None,
+    ):
+        httpx = _import_httpx()
+        client = self.client
+        client.last_response = None
+        client.last_json = last_json = {}
+        request_headers = dict(client.private.headers)
+        request_headers.update(client.private_headers(headers))
+        if domain:
+            request_headers["Host"] = domain
+        if not login:
+            await self._pace_request(endpoint_family(endpoint))
+        endpoint, api_url = client._private_api_url(endpoint, domain)
+        client.logger.info(api_url)
+        if data:  # POST
+            request_headers["Content-Type"] = PRIVATE_CONTENT_TYPE
+            data = client._private_request_body(data, with_signature, extra_sig)
+            method = "POST"
+        else:  # GET
+            request_headers.pop("Content-Type", None)
+            method = "GET"
+        response = await self._send(client.private, method, api_url, request_headers, params=params, data=data)
+        mid = response.headers.get("ig-set-x-mid")
+        if mid:
+            client.mid = mid
+        client.request_log(response)
+        client.last_response = response
+        try:
+            try:
+                response.raise_for_status()
+                client.last_json = last_json = response.json()
+            except JSONDecodeError as e:
+                client._raise_private_json_decode_error(e, response, endpoint)
+            except httpx.HTTPStatusError as e:
+                try:
+                    client.last_json = last_json = response.json()
+                except ValueError:
+                    pass
+                client._raise_private_http_error(e, response, endpoint, last_json)
+            return client._check_private_response_json(endpoint, response, last_json)
+        except ClientError as e:
+            # client.last_json is shared by every task on the loop, the error keeps its own
+            e.last_json = last_json
+            raise
+
+    async def private_request(
+        self,
+        endpoint,
+        data=None,
+        params=None,
+        login=False,
+        with_signature=True,
+        headers=None,
+        extra_sig=None,
+        domain: str = None,
+    ) -> Dict:
+        """Coroutine version of ``Client.private_request``"""
+        client = self.client
+        kwargs = dict(
+            data=data,
+            params=params,
+            login=login,
+            with_signature=with_signature,
+            headers=headers,
+            extra_sig=extra_sig,
+            domain=domain,
+        )
+        try:
+            if client.delay_range:
+                await asyncio.sleep(random.uniform(client.delay_range[0], client.delay_range[1]))
+            client.private_requests_count += 1
+            retry = client._retry_state()
+            while True:
+                try:
+                    return await self._call_guarded(
+                        endpoint_family(endpoint), self._send_private_request, endpoint, **kwargs
+                    )
+                except ClientError as e:
+                    delay = retry.next_delay(e)
+                    if delay is None:
+                        raise
+                    client.logger.info("Retry %s in %.2f seconds (%s)", endpoint, delay, e.__class__.__name__)
+                    await asyncio.sleep(delay)
+        except Exception as e:
+            if client.handle_exception:
+                client.handle_exception(client, e)
+            elif isinstance(e, ChallengeRequired):
+                await asyncio.to_thread(client.challenge_resolve, _error_json(e))
+            else:
+                raise e
+            if login and client.user_id:
+                return client.last_json
+            return await self._call_guarded(endpoint_family(endpoint), self._send_private_request, endpoint, **kwargs)
+
+    async def _send_public_request(
+        self,
+        url,
+        data=None,
+        params=None,
+        headers=None,
+        return_json=False,
+        timeout=None,
+        update_headers=None,
+    ):
+        httpx = _import_httpx()
+        client = self.client
+        client.public_requests_count += 1
+        per_request_headers = None
+        if headers:
+            if update_headers in [None, True]:
+                client.public.headers.update(headers)
+            elif update_headers is False:
+                per_request_headers = headers
+        request_headers = dict(client.public.headers)
+        if per_request_headers:
+            request_headers.update(per_request_headers)
+        await self._pace_request(PUBLIC_FAMILY)
+        try:
+            method = "POST" if data is not None else "GET"
+            response = await self._send(
+                client.public, method, url, request_headers, params=params, data=data, timeout=timeout
+            )
+            client.public_request_logger.info(
+                "[%s] [%s] %s %s",
+                self._proxy,
+                response.status_code,
+                method,
+                response.url,
+            )
+            client.last_public_response = response
+            response.raise_for_status()
+            if return_json:
+                client.last_public_json = response.json()
+                return client.last_public_json
+            return response.text
+        except JSONDecodeError as e:
+            client._raise_public_json_decode_error(e, response, url)
+        except httpx.HTTPStatusError as e:
+            client._raise_public_http_error(e, response)
+        finally:
+            client.last_response_ts = time.time()
+
+    async def public_request(
+        self,
+        url,
+        data=None,
+        params=None,
+        headers=None,
+        update_headers=None,
+        return_json=False,
+        retries_count=None,
+        retries_timeout=None,
+    ):
+        """Coroutine version of ``Client.public_request``"""
+        client = self.client
+        retries_count = client.public_request_retries_count if retries_count is None else retries_count
+        retries_timeout = client.public_request_retries_timeout if retries_timeout is None else retries_timeout
+        assert retries_count <= 10, "Retries count is too high"
+        assert retries_timeout <= 600, "Retries timeout is too high"
+        retry = client._retry_state(retries_count - 1, retries_timeout)
+        for iteration in range(retries_count):
+            try:
+                return await self._call_guarded(
+                    PUBLIC_FAMILY,
+                    self._send_public_request,
+                    url,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    return_json=return_json,
+                    update_headers=update_headers,
+                )
+            except (CircuitOpenError, ClientLoginRequired, ClientNotFoundError, ClientBadRequestError) as e:
+                raise e  # Stop retries
+            except ClientError as e:
+                delay = retry.next_delay(e)
+                if delay is None:
+                    raise e
+                await asyncio.sleep(delay)
+
+    async def public_graphql_request(
+        self,
+        variables,
+        query_hash=None,
+        query_id=None,
+        data=None,
+        params=None,
+        headers=None,
+    ):
+        """Coroutine version of ``Client.public_graphql_request``"""
+        params = self.client._public_graphql_params(variables, query_hash, query_id, params)
+        try:
+            body_json = await self.public_request(
+                self.client.GRAPHQL_PUBLIC_API_URL,
+                data=data,
+                params=params,
+                headers=headers,
+                return_json=True,
+            )
+            return self.client._public_graphql_data(body_json)
+        except ClientBadRequestError as e:
+            raise self.client._public_graphql_bad_request(e)
+
+    async def private_graphql_request(
+        self, data: Dict, headers: Optional[Dict] = None, domain: Optional[str] = None
+    ) -> Dict:
+        """Coroutine version of ``Client.private_graphql_request``"""
+        httpx = _import_httpx()
+        client = self.client
+        client.last_response = None
+        client.last_json = {}
+        request_headers = dict(client.private.headers)
+        request_headers.update(client.base_headers)
+        request_headers["Content-Type"] = PRIVATE_CONTENT_TYPE
+        if client.authorization:
+            request_headers["Authorization"] = client.authorization
+        friendly_name = data.get("fb_api_req_friendly_name")
+        if friendly_name:
+            request_headers["X-FB-Friendly-Name"] = friendly_name
+        if headers:
+            request_headers.update(headers)
+        await self._pace_request(PRIVATE_GRAPHQL_FAMILY)
+        url = f"https://{domain or config.API_DOMAIN}/graphql/query"
+        client.private_requests_count += 1
+        response = await self._send(client.private, "POST", url, request_headers, data=data)
+        client.request_log(response)
+        client.last_response = response
+        try:
+            response.raise_for_status()
+            client.last_json = last_json = client._json_from_graphql_response(response)
+        except JSONDecodeError as exc:
+            raise ClientJSONDecodeError(
+                "JSONDecodeError {0!s} while opening {1!s}".format(exc, response.url),
+                response=response,
+            )
+        except httpx.HTTPStatusError as exc:
+            raise ClientError(exc, response=response)
+        if last_json.get("errors"):
+            raise ClientGraphqlError(last_json.get("errors"))
+        if last_json.get("status") == "fail":
+            raise ClientError(response=response, **last_json)
+        return last_json
+
+    async def user_info_v1(self, user_id: str, from_module: str = "self_profile", is_app_start: bool = False) -> User:
+        """Coroutine version of ``Client.user_info_v1``"""
+        user_id = str(user_id)
+        try:
+            params = self.client._user_info_v1_params(from_module, is_app_start)
+            result = await self.private_request(f"users/{user_id}/info/", params=params)
+        except ClientNotFoundError as e:
+            raise UserNotFound(e, user_id=user_id, **_error_json(e))
+        except ClientError as e:
+            if "User not found" in str(e):
+                raise UserNotFound(e, user_id=user_id, **_error_json(e))
+            raise e
+        return self._extract(extract_user_v1, result["user"])
+
+    async def user_info_by_username_v1(self, username: str) -> User:
+        """Coroutine version of ``Client.user_info_by_username_v1``"""
+        username = self.client._normalize_username(username)
+        try:
+            result = await self.private_request(f"users/{username}/usernameinfo/")
+        except ClientNotFoundError as e:
+            raise UserNotFound(e, username=username, **_error_json(e))
+        except ClientError as e:
+            if "User not found" in str(e):
+                raise UserNotFound(e, username=username, **_error_json(e))
+            raise e
+        return self._extract(extract_user_v1, result["user"])
+
+    async def user_info(self, user_id: str, use_cache: bool = True) -> User:
+        """Get user object from user id (Private API), sharing the wrapped client's cache"""
+        user_id = str(user_id)
+        client = self.client
+        user = client._cache_lookup(client._users_cache, "users", user_id, User) if use_cache else None
+        if user is None:
+            with client._negative_cache("users", user_id, use_cache):
+                user = await self._coalesce(("user_info", user_id), self._fetch_user_info, user_id)
+        return client._cache_hit(user)
+
+    async def _fetch_user_info(self, user_id: str) -> User:
+        client = self.client
+        user = await self.user_info_v1(user_id)
+        user = client._cache_put(client._users_cache, user_id, user)
+        client._cache_store("users", user_id, user)
+        client._index_usernames([user])
+        return user
+
+    async def user_info_by_username(self, username: str, use_cache: bool = True) -> User:
+        """Get user object from username (Private API), sharing the wrapped client's cache"""
+        username = self.client._normalize_username(username)
+        client = self.client
+        user_id = client._username_lookup(username) if use_cache else None
+        if user_id is not None:
+            try:
+                user = await self.user_info(user_id)
+            except UserNotFound:
+                user = None
+            if user is not None and user.username.lower() == username:
+                return user
+            client._forget_username(username)  # renamed or deleted since it was indexed
+        with client._negative_cache("usernames", username, use_cache):
+            user = await self._coalesce(
+                ("user_info_by_username", username), self._fetch_user_info_by_username, username
+            )
+        return client._cache_hit(user)
+
+    async def _fetch_user_info_by_username(self, username: str) -> User:
+        client = self.client
+        user = await self.user_info_by_username_v1(username)
+        user = client._cache_put(client._users_cache, user.pk, user)
+        client._cache_store("users", user.pk, user)
+        client._index_usernames([user])
+        return user
+
+    async def media_info_v1(self, media_pk: str) -> Media:
+        """Coroutine version of ``Client.media_info_v1``"""
+        try:
+            result = await self.private_request(f"media/{media_pk}/info/")
+        except ClientNotFoundError as e:
+            raise MediaNotFound(e, media_pk=media_pk, **_error_json(e))
+        except ClientError as e:
+            if "Media not found" in str(e):
+                raise MediaNotFound(e, media_pk=media_pk, **_error_json(e))
+            raise e
+        return self._extract(extract_media_v1, result["items"].pop())
+
+    async def media_info(self, media_pk: str, use_cache: bool = True) -> Media:
+        """Get Media from PK (Private API), sharing the wrapped client's cache"""
+        client = self.client
+        media_pk = client.media_pk(media_pk)
+        media = client._cache_lookup(client._medias_cache, "medias", media_pk, Media) if use_cache else None
+        if media is None:
+            with client._negative_cache("medias", media_pk, use_cache):
+                media = await self._coalesce(("media_info", media_pk), self._fetch_media_info, media_pk)
+        return client._cache_hit(media)
+
+    async def _fetch_media_info(self, media_pk: str) -> Media:
+        media = self.client._cache_put(self.client._medias_cache, media_pk, await self.media_info_v1(media_pk))
+        self.client._cache_store("medias", media_pk, media)
+        return media
+
+    async def user_stories_v1(self, user_id: str, amount: int = None) -> List[Story]:
+        """Coroutine version of ``Client.user_stories_v1``"""
+        return (await self._user_stories_v1(user_id, amount))[0]
+
+    async def _user_stories_v1(self, user_id: str, amount: int = None) -> Tuple[List[Story], Dict]:
+        # stories with the response they came from, for errors built from it
+        params = {"supported_capabilities_new": json.dumps(config.SUPPORTED_CAPABILITIES)}
+        user_id = int(user_id)
+        result = await self.private_request(f"feed/user/{user_id}/story/", params=params)
+        reel = result.get("reel") or {}
+        stories = [self._extract(extract_story_v1, item) for item in reel.get("items", [])]
+        if amount:
+            stories = stories[: int(amount)]
+        return stories, result
+
+    async def story_info_v1(self, story_pk: str) -> Story:
+        """Coroutine version of ``Client.story_info_v1``"""
+        client = self.client
+        story_id = client.media_id(story_pk)
+        story_pk, user_id = story_id.split("_")
+        found = None
+        stories, result = await self._user_stories_v1(user_id)
+        for story in stories:
+            story = client._cache_put(client._stories_cache, story.pk, story)
+            if story.pk == story_pk:
+                found = story
+        if found is None:
+            raise StoryNotFound(story_pk=story_pk, **result)
+        return client._cache_hit(found)
+
+    async def story_info(self, story_pk: str, use_cache: bool = True) -> Story:
+        """Get Story by pk or id, sharing the wrapped client's cache"""
+        client = self.client
+        story = client._cache_lookup(client._stories_cache, "stories", story_pk, Story) if use_cache else None
+        if story is None:
+            with client._negative_cache("stories", story_pk, use_cache):
+                story = await self._coalesce(("story_info", story_pk), self._fetch_story_info, story_pk)
+        return client._cache_hit(story)
+
+    async def _fetch_story_info(self, story_pk: str) -> Story:
+        story = self.client._cache_put(self.client._stories_cache, story_pk, await self.story_info_v1(story_pk))
+        self.client._cache_store("stories", story_pk, story)
+        return story
+
+    async def direct_threads_chunk(
+        self,
+        selected_filter: Optional[str] = None,
+        box: Optional[str] = None,
+        thread_message_limit: Optional[int] = None,
+        cursor: str = None,
+    ) -> Tuple[List[DirectThread], str]:
+        """Coroutine version of ``Client.direct_threads_chunk``"""
+        assert self.client.user_id, "Login required"
+        params = self.client._direct_threads_params(selected_filter, box, thread_message_limit, cursor)
+        result = await self.private_request("direct_v2/inbox/", params=params)
+        inbox = result.get("inbox", {})
+        threads = [self._extract(extract_direct_thread, thread) for thread in inbox.get("threads", [])]
+        return threads, inbox.get("oldest_cursor")
+
+    async def direct_threads(
+        self,
+        amount: int = 20,
+        selected_filter: Optional[str] = None,
+        box: Optional[str] = None,
+        thread_message_limit: Optional[int] = None,
+    ) -> List[DirectThread]:
+        """Coroutine version of ``Client.direct_threads``"""
+        cursor = None
+        threads = []
+        while True:
+            threads_chunk, cursor = await self.direct_threads_chunk(selected_filter, box, thread_message_limit, cursor)
+            threads.extend(threads_chunk)
+            if not cursor or (amount and len(threads) >= amount):
+                break
+        if amount:
+            threads = threads[:amount]
+        return threads
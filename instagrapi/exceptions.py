@@ -75,6 +75,14 @@ class ClientThrottledError(ClientError):
     """Raised due to a HTTP 429 response"""
 
 
+class CircuitOpenError(ClientError):
+    """Raised locally while the circuit breaker for an endpoint family is open"""
+
+    family = None
+    proxy = None
+    retry_at = None
+
+
 class ClientRequestTimeout(ClientError):
     """Raised due to a HTTP 408 response"""
 
@@ -3,6 +3,7 @@ import html
 import json
 import re
 from copy import deepcopy
+from functools import partial
 
 from .types import (
     About,
@@ -39,6 +40,8 @@ from .types import (
     Viewer,
 )
 from .utils import InstagramIdCodec, json_value
+from .utils.lazy import lazy_model
+from .utils.validation import build_model, validation_mode
 
 MEDIA_TYPES_GQL = {"GraphImage": 1, "GraphVideo": 2, "GraphSidecar": 8, "StoryVideo": 2}
 XDT_MEDIA_TYPES_GQL = {
@@ -52,22 +55,45 @@ def _normalize_media_gql_typename(data):
     data["__typename"] = XDT_MEDIA_TYPES_GQL.get(data.get("__typename"), data.get("__typename"))
 
 
-def extract_media_v1(data):
-    """Extract media from Private API"""
-    media = deepcopy(data)
+def _v1_area(candidate):
+    return candidate["height"] * candidate["width"]
+
+
+def _gql_area(resource):
+    return resource["config_width"] * resource["config_height"]
+
+
+def _largest(items, key):
+    # the last of the largest items, like sorted(items, key=key)[-1] but in one pass
+    return max(reversed(items), key=key)
+
+
+def _raw_value(value):
+    return value
+
+
+def extract_media_v1(data, lazy=None):
+    """
+    Extract media from Private API
+
+    With ``lazy`` (by default, in ``"lazy"`` validation mode) the nested
+    models (resources, usertags, sponsor_tags, coauthor_producers,
+    clips_metadata, image_versions2) are decoded from the payload on first access.
+    """
+    media = dict(data)
     if media.get("video_versions"):
         # Select Best Quality by Resolutiuon
-        media["video_url"] = sorted(media["video_versions"], key=lambda o: o["height"] * o["width"])[-1]["url"]
+        media["video_url"] = _largest(media["video_versions"], _v1_area)["url"]
     if media["media_type"] == 2 and not media.get("product_type"):
         media["product_type"] = "feed"
     if "image_versions2" in media:
-        media["thumbnail_url"] = sorted(
-            media["image_versions2"]["candidates"],
-            key=lambda o: o["height"] * o["width"],
-        )[-1]["url"]
-        scrubber = media["image_versions2"].get("scrubber_spritesheet_info_candidates") or {}
+        image_versions2 = media["image_versions2"]
+        media["thumbnail_url"] = _largest(image_versions2["candidates"], _v1_area)["url"]
+        scrubber = image_versions2.get("scrubber_spritesheet_info_candidates") or {}
         if scrubber.get("default") and not scrubber["default"].get("sprite_urls"):
-            media["image_versions2"].pop("scrubber_spritesheet_info_candidates", None)
+            media["image_versions2"] = {
+                key: value for key, value in image_versions2.items() if key != "scrubber_spritesheet_info_candidates"
+            }
     if media["media_type"] == 8:
         # remove thumbnail_url and video_url for albums
         # see resources
@@ -76,27 +102,35 @@ def extract_media_v1(data):
     location = media.get("location")
     media["location"] = location and extract_location(location)
     media["user"] = extract_user_short(media.get("user"))
-    usertags = media.get("usertags") or {}
-    media["usertags"] = sorted(
-        [extract_usertag(usertag) for usertag in usertags.get("in", [])],
-        key=lambda tag: tag.user.pk,
-    )
     media["like_count"] = media.get("like_count", 0)
     media["has_liked"] = media.get("has_liked", False)
-    media["sponsor_tags"] = [extract_user_short(tag["sponsor"]) for tag in media.get("sponsor_tags") or []]
     media["view_count"] = media.get("view_count", media.get("video_view_count", 0))
     media["play_count"] = media.get("play_count", media.get("video_play_count", 0))
-    media["coauthor_producers"] = [extract_user_short(user) for user in media.get("coauthor_producers", [])]
-    return Media(
-        caption_text=(media.get("caption") or {}).get("text", ""),
-        resources=[extract_resource_v1(edge) for edge in media.get("carousel_media") or []],
-        **media,
-    )
+    media["caption_text"] = (media.get("caption") or {}).get("text", "")
+    nested = {
+        "usertags": lambda: sorted(
+            [extract_usertag(usertag) for usertag in (data.get("usertags") or {}).get("in", [])],
+            key=lambda tag: tag.user.pk,
+        ),
+        "sponsor_tags": lambda: [extract_user_short(tag["sponsor"]) for tag in data.get("sponsor_tags") or []],
+        "coauthor_producers": lambda: [extract_user_short(user) for user in data.get("coauthor_producers", [])],
+        "resources": lambda: [extract_resource_v1(edge) for edge in data.get("carousel_media") or []],
+    }
+    if lazy is None:
+        lazy = validation_mode.get() == "lazy"
+    if lazy:
+        for name in ("image_versions2", "clips_metadata"):
+            if media.get(name) is not None:
+                nested[name] = partial(_raw_value, media.pop(name))
+        return lazy_model(Media, media, nested)
+    for name, decode in nested.items():
+        media[name] = decode()
+    return build_model(Media, media)
 
 
 def extract_media_v1_xma(data):
     """Extract media from Private API"""
-    media = deepcopy(data)
+    media = dict(data)
     if not media.get("target_url"):
         return None
 
@@ -118,7 +152,7 @@ def extract_media_v1_xma(data):
 
 def extract_media_gql(data):
     """Extract media from GraphQL"""
-    media = deepcopy(data)
+    media = dict(data)
     _normalize_media_gql_typename(media)
     user = extract_user_short(media["owner"])
     # if "full_name" in user:
@@ -131,13 +165,10 @@ def extract_media_gql(data):
         media["media_type"] = 0
     if media.get("media_type") == 2 and not media.get("product_type"):
         media["product_type"] = "feed"
-    sorted_resources = sorted(
-        # display_resources - user feed, thumbnail_resources - hashtag feed
-        media.get("display_resources", media.get("thumbnail_resources", [])),
-        key=lambda o: o["config_width"] * o["config_height"],
-    )
-    if sorted_resources:
-        media["thumbnail_url"] = sorted_resources[-1]["src"]
+    # display_resources - user feed, thumbnail_resources - hashtag feed
+    resources = media.get("display_resources", media.get("thumbnail_resources", []))
+    if resources:
+        media["thumbnail_url"] = _largest(resources, _gql_area)["src"]
     elif "thumbnail_src" in media:
         media["thumbnail_url"] = media["thumbnail_src"]
     if media.get("media_type") == 8:
@@ -149,44 +180,48 @@ def extract_media_gql(data):
     media_id = media.get("id")
     media["pk"] = media_id
     media["id"] = f"{media_id}_{user.pk}"
-    return Media(
-        code=media.get("shortcode"),
-        taken_at=media.get("taken_at_timestamp"),
-        location=extract_location(location) if location else None,
-        user=user,
-        view_count=media.get("video_view_count", 0),
-        play_count=media.get("play_count", media.get("video_play_count")),
-        has_liked=media.get("has_liked", media.get("viewer_has_liked")),
-        comment_count=json_value(
+    return build_model(
+        Media,
+        dict(
             media,
-            "edge_media_to_comment",
-            "count",
-            default=json_value(media, "edge_media_preview_comment", "count", default=0),
-        ),
-        like_count=json_value(media, "edge_media_preview_like", "count"),
-        caption_text=json_value(media, "edge_media_to_caption", "edges", 0, "node", "text", default=""),
-        usertags=sorted(
-            [
-                extract_usertag(usertag["node"])
-                for usertag in media.get("edge_media_to_tagged_user", {}).get("edges", [])
+            code=media.get("shortcode"),
+            taken_at=media.get("taken_at_timestamp"),
+            location=extract_location(location) if location else None,
+            user=user,
+            view_count=media.get("video_view_count", 0),
+            play_count=media.get("play_count", media.get("video_play_count")),
+            has_liked=media.get("has_liked", media.get("viewer_has_liked")),
+            comment_count=json_value(
+                media,
+                "edge_media_to_comment",
+                "count",
+                default=json_value(media, "edge_media_preview_comment", "count", default=0),
+            ),
+            like_count=json_value(media, "edge_media_preview_like", "count"),
+            caption_text=json_value(media, "edge_media_to_caption", "edges", 0, "node", "text", default=""),
+            usertags=sorted(
+                [
+                    extract_usertag(usertag["node"])
+                    for usertag in media.get("edge_media_to_tagged_user", {}).get("edges", [])
+                ],
+                key=lambda tag: tag.user.pk,
+            ),
+            resources=[
+                extract_resource_gql(edge["node"])
+                for edge in media.get("edge_sidecar_to_children", {}).get("edges", [])
+            ],
+            sponsor_tags=[
+                extract_user_short(edge["node"]["sponsor"])
+                for edge in media.get("edge_media_to_sponsor_user", {}).get("edges", [])
+            ],
+            comments_preview=extract_media_comments_preview_gql(
+                media.get("edge_media_to_parent_comment") or media.get("edge_media_preview_comment")
+            ),
+            hoisted_comments=[
+                extract_media_inline_comment_gql(edge["node"])
+                for edge in media.get("edge_media_to_hoisted_comment", {}).get("edges", [])
             ],
-            key=lambda tag: tag.user.pk,
-        ),
-        resources=[
-            extract_resource_gql(edge["node"]) for edge in media.get("edge_sidecar_to_children", {}).get("edges", [])
-        ],
-        sponsor_tags=[
-            extract_user_short(edge["node"]["sponsor"])
-            for edge in media.get("edge_media_to_sponsor_user", {}).get("edges", [])
-        ],
-        comments_preview=extract_media_comments_preview_gql(
-            media.get("edge_media_to_parent_comment") or media.get("edge_media_preview_comment")
         ),
-        hoisted_comments=[
-            extract_media_inline_comment_gql(edge["node"])
-            for edge in media.get("edge_media_to_hoisted_comment", {}).get("edges", [])
-        ],
-        **media,
     )
 
 
@@ -203,7 +238,7 @@ def extract_media_comments_preview_gql(data):
 
 
 def extract_media_inline_comment_gql(data, replied_to_comment_id=None):
-    comment = deepcopy(data)
+    comment = dict(data)
     comment["pk"] = str(comment.get("id"))
     comment["user"] = extract_user_short(comment.get("owner"))
     comment["created_at_utc"] = comment.get("created_at")
@@ -221,56 +256,53 @@ def extract_media_inline_comment_gql(data, replied_to_comment_id=None):
 
 
 def extract_resource_v1(data):
-    data = deepcopy(data)
+    data = dict(data)
     if data.get("video_versions"):
-        data["video_url"] = sorted(data["video_versions"], key=lambda o: o["height"] * o["width"])[-1]["url"]
+        data["video_url"] = _largest(data["video_versions"], _v1_area)["url"]
     candidates = data.get("image_versions2", {}).get("candidates", [])
-    data["thumbnail_url"] = (
-        sorted(
-            candidates,
-            key=lambda o: o["height"] * o["width"],
-        )[-1]["url"]
-        if candidates
-        else None
-    )
+    data["thumbnail_url"] = _largest(candidates, _v1_area)["url"] if candidates else None
     usertags = data.get("usertags") or {}
     data["usertags"] = sorted(
         [extract_usertag(usertag) for usertag in usertags.get("in", [])],
         key=lambda tag: tag.user.pk,
     )
-    return Resource(**data)
+    return build_model(Resource, data)
 
 
 def extract_resource_gql(data):
-    data = deepcopy(data)
+    data = dict(data)
     _normalize_media_gql_typename(data)
     data["media_type"] = MEDIA_TYPES_GQL[data["__typename"]]
-    return Resource(pk=data["id"], thumbnail_url=data["display_url"], **data)
+    return build_model(Resource, dict(data, pk=data["id"], thumbnail_url=data["display_url"]))
 
 
 def extract_usertag(data):
     """Extract user tag"""
     x, y = data.get("position", [data.get("x"), data.get("y")])
-    return Usertag(user=extract_user_short(data["user"]), x=x, y=y)
+    return build_model(Usertag, {"user": extract_user_short(data["user"]), "x": x, "y": y})
 
 
 def extract_user_short(data):
     """Extract User Short info"""
+    data = dict(data)
     data["pk"] = data.get("id", data.get("pk", None))
     assert data["pk"], f'User without pk "{data}"'
     if "latest_reel_media" not in data and "1llatest_reel_media" in data:
         data["latest_reel_media"] = data.get("1llatest_reel_media")
     friendship_status = data.get("friendship_status")
     if isinstance(friendship_status, dict):
-        friendship_status.setdefault("user_id", str(data["pk"]))
-        friendship_status.setdefault("following", False)
-        friendship_status.setdefault("incoming_request", False)
-        friendship_status.setdefault("is_bestie", False)
-        friendship_status.setdefault("is_feed_favorite", False)
-        friendship_status.setdefault("is_private", False)
-        friendship_status.setdefault("is_restricted", False)
-        friendship_status.setdefault("outgoing_request", False)
-    return UserShort(**data)
+        data["friendship_status"] = {
+            "user_id": str(data["pk"]),
+            "following": False,
+            "incoming_request": False,
+            "is_bestie": False,
+            "is_feed_favorite": False,
+            "is_private": False,
+            "is_restricted": False,
+            "outgoing_request": False,
+            **friendship_status,
+        }
+    return build_model(UserShort, data)
 
 
 def extract_viewer(data):
@@ -278,7 +310,7 @@ def extract_viewer(data):
     user = data.pop("user")
     user["pk"] = user.get("id", user.get("pk", None))
     assert user["pk"], f'User without pk "{user}"'
-    return Viewer(**user, **data)
+    return build_model(Viewer, {**user, **data})
 
 
 def extract_broadcast_channel(data):
@@ -290,15 +322,18 @@ def extract_broadcast_channel(data):
 def extract_user_gql(data):
     """For Public GraphQL API"""
     data["broadcast_channel"] = extract_broadcast_channel(data)
-    return User(
-        pk=data["id"],
-        media_count=data["edge_owner_to_timeline_media"]["count"],
-        follower_count=data["edge_followed_by"]["count"],
-        following_count=data["edge_follow"]["count"],
-        is_business=data["is_business_account"],
-        public_email=data["business_email"],
-        contact_phone_number=data["business_phone_number"],
-        **data,
+    return build_model(
+        User,
+        dict(
+            data,
+            pk=data["id"],
+            media_count=data["edge_owner_to_timeline_media"]["count"],
+            follower_count=data["edge_followed_by"]["count"],
+            following_count=data["edge_follow"]["count"],
+            is_business=data["is_business_account"],
+            public_email=data["business_email"],
+            contact_phone_number=data["business_phone_number"],
+        ),
     )
 
 
@@ -311,7 +346,7 @@ def extract_user_v1(data):
     versions = data.get("hd_profile_pic_versions")
     pic_hd = versions[-1] if versions else data.get("hd_profile_pic_url_info", {})
     data["profile_pic_url_hd"] = pic_hd.get("url")
-    return User(**data)
+    return build_model(User, data)
 
 
 def extract_location(data):
@@ -322,6 +357,7 @@ def extract_location(data):
         place_location = data["place"].get("location")
         if place_location:
             data = place_location
+    data = dict(data)
     data["pk"] = data.get("id", data.get("pk", data.get("location_id", None)))
     external_id = data.get("external_id") or data.get("facebook_places_id")
     if external_id in (None, "", "None"):
@@ -339,14 +375,14 @@ def extract_location(data):
             data["address"] = address.get("street_address")
             data["city"] = address.get("city_name")
             data["zip"] = address.get("zip_code")
-    return Location(**data)
+    return build_model(Location, data)
 
 
 def extract_comment(data):
     """Extract comment"""
     data["has_liked"] = data.get("has_liked_comment")
     data["like_count"] = data.get("comment_like_count")
-    return Comment(**data)
+    return build_model(Comment, data)
 
 
 def extract_collection(data):
@@ -466,7 +502,7 @@ def extract_reply_message(data):
         ms = data["media_share"]
         if not ms.get("code"):
             ms["code"] = InstagramIdCodec.encode(ms["id"])
-        data["media_share"] = extract_media_v1(ms)
+        data["media_share"] = extract_media_v1(ms, lazy=False)
     if "media" in data:
         data["media"] = extract_direct_media(data["media"])
     clip = data.get("clip", {})
@@ -474,7 +510,7 @@ def extract_reply_message(data):
         if "clip" in clip:
             # Instagram ¯\_(ツ)_/¯
             clip = clip.get("clip")
-        data["clip"] = extract_media_v1(clip)
+        data["clip"] = extract_media_v1(clip, lazy=False)
     generic_xma = data.get("generic_xma", [])
     if generic_xma:
         items = [extract_media_v1_xma(item) for item in generic_xma]
@@ -498,7 +534,7 @@ def extract_direct_message(data):
         ms = data["media_share"]
         if not ms.get("code"):
             ms["code"] = InstagramIdCodec.encode(ms["id"])
-        data["media_share"] = extract_media_v1(ms)
+        data["media_share"] = extract_media_v1(ms, lazy=False)
     if "media" in data:
         data["media"] = extract_direct_media(data["media"])
     if "voice_media" in data:
@@ -509,7 +545,7 @@ def extract_direct_message(data):
         if "clip" in clip:
             # Instagram ¯\_(ツ)_/¯
             clip = clip.get("clip")
-        data["clip"] = extract_media_v1(clip)
+        data["clip"] = extract_media_v1(clip, lazy=False)
     # Handle xma_clip (new Instagram API format for clip/reel shares)
     xma_clip = data.get("xma_clip", {})
     if xma_clip:
@@ -549,15 +585,12 @@ def extract_direct_message(data):
 
 
 def extract_direct_media(data):
-    media = deepcopy(data)
+    media = dict(data)
     if media.get("video_versions"):
         # Select Best Quality by Resolutiuon
-        media["video_url"] = sorted(media["video_versions"], key=lambda o: o["height"] * o["width"])[-1]["url"]
+        media["video_url"] = _largest(media["video_versions"], _v1_area)["url"]
     if "image_versions2" in media:
-        media["thumbnail_url"] = sorted(
-            media["image_versions2"]["candidates"],
-            key=lambda o: o["height"] * o["width"],
-        )[-1]["url"]
+        media["thumbnail_url"] = _largest(media["image_versions2"]["candidates"], _v1_area)["url"]
     if "user" in media:
         media["user"] = extract_user_short(media.get("user"))
     if "audio" in media:
@@ -585,18 +618,15 @@ def extract_hashtag_v1(data):
 
 def extract_story_v1(data):
     """Extract story from Private API"""
-    story = deepcopy(data)
+    story = dict(data)
     story["pk"] = str(story.get("pk"))
     if story.get("video_versions"):
         # Select Best Quality by Resolutiuon
-        story["video_url"] = sorted(story["video_versions"], key=lambda o: o["height"] * o["width"])[-1]["url"]
+        story["video_url"] = _largest(story["video_versions"], _v1_area)["url"]
     if story["media_type"] == 2 and not story.get("product_type"):
         story["product_type"] = "story"
     if "image_versions2" in story:
-        story["thumbnail_url"] = sorted(
-            story["image_versions2"]["candidates"],
-            key=lambda o: o["height"] * o["width"],
-        )[-1]["url"]
+        story["thumbnail_url"] = _largest(story["image_versions2"]["candidates"], _v1_area)["url"]
     story["mentions"] = [StoryMention(**mention) for mention in story.get("reel_mentions", [])]
     story["locations"] = [StoryLocation(**location) for location in story.get("story_locations", [])]
     story["hashtags"] = [StoryHashtag(**hashtag) for hashtag in story.get("story_hashtags", [])]
@@ -633,8 +663,7 @@ def extract_story_v1(data):
     feed_medias = []
     story_feed_medias = data.get("story_feed_media") or []
     for feed_media in story_feed_medias:
-        feed_media["media_pk"] = int(feed_media["media_id"])
-        feed_medias.append(StoryMedia(**feed_media))
+        feed_medias.append(StoryMedia(**{**feed_media, "media_pk": int(feed_media["media_id"])}))
     story["medias"] = feed_medias
     story["links"] = []
     for sticker in story.get("story_link_stickers", []):
@@ -652,37 +681,33 @@ def extract_story_v1(data):
         story["code"] = InstagramIdCodec.encode(story["pk"])
     if not story.get("taken_at"):
         story["taken_at"] = story.get("device_timestamp") or story.get("taken_at_timestamp")
-    return Story(**story)
+    return build_model(Story, story)
 
 
 def extract_story_archive_day(data):
     """Extract story archive day from Private API"""
-    return StoryArchiveDay(**deepcopy(data))
+    return StoryArchiveDay(**data)
 
 
 def extract_story_gql(data):
     """Extract story from Public API"""
-    story = deepcopy(data)
+    story = dict(data)
     if "video_resources" in story:
         # Select Best Quality by Resolutiuon
-        story["video_url"] = sorted(
-            story["video_resources"],
-            key=lambda o: o["config_height"] * o["config_width"],
-        )[-1]["src"]
+        story["video_url"] = _largest(story["video_resources"], _gql_area)["src"]
     story["product_type"] = "story"
     story["thumbnail_url"] = story.get("display_url")
     story["mentions"] = []
     story["medias"] = []
     for item in story.get("tappable_objects", []):
         if item["__typename"] == "GraphTappableMention":
-            item["id"] = 1
-            item["user"] = extract_user_short(item)
-            story["mentions"].append(StoryMention(**item))
+            mention = {**item, "id": 1}
+            mention["user"] = extract_user_short(mention)
+            story["mentions"].append(StoryMention(**mention))
         if item["__typename"] == "GraphTappableFeedMedia":
             media = item.get("media")
             if media:
-                item["media_pk"] = int(media["id"])
-                item["media_code"] = media["shortcode"]
+                item = {**item, "media_pk": int(media["id"]), "media_code": media["shortcode"]}
             story["medias"].append(StoryMedia(**item))
     story["locations"] = []
     story["hashtags"] = []
@@ -701,19 +726,19 @@ def extract_story_gql(data):
         extract_user_short(edge["node"]["sponsor"])
         for edge in story.get("edge_media_to_sponsor_user", {}).get("edges", [])
     ]
-    return Story(**story)
+    return build_model(Story, story)
 
 
 def extract_highlight_v1(data):
-    highlight = deepcopy(data)
+    highlight = dict(data)
     highlight["pk"] = highlight["id"].split(":")[1]
     highlight["items"] = [extract_story_v1(item) for item in highlight.get("items", [])]
     return Highlight(**highlight)
 
 
 def extract_guide_v1(data):
-    item = deepcopy(data.get("summary") or {})
-    item["cover_media"] = extract_media_v1(item["cover_media"])
+    item = dict(data.get("summary") or {})
+    item["cover_media"] = extract_media_v1(item["cover_media"], lazy=False)
     return Guide(**item)
 
 
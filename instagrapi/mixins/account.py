@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Dict, Literal, Optional, Union
 
 from instagrapi.extractors import extract_account, extract_user_short
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Account, UserShort
 from instagrapi.utils.auth import gen_token, generate_signature
 from instagrapi.utils.serialization import dumps
@@ -11,7 +12,7 @@ ProfessionalAccountType = Literal[2, 3]
 AIGM_UPDATE_ACCOUNT_LABEL_VISIBILITY_CLIENT_DOC_ID = "85502578717429613610069073956"
 
 
-class AccountMixin:
+class AccountMixin(ValidationMixin):
     """
     Helper class to manage your account
     """
@@ -63,7 +64,7 @@ class AccountMixin:
             An object of Account class
         """
         result = self.private_request("accounts/current_user/?edit=true")
-        return extract_account(result["user"])
+        return self._extract(extract_account, result["user"])
 
     def account_set_ai_info(self, enabled: bool) -> Account:
         """
@@ -355,7 +356,7 @@ class AccountMixin:
         biography = data.get("biography")
         if biography:
             self.account_set_biography(biography)
-        return extract_account(result["user"])
+        return self._extract(extract_account, result["user"])
 
     def account_set_biography(self, biography: str) -> bool:
         """
@@ -394,7 +395,7 @@ class AccountMixin:
             "accounts/change_profile_picture/",
             self.with_default_data({"use_fbuploader": True, "upload_id": upload_id}),
         )
-        return extract_user_short(result["user"])
+        return self._extract(extract_user_short, result["user"])
 
     def news_inbox_v1(self, mark_as_seen: bool = False) -> dict:
         """
@@ -649,6 +649,8 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
         self.set_ig_u_rur(self.settings.get("ig_u_rur"))
         self.set_ig_www_claim(self.settings.get("ig_www_claim"))
         self.set_usdid_settings(self.settings.get("usdid"))
+        if self.page_sizer is not None and "page_sizes" in self.settings:
+            self.page_sizer.restore(self.settings["page_sizes"])
         # init headers
         headers = self.base_headers
         if self.authorization:
@@ -887,7 +889,13 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
 
     @property
     def cookie_dict(self) -> dict:
-        return self.private.cookies.get_dict()
+        cookies = self.private.cookies
+        lock = getattr(cookies, "_cookies_lock", None) if self.thread_safe else None
+        if lock is None:
+            return cookies.get_dict()
+        # Iterating the jar while a response thread stores cookies is not safe
+        with lock:
+            return cookies.get_dict()
 
     @property
     def sessionid(self) -> str:
@@ -975,6 +983,8 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
         usdid_settings = self.get_usdid_settings()
         if usdid_settings:
             settings["usdid"] = usdid_settings
+        if self.page_sizer is not None:
+            settings["page_sizes"] = self.page_sizer.snapshot()
         return settings
 
     def set_settings(self, settings: Dict) -> bool:
@@ -1196,6 +1206,7 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
         if override_app_version:
             self.set_user_agent()
         self.bloks_versioning_id = self.device_settings.get("bloks_versioning_id")
+        self.invalidate_base_headers()
         if self.settings is not None:
             self.settings["device_settings"] = self.device_settings
         return True
@@ -1218,6 +1229,7 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
         self.user_agent = user_agent or config.USER_AGENT_BASE.format(**data)
         # self.private.headers.update({"User-Agent": self.user_agent})  # changed in base_headers
         self.settings["user_agent"] = self.user_agent
+        self.invalidate_base_headers()
         if reset:
             self.set_uuids({})
             # self.settings = self.get_settings()
@@ -1247,6 +1259,7 @@ class LoginMixin(PreLoginFlowMixin, PostLoginFlowMixin):
         self.tray_session_id = uuids.get("tray_session_id", self.generate_uuid())
         # self.device_id = uuids.get("device_id", self.generate_uuid())
         self.settings["uuids"] = uuids
+        self.invalidate_base_headers()
         if previous_phone_id and previous_phone_id != self.phone_id:
             self.set_usdid_settings({})
         return True
@@ -0,0 +1,110 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, List, Tuple, Union
+
+from instagrapi.utils.concurrency import request_local_scope
+
+Call = Union[Callable[[], Any], str, Tuple]
+
+
+class BatchMixin:
+    """
+    Run independent client calls concurrently
+    """
+
+    batch_max_concurrency = 4
+    _batch_depth = 0  # run_many calls in progress
+
+    def _resolve_call(self, call: Call) -> Tuple[Callable, tuple, dict]:
+        args, kwargs = (), {}
+        if isinstance(call, (tuple, list)):
+            if not call or len(call) > 3:
+                raise ValueError(f"Call must be (method, args) or (method, args, kwargs), got {call!r}")
+            func, args, kwargs = (tuple(call) + ((), {}))[:3]
+            args, kwargs = tuple(args or ()), dict(kwargs or {})
+        else:
+            func = call
+        if isinstance(func, str):
+            func = getattr(self, func)
+        if not callable(func):
+            raise TypeError(f"{func!r} is not callable")
+        return func, args, kwargs
+
+    @contextmanager
+    def _thread_safe_batch(self):
+        # workers share the client: thread-safe mode for as long as a batch runs
+        with self._state_lock:
+            self._batch_depth += 1
+            if self._batch_depth == 1:
+                self._thread_safe_before_batch = self.thread_safe
+                self.thread_safe = True
+        try:
+            yield
+        finally:
+            with self._state_lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.thread_safe = self._thread_safe_before_batch
+
+    def _run_call(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        # last_json/last_response of one call must not leak into another worker
+        with request_local_scope(self):
+            return func(*args, **kwargs)
+
+    def run_many(
+        self,
+        calls: Iterable[Call],
+        max_concurrency: int = None,
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """
+        Run independent client calls on a thread pool
+
+        Requests still go through the client pacer, so the account's request
+        budget is shared between workers. The client runs in thread-safe mode
+        (see ``set_thread_safe``) until the batch finishes: headers are sent
+        per request, and inside a worker ``last_json``, ``last_response`` and
+        the public/GraphQL equivalents are per-thread and do not overwrite the
+        values seen by the calling thread.
+
+        Parameters
+        ----------
+        calls: Iterable
+            Each call is a zero-argument callable, a client method name, or a
+            ``(method, args)`` / ``(method, args, kwargs)`` tuple where ``method``
+            is a callable or a client method name, e.g.
+            ``[("user_info", ("1",)), ("media_info", ("123_1",))]``
+        max_concurrency: int, optional
+            Number of worker threads, default ``batch_max_concurrency``
+        return_exceptions: bool, optional
+            When True (default) an exception raised by a call is returned in its
+            slot; otherwise the first failed call (in input order) is re-raised
+            after all calls finished
+
+        Returns
+        -------
+        List[Any]
+            Results in the same order as ``calls``
+        """
+        resolved = [self._resolve_call(call) for call in calls]
+        if not resolved:
+            return []
+        max_concurrency = max_concurrency or self.batch_max_concurrency
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        with (
+            self._thread_safe_batch(),
+            ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(resolved)),
+                thread_name_prefix="instagrapi-batch",
+            ) as executor,
+        ):
+            futures = [executor.submit(contextvars.copy_context().run, self._run_call, *call) for call in resolved]
+        results = []
+        for future in futures:
+            exc = future.exception()
+            if exc is not None and not return_exceptions:
+                raise exc
+            results.append(exc if exc is not None else future.result())
+        return results
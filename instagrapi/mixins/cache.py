@@ -0,0 +1,238 @@
+import json
+from contextlib import contextmanager
+from copy import copy, deepcopy
+from typing import Iterable, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from instagrapi.exceptions import (
+    ClientNotFoundError,
+    MediaUnavailable,
+    NotFoundError,
+    PrivateAccount,
+)
+from instagrapi.utils.cache import EntityCaches, LRUCache, build_entity_caches
+from instagrapi.utils.cache_backends import CacheBackend, build_cache_backend
+from instagrapi.utils.snapshot import copy_model, freeze
+
+CACHE_HIT_MODES = ("copy", "frozen", "deepcopy")
+
+
+class CacheMixin:
+    """
+    Entity caches: per-client LRU caches and an optional persistent backend
+    """
+
+    cache: EntityCaches = None
+    cache_backend: CacheBackend = None
+    cache_hits: str = "copy"
+    _failures_cache: LRUCache = None  # (namespace, key) -> exception
+    # Lookup failures that will not change within the "failures" cache TTL
+    negative_cache_exceptions: Tuple[Type[Exception], ...] = (
+        NotFoundError,
+        PrivateAccount,
+        MediaUnavailable,
+        ClientNotFoundError,
+    )
+
+    def set_cache(self, cache=None) -> bool:
+        """
+        Set the entity caches used by user_info, media_info, story_info, followers...
+
+        Parameters
+        ----------
+        cache: EntityCaches | dict | bool, optional
+            An ``EntityCaches`` instance (share it between clients to share cached
+            objects), a per-cache config merged over the defaults, e.g.
+            ``{"medias": {"maxsize": 1000, "ttl": 60, "max_bytes": 16 * 1024 * 1024}}``,
+            ``False`` to disable caching, or None for fresh default caches
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.cache = build_entity_caches(cache)
+        self._users_cache = self.cache.users
+        self._userhorts_cache = self.cache.user_shorts
+        self._usernames_cache = self.cache.usernames
+        self._user_usernames_cache = self.cache.user_usernames
+        self._users_following = self.cache.following
+        self._users_followers = self.cache.followers
+        self._medias_cache = self.cache.medias
+        self._stories_cache = self.cache.stories
+        self._failures_cache = self.cache.failures
+        return True
+
+    def set_cache_backend(self, backend=None) -> bool:
+        """
+        Set the persistent store consulted when the in-memory caches miss
+
+        ``user_info``, ``user_info_by_username``, ``media_info``, ``story_info``
+        and ``hashtag_info`` read serialized objects from the backend before
+        sending a request and write fetched objects back, so processes sharing
+        a backend share warm metadata across restarts.
+
+        Parameters
+        ----------
+        backend: CacheBackend | str | Path, optional
+            A backend instance, a ``.db``/``.sqlite`` path for ``SQLiteCacheBackend``
+            or a directory for ``FileCacheBackend``; None disables the backend
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.cache_backend = build_cache_backend(backend)
+        return True
+
+    def set_cache_hits(self, mode: str = "copy") -> bool:
+        """
+        Set what ``user_info``, ``media_info``, ``story_info``... return for cached objects
+
+        Parameters
+        ----------
+        mode: str
+            ``"copy"`` (default) returns a private copy built with ``copy_model``,
+            ``"frozen"`` stores read-only snapshots (see ``freeze``) and returns the
+            cached object itself without copying, ``"deepcopy"`` uses ``copy.deepcopy``
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        if mode not in CACHE_HIT_MODES:
+            raise ValueError(f"Unsupported cache hit mode: {mode!r}, expected one of {', '.join(CACHE_HIT_MODES)}")
+        self.cache_hits = mode
+        return True
+
+    def _cache_hit(self, value):
+        """The object handed to the caller for a cached ``value``"""
+        mode = self.cache_hits
+        if mode == "frozen":
+            return freeze(value)  # already frozen by _cache_put: returned as is
+        if mode == "deepcopy":
+            return deepcopy(value)
+        return copy_model(value)
+
+    def _cache_put(self, cache, key, value):
+        """Keep ``value`` in the in-memory ``cache``, return the stored object"""
+        if self.cache_hits == "frozen":
+            value = freeze(value)
+        cache[key] = value
+        return value
+
+    def _relationships_changed(self, cache, key) -> None:
+        """The followers/following dict cached under ``key`` was changed in place"""
+        if isinstance(cache, LRUCache):
+            cache.reweigh(key)
+
+    @contextmanager
+    def _negative_cache(self, namespace: str, key, use_cache: bool = True):
+        """
+        Fail fast for a lookup of ``key`` that recently failed with a
+        ``negative_cache_exceptions`` error, remember such failures raised in the block
+        """
+        cache_key = (namespace, str(key))
+        failure = self._failures_cache.get(cache_key) if use_cache else None
+        if failure is not None:
+            raise copy(failure)  # fresh instance per raise, tracebacks do not pile up
+        try:
+            yield
+        except self.negative_cache_exceptions as e:
+            self._failures_cache[cache_key] = copy(e)
+            raise
+        if not use_cache:
+            self._failures_cache.pop(cache_key, None)
+
+    def _cache_load(self, namespace: str, key, model: Optional[Type[BaseModel]] = None):
+        backend = self.cache_backend
+        if backend is None:
+            return None
+        key = str(key)
+        try:
+            value = backend.get(namespace, key)
+        except Exception as e:
+            self.logger.warning("Cache backend read %s/%s failed: %r", namespace, key, e)
+            return None
+        if value is None:
+            return None
+        try:
+            return model.model_validate_json(value) if model is not None else json.loads(value)
+        except (ValidationError, ValueError):
+            # Written by an incompatible version
+            backend.delete(namespace, key)
+            return None
+
+    def _cache_lookup(self, cache, namespace: str, key, model: Optional[Type[BaseModel]] = None):
+        """Look ``key`` up in the in-memory ``cache``, then in the backend (keeping a backend hit in memory)"""
+        value = cache.get(key)
+        if value is None:
+            value = self._cache_load(namespace, key, model)
+            if value is not None:
+                value = self._cache_put(cache, key, value)
+        return value
+
+    def _cache_store(self, namespace: str, key, value) -> None:
+        backend = self.cache_backend
+        if backend is None or value is None:
+            return
+        try:
+            data = value.model_dump_json() if isinstance(value, BaseModel) else json.dumps(value)
+            backend.set(namespace, str(key), data)
+        except Exception as e:
+            self.logger.warning("Cache backend write %s/%s failed: %r", namespace, key, e)
+
+    def _index_usernames(self, users: Iterable) -> None:
+        """
+        Remember the username -> pk pairs of extracted ``User``/``UserShort`` objects
+
+        ``user_id_from_username`` and ``user_info_by_username`` resolve indexed
+        usernames without a request. Pairs the in-memory index already holds
+        are not written to the backend again. A pk indexed under another
+        username before drops that pair: the account was renamed, and the old
+        username may be taken by someone else.
+        """
+        index = self._usernames_cache
+        previous_usernames = self._user_usernames_cache
+        changed = {}
+        for user in users:
+            username = getattr(user, "username", None)
+            if not username or not user.pk:
+                continue
+            username = username.lower()
+            previous = previous_usernames.get(user.pk)
+            if previous != username:
+                if previous is not None and index.get(previous) == user.pk:
+                    self._forget_username(previous)
+                    changed.pop(previous, None)
+                previous_usernames[user.pk] = username
+            if index.get(username) != user.pk:
+                index[username] = user.pk
+                changed[username] = json.dumps(user.pk)
+        backend = self.cache_backend
+        if backend is None or not changed:
+            return
+        try:
+            backend.set_many("usernames", changed)
+        except Exception as e:
+            self.logger.warning("Cache backend write usernames failed: %r", e)
+
+    def _username_lookup(self, username: str):
+        """Indexed pk of ``username`` (in memory, then in the backend), or None"""
+        user_id = self._cache_lookup(self._usernames_cache, "usernames", username)
+        if user_id is not None and self._user_usernames_cache.get(user_id) is None:
+            # e.g. a backend hit: a later rename of the account must drop it too
+            self._user_usernames_cache[user_id] = username
+        return user_id
+
+    def _forget_username(self, username: str) -> None:
+        """Drop a stale username -> pk pair (the account was renamed)"""
+        self._usernames_cache.pop(username, None)
+        if self.cache_backend is not None:
+            try:
+                self.cache_backend.delete("usernames", username)
+            except Exception as e:
+                self.logger.warning("Cache backend delete usernames/%s failed: %r", username, e)
@@ -18,6 +18,7 @@ from instagrapi.exceptions import (
     SelectContactPointRecoveryForm,
     SubmitPhoneNumberForm,
 )
+from instagrapi.mixins.validation import ValidationMixin
 
 WAIT_SECONDS = 5
 BLOKS_REDIRECT_ACTION = "com.bloks.www.ig.challenge.redirect.async"
@@ -38,7 +39,7 @@ def extract_messages(challenge):
     return messages
 
 
-class ChallengeResolveMixin:
+class ChallengeResolveMixin(ValidationMixin):
     """
     Helpers for resolving login challenge
     """
@@ -370,7 +371,7 @@ class ChallengeResolveMixin:
         msg = " ".join(
             [
                 "Log into your Instagram account from smartphone and change password!",
-                *extract_messages(result),
+                *self._extract(extract_messages, result),
             ]
         )
         raise LegacyForceSetNewPasswordForm(msg)
@@ -433,7 +434,7 @@ class ChallengeResolveMixin:
             'status': 'fail'}
             """
             if "extraData" in challenge:
-                messages += extract_messages(challenge)
+                messages += self._extract(extract_messages, challenge)
             if "errors" in challenge:
                 for error in challenge["errors"]:
                     messages.append(error)
@@ -471,7 +472,7 @@ class ChallengeResolveMixin:
             # Unknown challenge_type
             messages.append(f"Unsupported challenge type: {challenge_type}.")
             if challenge.get("extraData"):
-                messages += extract_messages(challenge)
+                messages += self._extract(extract_messages, challenge)
             if "errors" in challenge:
                 messages.append("\n".join(challenge["errors"]))
             messages.append("(Please manual login)")
@@ -1,11 +1,14 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from instagrapi.exceptions import CollectionNotFound
 from instagrapi.extractors import extract_collection, extract_media_v1
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Collection, Media
+from instagrapi.utils.checkpoints import build_checkpoint
+from instagrapi.utils.iterators import iter_paginated
 
 
-class CollectionMixin:
+class CollectionMixin(ValidationMixin):
     """
     Helpers for collection
     """
@@ -34,7 +37,7 @@ class CollectionMixin:
                 self.logger.exception(e)
                 return total_items
             for item in result["items"]:
-                total_items.append(extract_collection(item))
+                total_items.append(self._extract(extract_collection, item))
             if not result.get("more_available"):
                 return total_items
             next_max_id = result.get("next_max_id", "") or result.get("max_id", "")
@@ -128,7 +131,7 @@ class CollectionMixin:
         if max_id:
             params["max_id"] = max_id
         result = self.private_request(private_request_endpoint, params=params)
-        items = [extract_media_v1(m.get("media", m)) for m in result["items"]]
+        items = [self._extract(extract_media_v1, m.get("media", m)) for m in result["items"]]
         return items, result.get("next_max_id", "") or result.get("max_id", "")
 
     def collection_medias_v1(self, collection_pk: str, amount: int = 21, last_media_pk: int = 0) -> List[Media]:
@@ -167,6 +170,42 @@ class CollectionMixin:
                 break
         return total_items[:amount] if amount else total_items
 
+    def iter_collection_medias(
+        self, collection_pk: str, amount: int = 0, prefetch: int = 0, checkpoint=None
+    ) -> Iterator[Media]:
+        """
+        Iterate over media in a collection by collection_pk
+
+        Parameters
+        ----------
+        collection_pk: str
+            Unique identifier of a Collection, "liked" or "saved"
+        amount: int, optional
+            Maximum number of media to yield, default is 0 (all medias)
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+
+        Returns
+        -------
+        Iterator[Media]
+            Iterator of Media objects
+        """
+
+        def fetch_page(max_id: str, page_amount: int) -> Tuple[List[Media], str]:
+            return self.collection_medias_v1_chunk(collection_pk, max_id=max_id)
+
+        checkpoint = build_checkpoint(
+            checkpoint,
+            "collection_medias_v1",
+            self.cache_backend,
+            user_id=self.user_id,
+            collection_pk=str(collection_pk),
+        )
+        return iter_paginated(fetch_page, amount=amount, initial_cursor="", prefetch=prefetch, checkpoint=checkpoint)
+
     def collection_medias(self, collection_pk: str, amount: int = 21, last_media_pk: int = 0) -> List[Media]:
         """
         Get media in a collection by collection_pk
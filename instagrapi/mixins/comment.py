@@ -1,17 +1,20 @@
 import random
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from instagrapi.exceptions import ClientError, ClientNotFoundError, CommentNotFound, MediaNotFound
 from instagrapi.extractors import extract_comment
 from instagrapi.mixins.graphql import GQL_STUFF
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Comment
 from instagrapi.utils.auth import generate_jazoest
+from instagrapi.utils.checkpoints import build_checkpoint
+from instagrapi.utils.iterators import iter_paginated
 from instagrapi.utils.serialization import dumps
 
 MEDIA_COMMENTS_DOC_ID = "6974885689225067"
 
 
-class CommentMixin:
+class CommentMixin(ValidationMixin):
     """
     Helpers for managing comments on a Media
     """
@@ -154,6 +157,37 @@ class CommentMixin:
             comments = comments[:amount]
         return comments
 
+    def iter_media_comments_gql(
+        self, media_pk: str, amount: int = 0, prefetch: int = 0, checkpoint=None
+    ) -> Iterator[dict]:
+        """
+        Iterate over comments on a media through the web GraphQL doc_id endpoint
+
+        Parameters
+        ----------
+        media_pk: str
+            Unique identifier of a Media
+        amount: int, optional
+            Maximum number of comments to yield, default is 0 - Inf
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+
+        Returns
+        -------
+        Iterator[dict]
+            Iterator of raw GraphQL comment nodes
+        """
+        media_pk = str(self.media_pk(media_pk))
+
+        def fetch_page(end_cursor: str, page_amount: int) -> Tuple[List[dict], str]:
+            return self.media_comments_gql_chunk(media_pk, end_cursor=end_cursor)
+
+        checkpoint = build_checkpoint(checkpoint, "media_comments_gql", self.cache_backend, media_pk=media_pk)
+        return iter_paginated(fetch_page, amount=amount, initial_cursor="", prefetch=prefetch, checkpoint=checkpoint)
+
     def media_comments_public_gql_chunk(self, code: str, end_cursor: str = "") -> Tuple[List[dict], str]:
         """
         Get one public GraphQL comments page by media shortcode.
@@ -191,7 +225,7 @@ class CommentMixin:
         rows = result.get("stream_rows") or [result]
         for row in rows:
             for comment in row["comments"]:
-                comments.append(extract_comment(comment))
+                comments.append(self._extract(extract_comment, comment))
         min_id = result.get("next_min_id") or result.get("min_id", "")
         max_id = result.get("next_max_id") or result.get("max_id", "")
         return comments, min_id, max_id
@@ -222,7 +256,7 @@ class CommentMixin:
         if max_id:
             params["max_id"] = max_id
         result = self.private_request(f"media/{media_id}/comments/", params=params)
-        comments = [extract_comment(comment) for comment in result.get("comments", [])]
+        comments = [self._extract(extract_comment, comment) for comment in result.get("comments", [])]
         min_id = result.get("next_min_id") or result.get("min_id", "")
         max_id = result.get("next_max_id") or result.get("max_id", "")
         return comments, min_id, max_id
@@ -272,7 +306,7 @@ class CommentMixin:
         def get_comments():
             if result.get("comments"):
                 for comment in result.get("comments"):
-                    comments.append(extract_comment(comment))
+                    comments.append(self._extract(extract_comment, comment))
 
         media_id = self.media_id(media_id)
         params = None
@@ -326,7 +360,7 @@ class CommentMixin:
         def get_comments():
             if result.get("comments"):
                 for comment in result.get("comments"):
-                    comments.append(extract_comment(comment))
+                    comments.append(self._extract(extract_comment, comment))
 
         media_id = self.media_id(media_id)
         params = {"min_id": min_id} if min_id else None
@@ -350,6 +384,51 @@ class CommentMixin:
                 break
         return (comments, result.get("next_min_id"))
 
+    def iter_media_comments(
+        self,
+        media_id: str,
+        amount: int = 0,
+        page_size: int = 0,
+        prefetch: int = 0,
+        checkpoint=None,
+    ) -> Iterator[Comment]:
+        """
+        Iterate over comments on a media page by page
+
+        Parameters
+        ----------
+        media_id: str
+            Unique identifier of a Media
+        amount: int, optional
+            Maximum number of comments to yield, default is 0 - Inf
+        page_size: int, optional
+            Minimum number of comments to fetch per page, default is 0 (one request per page)
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+
+        Returns
+        -------
+        Iterator[Comment]
+            Iterator of Comment objects
+        """
+        media_id = self.media_id(media_id)
+
+        def fetch_page(min_id: str, page_amount: int) -> Tuple[List[Comment], str]:
+            return self.media_comments_chunk(media_id, page_amount, min_id)
+
+        checkpoint = build_checkpoint(checkpoint, "media_comments", self.cache_backend, media_id=media_id)
+        return iter_paginated(
+            fetch_page,
+            amount=amount,
+            page_size=page_size,
+            initial_cursor=None,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+        )
+
     def media_comment_replies(self, media_id: str, comment_id: str, amount: int = 0) -> List[Comment]:
         """
         Get replies for a media comment.
@@ -385,7 +464,7 @@ class CommentMixin:
                     raise MediaNotFound(e, media_id=media_id, **self.last_json)
                 raise e
 
-            replies.extend(extract_comment(comment) for comment in result.get("child_comments", []))
+            replies.extend(self._extract(extract_comment, comment) for comment in result.get("child_comments", []))
             if amount and len(replies) >= amount:
                 break
             if not (result.get("has_more_head_child_comments") and result.get("next_min_child_cursor")):
@@ -432,7 +511,7 @@ class CommentMixin:
             if "Media not found" in str(e):
                 raise MediaNotFound(e, media_id=media_id, **self.last_json)
             raise e
-        replies = [extract_comment(comment) for comment in result.get("child_comments", [])][:max_amount]
+        replies = [self._extract(extract_comment, comment) for comment in result.get("child_comments", [])][:max_amount]
         return (replies, result.get("next_min_child_cursor"))
 
     def media_comment(self, media_id: str, text: str, replied_to_comment_id: Optional[int] = None) -> Comment:
@@ -479,7 +558,7 @@ class CommentMixin:
             f"media/{media_id}/comment/",
             self.with_action_data(data),
         )
-        return extract_comment(result["comment"])
+        return self._extract(extract_comment, result["comment"])
 
     def media_check_offensive_comment(self, media_id: str, text: str) -> bool:
         """
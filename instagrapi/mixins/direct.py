@@ -4,7 +4,7 @@ import secrets
 import time
 import uuid
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
 
 from instagrapi.exceptions import (
     ClientError,
@@ -20,6 +20,7 @@ from instagrapi.extractors import (
     extract_user_short,
 )
 from instagrapi.image_util import prepare_image
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import (
     DirectMessage,
     DirectShortThread,
@@ -27,6 +28,8 @@ from instagrapi.types import (
     Media,
     UserShort,
 )
+from instagrapi.utils.checkpoints import build_checkpoint
+from instagrapi.utils.iterators import iter_paginated
 from instagrapi.utils.serialization import dumps
 from instagrapi.utils.video import read_video_metadata, read_video_metadata_with_moviepy
 
@@ -65,7 +68,7 @@ DirectMediaType = Literal["photo", "video"]
 BOX = Literal["general", "primary"]
 
 
-class DirectMixin:
+class DirectMixin(ValidationMixin):
     """
     Helpers for managing Direct Messaging
     """
@@ -117,33 +120,60 @@ class DirectMixin:
             threads = threads[:amount]
         return threads
 
-    def direct_threads_chunk(
+    def iter_direct_threads(
         self,
+        amount: int = 0,
         selected_filter: Optional[SELECTED_FILTER] = None,
         box: Optional[BOX] = None,
         thread_message_limit: Optional[int] = None,
-        cursor: str = None,
-    ) -> Tuple[List[DirectThread], str]:
+        prefetch: int = 0,
+        checkpoint=None,
+    ) -> Iterator[DirectThread]:
         """
-        Get direct a chunk of threads by cursor value
+        Iterate over direct message threads page by page
 
         Parameters
         ----------
+        amount: int, optional
+            Maximum number of threads to yield, default is 0 - Inf
         selected_filter: str, optional
             Filter to apply to threads ("flagged" or "unread")
-        thread_message_limit: int, optional
-            Thread message limit, deafult is 10
         box: str, optional
             Box to gather threads from ("primary" or "general") (business accounts only)
-        cursor: str, optional
-            Cursor from the previous chunk request
+        thread_message_limit: int, optional
+            Thread message limit, deafult is 10
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
 
         Returns
         -------
-        Tuple[List[DirectThread], str]
-            A tuple of list of objects of DirectThread and str (cursor)
+        Iterator[DirectThread]
+            Iterator of DirectThread objects
         """
-        assert self.user_id, "Login required"
+
+        def fetch_page(cursor: str, page_amount: int) -> Tuple[List[DirectThread], str]:
+            return self.direct_threads_chunk(selected_filter, box, thread_message_limit, cursor)
+
+        checkpoint = build_checkpoint(
+            checkpoint,
+            "direct_threads",
+            self.cache_backend,
+            user_id=self.user_id,
+            selected_filter=selected_filter,
+            box=box,
+        )
+        return iter_paginated(fetch_page, amount=amount, initial_cursor=None, prefetch=prefetch, checkpoint=checkpoint)
+
+    def _direct_threads_params(
+        self,
+        selected_filter: Optional[SELECTED_FILTER] = None,
+        box: Optional[BOX] = None,
+        thread_message_limit: Optional[int] = None,
+        cursor: str = None,
+    ) -> Dict:
         params = {
             **self._direct_request_tracking_params(),
             "visual_message_return_type": "unseen",
@@ -167,12 +197,41 @@ class DirectMixin:
             params.update({"thread_message_limit": thread_message_limit})
         if cursor:
             params.update({"cursor": cursor, "direction": "older", "fetch_reason": "page_scroll"})
+        return params
+
+    def direct_threads_chunk(
+        self,
+        selected_filter: Optional[SELECTED_FILTER] = None,
+        box: Optional[BOX] = None,
+        thread_message_limit: Optional[int] = None,
+        cursor: str = None,
+    ) -> Tuple[List[DirectThread], str]:
+        """
+        Get direct a chunk of threads by cursor value
+
+        Parameters
+        ----------
+        selected_filter: str, optional
+            Filter to apply to threads ("flagged" or "unread")
+        thread_message_limit: int, optional
+            Thread message limit, deafult is 10
+        box: str, optional
+            Box to gather threads from ("primary" or "general") (business accounts only)
+        cursor: str, optional
+            Cursor from the previous chunk request
 
+        Returns
+        -------
+        Tuple[List[DirectThread], str]
+            A tuple of list of objects of DirectThread and str (cursor)
+        """
+        assert self.user_id, "Login required"
+        params = self._direct_threads_params(selected_filter, box, thread_message_limit, cursor)
         threads = []
         result = self.private_request("direct_v2/inbox/", params=params)
         inbox = result.get("inbox", {})
         for thread in inbox.get("threads", []):
-            threads.append(extract_direct_thread(thread))
+            threads.append(self._extract(extract_direct_thread, thread))
         cursor = inbox.get("oldest_cursor")
         return threads, cursor
 
@@ -270,7 +329,7 @@ class DirectMixin:
         result = self.private_request("direct_v2/pending_inbox/", params=params)
         inbox = result.get("inbox", {})
         for thread in inbox.get("threads", []):
-            threads.append(extract_direct_thread(thread))
+            threads.append(self._extract(extract_direct_thread, thread))
         cursor = inbox.get("oldest_cursor")
         return threads, cursor
 
@@ -367,7 +426,7 @@ class DirectMixin:
         result = self.private_request("direct_v2/spam_inbox/", params=params)
         inbox = result.get("inbox", {})
         for thread in inbox.get("threads", []):
-            threads.append(extract_direct_thread(thread))
+            threads.append(self._extract(extract_direct_thread, thread))
         cursor = inbox.get("oldest_cursor")
         return threads, cursor
 
@@ -413,7 +472,7 @@ class DirectMixin:
         if amount:
             items = items[:amount]
         thread["items"] = items
-        return extract_direct_thread(thread)
+        return self._extract(extract_direct_thread, thread)
 
     def direct_messages(self, thread_id: int, amount: int = 20) -> List[DirectMessage]:
         """
@@ -564,7 +623,7 @@ class DirectMixin:
             data=self.with_default_data(kwargs),
             with_signature=False,
         )
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def _direct_message_reaction(
         self,
@@ -789,7 +848,7 @@ class DirectMixin:
             data=self.with_default_data(data),
             with_signature=False,
         )
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def _direct_video_metadata(self, path: Path) -> Tuple[int, int, float]:
         width, height, duration_sec = 720, 1280, 1.0
@@ -941,7 +1000,7 @@ class DirectMixin:
             data=self.with_default_data(data),
             with_signature=True,
         )
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def _messenger_rupload_headers(self, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         bearer = self.private.headers.get("Authorization") or self.authorization
@@ -1151,7 +1210,7 @@ class DirectMixin:
             data=self.with_default_data(data),
             with_signature=False,
         )
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def _voice_rupload(self, audio_bytes: bytes, upload_id: str, rand_key: int) -> int:
         """Upload audio to rupload.facebook.com and return the media_id used as
@@ -1305,7 +1364,7 @@ class DirectMixin:
             data=self.with_default_data(data),
             with_signature=False,
         )
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def direct_users_presence(self, user_ids: List[int]) -> Dict:
         """
@@ -1432,7 +1491,7 @@ class DirectMixin:
             params=params,
         )
         return [
-            extract_user_short(item.get("user", {}))
+            self._extract(extract_user_short, item.get("user", {}))
             for item in result.get("ranked_recipients", [])
             if "user" in item and item.get("user", {}).get("username", "") != ""  # Check to exclude suggestions from FB
         ]
@@ -1470,8 +1529,8 @@ class DirectMixin:
             thread = item.get("thread", {})
             data.append(
                 (
-                    extract_direct_message(message.get("item_info", {})),
-                    extract_direct_short_thread(thread),
+                    self._extract(extract_direct_message, message.get("item_info", {})),
+                    self._extract(extract_direct_short_thread, thread),
                 )
             )
         return data
@@ -1508,7 +1567,11 @@ class DirectMixin:
             "direct_v2/search_gen_ai_bots/",
             params={"num_ai_bots": str(amount)},
         )
-        return [extract_user_short(item) for item in result.get("user_search_results", []) if item.get("username")]
+        return [
+            self._extract(extract_user_short, item)
+            for item in result.get("user_search_results", [])
+            if item.get("username")
+        ]
 
     def direct_channels(self, user_id: Optional[int] = None, thread_subtypes: Optional[List[int]] = None) -> List[Dict]:
         """
@@ -1786,7 +1849,7 @@ class DirectMixin:
         )
         assert result.get("status", "") == "ok"
 
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def direct_story_share(self, story_id: str, user_ids: List[int] = [], thread_ids: List[int] = []) -> DirectMessage:
         """
@@ -1840,7 +1903,7 @@ class DirectMixin:
             data=self.with_default_data(data),
             with_signature=False,
         )
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def direct_thread_mark_unread(self, thread_id: int) -> bool:
         """
@@ -2027,7 +2090,7 @@ class DirectMixin:
         )
         assert result.get("status", "") == "ok"
 
-        return extract_direct_message(result["payload"])
+        return self._extract(extract_direct_message, result["payload"])
 
     def direct_media(self, thread_id: int, amount: int = 20) -> List[Media]:
         """
@@ -2063,7 +2126,7 @@ class DirectMixin:
                 raise DirectThreadNotFound(e, thread_id=thread_id, **self.last_json)
             for item in result["items"]:
                 media = item.get("media")
-                items.append(extract_direct_media(media))
+                items.append(self._extract(extract_direct_media, media))
                 max_timestamp = item.get("timestamp")
             more_available = result.get("more_available")
             if not more_available or (amount and len(items) >= amount):
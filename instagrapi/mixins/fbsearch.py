@@ -7,10 +7,11 @@ from instagrapi.extractors import (
     extract_track,
     extract_user_short,
 )
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Hashtag, Location, Media, Track, UserShort
 
 
-class FbSearchMixin:
+class FbSearchMixin(ValidationMixin):
     def _fbsearch_media_grid_nodes(self, media_grid: dict):
         for section in media_grid.get("sections") or []:
             layout_content = section.get("layout_content") or {}
@@ -43,7 +44,7 @@ class FbSearchMixin:
         result = self.private_request("fbsearch/places/", params=params)
         locations = []
         for item in result["items"]:
-            locations.append(extract_location(item["location"]))
+            locations.append(self._extract(extract_location, item["location"]))
         return locations
 
     def web_search_topsearch(self, query: str) -> dict:
@@ -74,7 +75,7 @@ class FbSearchMixin:
             "q": query,
         }
         result = self.private_request("users/search/", params=params)
-        return [extract_user_short(item) for item in result["users"]]
+        return [self._extract(extract_user_short, item) for item in result["users"]]
 
     def search_music(self, query: str) -> List[Track]:
         params = {
@@ -82,7 +83,7 @@ class FbSearchMixin:
             "browse_session_id": self.generate_uuid(),
         }
         result = self.private_request("music/audio_global_search/", params=params)
-        return [extract_track(item["track"]) for item in result["items"] if item.get("track")]
+        return [self._extract(extract_track, item["track"]) for item in result["items"] if item.get("track")]
 
     def search_hashtags(self, query: str) -> List[Hashtag]:
         params = {
@@ -92,7 +93,7 @@ class FbSearchMixin:
             "q": query,
         }
         result = self.private_request("tags/search/", params=params)
-        return [extract_hashtag_v1(ht) for ht in result["results"]]
+        return [self._extract(extract_hashtag_v1, ht) for ht in result["results"]]
 
     def fbsearch_suggested_profiles(self, user_id: str) -> List[UserShort]:
         params = {
@@ -100,11 +101,11 @@ class FbSearchMixin:
             "include_friendship_status": "true",
         }
         result = self.private_request("fbsearch/accounts_recs/", params=params)
-        return [extract_user_short(item) for item in result["users"]]
+        return [self._extract(extract_user_short, item) for item in result["users"]]
 
     def web_search_topsearch_hashtags(self, query: str) -> List[Hashtag]:
         result = self.web_search_topsearch(query)
-        return [extract_hashtag_v1(item["hashtag"]) for item in result.get("hashtags", [])]
+        return [self._extract(extract_hashtag_v1, item["hashtag"]) for item in result.get("hashtags", [])]
 
     def fbsearch_item(
         self,
@@ -197,7 +198,7 @@ class FbSearchMixin:
         data = []
         for item in result.get("recent", []):
             if "user" in item.keys():
-                data.append((item.get("client_time", None), extract_user_short(item["user"])))
+                data.append((item.get("client_time", None), self._extract(extract_user_short, item["user"])))
             if "hashtag" in item.keys():
                 hashtag = item.get("hashtag")
                 hashtag["media_count"] = hashtag.pop("formatted_media_count")
@@ -353,7 +354,7 @@ class FbSearchMixin:
                 if amount and len(medias) >= amount:
                     break
                 try:
-                    medias.append(extract_media_v1(node))
+                    medias.append(self._extract(extract_media_v1, node))
                 except (KeyError, AttributeError, TypeError) as exc:
                     self.logger.warning("Skipping malformed fbsearch media node: %s", exc)
                     continue
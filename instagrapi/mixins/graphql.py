@@ -9,6 +9,7 @@ import requests
 from instagrapi import config
 from instagrapi.exceptions import (
     ChallengeRequired,
+    CircuitOpenError,
     ClientBadRequestError,
     ClientConnectionError,
     ClientError,
@@ -26,7 +27,9 @@ from instagrapi.exceptions import (
     SentryBlock,
     UserNotFound,
 )
+from instagrapi.utils.concurrency import RequestLocal
 from instagrapi.utils.logging import truncate_log_text
+from instagrapi.utils.pacing import GRAPHQL_FAMILY, PRIVATE_GRAPHQL_FAMILY
 from instagrapi.utils.timing import random_delay
 
 GRAPHQL_API_URL = "https://www.instagram.com/api/graphql"
@@ -71,8 +74,8 @@ GQL_STUFF = {
 class PrivateGraphQLRequestMixin:
     _fb_dtsg = None
     graphql_requests_count = 0
-    last_graphql_response = None
-    last_graphql_json = {}
+    last_graphql_response = RequestLocal()
+    last_graphql_json = RequestLocal({})
     request_logger = logging.getLogger("graphql_request")
 
     def __init__(self, *args, **kwargs):
@@ -94,8 +97,13 @@ class PrivateGraphQLRequestMixin:
                 ),
             }
         )
+        self._configure_graphql_session_pool()
         super().__init__(*args, **kwargs)
 
+    def _configure_graphql_session_pool(self):
+        if self.pool_manager is not None:
+            self.pool_manager.mount(self.graphql, proxy=self.proxy)
+
     def _merge_incremental_graphql_payload(self, base: Dict, payload: Dict) -> None:
         path = payload.get("path")
         if not isinstance(path, list) or not path or "data" not in payload:
@@ -177,12 +185,14 @@ class PrivateGraphQLRequestMixin:
         assert retries_count <= 10, "Retries count is too high"
         assert retries_timeout <= 600, "Retries timeout is too high"
         self.inject_sessionid_to_public()
+        retry = self._retry_state(retries_count - 1, retries_timeout)
         for iteration in range(retries_count):
             try:
                 if self.delay_range:
                     random_delay(delay_range=self.delay_range)
-                return self._send_graphql_request(**kwargs)
+                return self._call_guarded(GRAPHQL_FAMILY, self._send_graphql_request, **kwargs)
             except (
+                CircuitOpenError,
                 ClientLoginRequired,
                 ClientNotFoundError,
                 ClientBadRequestError,
@@ -199,30 +209,35 @@ class PrivateGraphQLRequestMixin:
                     )
                 ):
                     raise e
-                if retries_count > iteration + 1:
-                    time.sleep(retries_timeout)
-                else:
+                delay = retry.next_delay(e)
+                if delay is None:
                     raise e
+                time.sleep(delay)
 
     def _send_graphql_request(self, data=None, params=None, headers=None, return_json=False):
         self.last_graphql_response = None
-        self.graphql_requests_count += 1
+        self._increment_counter("graphql_requests_count")
+        per_request_headers = None
         if headers:
-            self.graphql.headers.update(headers)
-        if self.last_response_ts and (time.time() - self.last_response_ts) < 1.0:
-            time.sleep(1.0)
+            if self.thread_safe:
+                per_request_headers = headers
+            else:
+                self.graphql.headers.update(headers)
+        self._pace_request(GRAPHQL_FAMILY)
         try:
             if data is not None:
                 response = self.graphql.post(
                     GRAPHQL_API_URL,
                     data=data,
                     params=params,
+                    headers=per_request_headers,
                     proxies=self.graphql.proxies,
                 )
             else:
                 response = self.graphql.get(
                     GRAPHQL_API_URL,
                     params=params,
+                    headers=per_request_headers,
                     proxies=self.graphql.proxies,
                 )
             self.request_logger.debug("graphql_request %s: %s", response.status_code, response.url)
@@ -321,21 +336,26 @@ class PrivateGraphQLRequestMixin:
         self.last_response = None
         self.last_json = {}
         response = None
-        self.private.headers.update(self.base_headers)
-        self.private.headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
+        request_headers = self.base_headers
+        request_headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
         if self.authorization:
-            self.private.headers["Authorization"] = self.authorization
+            request_headers["Authorization"] = self.authorization
         friendly_name = data.get("fb_api_req_friendly_name")
         if friendly_name:
-            self.private.headers["X-FB-Friendly-Name"] = friendly_name
+            request_headers["X-FB-Friendly-Name"] = friendly_name
         if headers:
-            self.private.headers.update(headers)
-        if self.request_timeout:
-            time.sleep(self.request_timeout)
+            request_headers.update(headers)
+        if not self.thread_safe:
+            self.private.headers.update(request_headers)
+            request_headers = None
+        self._pace_request(PRIVATE_GRAPHQL_FAMILY)
         url = f"https://{domain or config.API_DOMAIN}/graphql/query"
         try:
-            self.private_requests_count += 1
-            response = self.private.post(url, data=data, proxies=self.private.proxies)
+            self._increment_counter("private_requests_count")
+            if request_headers is None:
+                response = self.private.post(url, data=data, proxies=self.private.proxies)
+            else:
+                response = self.private.post(url, data=data, headers=request_headers, proxies=self.private.proxies)
             self.request_log(response)
             self.last_response = response
             response.raise_for_status()
@@ -394,12 +414,11 @@ class PrivateGraphQLRequestMixin:
         merged["Host"] = domain
         if self.authorization:
             merged.setdefault("Authorization", self.authorization)
-        if self.request_timeout:
-            time.sleep(self.request_timeout)
+        self._pace_request(PRIVATE_GRAPHQL_FAMILY)
         url = f"https://{domain}/graphql_www"
         response = None
         try:
-            self.private_requests_count += 1
+            self._increment_counter("private_requests_count")
             response = self.private.post(url, data=data, headers=merged, proxies=self.private.proxies)
             self.request_log(response)
             self.last_response = response
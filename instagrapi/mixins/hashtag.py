@@ -1,7 +1,8 @@
 import base64
 import json
 import warnings
-from typing import Iterator, List, Literal, Tuple
+from datetime import datetime
+from typing import Callable, Iterator, List, Literal, Optional, Tuple, Union
 
 from instagrapi.exceptions import ClientError, ClientLoginRequired, HashtagNotFound, PrivateError, WrongCursorError
 from instagrapi.extractors import (
@@ -10,14 +11,16 @@ from instagrapi.extractors import (
     extract_media_gql,
     extract_media_v1,
 )
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Hashtag, Media
-from instagrapi.utils.iterators import iter_paginated
+from instagrapi.utils.checkpoints import build_checkpoint
+from instagrapi.utils.iterators import TimeWindow, iter_paginated
 from instagrapi.utils.serialization import dumps
 
 HashtagTab = Literal["top", "recent", "clips"]
 
 
-class HashtagMixin:
+class HashtagMixin(ValidationMixin):
     """
     Helpers for managing Hashtag
     """
@@ -76,7 +79,7 @@ class HashtagMixin:
         data = self.public_graphql_request(variables, query_hash="f92f56d47dc7a55b606908374b43a314")
         if not data.get("hashtag"):
             raise HashtagNotFound(name=name, **data)
-        return extract_hashtag_gql(data["hashtag"])
+        return self._extract(extract_hashtag_gql, data["hashtag"])
 
     def hashtag_info_v1(self, name: str) -> Hashtag:
         """
@@ -94,9 +97,9 @@ class HashtagMixin:
         """
         name = self._normalize_hashtag_name(name)
         result = self.private_request(f"tags/{name}/info/")
-        return extract_hashtag_v1(result)
+        return self._extract(extract_hashtag_v1, result)
 
-    def hashtag_info(self, name: str) -> Hashtag:
+    def hashtag_info(self, name: str, use_cache: bool = True) -> Hashtag:
         """
         Get information about a hashtag
 
@@ -104,6 +107,8 @@ class HashtagMixin:
         ----------
         name: str
             Name of the hashtag
+        use_cache: bool, optional
+            Whether or not to use the persistent cache backend, default value is True
 
         Returns
         -------
@@ -111,7 +116,12 @@ class HashtagMixin:
             An object of Hashtag
         """
         name = self._normalize_hashtag_name(name)
-        return self.hashtag_info_v1(name)
+        hashtag = self._cache_load("hashtags", name, Hashtag) if use_cache else None
+        if hashtag is None:
+            with self._negative_cache("hashtags", name, use_cache):
+                hashtag = self.hashtag_info_v1(name)
+            self._cache_store("hashtags", name, hashtag)
+        return hashtag
 
     def hashtag_medias_v1_chunk(
         self, name: str, max_amount: int = 27, tab_key: HashtagTab = "top", max_id: str = None
@@ -177,7 +187,7 @@ class HashtagMixin:
                 if max_amount and len(medias) >= max_amount:
                     break
                 try:
-                    media = extract_media_v1(node["media"])
+                    media = self._extract(extract_media_v1, node["media"])
                 except (KeyError, AttributeError, TypeError) as exc:
                     self.logger.warning("Skipping malformed hashtag node: %s", exc)
                     continue
@@ -233,7 +243,7 @@ class HashtagMixin:
         medias = []
         for edge in media_edge.get("edges") or []:
             try:
-                medias.append(extract_media_gql(edge["node"]))
+                medias.append(self._extract(extract_media_gql, edge["node"]))
             except (KeyError, AttributeError, TypeError) as exc:
                 self.logger.warning("Skipping malformed hashtag GraphQL node: %s", exc)
         if amount:
@@ -330,6 +340,11 @@ class HashtagMixin:
         amount: int = 0,
         page_size: int = 27,
         tab_key: HashtagTab = "recent",
+        prefetch: int = 0,
+        checkpoint=None,
+        since: Union[datetime, float, None] = None,
+        until: Union[datetime, float, None] = None,
+        predicate: Optional[Callable[[Media], bool]] = None,
     ) -> Iterator[Media]:
         """
         Iterate over medias for a hashtag.
@@ -344,6 +359,18 @@ class HashtagMixin:
             Maximum number of media to fetch per page, default is 27
         tab_key: str, optional
             Tab key: "top", "recent" or "clips", default is "recent". Public GraphQL only supports "recent".
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+        since: datetime | float, optional
+            Skip medias taken before this time and on the "recent" tab stop paginating once
+            only older medias are left
+        until: datetime | float, optional
+            Skip medias taken at or after this time
+        predicate: Callable[[Media], bool], optional
+            Yield only medias for which it returns True; ``amount`` counts yielded medias
 
         Returns
         -------
@@ -355,7 +382,22 @@ class HashtagMixin:
         def fetch_page(end_cursor: str, page_amount: int) -> Tuple[List[Media], str]:
             return self.hashtag_medias_paginated(name, amount=page_amount, tab_key=tab_key, end_cursor=end_cursor)
 
-        return iter_paginated(fetch_page, amount=amount, page_size=page_size, initial_cursor=None)
+        window = None
+        if since is not None or until is not None or predicate is not None:
+            # only the recent tab is newest first, top and clips are ranked
+            window = TimeWindow(since, until, predicate, ordered=tab_key == "recent")
+        checkpoint = build_checkpoint(
+            checkpoint, "hashtag_medias", self.cache_backend, name=name, tab_key=tab_key, since=since, until=until
+        )
+        return iter_paginated(
+            fetch_page,
+            amount=amount,
+            page_size=page_size,
+            initial_cursor=None,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            window=window,
+        )
 
     def hashtag_medias_v1(self, name: str, amount: int = 27, tab_key: HashtagTab = "top") -> List[Media]:
         """
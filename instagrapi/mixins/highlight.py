@@ -8,12 +8,13 @@ from urllib.parse import urlparse
 from instagrapi import config
 from instagrapi.exceptions import HighlightNotFound
 from instagrapi.extractors import extract_highlight_v1
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Highlight
 from instagrapi.utils.serialization import dumps
 from instagrapi.utils.validation import vassert
 
 
-class HighlightMixin:
+class HighlightMixin(ValidationMixin):
     def highlight_pk_from_url(self, url: str) -> str:
         """
         Get Highlight PK from URL
@@ -64,7 +65,7 @@ class HighlightMixin:
             "will_sound_on": random.randint(0, 1),
         }
         result = self.private_request(f"highlights/{user_id}/highlights_tray/", params=params)
-        return [extract_highlight_v1(highlight) for highlight in result.get("tray", [])]
+        return [self._extract(extract_highlight_v1, highlight) for highlight in result.get("tray", [])]
 
     def user_highlights(self, user_id: str, amount: int = 0) -> List[Highlight]:
         """
@@ -110,7 +111,7 @@ class HighlightMixin:
         data = result["reels"]
         if highlight_id not in data:
             raise HighlightNotFound(highlight_pk=highlight_pk, **data)
-        return extract_highlight_v1(data[highlight_id])
+        return self._extract(extract_highlight_v1, data[highlight_id])
 
     def highlight_info(self, highlight_pk: str) -> Highlight:
         """
@@ -170,7 +171,7 @@ class HighlightMixin:
             "media_ids": dumps([self.media_id(sid) for sid in story_ids]),
         }
         result = self.private_request("highlights/create_reel/", data=data)
-        return extract_highlight_v1(result["reel"])
+        return self._extract(extract_highlight_v1, result["reel"])
 
     def highlight_edit(
         self,
@@ -193,7 +194,7 @@ class HighlightMixin:
         if cover:
             data["cover"] = dumps(cover)
         result = self.private_request(f"highlights/highlight:{highlight_pk}/edit_reel/", data=data)
-        return extract_highlight_v1(result["reel"])
+        return self._extract(extract_highlight_v1, result["reel"])
 
     def highlight_change_title(self, highlight_pk: str, title: str) -> Highlight:
         """
@@ -1,7 +1,8 @@
 import time
-from typing import Dict, List, Literal
+from typing import Dict, Iterator, List, Literal, Tuple
 
 from instagrapi.exceptions import ClientError, MediaError, UserError
+from instagrapi.utils.iterators import iter_paginated
 from instagrapi.utils.serialization import json_value
 
 POST_TYPES = ("ALL", "CAROUSEL_V2", "IMAGE", "SHOPPING", "VIDEO")
@@ -84,12 +85,50 @@ class InsightsMixin:
         List[Dict]
             List of dictionaries of response from the call
         """
+        medias = []
+        cursor = None
+        while True:
+            edges, cursor = self.insights_media_feed_chunk(post_type, time_frame, data_ordering, cursor)
+            medias.extend(edges)
+            if not cursor:
+                break
+            if count and len(medias) >= count:
+                break
+            time.sleep(sleep)
+        if count:
+            medias = medias[:count]
+        return medias
+
+    def insights_media_feed_chunk(
+        self,
+        post_type: POST_TYPE = "ALL",
+        time_frame: TIME_FRAME = "TWO_YEARS",
+        data_ordering: DATA_ORDERING = "REACH_COUNT",
+        cursor: str = None,
+    ) -> Tuple[List[Dict], str]:
+        """
+        Get one page of insights for medias from feed
+
+        Parameters
+        ----------
+        post_type: POST_TYPE, optional
+            Types of posts, default is "ALL"
+        time_frame: TIME_FRAME, optional
+            Time frame to pull media insights, default is "TWO_YEARS"
+        data_ordering: DATA_ORDERING, optional
+            Ordering strategy for the data, default is "REACH_COUNT"
+        cursor: str, optional
+            Cursor from the previous page
+
+        Returns
+        -------
+        Tuple[List[Dict], str]
+            Media edges and the cursor of the next page (None on the last page)
+        """
         assert post_type in POST_TYPES, f'Unsupported post_type="{post_type}" {POST_TYPES}'
         assert time_frame in TIME_FRAMES, f'Unsupported time_frame="{time_frame}" {TIME_FRAMES}'
         assert data_ordering in DATA_ORDERS, f'Unsupported data_ordering="{data_ordering}" {DATA_ORDERS}'
         assert self.user_id, "Login required"
-        medias = []
-        cursor = None
         data = {
             "surface": "post_grid",
             "doc_id": 2345520318892697,
@@ -100,7 +139,7 @@ class InsightsMixin:
         }
         query_params = {
             "IgInsightsGridMediaImage_SIZE": 480,
-            "count": 200,  # TODO Try to detect max allowed value
+            "count": self._page_size("insights_media_feed", 200, 500),
             # "cursor": "0",
             "dataOrdering": data_ordering,
             "postType": post_type,
@@ -112,39 +151,75 @@ class InsightsMixin:
                 "id": self.user_id,
             },
         }
-        while True:
-            if cursor:
-                query_params["cursor"] = cursor
-            result = self.private_request(
+        if cursor:
+            query_params["cursor"] = cursor
+        result, query_params["count"] = self._sized_request(
+            "insights_media_feed",
+            query_params["count"],
+            lambda size: self.private_request(
                 "ads/graphql/",
-                self.with_query_params(data, query_params),
-            )
-            if not json_value(
-                result,
-                "data",
-                "shadow_instagram_user",
-                "business_manager",
-                default=None,
-            ):
-                raise UserError("Account is not business account", **self.last_json)
-            stats = json_value(
-                result,
-                "data",
-                "shadow_instagram_user",
-                "business_manager",
-                "top_posts_unit",
-                "top_posts",
-            )
-            cursor = stats["page_info"]["end_cursor"]
-            medias.extend(stats["edges"])
-            if not stats["page_info"]["has_next_page"]:
-                break
-            if count and len(medias) >= count:
-                break
-            time.sleep(sleep)
-        if count:
-            medias = medias[:count]
-        return medias
+                self.with_query_params(data, dict(query_params, count=size)),
+            ),
+        )
+        if not json_value(
+            result,
+            "data",
+            "shadow_instagram_user",
+            "business_manager",
+            default=None,
+        ):
+            raise UserError("Account is not business account", **self.last_json)
+        stats = json_value(
+            result,
+            "data",
+            "shadow_instagram_user",
+            "business_manager",
+            "top_posts_unit",
+            "top_posts",
+        )
+        cursor = stats["page_info"]["end_cursor"] if stats["page_info"]["has_next_page"] else None
+        self._page_received("insights_media_feed", query_params["count"], len(stats["edges"]), bool(cursor))
+        return stats["edges"], cursor
+
+    def iter_insights_media_feed(
+        self,
+        post_type: POST_TYPE = "ALL",
+        time_frame: TIME_FRAME = "TWO_YEARS",
+        data_ordering: DATA_ORDERING = "REACH_COUNT",
+        count: int = 0,
+        sleep: int = 2,
+        prefetch: int = 0,
+    ) -> Iterator[Dict]:
+        """
+        Iterate over insights for all medias from feed, sleeping between pages
+
+        Parameters
+        ----------
+        post_type: POST_TYPE, optional
+            Types of posts, default is "ALL"
+        time_frame: TIME_FRAME, optional
+            Time frame to pull media insights, default is "TWO_YEARS"
+        data_ordering: DATA_ORDERING, optional
+            Ordering strategy for the data, default is "REACH_COUNT"
+        count: int, optional
+            Max media count for retrieving, default is 0
+        sleep: int, optional
+            Timeout between pages iterations, default is 2
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+
+        Returns
+        -------
+        Iterator[Dict]
+            Iterator of media edges from the response
+        """
+
+        def fetch_page(cursor: str, page_amount: int) -> Tuple[List[Dict], str]:
+            if cursor:
+                time.sleep(sleep)
+            return self.insights_media_feed_chunk(post_type, time_frame, data_ordering, cursor)
+
+        return iter_paginated(fetch_page, amount=count, initial_cursor=None, prefetch=prefetch)
 
     """
     Helpers for getting insights for media
@@ -1,16 +1,20 @@
 import base64
 import json
-from typing import List, Literal, Tuple
+from datetime import datetime
+from typing import Callable, Iterator, List, Literal, Optional, Tuple, Union
 
 from instagrapi.exceptions import LocationNotFound, WrongCursorError
 from instagrapi.extractors import extract_guide_v1, extract_location, extract_media_v1
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Guide, Location, Media
+from instagrapi.utils.checkpoints import build_checkpoint
+from instagrapi.utils.iterators import TimeWindow, iter_paginated
 
 tab_keys_v1 = ("ranked", "recent")
 LocationTab = Literal["ranked", "recent"]
 
 
-class LocationMixin:
+class LocationMixin(ValidationMixin):
     """
     Helper class to get location
     """
@@ -43,7 +47,7 @@ class LocationMixin:
             if "lat" not in venue:
                 venue["lat"] = lat
                 venue["lng"] = lng
-            locations.append(extract_location(venue))
+            locations.append(self._extract(extract_location, venue))
         return locations
 
     def location_search_name(self, name: str) -> List[Location]:
@@ -63,7 +67,7 @@ class LocationMixin:
         result = self.top_search(name)
         locations = []
         for place in result.get("places", []):
-            location = extract_location(place)
+            location = self._extract(extract_location, place)
             if location:
                 locations.append(location)
         return locations
@@ -194,7 +198,7 @@ class LocationMixin:
         if not result.get("name"):
             # Sorry, this page isn't available.
             raise LocationNotFound(location_pk=location_pk, **result)
-        return extract_location(result)
+        return self._extract(extract_location, result)
 
     def location_info(self, location_pk: int) -> Location:
         """
@@ -267,7 +271,7 @@ class LocationMixin:
             layout_content = section.get("layout_content") or {}
             nodes = layout_content.get("medias") or []
             for node in nodes:
-                media = extract_media_v1(node["media"])
+                media = self._extract(extract_media_v1, node["media"])
                 medias.append(media)
         return medias, next_max_id
 
@@ -303,6 +307,68 @@ class LocationMixin:
             medias = medias[:amount]
         return medias
 
+    def iter_location_medias(
+        self,
+        location_pk: int,
+        amount: int = 0,
+        tab_key: LocationTab = "ranked",
+        prefetch: int = 0,
+        checkpoint=None,
+        since: Union[datetime, float, None] = None,
+        until: Union[datetime, float, None] = None,
+        predicate: Optional[Callable[[Media], bool]] = None,
+    ) -> Iterator[Media]:
+        """
+        Iterate over medias for a location by Private Mobile API
+
+        Parameters
+        ----------
+        location_pk: int
+            Unique identifier for a location
+        amount: int, optional
+            Maximum number of media to yield, default is 0 (all medias)
+        tab_key: str, optional
+            Tab key: "ranked" or "recent", default is "ranked"
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+        since: datetime | float, optional
+            Skip medias taken before this time and on the "recent" tab stop paginating once
+            only older medias are left
+        until: datetime | float, optional
+            Skip medias taken at or after this time
+        predicate: Callable[[Media], bool], optional
+            Yield only medias for which it returns True; ``amount`` counts yielded medias
+
+        Returns
+        -------
+        Iterator[Media]
+            Iterator of Media objects
+        """
+        assert tab_key in tab_keys_v1, f'You must specify one of the options for "tab_key" {tab_keys_v1}'
+
+        def fetch_page(max_id: str, page_amount: int) -> Tuple[List[Media], str]:
+            return self.location_medias_v1_chunk(location_pk, page_amount, tab_key, max_id)
+
+        window = None
+        if since is not None or until is not None or predicate is not None:
+            # the ranked tab is not newest first, it can only be filtered
+            window = TimeWindow(since, until, predicate, ordered=tab_key == "recent")
+        checkpoint = build_checkpoint(
+            checkpoint,
+            "location_medias_v1",
+            self.cache_backend,
+            location_pk=str(location_pk),
+            tab_key=tab_key,
+            since=since,
+            until=until,
+        )
+        return iter_paginated(
+            fetch_page, amount=amount, initial_cursor=None, prefetch=prefetch, checkpoint=checkpoint, window=window
+        )
+
     def location_medias_top_v1(self, location_pk: int, amount: int = 21) -> List[Media]:
         """
         Get top medias for a location
@@ -390,4 +456,4 @@ class LocationMixin:
         """
         location_pk = int(location_pk)
         result = self.private_request(f"guides/location/{location_pk}/")
-        return [extract_guide_v1(item) for item in (result.get("guides") or [])]
+        return [self._extract(extract_guide_v1, item) for item in (result.get("guides") or [])]
@@ -5,7 +5,7 @@ import time
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from instagrapi.exceptions import (
@@ -27,22 +27,25 @@ from instagrapi.extractors import (
     extract_user_short,
 )
 from instagrapi.mixins.graphql import GQL_STUFF
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Location, Media, Story, StoryMedia, UserShort, Usertag
 from instagrapi.utils.auth import generate_jazoest
+from instagrapi.utils.cache import LRUCache
+from instagrapi.utils.checkpoints import build_checkpoint
 from instagrapi.utils.ids import InstagramIdCodec
-from instagrapi.utils.iterators import iter_paginated
+from instagrapi.utils.iterators import TimeWindow, iter_paginated
 from instagrapi.utils.serialization import dumps, json_value
 
 MEDIA_INFO_DOC_ID = "27128499623469141"
 IG_PROFILE_TIMELINE_DOC_ID = "56030350814417327502004290437"
 
 
-class MediaMixin:
+class MediaMixin(ValidationMixin):
     """
     Helpers for media
     """
 
-    _medias_cache = {}  # pk -> object
+    _medias_cache: LRUCache = None  # pk -> object, bound by Client.set_cache
 
     def _media_share_story_background(self) -> Path:
         temp = tempfile.NamedTemporaryFile(prefix="instagrapi_story_share_", suffix=".jpg", delete=False)
@@ -187,7 +190,7 @@ class MediaMixin:
             media = item.get("media") if isinstance(item, dict) else None
             if not media:
                 continue
-            medias.append(extract_media_v1(self._normalize_xdt_profile_media(media)))
+            medias.append(self._extract(extract_media_v1, self._normalize_xdt_profile_media(media)))
         end_cursor = None
         if timeline.get("more_available"):
             end_cursor = timeline.get("next_max_id") or timeline.get("profile_grid_items_cursor")
@@ -214,7 +217,7 @@ class MediaMixin:
         end_cursor = page_info.get("end_cursor")
         if amount:
             medias = medias[:amount]
-        return ([extract_media_gql(media) for media in medias], end_cursor)
+        return ([self._extract(extract_media_gql, media) for media in medias], end_cursor)
 
     def _extract_configured_media(self, configured):
         media = None
@@ -224,7 +227,7 @@ class MediaMixin:
             media = self.last_json.get("media") if isinstance(self.last_json, dict) else None
         if media is None:
             return None
-        return extract_media_v1(media)
+        return self._extract(extract_media_v1, media)
 
     def _extract_configured_media_or_raise(self, configured, exception_cls, context: str):
         media = self._extract_configured_media(configured)
@@ -341,7 +344,7 @@ class MediaMixin:
                 response=self.last_response,
                 **(self.last_json if isinstance(self.last_json, dict) else {}),
             )
-        return extract_direct_message(message_metadata[0])
+        return self._extract(extract_direct_message, message_metadata[0])
 
     def media_id(self, media_pk: str) -> str:
         """
@@ -593,18 +596,18 @@ class MediaMixin:
             )
             media = data.get("xdt_shortcode_media") or data.get("shortcode_media")
             if media:
-                return extract_media_gql(media)
+                return self._extract(extract_media_gql, media)
             media_items = json_value(data, "xdt_api__v1__media__shortcode__web_info", "items", default=[])
             if not media_items:
                 raise MediaNotFound(media_pk=media_pk, **data)
-            return extract_media_v1(self._normalize_xdt_media_info(media_items[0]))
+            return self._extract(extract_media_v1, self._normalize_xdt_media_info(media_items[0]))
         if not data.get("shortcode_media"):
             raise MediaNotFound(media_pk=media_pk, **data)
         if data["shortcode_media"]["location"] and self.authorization:
             data["shortcode_media"]["location"] = self.location_complete(
-                extract_location(data["shortcode_media"]["location"])
+                self._extract(extract_location, data["shortcode_media"]["location"])
             ).dict()
-        return extract_media_gql(data["shortcode_media"])
+        return self._extract(extract_media_gql, data["shortcode_media"])
 
     def _media_info_public(self, media_pk: str) -> Media:
         try:
@@ -636,7 +639,7 @@ class MediaMixin:
             if "Media not found" in str(e):
                 raise MediaNotFound(e, media_pk=media_pk, **self.last_json)
             raise e
-        return extract_media_v1(result["items"].pop())
+        return self._extract(extract_media_v1, result["items"].pop())
 
     def media_info_v2(self, media_id: str) -> Media:
         """
@@ -669,7 +672,7 @@ class MediaMixin:
         media = result.get("media_or_ad")
         if not media:
             raise MediaNotFound(media_id=media_id, **(self.last_json or {}))
-        return extract_media_v1(media)
+        return self._extract(extract_media_v1, media)
 
     def media_info(self, media_pk: str, use_cache: bool = True) -> Media:
         """
@@ -688,25 +691,32 @@ class MediaMixin:
             An object of Media type
         """
         media_pk = self.media_pk(media_pk)
-        if not use_cache or media_pk not in self._medias_cache:
-            if self._has_private_auth():
-                try:
-                    media = self.media_info_v1(media_pk)
-                except Exception as e:
-                    if not isinstance(e, ClientError):
-                        self.logger.exception(e)  # Register unknown error
-                    media = self._media_info_public(media_pk)
-            else:
-                try:
-                    media = self._media_info_public(media_pk)
-                except Exception as e:
-                    if not isinstance(e, ClientError):
-                        self.logger.exception(e)  # Register unknown error
-                    # Restricted Video: This video is not available in your country.
-                    # Or private account
-                    media = self.media_info_v1(media_pk)
-            self._medias_cache[media_pk] = media
-        return deepcopy(self._medias_cache[media_pk])  # return copy of cache (dict changes protection)
+        media = self._cache_lookup(self._medias_cache, "medias", media_pk, Media) if use_cache else None
+        if media is None:
+            with self._negative_cache("medias", media_pk, use_cache):
+                media = self._coalesce(("media_info", media_pk), self._fetch_media_info, media_pk)
+        return self._cache_hit(media)  # copy or frozen snapshot (dict changes protection)
+
+    def _fetch_media_info(self, media_pk: str) -> Media:
+        if self._has_private_auth():
+            try:
+                media = self.media_info_v1(media_pk)
+            except Exception as e:
+                if not isinstance(e, ClientError):
+                    self.logger.exception(e)  # Register unknown error
+                media = self._media_info_public(media_pk)
+        else:
+            try:
+                media = self._media_info_public(media_pk)
+            except Exception as e:
+                if not isinstance(e, ClientError):
+                    self.logger.exception(e)  # Register unknown error
+                # Restricted Video: This video is not available in your country.
+                # Or private account
+                media = self.media_info_v1(media_pk)
+        media = self._cache_put(self._medias_cache, media_pk, media)
+        self._cache_store("medias", media_pk, media)
+        return media
 
     def media_delete(self, media_id: str) -> bool:
         """
@@ -850,7 +860,7 @@ class MediaMixin:
         Dict
             A dictionary of response from the call
         """
-        return extract_media_oembed(self.private_request(f"oembed?url={url}"))
+        return self._extract(extract_media_oembed, self.private_request(f"oembed?url={url}"))
 
     def media_like(self, media_id: str, revert: bool = False) -> bool:
         """
@@ -1101,7 +1111,7 @@ class MediaMixin:
         next_max_id = self.last_json.get("next_max_id", "")
         if amount:
             medias = medias[:amount]
-        return ([extract_media_v1(media) for media in medias], next_max_id)
+        return ([self._extract(extract_media_v1, media) for media in medias], next_max_id)
 
     def user_videos_chunk_v1(self, user_id: str, end_cursor: str = "") -> Tuple[List[Media], str]:
         """
@@ -1187,7 +1197,7 @@ class MediaMixin:
         next_max_id = self.last_json.get("next_max_id", "")
         if amount:
             medias = medias[:amount]
-        return ([extract_media_v1(media) for media in medias], next_max_id)
+        return ([self._extract(extract_media_v1, media) for media in medias], next_max_id)
 
     def user_medias_chunk_v1(self, user_id: str, end_cursor: str = "") -> Tuple[List[Media], str]:
         """
@@ -1287,7 +1297,17 @@ class MediaMixin:
         """
         return self.user_medias_paginated(user_id, amount=0, end_cursor=end_cursor)
 
-    def iter_user_medias(self, user_id: str, amount: int = 0, page_size: int = 0) -> Iterator[Media]:
+    def iter_user_medias(
+        self,
+        user_id: str,
+        amount: int = 0,
+        page_size: int = 0,
+        prefetch: int = 0,
+        checkpoint=None,
+        since: Union[datetime, float, None] = None,
+        until: Union[datetime, float, None] = None,
+        predicate: Optional[Callable[[Media], bool]] = None,
+    ) -> Iterator[Media]:
         """
         Iterate over a user's media.
 
@@ -1298,6 +1318,17 @@ class MediaMixin:
             Maximum number of media to yield, default is 0 (all medias)
         page_size: int, optional
             Maximum number of media to fetch per page. Default value 0 keeps the endpoint default.
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+        since: datetime | float, optional
+            Skip medias taken before this time and stop paginating once only older medias are left
+        until: datetime | float, optional
+            Skip medias taken at or after this time
+        predicate: Callable[[Media], bool], optional
+            Yield only medias for which it returns True; ``amount`` counts yielded medias
 
         Returns
         -------
@@ -1309,7 +1340,28 @@ class MediaMixin:
         def fetch_page(end_cursor: str, page_amount: int) -> Tuple[List[Media], str]:
             return self.user_medias_paginated(user_id, amount=page_amount, end_cursor=end_cursor)
 
-        return iter_paginated(fetch_page, amount=amount, page_size=page_size, initial_cursor="")
+        def pinned_pks() -> Optional[List[str]]:
+            # pinned medias head the feed whatever their age, they must not end the crawl
+            try:
+                return [media.pk for media in self.user_pinned_medias(user_id)]
+            except ClientError:
+                return None
+
+        window = None
+        if since is not None or until is not None or predicate is not None:
+            window = TimeWindow(since, until, predicate, pinned=pinned_pks)
+        checkpoint = build_checkpoint(
+            checkpoint, "user_medias", self.cache_backend, user_id=user_id, since=since, until=until
+        )
+        return iter_paginated(
+            fetch_page,
+            amount=amount,
+            page_size=page_size,
+            initial_cursor="",
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            window=window,
+        )
 
     def user_pinned_medias(self, user_id) -> List[Media]:
         """
@@ -1338,7 +1390,7 @@ class MediaMixin:
         for media in medias["items"]:
             pinned_user_ids = media.get("timeline_pinned_user_ids") or ()
             if user_id in map(str, pinned_user_ids):
-                pinned_medias.append(extract_media_v1(media))
+                pinned_medias.append(self._extract(extract_media_v1, media))
         return pinned_medias
 
     def user_medias(self, user_id: str, amount: int = 0, sleep: int = 0) -> List[Media]:
@@ -1434,7 +1486,7 @@ class MediaMixin:
         next_max_id = json_value(self.last_json, "paging_info", "max_id", default="")
         if amount:
             medias = medias[:amount]
-        return ([extract_media_v1(media["media"]) for media in medias], next_max_id)
+        return ([self._extract(extract_media_v1, media["media"]) for media in medias], next_max_id)
 
     def user_clips_chunk_v1(self, user_id: str, end_cursor: str = "") -> Tuple[List[Media], str]:
         """
@@ -1547,7 +1599,7 @@ class MediaMixin:
         """
         media_id = self.media_id(media_id)
         result = self.private_request(f"media/{media_id}/likers/")
-        return [extract_user_short(u) for u in result["users"]]
+        return [self._extract(extract_user_short, u) for u in result["users"]]
 
     def media_likers_gql_chunk(self, media_pk: str, end_cursor: str = "") -> List[dict]:
         """
@@ -1572,6 +1624,20 @@ class MediaMixin:
             likers = likers[:amount]
         return likers
 
+    def iter_media_likers_gql(self, media_pk: str, amount: int = 0) -> Iterator[dict]:
+        """
+        Iterate over media likers through the web GraphQL doc_id endpoint.
+
+        The endpoint returns a single page, the iterator only saves callers
+        from special-casing it.
+        """
+        media_pk = self.media_pk(media_pk)
+
+        def fetch_page(cursor: str, page_amount: int) -> Tuple[List[dict], str]:
+            return self.media_likers_gql_chunk(media_pk), None
+
+        return iter_paginated(fetch_page, amount=amount)
+
     def media_archive(self, media_id: str, revert: bool = False) -> bool:
         """
         Archive a media
@@ -1631,7 +1697,7 @@ class MediaMixin:
         items = result.get("items", [])
         if amount:
             items = items[:amount]
-        medias = [extract_media_v1(item.get("media", item)) for item in items]
+        medias = [self._extract(extract_media_v1, item.get("media", item)) for item in items]
         return medias, result.get("max_id") or ""
 
     def archive_medias_v1(self, amount: int = 0) -> List[Media]:
@@ -1662,6 +1728,32 @@ class MediaMixin:
             medias = medias[:amount]
         return medias
 
+    def iter_archive_medias(self, amount: int = 0, prefetch: int = 0, checkpoint=None) -> Iterator[Media]:
+        """
+        Iterate over your archived medias by Private Mobile API
+
+        Parameters
+        ----------
+        amount: int, optional
+            Maximum number of media to yield, default is 0 (all medias)
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+
+        Returns
+        -------
+        Iterator[Media]
+            Iterator of Media objects
+        """
+
+        def fetch_page(end_cursor: str, page_amount: int) -> Tuple[List[Media], str]:
+            return self.archive_medias_paginated_v1(amount=page_amount, end_cursor=end_cursor)
+
+        checkpoint = build_checkpoint(checkpoint, "archive_medias_v1", self.cache_backend, user_id=self.user_id)
+        return iter_paginated(fetch_page, amount=amount, initial_cursor="", prefetch=prefetch, checkpoint=checkpoint)
+
     def archive_medias(self, amount: int = 0) -> List[Media]:
         """
         Get your archived medias
@@ -1720,7 +1812,7 @@ class MediaMixin:
             time.sleep(sleep)
         if amount:
             medias = medias[:amount]
-        return [extract_media_gql(media) for media in medias]
+        return [self._extract(extract_media_gql, media) for media in medias]
 
     def usertag_medias_paginated_gql(
         self, user_id: str, amount: int = 0, sleep: int = 2, end_cursor=None
@@ -1757,7 +1849,7 @@ class MediaMixin:
         medias = [edge["node"] for edge in edges]
         if amount:
             medias = medias[:amount]
-        return [extract_media_gql(media) for media in medias], page_info.get("end_cursor")
+        return [self._extract(extract_media_gql, media) for media in medias], page_info.get("end_cursor")
 
     def usertag_medias_paginated_v1(
         self, user_id: str, amount: int = 0, end_cursor: str = ""
@@ -1784,7 +1876,7 @@ class MediaMixin:
         items = result.get("items", [])
         if amount:
             items = items[:amount]
-        return [extract_media_v1(media) for media in items], result.get("next_max_id") or ""
+        return [self._extract(extract_media_v1, media) for media in items], result.get("next_max_id") or ""
 
     def usertag_medias_v1_chunk(self, user_id: str, max_id: str = "") -> Tuple[List[Media], str]:
         """
@@ -1827,7 +1919,57 @@ class MediaMixin:
             next_max_id = self.last_json.get("next_max_id", "")
         if amount:
             medias = medias[:amount]
-        return [extract_media_v1(media) for media in medias]
+        return [self._extract(extract_media_v1, media) for media in medias]
+
+    def iter_usertag_medias(
+        self,
+        user_id: str,
+        amount: int = 0,
+        prefetch: int = 0,
+        checkpoint=None,
+        since: Union[datetime, float, None] = None,
+        until: Union[datetime, float, None] = None,
+        predicate: Optional[Callable[[Media], bool]] = None,
+    ) -> Iterator[Media]:
+        """
+        Iterate over medias where a user is tagged (by Private Mobile API)
+
+        Parameters
+        ----------
+        user_id: str
+        amount: int, optional
+            Maximum number of media to yield, default is 0 (all medias)
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+        since: datetime | float, optional
+            Skip medias taken before this time and stop paginating once only older medias are left
+        until: datetime | float, optional
+            Skip medias taken at or after this time
+        predicate: Callable[[Media], bool], optional
+            Yield only medias for which it returns True; ``amount`` counts yielded medias
+
+        Returns
+        -------
+        Iterator[Media]
+            Iterator of Media objects
+        """
+        user_id = str(user_id)
+
+        def fetch_page(end_cursor: str, page_amount: int) -> Tuple[List[Media], str]:
+            return self.usertag_medias_paginated_v1(user_id, amount=page_amount, end_cursor=end_cursor)
+
+        window = None
+        if since is not None or until is not None or predicate is not None:
+            window = TimeWindow(since, until, predicate)
+        checkpoint = build_checkpoint(
+            checkpoint, "usertag_medias_v1", self.cache_backend, user_id=user_id, since=since, until=until
+        )
+        return iter_paginated(
+            fetch_page, amount=amount, initial_cursor="", prefetch=prefetch, checkpoint=checkpoint, window=window
+        )
 
     def usertag_medias_paginated(self, user_id: str, amount: int = 0, end_cursor: str = "") -> Tuple[List[Media], str]:
         """
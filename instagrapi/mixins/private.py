@@ -1,8 +1,10 @@
 import json
 import logging
 import random
+import threading
 import time
 from json.decoder import JSONDecodeError
+from typing import Any, Callable, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -42,7 +44,13 @@ from instagrapi.exceptions import (
     VideoTooLongException,
 )
 from instagrapi.utils.auth import generate_signature
-from instagrapi.utils.logging import truncate_log_text
+from instagrapi.utils.circuit import CircuitBreaker, build_circuit_breaker
+from instagrapi.utils.concurrency import RequestLocal, SingleFlight
+from instagrapi.utils.logging import DEFAULT_LOG_TEXT_LIMIT, request_log_record, truncate_log_text
+from instagrapi.utils.pacing import GRAPHQL_FAMILY, PUBLIC_FAMILY, RequestPacer, build_pacer, endpoint_family
+from instagrapi.utils.page_size import PageSizer, build_page_sizer
+from instagrapi.utils.proxy_pool import ProxyPool, build_proxy_pool
+from instagrapi.utils.retry import RetryPolicy, RetryState, build_retry_policy
 from instagrapi.utils.serialization import dumps
 from instagrapi.utils.timing import random_delay
 
@@ -59,6 +67,10 @@ _LOGIN_CONTEXT_REJECTION_HINT = (
     "This can also happen when Instagram rejects the proxy/IP, device fingerprint, "
     "or login context, even if the password is correct."
 )
+_IG_U_DIRECT_REGION_HINT_HASH = "01f7bae7d8b131877d8e0ae1493252280d72f6d0d554447cb1dc9049b6b2c507c08605b7"
+_IG_U_SHBID_HASH = "01f778d9c9f7546cf3722578fbf9b85143cd6e5132723e5c93f40f55ca0459c8ef8a0d9f"
+_IG_U_SHBTS_HASH = "01f7ace11925d0388080078d0282b75b8059844855da27e23c90a362270fddfb3fae7e28"
+_IG_U_RUR_HASH = "01f7f627f9ae4ce2874b2e04463efdb184340968b1b006fa88cb4cc69a942a04201e544c"
 
 
 def _private_message_text(message) -> str:
@@ -131,15 +143,30 @@ class PrivateRequestMixin:
     challenge_code_handler = manual_input_code
     change_password_handler = manual_change_password
     private_request_logger = logging.getLogger("private_request")
+    request_log_sampling = False
+    request_log_sample_rate = 0.0
+    request_log_body_limit = DEFAULT_LOG_TEXT_LIMIT
     request_timeout = 1
     session_retry_total = 3
     session_retry_backoff_factor = 2
     session_retry_statuses = [429, 500, 502, 503, 504]
     domain = config.API_DOMAIN
-    last_response = None
-    last_json = {}
+    last_response = RequestLocal()
+    last_json = RequestLocal({})
+    pacer: RequestPacer = None
+    retry_policy: RetryPolicy = None
+    circuit_breaker: CircuitBreaker = None
+    page_sizer: PageSizer = None
+    proxy_pool: ProxyPool = None
+    proxy_pool_key = None
+    pool_manager = None
+    thread_safe = False
+    request_coalescing = True
 
     def __init__(self, *args, **kwargs):
+        self._state_lock = threading.RLock()
+        self._inflight = SingleFlight()
+        self.thread_safe = bool(kwargs.pop("thread_safe", getattr(self, "thread_safe", False)))
         session = requests.Session()
         self.private = session
         self.private.verify = getattr(self, "tls_verify", True)
@@ -184,10 +211,266 @@ class PrivateRequestMixin:
             )
 
     def _configure_private_session_retry(self):
+        if self.pool_manager is not None:
+            self.pool_manager.mount(self.private, self._build_private_session_retry_strategy(), self.proxy)
+            return
         adapter = HTTPAdapter(max_retries=self._build_private_session_retry_strategy())
         self.private.mount("https://", adapter)
         self.private.mount("http://", adapter)
 
+    def set_pacer(self, pacer=None) -> bool:
+        """
+        Set the request pacer consulted before every private, public and GraphQL request
+
+        Parameters
+        ----------
+        pacer: str | RequestPacer, optional
+            A ``RequestPacer`` instance or a preset name: ``"legacy"`` (default,
+            fixed ``request_timeout`` sleeps), ``"balanced"`` (per-family token
+            buckets) or ``"none"``
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.pacer = build_pacer(pacer, self)
+        return True
+
+    def set_retry_policy(self, policy=None) -> bool:
+        """
+        Set the retry policy used by private, public and GraphQL requests
+
+        Parameters
+        ----------
+        policy: RetryPolicy | dict, optional
+            A ``RetryPolicy`` or its keyword arguments; None restores the default
+            (one jittered retry for request timeouts and incomplete reads)
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.retry_policy = build_retry_policy(policy)
+        return True
+
+    def _retry_state(self, retries: int = None, base_delay: float = None) -> RetryState:
+        if self.retry_policy is None:
+            self.retry_policy = build_retry_policy()
+        return self.retry_policy.begin(retries, base_delay)
+
+    def set_circuit_breaker(self, breaker=None) -> bool:
+        """
+        Set the circuit breaker that fails fast while an endpoint family is throttled
+
+        Parameters
+        ----------
+        breaker: CircuitBreaker | dict | bool, optional
+            A ``CircuitBreaker`` (may be shared between clients), its keyword
+            arguments, ``True`` for the defaults, or None to disable
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.circuit_breaker = build_circuit_breaker(breaker)
+        return True
+
+    def set_page_sizer(self, sizer=None) -> bool:
+        """
+        Set the page sizer that learns the largest page size of list endpoints
+
+        Parameters
+        ----------
+        sizer: PageSizer | dict | bool, optional
+            A ``PageSizer`` (may be shared between clients), its keyword
+            arguments, ``True`` for the defaults, or None to keep the fixed sizes
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.page_sizer = build_page_sizer(sizer)
+        settings = getattr(self, "settings", None) or {}
+        if self.page_sizer is not None and settings.get("page_sizes"):
+            self.page_sizer.restore(settings["page_sizes"])
+        return True
+
+    def _page_size(self, endpoint: str, default: int, maximum: int) -> int:
+        if self.page_sizer is None:
+            return default
+        return self.page_sizer.size(endpoint, default, maximum)
+
+    def _sized_request(self, endpoint: str, requested: int, request: Callable[[int], Any]) -> Tuple[Any, int]:
+        """
+        Call ``request(size)``, return its result and the size it succeeded with
+
+        A request the server rejects for its size is retried with the smaller
+        size the page sizer backs off to, other errors are raised as is.
+        """
+        while True:
+            try:
+                return request(requested), requested
+            except ClientError as e:
+                if self.page_sizer is None or not self.page_sizer.failed(endpoint, requested, e):
+                    raise
+            requested = self.page_sizer.size(endpoint, requested, requested)
+
+    def _page_received(self, endpoint: str, requested: int, received: int, has_more: bool) -> None:
+        if self.page_sizer is not None:
+            self.page_sizer.record(endpoint, requested, received, has_more)
+
+    def set_proxy_pool(self, pool=None, key=None) -> bool:
+        """
+        Take the proxy from a pool and rotate it when the proxy fails
+
+        The client reports the latency and outcome of every private, public and
+        GraphQL request to the pool. When the pool demotes the current proxy
+        (``ProxyAddressIsBlocked``, connection errors, high error rate) the
+        client switches to the proxy the pool assigns next; cookies, device
+        settings and session headers are kept.
+
+        Parameters
+        ----------
+        pool: ProxyPool | list, optional
+            A ``ProxyPool`` (may be shared between clients) or a list of proxy
+            DSNs; None detaches the pool and keeps the current proxy
+        key: Hashable, optional
+            Account key for sticky assignment, default the username (or the client id)
+
+        Returns
+        -------
+        bool
+            True when a proxy was assigned
+        """
+        previous, self.proxy_pool = self.proxy_pool, build_proxy_pool(pool)
+        if previous is not None and self.proxy_pool_key is not None and previous is not self.proxy_pool:
+            previous.release(self.proxy_pool_key)
+        if self.proxy_pool is None:
+            self.proxy_pool_key = None
+            return False
+        self.proxy_pool_key = key if key is not None else getattr(self, "username", None) or f"client-{id(self)}"
+        dsn = self.proxy_pool.assign(self.proxy_pool_key)
+        if dsn is None:
+            return False
+        if dsn != self.proxy:
+            self.set_proxy(dsn)
+        return True
+
+    def _rotate_proxy(self, failed_proxy: str) -> None:
+        with self._state_lock:
+            dsn = self.proxy_pool.rotate(self.proxy_pool_key, failed_proxy)
+            if dsn and dsn != self.proxy:
+                self.logger.warning("Proxy %s demoted, switching to %s", failed_proxy, dsn)
+                self.set_proxy(dsn)
+
+    def _response_elapsed(self, family: str):
+        attr = {PUBLIC_FAMILY: "last_public_response", GRAPHQL_FAMILY: "last_graphql_response"}.get(
+            family, "last_response"
+        )
+        elapsed = getattr(getattr(self, attr, None), "elapsed", None)
+        return elapsed.total_seconds() if hasattr(elapsed, "total_seconds") else None
+
+    def _call_guarded(self, family: str, send, *args, **kwargs):
+        """Send through the circuit breaker and report the outcome to the proxy pool"""
+        breaker, pool, proxy = self.circuit_breaker, self.proxy_pool, self.proxy
+        if breaker is None and (pool is None or not proxy):
+            return send(*args, **kwargs)
+        if breaker is not None:
+            breaker.before(family, proxy)
+        try:
+            result = send(*args, **kwargs)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(family, proxy, e)
+            if pool is not None and proxy and pool.record(proxy, exc=e):
+                self._rotate_proxy(proxy)
+            raise
+        if breaker is not None:
+            breaker.record(family, proxy)
+        if pool is not None and proxy:
+            pool.record(proxy, latency=self._response_elapsed(family))
+        return result
+
+    def _send_private_request_with_retry(self, endpoint, **kwargs):
+        retry = self._retry_state()
+        family = endpoint_family(endpoint)
+        while True:
+            try:
+                return self._call_guarded(family, self._send_private_request, endpoint, **kwargs)
+            except ClientError as e:
+                delay = retry.next_delay(e)
+                if delay is None:
+                    raise
+                self.logger.info("Retry %s in %.2f seconds (%s)", endpoint, delay, e.__class__.__name__)
+                time.sleep(delay)
+
+    def set_thread_safe(self, enabled: bool = True) -> bool:
+        """
+        Allow one client to be shared by several threads
+
+        In thread-safe mode per-request headers are sent with each request
+        instead of being merged into the shared sessions, ``last_json`` and
+        ``last_response`` (and their public/GraphQL equivalents) are
+        thread-local, and request counters and ``mid`` are updated under a lock.
+        Login, challenge resolution and settings changes should still be done
+        before the client is shared.
+
+        Parameters
+        ----------
+        enabled: bool
+            Enable or disable thread-safe mode
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.thread_safe = bool(enabled)
+        return True
+
+    def set_request_coalescing(self, enabled: bool = True) -> bool:
+        """
+        Coalesce concurrent identical entity lookups
+
+        While ``user_info``, ``user_info_by_username``, ``media_info`` or
+        ``story_info`` is fetching an object, other threads asking for the same
+        object wait for that request and share its result instead of sending
+        their own.
+
+        Parameters
+        ----------
+        enabled: bool
+            Enable (default) or disable coalescing
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.request_coalescing = bool(enabled)
+        return True
+
+    def _coalesce(self, key, fn, *args, **kwargs):
+        if not self.request_coalescing:
+            return fn(*args, **kwargs)
+        return self._inflight.do(key, fn, *args, **kwargs)[0]
+
+    def _increment_counter(self, name: str) -> None:
+        if not self.thread_safe:
+            setattr(self, name, getattr(self, name) + 1)
+            return
+        with self._state_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _pace_request(self, family: str) -> float:
+        if self.pacer is None:
+            self.pacer = build_pacer(None, self)
+        return self.pacer.acquire(family)
+
     def small_delay(self):
         """
         Small Delay
@@ -208,24 +491,60 @@ class PrivateRequestMixin:
         """
         time.sleep(random.uniform(0.175, 0.875))
 
-    @property
-    def base_headers(self):
+    def _base_headers_key(self) -> tuple:
+        return (
+            self.user_id,
+            self.locale,
+            self.country,
+            self.bloks_versioning_id,
+            self.uuid,
+            self.phone_id,
+            self.android_device_id,
+            self.timezone_offset,
+            self.app_id,
+            self.user_agent,
+            self.mid,
+            self.domain,
+            self.ig_u_rur,
+            self.ig_www_claim,
+            bool(self.usdid_private_key),
+        )
+
+    def invalidate_base_headers(self) -> bool:
+        """
+        Drop the cached static part of ``base_headers``
+
+        The cache is also rebuilt whenever one of its inputs (locale, device,
+        uuids, user agent, mid, logged in user, ...) changes, so this is only
+        needed after mutating state that ``base_headers`` cannot observe.
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self._base_headers_cache = None
+        return True
+
+    def _build_static_base_headers(self) -> dict:
         locale = self.locale.replace("-", "_")
         accept_language = ["en-US"]
         if locale:
             lang = locale.replace("_", "-")
             if lang not in accept_language:
                 accept_language.insert(0, lang)
+        # Per-request values are filled in by base_headers, the placeholders
+        # keep the header order stable
         headers = {
             "X-IG-App-Locale": locale,
             "X-IG-Device-Locale": locale,
             "X-IG-Mapped-Locale": locale,
-            "X-Pigeon-Session-Id": self.generate_uuid("UFS-", "-1"),
-            "X-Pigeon-Rawclienttime": str(round(time.time(), 3)),
+            "X-Pigeon-Session-Id": None,
+            "X-Pigeon-Rawclienttime": None,
             # "X-IG-Connection-Speed": "-1kbps",
-            "X-IG-Bandwidth-Speed-KBPS": str(random.randint(2500000, 3000000) / 1000),  # "-1.000"
-            "X-IG-Bandwidth-TotalBytes-B": str(random.randint(5000000, 90000000)),  # "0"
-            "X-IG-Bandwidth-TotalTime-MS": str(random.randint(2000, 9000)),  # "0"
+            "X-IG-Bandwidth-Speed-KBPS": None,  # "-1.000"
+            "X-IG-Bandwidth-TotalBytes-B": None,  # "0"
+            "X-IG-Bandwidth-TotalTime-MS": None,  # "0"
             # "X-IG-EU-DC-ENABLED": "true", # <- type of DC? Eu is euro, but we use US
             # "X-IG-Prefetch-Request": "foreground",  # OLD from instabot
             "X-IG-App-Startup-Country": self.country.upper(),
@@ -260,30 +579,17 @@ class PrivateRequestMixin:
             "X-FB-Server-Cluster": "True",
             "IG-INTENDED-USER-ID": str(self.user_id or 0),
             "X-IG-Nav-Chain": "9MV:self_profile:2,ProfileMediaTabFragment:self_profile:3,9Xf:self_following:4",
-            "X-IG-SALT-IDS": str(random.randint(1061162222, 1061262222)),
+            "X-IG-SALT-IDS": None,
         }
         if self.user_id:
-            next_year = time.time() + 31536000  # + 1 year in seconds
             headers.update(
                 {
                     "IG-U-DS-USER-ID": str(self.user_id),
                     # Direct:
-                    "IG-U-IG-DIRECT-REGION-HINT": (
-                        f"LLA,{self.user_id},{next_year}:"
-                        "01f7bae7d8b131877d8e0ae1493252280d72f6d0d554447cb1dc9049b6b2c507c08605b7"
-                    ),
-                    "IG-U-SHBID": (
-                        f"12695,{self.user_id},{next_year}:"
-                        "01f778d9c9f7546cf3722578fbf9b85143cd6e5132723e5c93f40f55ca0459c8ef8a0d9f"
-                    ),
-                    "IG-U-SHBTS": (
-                        f"{int(time.time())},{self.user_id},{next_year}:"
-                        "01f7ace11925d0388080078d0282b75b8059844855da27e23c90a362270fddfb3fae7e28"
-                    ),
-                    "IG-U-RUR": (
-                        f"RVA,{self.user_id},{next_year}:"
-                        "01f7f627f9ae4ce2874b2e04463efdb184340968b1b006fa88cb4cc69a942a04201e544c"
-                    ),
+                    "IG-U-IG-DIRECT-REGION-HINT": None,
+                    "IG-U-SHBID": None,
+                    "IG-U-SHBTS": None,
+                    "IG-U-RUR": None,
                 }
             )
         if self.ig_u_rur:
@@ -291,7 +597,33 @@ class PrivateRequestMixin:
         if self.ig_www_claim:
             headers.update({"X-IG-WWW-Claim": self.ig_www_claim})
         if self.usdid_private_key:
-            headers.update({"X-Meta-Usdid": self.usdid_header()})
+            headers.update({"X-Meta-Usdid": None})
+        return headers
+
+    @property
+    def base_headers(self):
+        key = self._base_headers_key()
+        cache = getattr(self, "_base_headers_cache", None)
+        if cache is None or cache[0] != key:
+            cache = self._base_headers_cache = (key, self._build_static_base_headers())
+        headers = dict(cache[1])
+        now = time.time()
+        headers["X-Pigeon-Session-Id"] = self.generate_uuid("UFS-", "-1")
+        headers["X-Pigeon-Rawclienttime"] = str(round(now, 3))
+        headers["X-IG-Bandwidth-Speed-KBPS"] = str(random.randint(2500000, 3000000) / 1000)
+        headers["X-IG-Bandwidth-TotalBytes-B"] = str(random.randint(5000000, 90000000))
+        headers["X-IG-Bandwidth-TotalTime-MS"] = str(random.randint(2000, 9000))
+        headers["X-IG-SALT-IDS"] = str(random.randint(1061162222, 1061262222))
+        user_id = key[0]
+        if user_id:
+            expires = f",{user_id},{now + 31536000}:"  # + 1 year in seconds
+            headers["IG-U-IG-DIRECT-REGION-HINT"] = "LLA" + expires + _IG_U_DIRECT_REGION_HINT_HASH
+            headers["IG-U-SHBID"] = "12695" + expires + _IG_U_SHBID_HASH
+            headers["IG-U-SHBTS"] = str(int(now)) + expires + _IG_U_SHBTS_HASH
+            if not self.ig_u_rur:
+                headers["IG-U-RUR"] = "RVA" + expires + _IG_U_RUR_HASH
+        if self.usdid_private_key:
+            headers["X-Meta-Usdid"] = self.usdid_header()
         return headers
 
     def private_headers(self, headers=None):
@@ -317,6 +649,7 @@ class PrivateRequestMixin:
             A boolean value
         """
         self.settings["country"] = self.country = str(country)
+        self.invalidate_base_headers()
         return True
 
     def set_country_code(self, country_code: int = 1):
@@ -350,6 +683,7 @@ class PrivateRequestMixin:
         """
         user_agent = (self.settings.get("user_agent") or "").replace(self.locale, locale)
         self.settings["locale"] = self.locale = str(locale)
+        self.invalidate_base_headers()
         self.set_user_agent(user_agent)  # update locale in user_agent
         if "_" in locale:
             self.set_country(locale.rsplit("_", 1)[1])
@@ -389,6 +723,7 @@ class PrivateRequestMixin:
             A boolean value
         """
         self.settings["timezone_offset"] = self.timezone_offset = int(seconds)
+        self.invalidate_base_headers()
         self.set_timezone_name(
             self._timezone_name_from_offset(self.timezone_offset) if timezone_name is None else timezone_name
         )
@@ -401,16 +736,35 @@ class PrivateRequestMixin:
 
     def set_ig_u_rur(self, value):
         self.settings["ig_u_rur"] = self.ig_u_rur = value
+        self.invalidate_base_headers()
         return True
 
     def set_ig_www_claim(self, value):
         self.settings["ig_www_claim"] = self.ig_www_claim = value
+        self.invalidate_base_headers()
         return True
 
     @staticmethod
     def with_query_params(data, params):
         return dict(data, **{"query_params": json.dumps(params, separators=(",", ":"))})
 
+    @staticmethod
+    def _private_api_url(endpoint: str, domain: str = None):
+        if not endpoint.startswith("/"):
+            endpoint = f"/v1/{endpoint}"
+        if endpoint == "/challenge/":  # wow so hard, is it safe tho?
+            endpoint = "/v1/challenge/"
+        return endpoint, f"https://{domain or config.API_DOMAIN}/api{endpoint}"
+
+    @staticmethod
+    def _private_request_body(data, with_signature: bool = True, extra_sig=None):
+        if with_signature:
+            # Client.direct_answer doesn't need a signature
+            data = generate_signature(dumps(data))
+            if extra_sig:
+                data += "&".join(extra_sig)
+        return data
+
     def _send_private_request(
         self,
         endpoint,
@@ -424,36 +778,34 @@ class PrivateRequestMixin:
     ):
         self.last_response = None
         self.last_json = last_json = {}  # for Sentry context in traceback
-        self.private.headers.update(self.base_headers)
         # Per-request overrides (caller headers such as X-FB-Friendly-Name, and the
         # Host override used for domain routing) must not be merged into the
         # persistent session headers: doing so leaks e.g. a Bloks async-action
         # friendly name onto every later unrelated request. Send them per-request.
-        request_headers = dict(headers) if headers else {}
+        if self.thread_safe:
+            request_headers = self.base_headers
+            if headers:
+                request_headers.update(headers)
+        else:
+            self.private.headers.update(self.base_headers)
+            request_headers = dict(headers) if headers else {}
         if domain:
             request_headers["Host"] = domain
+        # Content-Type is per request so concurrent GETs and POSTs do not race on the session
+        has_content_type = any(key.lower() == "content-type" for key in request_headers)
         if not login:
-            time.sleep(self.request_timeout)
+            self._pace_request(endpoint_family(endpoint))
         # if self.user_id and login:
         #     raise Exception(f"User already logged ({self.user_id})")
         try:
-            if not endpoint.startswith("/"):
-                endpoint = f"/v1/{endpoint}"
-
-            if endpoint == "/challenge/":  # wow so hard, is it safe tho?
-                endpoint = "/v1/challenge/"
-
-            api_url = f"https://{domain or config.API_DOMAIN}/api{endpoint}"
+            endpoint, api_url = self._private_api_url(endpoint, domain)
             self.logger.info(api_url)
             if data:  # POST
                 # Client.direct_answer raw dict
                 # data = json.dumps(data)
-                self.private.headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
-                if with_signature:
-                    # Client.direct_answer doesn't need a signature
-                    data = generate_signature(dumps(data))
-                    if extra_sig:
-                        data += "&".join(extra_sig)
+                if not has_content_type:
+                    request_headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
+                data = self._private_request_body(data, with_signature, extra_sig)
                 response = self.private.post(
                     api_url,
                     data=data,
@@ -462,159 +814,179 @@ class PrivateRequestMixin:
                     proxies=self.private.proxies,
                 )
             else:  # GET
-                self.private.headers.pop("Content-Type", None)
+                if not has_content_type:
+                    # None drops a Content-Type left on the session by older code
+                    request_headers["Content-Type"] = None
                 response = self.private.get(
                     api_url,
                     params=params,
                     headers=request_headers or None,
                     proxies=self.private.proxies,
                 )
-            self.logger.debug(
-                "private_request %s: %s (%s)",
-                response.status_code,
-                response.url,
-                response.text,
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                # response.text decodes the whole body, skip it unless it is logged
+                self.logger.debug(
+                    "private_request %s: %s (%s)",
+                    response.status_code,
+                    response.url,
+                    response.text,
+                )
             mid = response.headers.get("ig-set-x-mid")
             if mid:
-                self.mid = mid
+                with self._state_lock:
+                    self.mid = mid
             self.request_log(response)
             self.last_response = response
             response.raise_for_status()
             # last_json - for Sentry context in traceback
             self.last_json = last_json = response.json()
-            self.logger.debug("last_json %s", last_json)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("last_json %s", last_json)
         except JSONDecodeError as e:
-            self.logger.error(
-                "Status %s: JSONDecodeError in private_request (user_id=%s, endpoint=%s) >>> %s",
-                response.status_code,
-                self.user_id,
-                endpoint,
-                truncate_log_text(response.text),
-            )
-            raise ClientJSONDecodeError(
-                "JSONDecodeError {0!s} while opening {1!s}".format(e, response.url),
-                response=response,
-            )
+            self._raise_private_json_decode_error(e, response, endpoint)
         except requests.HTTPError as e:
             try:
                 self.last_json = last_json = response.json()
             except ValueError:
                 pass
-            message = last_json.get("message", "")
-            if "Please wait a few minutes" in message:
-                raise PleaseWaitFewMinutes(e, response=e.response, **last_json)
-            if e.response.status_code == 403:
-                if message == "login_required":
-                    raise LoginRequired(response=e.response, **last_json)
-                if len(e.response.text) < 512:
-                    last_json["message"] = e.response.text
-                raise ClientForbiddenError(e, response=e.response, **last_json)
-            elif e.response.status_code == 400:
-                error_type = last_json.get("error_type")
-                if last_json.get("two_factor_info"):
-                    if not last_json.get("message"):
-                        last_json["message"] = "Two-factor authentication required"
-                        if last_json.get("error_type") != "two_factor_required":
-                            self.logger.info(
-                                "Changing error_type from %s to two_factor_required due to presence of two_factor_info",
-                                last_json.get("error_type"),
-                            )
-                        last_json["error_type"] = "two_factor_required"
-                    raise TwoFactorRequired(**last_json)
-                elif message == "challenge_required":
-                    challenge = last_json.get("challenge") or {}
-                    if "/suspended/" in (challenge.get("url") or ""):
-                        raise AccountSuspended(**last_json)
-                    raise ChallengeRequired(**last_json)
-                elif message == "feedback_required":
-                    raise FeedbackRequired(
-                        **dict(
-                            last_json,
-                            message="%s: %s" % (message, last_json.get("feedback_message")),
-                        )
-                    )
-                elif error_type == "sentry_block":
-                    raise SentryBlock(**last_json)
-                elif error_type == "rate_limit_error":
-                    raise RateLimitError(**last_json)
-                elif error_type == "bad_password":
-                    last_json["message"] = " ".join(
-                        part
-                        for part in (
-                            last_json.get("message") or "Instagram rejected the login credentials.",
-                            _LOGIN_CONTEXT_REJECTION_HINT,
-                        )
-                        if part
-                    )
-                    raise BadPassword(**last_json)
-                elif error_type == "two_factor_required":
-                    if not last_json["message"]:
-                        last_json["message"] = "Two-factor authentication required"
-                    raise TwoFactorRequired(**last_json)
-                elif _is_account_contact_point_required(endpoint, message):
-                    raise AccountContactPointRequired(e, response=e.response, **last_json)
-                elif _is_account_edit_error(endpoint):
-                    raise AccountEditError(e, response=e.response, **last_json)
-                elif _is_direct_message_requests_disabled(endpoint, message):
-                    raise DirectMessageRequestsDisabled(e, response=e.response, **last_json)
-                elif "VideoTooLongException" in message:
-                    raise VideoTooLongException(e, response=e.response, **last_json)
-                elif "Not authorized to view user" in message:
-                    raise PrivateAccount(e, response=e.response, **last_json)
-                elif "Invalid target user" in message:
-                    raise InvalidTargetUser(e, response=e.response, **last_json)
-                elif "Invalid media_id" in message:
-                    raise InvalidMediaId(e, response=e.response, **last_json)
-                elif "Media is unavailable" in message or "Media not found or unavailable" in message:
-                    raise MediaUnavailable(e, response=e.response, **last_json)
-                elif "has been deleted" in message:
-                    # Sorry, this photo has been deleted.
-                    raise MediaUnavailable(e, response=e.response, **last_json)
-                elif "unable to fetch followers" in message:
-                    # returned when user not found
-                    raise UserNotFound(e, response=e.response, **last_json)
-                elif "The username you entered" in message:
-                    # The username you entered doesn't appear to belong to an account.
-                    # Please check your username and try again.
-                    last_json["message"] = (
-                        "Instagram has blocked your IP address, use a quality proxy provider (not free, not shared)"
-                    )
-                    raise ProxyAddressIsBlocked(**last_json)
-                elif error_type or message:
-                    raise UnknownError(**last_json)
-                # TODO: Handle last_json with {'message': 'counter get error', 'status': 'fail'}
-                self.logger.exception(e)
-                self.logger.warning(
-                    "Status 400: %s",
-                    message or "Empty response message. Maybe enabled Two-factor auth?",
-                )
-                raise ClientBadRequestError(e, response=e.response, **last_json)
-            elif e.response.status_code == 429:
-                self.logger.warning("Status 429: Too many requests")
-                raise ClientThrottledError(e, response=e.response, **last_json)
-            elif e.response.status_code == 401:
-                self.logger.warning("Status 401: Unauthorized %s", endpoint)
-                raise ClientUnauthorizedError(e, response=e.response, **last_json)
-            elif e.response.status_code == 404:
-                if e.response.content == b"Not Found":
-                    # Masked challenge (often on /media/.../comments/) — IG
-                    # returns the bare body "Not Found" instead of a JSON
-                    # challenge envelope. Surface it as ChallengeRequired so
-                    # callers can resolve it instead of treating the resource
-                    # as missing.
-                    self.logger.warning("Status 404 (masked challenge): %s", endpoint)
-                    raise ChallengeRequired(**last_json)
-                self.logger.warning("Status 404: Endpoint %s does not exist", endpoint)
-                raise ClientNotFoundError(e, response=e.response, **last_json)
-            elif e.response.status_code == 408:
-                self.logger.warning("Status 408: Request Timeout")
-                raise ClientRequestTimeout(e, response=e.response, **last_json)
-            raise ClientError(e, response=e.response, **last_json)
+            self._raise_private_http_error(e, e.response, endpoint, last_json)
         except requests.exceptions.ChunkedEncodingError as e:
             raise ClientIncompleteReadError("{} {}".format(e.__class__.__name__, str(e))) from e
         except requests.ConnectionError as e:
             raise ClientConnectionError("{e.__class__.__name__} {e}".format(e=e))
+        return self._check_private_response_json(endpoint, response, last_json)
+
+    def _raise_private_json_decode_error(self, e, response, endpoint):
+        self.logger.error(
+            "Status %s: JSONDecodeError in private_request (user_id=%s, endpoint=%s) >>> %s",
+            response.status_code,
+            self.user_id,
+            endpoint,
+            truncate_log_text(response.text),
+        )
+        raise ClientJSONDecodeError(
+            "JSONDecodeError {0!s} while opening {1!s}".format(e, response.url),
+            response=response,
+        )
+
+    def _raise_private_http_error(self, e, response, endpoint, last_json):
+        """Map a failed private API response to a typed exception. Always raises.
+
+        Shared by the sync sender and ``AsyncClient`` so both classify errors
+        the same way; ``response`` only needs ``status_code``, ``text`` and ``content``.
+        """
+        message = last_json.get("message", "")
+        if "Please wait a few minutes" in message:
+            raise PleaseWaitFewMinutes(e, response=response, **last_json)
+        if response.status_code == 403:
+            if message == "login_required":
+                raise LoginRequired(response=response, **last_json)
+            if len(response.text) < 512:
+                last_json["message"] = response.text
+            raise ClientForbiddenError(e, response=response, **last_json)
+        elif response.status_code == 400:
+            error_type = last_json.get("error_type")
+            if last_json.get("two_factor_info"):
+                if not last_json.get("message"):
+                    last_json["message"] = "Two-factor authentication required"
+                    if last_json.get("error_type") != "two_factor_required":
+                        self.logger.info(
+                            "Changing error_type from %s to two_factor_required due to presence of two_factor_info",
+                            last_json.get("error_type"),
+                        )
+                    last_json["error_type"] = "two_factor_required"
+                raise TwoFactorRequired(**last_json)
+            elif message == "challenge_required":
+                challenge = last_json.get("challenge") or {}
+                if "/suspended/" in (challenge.get("url") or ""):
+                    raise AccountSuspended(**last_json)
+                raise ChallengeRequired(**last_json)
+            elif message == "feedback_required":
+                raise FeedbackRequired(
+                    **dict(
+                        last_json,
+                        message="%s: %s" % (message, last_json.get("feedback_message")),
+                    )
+                )
+            elif error_type == "sentry_block":
+                raise SentryBlock(**last_json)
+            elif error_type == "rate_limit_error":
+                raise RateLimitError(**last_json)
+            elif error_type == "bad_password":
+                last_json["message"] = " ".join(
+                    part
+                    for part in (
+                        last_json.get("message") or "Instagram rejected the login credentials.",
+                        _LOGIN_CONTEXT_REJECTION_HINT,
+                    )
+                    if part
+                )
+                raise BadPassword(**last_json)
+            elif error_type == "two_factor_required":
+                if not last_json["message"]:
+                    last_json["message"] = "Two-factor authentication required"
+                raise TwoFactorRequired(**last_json)
+            elif _is_account_contact_point_required(endpoint, message):
+                raise AccountContactPointRequired(e, response=response, **last_json)
+            elif _is_account_edit_error(endpoint):
+                raise AccountEditError(e, response=response, **last_json)
+            elif _is_direct_message_requests_disabled(endpoint, message):
+                raise DirectMessageRequestsDisabled(e, response=response, **last_json)
+            elif "VideoTooLongException" in message:
+                raise VideoTooLongException(e, response=response, **last_json)
+            elif "Not authorized to view user" in message:
+                raise PrivateAccount(e, response=response, **last_json)
+            elif "Invalid target user" in message:
+                raise InvalidTargetUser(e, response=response, **last_json)
+            elif "Invalid media_id" in message:
+                raise InvalidMediaId(e, response=response, **last_json)
+            elif "Media is unavailable" in message or "Media not found or unavailable" in message:
+                raise MediaUnavailable(e, response=response, **last_json)
+            elif "has been deleted" in message:
+                # Sorry, this photo has been deleted.
+                raise MediaUnavailable(e, response=response, **last_json)
+            elif "unable to fetch followers" in message:
+                # returned when user not found
+                raise UserNotFound(e, response=response, **last_json)
+            elif "The username you entered" in message:
+                # The username you entered doesn't appear to belong to an account.
+                # Please check your username and try again.
+                last_json["message"] = (
+                    "Instagram has blocked your IP address, use a quality proxy provider (not free, not shared)"
+                )
+                raise ProxyAddressIsBlocked(**last_json)
+            elif error_type or message:
+                raise UnknownError(**last_json)
+            # TODO: Handle last_json with {'message': 'counter get error', 'status': 'fail'}
+            self.logger.exception(e)
+            self.logger.warning(
+                "Status 400: %s",
+                message or "Empty response message. Maybe enabled Two-factor auth?",
+            )
+            raise ClientBadRequestError(e, response=response, **last_json)
+        elif response.status_code == 429:
+            self.logger.warning("Status 429: Too many requests")
+            raise ClientThrottledError(e, response=response, **last_json)
+        elif response.status_code == 401:
+            self.logger.warning("Status 401: Unauthorized %s", endpoint)
+            raise ClientUnauthorizedError(e, response=response, **last_json)
+        elif response.status_code == 404:
+            if response.content == b"Not Found":
+                # Masked challenge (often on /media/.../comments/) — IG
+                # returns the bare body "Not Found" instead of a JSON
+                # challenge envelope. Surface it as ChallengeRequired so
+                # callers can resolve it instead of treating the resource
+                # as missing.
+                self.logger.warning("Status 404 (masked challenge): %s", endpoint)
+                raise ChallengeRequired(**last_json)
+            self.logger.warning("Status 404: Endpoint %s does not exist", endpoint)
+            raise ClientNotFoundError(e, response=response, **last_json)
+        elif response.status_code == 408:
+            self.logger.warning("Status 408: Request Timeout")
+            raise ClientRequestTimeout(e, response=response, **last_json)
+        raise ClientError(e, response=response, **last_json)
+
+    def _check_private_response_json(self, endpoint, response, last_json):
         if last_json.get("status") == "fail":
             message = last_json.get("message", "")
             if _is_account_contact_point_required(endpoint, message):
@@ -638,19 +1010,73 @@ class PrivateRequestMixin:
         return last_json
 
     def request_log(self, response):
-        self.private_request_logger.info(
-            "%s [%s] %s %s (%s)",
+        logger = self.private_request_logger
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        device_settings = self.device_settings
+        if self.request_log_sampling:
+            logger.info(
+                "%s [%s] %s %s",
+                self.username,
+                response.status_code,
+                response.request.method,
+                response.url,
+                extra={
+                    "request": request_log_record(
+                        response,
+                        self.request_log_sample_rate,
+                        self.request_log_body_limit,
+                        username=self.username,
+                        app_version=device_settings.get("app_version"),
+                        device="{} {}".format(device_settings.get("manufacturer"), device_settings.get("model")),
+                    )
+                },
+            )
+            return
+        logger.info(
+            "%s [%s] %s %s (%s, %s %s)",
             self.username,
             response.status_code,
             response.request.method,
             response.url,
-            "{app_version}, {manufacturer} {model}".format(
-                app_version=self.device_settings.get("app_version"),
-                manufacturer=self.device_settings.get("manufacturer"),
-                model=self.device_settings.get("model"),
-            ),
+            device_settings.get("app_version"),
+            device_settings.get("manufacturer"),
+            device_settings.get("model"),
         )
 
+    def set_request_log_sampling(
+        self, enabled: bool = True, sample_rate: float = 0.0, body_limit: int = DEFAULT_LOG_TEXT_LIMIT
+    ) -> bool:
+        """
+        Switch ``request_log`` to structured records with sampled body excerpts
+
+        Every record gets a ``request`` attribute (``method``, ``url``, ``status``,
+        ``elapsed_ms``, ``username``, ``app_version``, ``device``) for JSON log
+        formatters. A truncated ``body`` is added for error responses and for a
+        ``sample_rate`` fraction of successful ones.
+
+        Parameters
+        ----------
+        enabled: bool
+            Use structured records, ``False`` restores the plain one-line log
+        sample_rate: float
+            Fraction (0..1) of successful responses whose body excerpt is logged
+        body_limit: int
+            Maximum number of body characters per excerpt
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        sample_rate = float(sample_rate)
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.request_log_sampling = bool(enabled)
+        self.request_log_sample_rate = sample_rate
+        self.request_log_body_limit = int(body_limit)
+        return True
+
     def private_request(
         self,
         endpoint,
@@ -679,16 +1105,8 @@ class PrivateRequestMixin:
         try:
             if self.delay_range:
                 random_delay(delay_range=self.delay_range)
-            self.private_requests_count += 1
-            self._send_private_request(endpoint, **kwargs)
-        except ClientRequestTimeout:
-            self.logger.info("Wait 60 seconds and try one more time (ClientRequestTimeout)")
-            time.sleep(60)
-            return self._send_private_request(endpoint, **kwargs)
-        except ClientIncompleteReadError:
-            self.logger.info("Wait 2 seconds and try one more time (ClientIncompleteReadError)")
-            time.sleep(2)
-            return self._send_private_request(endpoint, **kwargs)
+            self._increment_counter("private_requests_count")
+            self._send_private_request_with_retry(endpoint, **kwargs)
         # except BadPassword as e:
         #     raise e
         except Exception as e:
@@ -701,5 +1119,5 @@ class PrivateRequestMixin:
             if login and self.user_id:
                 # After challenge resolve return last_json
                 return self.last_json
-            return self._send_private_request(endpoint, **kwargs)
+            return self._call_guarded(endpoint_family(endpoint), self._send_private_request, endpoint, **kwargs)
         return self.last_json
@@ -16,6 +16,7 @@ from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
 from instagrapi.exceptions import (
+    CircuitOpenError,
     ClientBadRequestError,
     ClientConnectionError,
     ClientError,
@@ -28,7 +29,9 @@ from instagrapi.exceptions import (
     ClientThrottledError,
     ClientUnauthorizedError,
 )
+from instagrapi.utils.concurrency import RequestLocal
 from instagrapi.utils.logging import truncate_log_text
+from instagrapi.utils.pacing import PUBLIC_FAMILY
 from instagrapi.utils.timing import random_delay
 
 PublicTransport = Literal["requests", "curl"]
@@ -41,8 +44,8 @@ class PublicRequestMixin:
     PUBLIC_API_URL = "https://www.instagram.com/"
     GRAPHQL_PUBLIC_API_URL = "https://www.instagram.com/graphql/query/"
     GRAPHQL_PUBLIC_WEB_API_URL = "https://www.instagram.com/api/graphql"
-    last_public_response = None
-    last_public_json = {}
+    last_public_response = RequestLocal()
+    last_public_json = RequestLocal({})
     public_request_logger = logging.getLogger("public_request")
     request_timeout = 1
     public_request_retries_count = 3
@@ -62,6 +65,7 @@ class PublicRequestMixin:
         "(KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
     }
     public_accept_language = "en-US"
+    pool_manager = None
 
     def __init__(self, *args, **kwargs):
         session = requests.Session()
@@ -166,6 +170,9 @@ class PublicRequestMixin:
                     "curl public transport requires the optional curl extra: pip install instagrapi[curl]"
                 ) from exc
             adapter = CurlCffiAdapter(impersonate_browser_type=self.public_transport_impersonate)
+        elif self.pool_manager is not None:
+            self.pool_manager.mount(self.public, self._build_public_session_retry_strategy(), self.proxy)
+            return
         else:
             adapter = HTTPAdapter(max_retries=self._build_public_session_retry_strategy())
         self.public.mount("https://", adapter)
@@ -195,7 +202,7 @@ class PublicRequestMixin:
             The raw response. Status code typically 200 / 301 / 302 /
             307 / 308.
         """
-        self.public_requests_count += 1
+        self._increment_counter("public_requests_count")
         return self.public.head(
             url,
             allow_redirects=follow_redirects,
@@ -224,12 +231,16 @@ class PublicRequestMixin:
         retries_timeout = self.public_request_retries_timeout if retries_timeout is None else retries_timeout
         assert retries_count <= 10, "Retries count is too high"
         assert retries_timeout <= 600, "Retries timeout is too high"
+        retry = self._retry_state(retries_count - 1, retries_timeout)
         for iteration in range(retries_count):
             try:
                 if self.delay_range:
                     random_delay(delay_range=self.delay_range)
-                return self._send_public_request(url, update_headers=update_headers, **kwargs)
+                return self._call_guarded(
+                    PUBLIC_FAMILY, self._send_public_request, url, update_headers=update_headers, **kwargs
+                )
             except (
+                CircuitOpenError,
                 ClientLoginRequired,
                 ClientNotFoundError,
                 ClientBadRequestError,
@@ -248,10 +259,10 @@ class PublicRequestMixin:
                     )
                 ):
                     raise e
-                if retries_count > iteration + 1:
-                    time.sleep(retries_timeout)
-                else:
+                delay = retry.next_delay(e)
+                if delay is None:
                     raise e
+                time.sleep(delay)
                 continue
 
     def _send_public_request(
@@ -265,17 +276,17 @@ class PublicRequestMixin:
         timeout=None,
         update_headers=None,
     ):
-        self.public_requests_count += 1
+        self._increment_counter("public_requests_count")
         per_request_headers = None
         if headers:
-            if update_headers in [None, True]:
+            if update_headers is None:
+                # Shared clients must not leak one caller's headers into another's request
+                update_headers = not self.thread_safe
+            if update_headers is True:
                 self.public.headers.update(headers)
             elif update_headers is False:
                 per_request_headers = headers
-        if self.last_response_ts and (time.time() - self.last_response_ts) < 1.0:
-            time.sleep(1.0)
-        if self.request_timeout:
-            time.sleep(self.request_timeout)
+        self._pace_request(PUBLIC_FAMILY)
         try:
             if data is not None:  # POST
                 response = self.public.post(
@@ -324,38 +335,44 @@ class PublicRequestMixin:
             return response.text
 
         except JSONDecodeError as e:
-            if "/login/" in response.url or "/challenge/" in response.url:
-                raise ClientLoginRequired(e, response=response)
-
-            self.public_request_logger.error(
-                "Status %s: JSONDecodeError in public_request (url=%s) >>> %s",
-                response.status_code,
-                response.url,
-                truncate_log_text(response.text),
-            )
-            raise ClientJSONDecodeError(
-                "JSONDecodeError {0!s} while opening {1!s}".format(e, url),
-                response=response,
-            )
+            self._raise_public_json_decode_error(e, response, url)
         except requests.HTTPError as e:
-            if e.response.status_code == 401:
-                # HTTPError: 401 Client Error: Unauthorized for url: https://i.instagram.com/api/v1/users....
-                raise ClientUnauthorizedError(e, response=e.response)
-            elif e.response.status_code == 403:
-                raise ClientForbiddenError(e, response=e.response)
-            elif e.response.status_code == 400:
-                raise ClientBadRequestError(e, response=e.response)
-            elif e.response.status_code == 429:
-                raise ClientThrottledError(e, response=e.response)
-            elif e.response.status_code == 404:
-                raise ClientNotFoundError(e, response=e.response)
-            raise ClientError(e, response=e.response)
-
+            self._raise_public_http_error(e, e.response)
         except requests.ConnectionError as e:
             raise ClientConnectionError("{} {}".format(e.__class__.__name__, str(e)))
         finally:
             self.last_response_ts = time.time()
 
+    def _raise_public_json_decode_error(self, e, response, url):
+        if "/login/" in str(response.url) or "/challenge/" in str(response.url):
+            raise ClientLoginRequired(e, response=response)
+
+        self.public_request_logger.error(
+            "Status %s: JSONDecodeError in public_request (url=%s) >>> %s",
+            response.status_code,
+            response.url,
+            truncate_log_text(response.text),
+        )
+        raise ClientJSONDecodeError(
+            "JSONDecodeError {0!s} while opening {1!s}".format(e, url),
+            response=response,
+        )
+
+    @staticmethod
+    def _raise_public_http_error(e, response):
+        if response.status_code == 401:
+            # HTTPError: 401 Client Error: Unauthorized for url: https://i.instagram.com/api/v1/users....
+            raise ClientUnauthorizedError(e, response=response)
+        elif response.status_code == 403:
+            raise ClientForbiddenError(e, response=response)
+        elif response.status_code == 400:
+            raise ClientBadRequestError(e, response=response)
+        elif response.status_code == 429:
+            raise ClientThrottledError(e, response=response)
+        elif response.status_code == 404:
+            raise ClientNotFoundError(e, response=response)
+        raise ClientError(e, response=response)
+
     def _expected_content_length(self, response) -> Optional[int]:
         content_length = response.headers.get("Content-Length")
         if not content_length:
@@ -397,15 +414,8 @@ class PublicRequestMixin:
         )
         return content
 
-    def public_graphql_request(
-        self,
-        variables,
-        query_hash=None,
-        query_id=None,
-        data=None,
-        params=None,
-        headers=None,
-    ):
+    @staticmethod
+    def _public_graphql_params(variables, query_hash=None, query_id=None, params=None):
         assert query_id or query_hash, "Must provide valid one of: query_id, query_hash"
         default_params = {"variables": json.dumps(variables, separators=(",", ":"))}
         if query_id:
@@ -418,7 +428,47 @@ class PublicRequestMixin:
             params.update(default_params)
         else:
             params = default_params
+        return params
+
+    @staticmethod
+    def _public_graphql_data(body_json):
+        if body_json.get("status", None) != "ok":
+            raise ClientGraphqlError(
+                "Unexpected status '{}' in response. Message: '{}'".format(
+                    body_json.get("status", None), body_json.get("message", None)
+                )
+            )
 
+        if "data" not in body_json:
+            errors = body_json.get("errors") or []
+            summary = errors[0].get("summary") if errors else None
+            description = errors[0].get("description") if errors else None
+            raise ClientGraphqlError(
+                "Missing 'data' in GraphQL response. Summary: '{}'. Description: '{}'".format(summary, description)
+            )
+
+        return body_json["data"]
+
+    @staticmethod
+    def _public_graphql_bad_request(e):
+        message = None
+        try:
+            body_json = e.response.json()
+            message = body_json.get("message", None)
+        except JSONDecodeError:
+            pass
+        return ClientGraphqlError("Error: '{}'. Message: '{}'".format(e, message), response=e.response)
+
+    def public_graphql_request(
+        self,
+        variables,
+        query_hash=None,
+        query_id=None,
+        data=None,
+        params=None,
+        headers=None,
+    ):
+        params = self._public_graphql_params(variables, query_hash, query_id, params)
         try:
             body_json = self.public_request(
                 self.GRAPHQL_PUBLIC_API_URL,
@@ -427,32 +477,9 @@ class PublicRequestMixin:
                 headers=headers,
                 return_json=True,
             )
-
-            if body_json.get("status", None) != "ok":
-                raise ClientGraphqlError(
-                    "Unexpected status '{}' in response. Message: '{}'".format(
-                        body_json.get("status", None), body_json.get("message", None)
-                    )
-                )
-
-            if "data" not in body_json:
-                errors = body_json.get("errors") or []
-                summary = errors[0].get("summary") if errors else None
-                description = errors[0].get("description") if errors else None
-                raise ClientGraphqlError(
-                    "Missing 'data' in GraphQL response. Summary: '{}'. Description: '{}'".format(summary, description)
-                )
-
-            return body_json["data"]
-
+            return self._public_graphql_data(body_json)
         except ClientBadRequestError as e:
-            message = None
-            try:
-                body_json = e.response.json()
-                message = body_json.get("message", None)
-            except JSONDecodeError:
-                pass
-            raise ClientGraphqlError("Error: '{}'. Message: '{}'".format(e, message), response=e.response)
+            raise self._public_graphql_bad_request(e)
 
     @staticmethod
     def _extract_public_lsd_token(html: str) -> Optional[str]:
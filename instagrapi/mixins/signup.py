@@ -21,6 +21,7 @@ from instagrapi.exceptions import (
 )
 from instagrapi.extractors import extract_user_short
 from instagrapi.mixins.challenge import ChallengeChoice
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import UserShort
 from instagrapi.utils.serialization import dumps
 
@@ -57,7 +58,7 @@ CAA_REG_GENERIC_REJECTION_RE = re.compile(
 )
 
 
-class SignUpMixin:
+class SignUpMixin(ValidationMixin):
     waterfall_id = str(uuid4())
     adid = str(uuid4())
     wait_seconds = 5
@@ -671,7 +672,7 @@ class SignUpMixin:
             raise ClientError("CAA signup did not return created_user")
         if registration_response.get("account_created") is False:
             raise ClientError(f"CAA signup did not create an account: {registration_response}")
-        return extract_user_short(registration_response["created_user"])
+        return self._extract(extract_user_short, registration_response["created_user"])
 
     def signup(
         self,
@@ -757,7 +758,7 @@ class SignUpMixin:
             if self.challenge_flow(data["challenge"], phone_number=phone_number, username=username):
                 kwargs.update({"suggestedUsername": "", "sn_result": "MLA"})
             retries += 1
-        return extract_user_short(data["created_user"])
+        return self._extract(extract_user_short, data["created_user"])
 
     def get_signup_config(self) -> dict:
         return self.private_request(
@@ -1,7 +1,7 @@
 import json
 from copy import deepcopy
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from urllib.parse import urlparse
 
 from instagrapi import config
@@ -19,11 +19,15 @@ from instagrapi.extractors import (
     extract_user_short,
     extract_viewer,
 )
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Story, StoryArchiveDay, UserShort, Viewer
+from instagrapi.utils.cache import LRUCache
+from instagrapi.utils.checkpoints import build_checkpoint
+from instagrapi.utils.iterators import iter_paginated
 
 
-class StoryMixin:
-    _stories_cache = {}  # pk -> object
+class StoryMixin(ValidationMixin):
+    _stories_cache: LRUCache = None  # pk -> object, bound by Client.set_cache
 
     def story_pk_from_url(self, url: str) -> str:
         """
@@ -64,13 +68,14 @@ class StoryMixin:
         story_id = self.media_id(story_pk)
         story_pk, user_id = story_id.split("_")
 
-        stories = self.user_stories_v1(user_id)
-        for story in stories:
-            self._stories_cache[story.pk] = story
-        if story_pk not in self._stories_cache:
+        found = None
+        for story in self.user_stories_v1(user_id):
+            story = self._cache_put(self._stories_cache, story.pk, story)
+            if story.pk == story_pk:
+                found = story
+        if found is None:
             raise StoryNotFound(story_pk=story_pk, **self.last_json)
-        story = self._stories_cache[story_pk]
-        return deepcopy(story)
+        return self._cache_hit(found)
 
     def story_info(self, story_pk: str, use_cache: bool = True) -> Story:
         """
@@ -88,10 +93,17 @@ class StoryMixin:
         Story
             An object of Story type
         """
-        if not use_cache or story_pk not in self._stories_cache:
-            story = self.story_info_v1(story_pk)
-            self._stories_cache[story_pk] = story
-        return deepcopy(self._stories_cache[story_pk])
+        story = self._cache_lookup(self._stories_cache, "stories", story_pk, Story) if use_cache else None
+        if story is None:
+            with self._negative_cache("stories", story_pk, use_cache):
+                story = self._coalesce(("story_info", story_pk), self._fetch_story_info, story_pk)
+        return self._cache_hit(story)
+
+    def _fetch_story_info(self, story_pk: str) -> Story:
+        story = self.story_info_v1(story_pk)
+        story = self._cache_put(self._stories_cache, story_pk, story)
+        self._cache_store("stories", story_pk, story)
+        return story
 
     def story_delete(self, story_pk: str) -> bool:
         """
@@ -147,11 +159,11 @@ class StoryMixin:
             stories_un.update(res)
         users = []
         for media in stories_un["reels_media"]:
-            user = extract_user_short(media["owner"])
+            user = self._extract(extract_user_short, media["owner"])
             items = media["items"]
             if amount:
                 items = items[:amount]
-            user.stories = [extract_story_gql(m) for m in items]
+            user.stories = [self._extract(extract_story_gql, m) for m in items]
             users.append(user)
         return users
 
@@ -204,7 +216,7 @@ class StoryMixin:
         reel = self.private_request(f"feed/user/{user_id}/story/", params=params).get("reel") or {}
         stories = []
         for item in reel.get("items", []):
-            stories.append(extract_story_v1(item))
+            stories.append(self._extract(extract_story_v1, item))
         if amount:
             stories = stories[: int(amount)]
         return stories
@@ -283,7 +295,7 @@ class StoryMixin:
         items = result.get("items", [])
         if amount:
             items = items[:amount]
-        return ([extract_story_archive_day(item) for item in items], result.get("max_id") or "")
+        return ([self._extract(extract_story_archive_day, item) for item in items], result.get("max_id") or "")
 
     def archive_story_days_v1(self, amount: int = 0, include_memories: bool = True) -> List[StoryArchiveDay]:
         """
@@ -378,8 +390,8 @@ class StoryMixin:
             result = self.private_request("feed/reels_media_stream/", data=data)
             for reel in self._archive_story_reels(result):
                 for item in reel.get("items", []):
-                    story = extract_story_v1(item)
-                    self._stories_cache[story.pk] = story
+                    story = self._extract(extract_story_v1, item)
+                    self._cache_put(self._stories_cache, story.pk, story)
                     stories.append(story)
                     if amount and len(stories) >= amount:
                         return stories
@@ -480,7 +492,7 @@ class StoryMixin:
                 params["max_id"] = max_id
             result = self.private_request(f"media/{story_pk}/list_reel_media_viewer/", params=params)
             for item in result["viewers"]:
-                viewer = extract_viewer(item)
+                viewer = self._extract(extract_viewer, item)
                 if viewer.pk in unique_set:
                     continue
                 unique_set.add(viewer.pk)
@@ -511,6 +523,37 @@ class StoryMixin:
             viewers = viewers[:amount]
         return viewers
 
+    def iter_story_viewers(
+        self, story_pk: int, amount: int = 0, prefetch: int = 0, checkpoint=None
+    ) -> Iterator[Viewer]:
+        """
+        Iterate over story viewers (Private API), one request per page
+
+        Parameters
+        ----------
+        story_pk: int
+        amount: int, optional
+            Maximum number of story viewers
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+
+        Returns
+        -------
+        Iterator[Viewer]
+            Iterator of Viewer objects
+        """
+        story_pk = self.media_pk(story_pk)
+
+        def fetch_page(max_id: str, page_amount: int) -> Tuple[List[Viewer], str]:
+            # max_amount=1 stops the chunk after a single request
+            return self.story_viewers_chunk(story_pk, max_amount=1, max_id=max_id)
+
+        checkpoint = build_checkpoint(checkpoint, "story_viewers", self.cache_backend, story_pk=str(story_pk))
+        return iter_paginated(fetch_page, amount=amount, initial_cursor="", prefetch=prefetch, checkpoint=checkpoint)
+
     def story_likers_chunk(self, story_pk: int, max_amount: int = 0, max_id: str = "") -> tuple[list[UserShort], str]:
         unique_set: set[str] = set()
         likers: list[UserShort] = []
@@ -524,7 +567,7 @@ class StoryMixin:
             for item in result.get("viewers") or []:
                 if not item.get("has_liked"):
                     continue
-                liker = extract_user_short(item["user"])
+                liker = self._extract(extract_user_short, item["user"])
                 if liker.pk in unique_set:
                     continue
                 unique_set.add(liker.pk)
@@ -1,10 +1,11 @@
 from typing import List
 
 from instagrapi.extractors import extract_media_v1
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Media
 
 
-class ReelsMixin:
+class ReelsMixin(ValidationMixin):
     """
     Helpers for Reels
     """
@@ -107,7 +108,7 @@ class ReelsMixin:
             for item in result["items"]:
                 if last_media_pk and last_media_pk == item["media"]["pk"]:
                     return total_items
-                total_items.append(extract_media_v1(item.get("media")))
+                total_items.append(self._extract(extract_media_v1, item.get("media")))
 
             if not result.get("paging_info", {}).get("more_available"):
                 return total_items
@@ -6,13 +6,14 @@ import requests
 
 from instagrapi.exceptions import ClientError, TrackNotFound
 from instagrapi.extractors import extract_track
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import Track
 from instagrapi.utils.serialization import json_value
 
 MUSIC_PRODUCT = Literal["feed_post", "music_in_feed", "story_camera_clips_v2"]
 
 
-class TrackMixin:
+class TrackMixin(ValidationMixin):
     @staticmethod
     def _track_value(track: Union[Track, Dict], key: str):
         if isinstance(track, dict):
@@ -392,7 +393,7 @@ class TrackMixin:
         track = json_value(result, "metadata", "music_info", "music_asset_info")
         if not track:
             raise TrackNotFound(music_canonical_id=str(music_canonical_id))
-        return extract_track(track)
+        return self._extract(extract_track, track)
 
     def track_info_by_id(self, track_id: str, max_id: str = "") -> Dict:
         """
@@ -1,6 +1,6 @@
+import base64
 import json
 import logging
-from copy import deepcopy
 from json.decoder import JSONDecodeError
 from typing import Dict, Iterator, List, Literal, Optional, Sequence, Tuple, Union
 
@@ -25,11 +25,16 @@ from instagrapi.extractors import (
     extract_user_v1,
 )
 from instagrapi.mixins.public import PUBLIC_WEB_APP_ID, PUBLIC_WEB_ASBD_ID
+from instagrapi.mixins.validation import ValidationMixin
 from instagrapi.types import About, AddressBookContact, Guide, Relationship, RelationshipShort, User, UserShort
+from instagrapi.utils.cache import LRUCache
+from instagrapi.utils.checkpoints import build_checkpoint
+from instagrapi.utils.follow_sync import FollowDelta, FollowSnapshot
 from instagrapi.utils.iterators import iter_paginated
 from instagrapi.utils.serialization import dumps, json_value
 
 MAX_USER_COUNT = 200
+USER_COUNT_CEILING = 1000  # largest count an adaptive page sizer may try
 INFO_FROM_MODULES = ("self_profile", "feed_timeline", "reel_feed_timeline")
 FOLLOWERS_ORDERS = ("date_followed_latest", "date_followed_earliest")
 USER_WEB_PROFILE_DOC_ID = "26762473490008061"
@@ -46,16 +51,18 @@ USER_REPORT_REASON = Literal["spam"]
 UserBlockSurface = Literal["profile", "direct_thread_info"]
 
 
-class UserMixin:
+class UserMixin(ValidationMixin):
     """
     Helpers to manage user
     """
 
-    _users_cache = {}  # user_pk -> User
-    _userhorts_cache = {}  # user_pk -> UserShort
-    _usernames_cache = {}  # username -> user_pk
-    _users_following = {}  # user_pk -> dict(user_pk -> "short user object")
-    _users_followers = {}  # user_pk -> dict(user_pk -> "short user object")
+    # Per-client LRU/TTL caches, bound by Client.set_cache
+    _users_cache: LRUCache = None  # user_pk -> User
+    _userhorts_cache: LRUCache = None  # user_pk -> UserShort
+    _usernames_cache: LRUCache = None  # username -> user_pk
+    _user_usernames_cache: LRUCache = None  # user_pk -> username
+    _users_following: LRUCache = None  # user_pk -> dict(user_pk -> "short user object")
+    _users_followers: LRUCache = None  # user_pk -> dict(user_pk -> "short user object")
     _fb_dtsg = None
 
     @staticmethod
@@ -100,6 +107,9 @@ class UserMixin:
         'example' -> 1903424587
         """
         username = self._normalize_username(username)
+        user_id = self._username_lookup(username)
+        if user_id is not None:
+            return str(user_id)
         return str(self.user_info_by_username(username).pk)
 
     def user_short_gql(self, user_id: str, use_cache: bool = True) -> UserShort:
@@ -122,7 +132,7 @@ class UserMixin:
             cache = self._userhorts_cache.get(user_id)
             if cache:
                 return cache
-        user = extract_user_short(self.user_web_profile_info_gql(user_id))
+        user = self._extract(extract_user_short, self.user_web_profile_info_gql(user_id))
         self._userhorts_cache[user_id] = user
         return user
 
@@ -259,13 +269,14 @@ class UserMixin:
             "Accept-Language": "en-US,en;q=0.9",
             "Priority": "u=1, i",
         }
-        data = extract_user_gql(
+        data = self._extract(
+            extract_user_gql,
             json.loads(
                 self.public_request(
                     f"https://www.instagram.com/api/v1/users/web_profile_info/?username={username}",
                     headers=temporary_public_headers,
                 )
-            )["data"]["user"]
+            )["data"]["user"],
         )
         return data
 
@@ -291,7 +302,7 @@ class UserMixin:
         user_data = (data or {}).get("user")
         if user_data is None:
             raise UserNotFound("User not found", user_id=user_id)
-        return extract_user_v1(self._normalize_polaris_profile(user_data))
+        return self._extract(extract_user_v1, self._normalize_polaris_profile(user_data))
 
     def user_info_by_username_v2_gql(self, username: str) -> User:
         """
@@ -345,7 +356,7 @@ class UserMixin:
             if "User not found" in str(e):
                 raise UserNotFound(e, username=username, **self.last_json)
             raise e
-        return extract_user_v1(result["user"])
+        return self._extract(extract_user_v1, result["user"])
 
     def user_info_by_username(self, username: str, use_cache: bool = True) -> User:
         """
@@ -364,29 +375,45 @@ class UserMixin:
             An object of User type
         """
         username = self._normalize_username(username)
-        if not use_cache or username not in self._usernames_cache:
-            if self._has_private_auth():
-                try:
-                    user = self.user_info_by_username_v1(username)
-                except Exception as e:
-                    if not isinstance(e, ClientError):
-                        self.logger.exception(e)
-                    user = self._user_info_by_username_public(username)
-            else:
-                try:
-                    user = self._user_info_by_username_public(username)
-                except Exception as e:
-                    if isinstance(e, RequestException):
-                        self.logger.warning(
-                            "Public user lookup failed, falling back to private API: %s",
-                            e,
-                        )
-                    elif not isinstance(e, ClientError):
-                        self.logger.exception(e)  # Register unknown error
-                    user = self.user_info_by_username_v1(username)
-            self._users_cache[user.pk] = user
-            self._usernames_cache[user.username] = user.pk
-        return self.user_info(self._usernames_cache[username])
+        user_id = self._username_lookup(username) if use_cache else None
+        if user_id is not None:
+            try:
+                user = self.user_info(user_id)
+            except UserNotFound:
+                user = None
+            if user is not None and user.username.lower() == username:
+                return user
+            self._forget_username(username)  # renamed or deleted since it was indexed
+        with self._negative_cache("usernames", username, use_cache):
+            user = self._coalesce(("user_info_by_username", username), self._fetch_user_info_by_username, username)
+        if user.pk not in self._users_cache:  # caching disabled or already evicted
+            return self._cache_hit(user)
+        return self.user_info(user.pk)
+
+    def _fetch_user_info_by_username(self, username: str) -> User:
+        if self._has_private_auth():
+            try:
+                user = self.user_info_by_username_v1(username)
+            except Exception as e:
+                if not isinstance(e, ClientError):
+                    self.logger.exception(e)
+                user = self._user_info_by_username_public(username)
+        else:
+            try:
+                user = self._user_info_by_username_public(username)
+            except Exception as e:
+                if isinstance(e, RequestException):
+                    self.logger.warning(
+                        "Public user lookup failed, falling back to private API: %s",
+                        e,
+                    )
+                elif not isinstance(e, ClientError):
+                    self.logger.exception(e)  # Register unknown error
+                user = self.user_info_by_username_v1(username)
+        user = self._cache_put(self._users_cache, user.pk, user)
+        self._cache_store("users", user.pk, user)
+        self._index_usernames([user])
+        return user
 
     def user_info_gql(self, user_id: str) -> User:
         """
@@ -409,6 +436,19 @@ class UserMixin:
         except JSONDecodeError as e:
             raise ClientJSONDecodeError(e, user_id=user_id)
 
+    @staticmethod
+    def _user_info_v1_params(from_module: INFO_FROM_MODULE = "self_profile", is_app_start: bool = False) -> Dict:
+        params = {
+            "is_prefetch": "false",
+            "entry_point": "self_profile",
+            "from_module": from_module,
+            "is_app_start": is_app_start,
+        }
+        assert from_module in INFO_FROM_MODULES, f'Unsupported send_attribute="{from_module}" {INFO_FROM_MODULES}'
+        if from_module != "self_profile":
+            params["entry_point"] = "profile"
+        return params
+
     def user_info_v1(
         self,
         user_id: str,
@@ -434,16 +474,7 @@ class UserMixin:
         """
         user_id = str(user_id)
         try:
-            params = {
-                "is_prefetch": "false",
-                "entry_point": "self_profile",
-                "from_module": from_module,
-                "is_app_start": is_app_start,
-            }
-            assert from_module in INFO_FROM_MODULES, f'Unsupported send_attribute="{from_module}" {INFO_FROM_MODULES}'
-            if from_module != "self_profile":
-                params["entry_point"] = "profile"
-
+            params = self._user_info_v1_params(from_module, is_app_start)
             result = self.private_request(f"users/{user_id}/info/", params=params)
         except ClientNotFoundError as e:
             raise UserNotFound(e, user_id=user_id, **self.last_json)
@@ -451,7 +482,7 @@ class UserMixin:
             if "User not found" in str(e):
                 raise UserNotFound(e, user_id=user_id, **self.last_json)
             raise e
-        return extract_user_v1(result["user"])
+        return self._extract(extract_user_v1, result["user"])
 
     def user_about_v1(self, user_id: str) -> About:
         """
@@ -473,7 +504,7 @@ class UserMixin:
             if "User not found" in str(e):
                 raise UserNotFound(e, user_id=user_id, **self.last_json)
             raise e
-        return extract_about_v1(self.last_json)
+        return self._extract(extract_about_v1, self.last_json)
 
     def user_info(self, user_id: str, use_cache: bool = True) -> User:
         """
@@ -492,24 +523,31 @@ class UserMixin:
             An object of User type
         """
         user_id = str(user_id)
-        if not use_cache or user_id not in self._users_cache:
-            if self._has_private_auth():
-                try:
-                    user = self.user_info_v1(user_id)
-                except Exception as e:
-                    if not isinstance(e, ClientError):
-                        self.logger.exception(e)
-                    user = self._user_info_public(user_id)
-            else:
-                try:
-                    user = self._user_info_public(user_id)
-                except Exception as e:
-                    if not isinstance(e, ClientError):
-                        self.logger.exception(e)
-                    user = self.user_info_v1(user_id)
-            self._users_cache[user_id] = user
-            self._usernames_cache[user.username] = user.pk
-        return deepcopy(self._users_cache[user_id])  # return copy of cache (dict changes protection)
+        user = self._cache_lookup(self._users_cache, "users", user_id, User) if use_cache else None
+        if user is None:
+            with self._negative_cache("users", user_id, use_cache):
+                user = self._coalesce(("user_info", user_id), self._fetch_user_info, user_id)
+        return self._cache_hit(user)  # copy or frozen snapshot (dict changes protection)
+
+    def _fetch_user_info(self, user_id: str) -> User:
+        if self._has_private_auth():
+            try:
+                user = self.user_info_v1(user_id)
+            except Exception as e:
+                if not isinstance(e, ClientError):
+                    self.logger.exception(e)
+                user = self._user_info_public(user_id)
+        else:
+            try:
+                user = self._user_info_public(user_id)
+            except Exception as e:
+                if not isinstance(e, ClientError):
+                    self.logger.exception(e)
+                user = self.user_info_v1(user_id)
+        user = self._cache_put(self._users_cache, user_id, user)
+        self._cache_store("users", user_id, user)
+        self._index_usernames([user])
+        return user
 
     def new_feed_exist(self) -> bool:
         """
@@ -593,8 +631,9 @@ class UserMixin:
             List of users
         """
         results = self.private_request("users/search/", params={"query": query, "count": count})
-        users = results.get("users", [])
-        return [extract_user_short(user) for user in users]
+        users = [self._extract(extract_user_short, user) for user in results.get("users", [])]
+        self._index_usernames(users)
+        return users
 
     def search_users(self, query: str, count: int = 50) -> List[UserShort]:
         """
@@ -636,8 +675,9 @@ class UserMixin:
                 "enable_groups": "true",
             },
         )
-        users = results.get("users", [])
-        return [extract_user_short(user) for user in users]
+        users = [self._extract(extract_user_short, user) for user in results.get("users", [])]
+        self._index_usernames(users)
+        return users
 
     def search_followers(self, user_id: str, query: str) -> List[UserShort]:
         """
@@ -682,8 +722,9 @@ class UserMixin:
                 "enable_groups": "true",
             },
         )
-        users = results.get("users", [])
-        return [extract_user_short(user) for user in users]
+        users = [self._extract(extract_user_short, user) for user in results.get("users", [])]
+        self._index_usernames(users)
+        return users
 
     def search_following(self, user_id: str, query: str) -> List[UserShort]:
         """
@@ -723,13 +764,14 @@ class UserMixin:
             page_info = json_value(data, "user", "edge_follow", "page_info", default={})
             edges = json_value(data, "user", "edge_follow", "edges", default=[])
             for edge in edges:
-                users.append(extract_user_short(edge["node"]))
+                users.append(self._extract(extract_user_short, edge["node"]))
             end_cursor = page_info.get("end_cursor")
             if not page_info.get("has_next_page") or not end_cursor:
                 break
             if max_amount and len(users) >= max_amount:
                 break
             # time.sleep(sleep)
+        self._index_usernames(users)
         return users, end_cursor
 
     def user_following_gql(self, user_id: str, amount: int = 0) -> List[UserShort]:
@@ -754,7 +796,11 @@ class UserMixin:
         return users
 
     def user_following_v1_chunk(
-        self, user_id: str, max_amount: int = 0, max_id: str = ""
+        self,
+        user_id: str,
+        max_amount: int = 0,
+        max_id: str = "",
+        order: Optional[FOLLOWERS_ORDER] = None,
     ) -> Tuple[List[UserShort], str]:
         """
         Get user's following users information by Private Mobile API and max_id (cursor)
@@ -767,18 +813,21 @@ class UserMixin:
             Maximum number of media to return, default is 0 - Inf
         max_id: str, optional
             Max ID, default value is empty String
+        order: FOLLOWERS_ORDER, optional
+            Sort order: date_followed_latest or date_followed_earliest
 
         Returns
         -------
         Tuple[List[UserShort], str]
             Tuple of List of users and max_id
         """
+        endpoint = "user_following_v1"
         unique_set = set()
         users: List[UserShort] = []
         while True:
-            count = MAX_USER_COUNT
+            count = self._page_size(endpoint, MAX_USER_COUNT, USER_COUNT_CEILING)
             if max_amount:
-                count = min(max_amount - len(users), MAX_USER_COUNT)
+                count = min(max_amount - len(users), count)
             params = {
                 "count": count,
                 "rank_token": self.rank_token,
@@ -786,21 +835,29 @@ class UserMixin:
                 "query": "",
                 "enable_groups": "true",
             }
+            if order:
+                params["order"] = order
             if max_id:
                 params["max_id"] = max_id
-            result = self.private_request(
-                f"friendships/{user_id}/following/",
-                params=params,
+            result, count = self._sized_request(
+                endpoint,
+                count,
+                lambda size: self.private_request(
+                    f"friendships/{user_id}/following/",
+                    params=dict(params, count=size),
+                ),
             )
             for user in result["users"]:
-                user = extract_user_short(user)
+                user = self._extract(extract_user_short, user)
                 if user.pk in unique_set:
                     continue
                 unique_set.add(user.pk)
                 users.append(user)
             max_id = result.get("next_max_id")
+            self._page_received(endpoint, count, len(result["users"]), bool(max_id))
             if not max_id or (max_amount and len(users) >= max_amount):
                 break
+        self._index_usernames(users)
         return users, max_id
 
     def user_following_v1(self, user_id: str, amount: int = 0) -> List[UserShort]:
@@ -829,6 +886,8 @@ class UserMixin:
         user_id: str,
         amount: int = 0,
         page_size: int = MAX_USER_COUNT,
+        prefetch: int = 0,
+        checkpoint=None,
     ) -> Iterator[UserShort]:
         """
         Iterate over user's following users by Private Mobile API.
@@ -841,6 +900,11 @@ class UserMixin:
             Maximum number of users to yield, default is 0 - Inf
         page_size: int, optional
             Maximum number of users to fetch per page, default is 200
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
 
         Returns
         -------
@@ -852,7 +916,10 @@ class UserMixin:
         def fetch_page(max_id: str, max_amount: int) -> Tuple[List[UserShort], str]:
             return self.user_following_v1_chunk(user_id, max_amount=max_amount, max_id=max_id)
 
-        return iter_paginated(fetch_page, amount=amount, page_size=page_size, initial_cursor="")
+        checkpoint = build_checkpoint(checkpoint, "user_following_v1", self.cache_backend, user_id=user_id)
+        return iter_paginated(
+            fetch_page, amount=amount, page_size=page_size, initial_cursor="", prefetch=prefetch, checkpoint=checkpoint
+        )
 
     def user_following(self, user_id: str, use_cache: bool = True, amount: int = 0) -> Dict[str, UserShort]:
         """
@@ -889,8 +956,9 @@ class UserMixin:
                     if not isinstance(e, ClientError):
                         self.logger.exception(e)
                     users = self.user_following_v1(user_id, amount)
-            self._users_following[user_id] = {user.pk: user for user in users}
-        following = self._users_following[user_id]
+            users = {user.pk: user for user in users}
+            self._users_following[user_id] = users
+        following = users
         if amount and len(following) > amount:
             following = dict(list(following.items())[:amount])
         return following
@@ -927,18 +995,27 @@ class UserMixin:
         while True:
             if end_cursor:
                 variables["after"] = end_cursor
-            data = self.public_graphql_request(variables, query_hash="37479f2b8209594dde7facb0d904896a")
+            data, variables["first"] = self._sized_request(
+                "user_followers_gql",
+                self._page_size("user_followers_gql", 12, 50),
+                lambda size: self.public_graphql_request(
+                    dict(variables, first=size), query_hash="37479f2b8209594dde7facb0d904896a"
+                ),
+            )
             if not data["user"] and not users:
                 raise UserNotFound(user_id=user_id, **data)
             page_info = json_value(data, "user", "edge_followed_by", "page_info", default={})
             edges = json_value(data, "user", "edge_followed_by", "edges", default=[])
             for edge in edges:
-                users.append(extract_user_short(edge["node"]))
+                users.append(self._extract(extract_user_short, edge["node"]))
             end_cursor = page_info.get("end_cursor")
-            if not page_info.get("has_next_page") or not end_cursor:
+            has_more = bool(page_info.get("has_next_page") and end_cursor)
+            self._page_received("user_followers_gql", variables["first"], len(edges), has_more)
+            if not has_more:
                 break
             if max_amount and len(users) >= max_amount:
                 break
+        self._index_usernames(users)
         return users, end_cursor
 
     def user_followers_gql(self, user_id: str, amount: int = 0) -> List[UserShort]:
@@ -962,6 +1039,38 @@ class UserMixin:
             users = users[:amount]
         return users
 
+    def iter_user_followers_gql(
+        self, user_id: str, amount: int = 0, prefetch: int = 0, checkpoint=None
+    ) -> Iterator[UserShort]:
+        """
+        Iterate over user's followers by Public Graphql API, one request per page
+
+        Parameters
+        ----------
+        user_id: str
+            User id of an instagram account
+        amount: int, optional
+            Maximum number of users to yield, default is 0 - Inf
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
+
+        Returns
+        -------
+        Iterator[UserShort]
+            Iterator of UserShort objects
+        """
+        user_id = str(user_id)
+
+        def fetch_page(end_cursor: str, page_amount: int) -> Tuple[List[UserShort], str]:
+            # max_amount=1 stops the chunk after a single request
+            return self.user_followers_gql_chunk(user_id, max_amount=1, end_cursor=end_cursor)
+
+        checkpoint = build_checkpoint(checkpoint, "user_followers_gql", self.cache_backend, user_id=user_id)
+        return iter_paginated(fetch_page, amount=amount, initial_cursor=None, prefetch=prefetch, checkpoint=checkpoint)
+
     def user_followers_v1_chunk(
         self,
         user_id: str,
@@ -988,12 +1097,13 @@ class UserMixin:
         Tuple[List[UserShort], str]
             Tuple of List of users and max_id
         """
+        endpoint = "user_followers_v1"
         unique_set = set()
         users = []
         while True:
-            count = MAX_USER_COUNT
+            count = self._page_size(endpoint, MAX_USER_COUNT, USER_COUNT_CEILING)
             if max_amount:
-                count = min(max_amount - len(users), MAX_USER_COUNT)
+                count = min(max_amount - len(users), count)
             params = {
                 "count": count,
                 "rank_token": self.rank_token,
@@ -1005,19 +1115,25 @@ class UserMixin:
                 params["order"] = order
             if max_id:
                 params["max_id"] = max_id
-            result = self.private_request(
-                f"friendships/{user_id}/followers/",
-                params=params,
+            result, count = self._sized_request(
+                endpoint,
+                count,
+                lambda size: self.private_request(
+                    f"friendships/{user_id}/followers/",
+                    params=dict(params, count=size),
+                ),
             )
             for user in result["users"]:
-                user = extract_user_short(user)
+                user = self._extract(extract_user_short, user)
                 if user.pk in unique_set:
                     continue
                 unique_set.add(user.pk)
                 users.append(user)
             max_id = result.get("next_max_id")
+            self._page_received(endpoint, count, len(result["users"]), bool(max_id))
             if not max_id or (max_amount and len(users) >= max_amount):
                 break
+        self._index_usernames(users)
         return users, max_id
 
     def user_followers_v1(
@@ -1054,6 +1170,8 @@ class UserMixin:
         amount: int = 0,
         page_size: int = MAX_USER_COUNT,
         order: Optional[FOLLOWERS_ORDER] = None,
+        prefetch: int = 0,
+        checkpoint=None,
     ) -> Iterator[UserShort]:
         """
         Iterate over user's followers by Private Mobile API.
@@ -1068,6 +1186,11 @@ class UserMixin:
             Maximum number of users to fetch per page, default is 200
         order: FOLLOWERS_ORDER, optional
             Followers sort order: date_followed_latest or date_followed_earliest
+        prefetch: int, optional
+            Number of pages to fetch ahead in a background thread, default is 0 (fetch on demand)
+        checkpoint: Checkpoint | CacheBackend | str | bool, optional
+            Persist progress after every page to resume an interrupted crawl: a store
+            (cache backend or path), a ``Checkpoint``, or True for the client cache backend
 
         Returns
         -------
@@ -1086,7 +1209,10 @@ class UserMixin:
                 )
             return self.user_followers_v1_chunk(user_id, max_amount=max_amount, max_id=max_id)
 
-        return iter_paginated(fetch_page, amount=amount, page_size=page_size, initial_cursor="")
+        checkpoint = build_checkpoint(checkpoint, "user_followers_v1", self.cache_backend, user_id=user_id, order=order)
+        return iter_paginated(
+            fetch_page, amount=amount, page_size=page_size, initial_cursor="", prefetch=prefetch, checkpoint=checkpoint
+        )
 
     @staticmethod
     def _private_graphql_root(data: Dict, root_field_name: str) -> Dict:
@@ -1146,9 +1272,10 @@ class UserMixin:
             raise ClientGraphqlError("Missing private GraphQL followers payload")
         users = []
         for user in followers.get("users") or []:
-            users.append(extract_user_short(user))
+            users.append(self._extract(extract_user_short, user))
             if max_amount and len(users) >= max_amount:
                 break
+        self._index_usernames(users)
         return users, followers.get("next_max_id")
 
     def user_followers_private_gql(
@@ -1250,12 +1377,151 @@ class UserMixin:
                     if not isinstance(e, ClientError):
                         self.logger.exception(e)
                     users = self.user_followers_v1(user_id, amount)
-            self._users_followers[user_id] = {user.pk: user for user in users}
-        followers = self._users_followers[user_id]
+            users = {user.pk: user for user in users}
+            self._users_followers[user_id] = users
+        followers = users
         if amount and len(followers) > amount:
             followers = dict(list(followers.items())[:amount])
         return followers
 
+    def user_followers_delta(
+        self,
+        user_id: str,
+        snapshot: Optional[FollowSnapshot] = None,
+        full: bool = False,
+        expected_count: Optional[int] = None,
+        overlap: int = 5,
+        page_size: int = MAX_USER_COUNT,
+    ) -> FollowDelta:
+        """
+        Get followers gained since the last sync, paging from the newest follower
+
+        Pages are requested with ``order="date_followed_latest"`` and the walk
+        stops after ``overlap`` consecutive already-known followers, so a
+        sync costs a few pages instead of the whole list. Unfollows are only
+        visible to a full walk, made when there is no snapshot, when ``full``
+        is set, or when ``expected_count`` (e.g. ``user_info(user_id).follower_count``)
+        does not match the updated snapshot.
+
+        Parameters
+        ----------
+        user_id: str
+            User id of an instagram account
+        snapshot: FollowSnapshot, optional
+            Result of the previous sync; by default loaded from (and saved to) the cache backend
+        full: bool, optional
+            Walk the whole list to also detect removed followers, default value is False
+        expected_count: int, optional
+            Current number of followers, a mismatch triggers a full walk
+        overlap: int, optional
+            Consecutive known followers that end an incremental walk, default value is 5
+        page_size: int, optional
+            Followers per request, default value is 200
+
+        Returns
+        -------
+        FollowDelta
+            Added users (newest first), removed pks and the updated snapshot
+        """
+        return self._follow_delta(
+            "followers", self.user_followers_v1_chunk, user_id, snapshot, full, expected_count, overlap, page_size
+        )
+
+    def user_following_delta(
+        self,
+        user_id: str,
+        snapshot: Optional[FollowSnapshot] = None,
+        full: bool = False,
+        expected_count: Optional[int] = None,
+        overlap: int = 5,
+        page_size: int = MAX_USER_COUNT,
+    ) -> FollowDelta:
+        """
+        Get accounts followed since the last sync, see ``user_followers_delta``
+
+        Parameters
+        ----------
+        user_id: str
+            User id of an instagram account
+        snapshot: FollowSnapshot, optional
+            Result of the previous sync; by default loaded from (and saved to) the cache backend
+        full: bool, optional
+            Walk the whole list to also detect removed accounts, default value is False
+        expected_count: int, optional
+            Current number of followed accounts (``following_count``), a mismatch triggers a full walk
+        overlap: int, optional
+            Consecutive known accounts that end an incremental walk, default value is 5
+        page_size: int, optional
+            Accounts per request, default value is 200
+
+        Returns
+        -------
+        FollowDelta
+            Added users (newest first), removed pks and the updated snapshot
+        """
+        return self._follow_delta(
+            "following", self.user_following_v1_chunk, user_id, snapshot, full, expected_count, overlap, page_size
+        )
+
+    def _follow_delta(self, kind, fetch_chunk, user_id, snapshot, full, expected_count, overlap, page_size):
+        user_id = str(user_id)
+        key = f"{kind}:{user_id}"
+        if snapshot is None:
+            snapshot = self._load_follow_snapshot(key)
+        full = full or snapshot is None
+        previous = snapshot or FollowSnapshot(user_id, kind)
+        added, seen, pages = [], set(), 0
+        known_in_row = 0
+        max_id = ""
+        caught_up = False
+        while not caught_up:
+            users, max_id = fetch_chunk(user_id, max_amount=page_size, max_id=max_id, order="date_followed_latest")
+            pages += 1
+            for user in users:
+                if user.pk in seen:
+                    continue
+                seen.add(user.pk)
+                if user.pk not in previous:
+                    known_in_row = 0
+                    added.append(user)
+                    continue
+                known_in_row += 1
+                if not full and known_in_row >= overlap:
+                    caught_up = True  # the rest of the list is already known
+                    break
+            if not max_id:
+                break
+        added_pks = [user.pk for user in added]
+        if full:
+            removed = [pk for pk in previous if pk not in seen]
+            updated = previous.merged(added_pks, removed, full=True)
+        else:
+            removed = []
+            updated = previous.merged(added_pks)
+            if expected_count is not None and len(updated) != expected_count:
+                self.logger.info(
+                    "%s of %s: %d known, %d expected, walking the whole list",
+                    kind,
+                    user_id,
+                    len(updated),
+                    expected_count,
+                )
+                delta = self._follow_delta(kind, fetch_chunk, user_id, updated, True, None, overlap, page_size)
+                delta.added = added + delta.added
+                delta.pages += pages
+                return delta
+        self._cache_store("follow_snapshots", key, base64.b64encode(updated.dumps()).decode())
+        return FollowDelta(added=added, removed=removed, snapshot=updated, full=full, pages=pages)
+
+    def _load_follow_snapshot(self, key: str) -> Optional[FollowSnapshot]:
+        data = self._cache_load("follow_snapshots", key)
+        if not data:
+            return None
+        try:
+            return FollowSnapshot.loads(base64.b64decode(data))
+        except ValueError:
+            return None
+
     def user_follow_requests_chunk(self, max_amount: int = 0, max_id: str = "") -> Tuple[List[UserShort], str]:
         """
         Get pending incoming follow requests by Private Mobile API
@@ -1281,7 +1547,7 @@ class UserMixin:
                 params["max_id"] = max_id
             result = self.private_request("friendships/pending/", params=params)
             for user in result.get("users", []):
-                user = extract_user_short(user)
+                user = self._extract(extract_user_short, user)
                 if user.pk in unique_set:
                     continue
                 unique_set.add(user.pk)
@@ -1289,6 +1555,7 @@ class UserMixin:
             max_id = result.get("next_max_id")
             if not max_id or (max_amount and len(users) >= max_amount):
                 break
+        self._index_usernames(users)
         return users, max_id
 
     def user_follow_requests(self, amount: int = 0) -> List[UserShort]:
@@ -1425,6 +1692,7 @@ class UserMixin:
         followed = friendship_status.get("following") is True or friendship_status.get("outgoing_request") is True
         if followed and following_cache is not None:
             following_cache[user_id] = self._userhorts_cache.get(user_id) or UserShort(pk=user_id)
+            self._relationships_changed(self._users_following, current_user_id)
         return followed
 
     def user_unfollow(self, user_id: str) -> bool:
@@ -1450,8 +1718,10 @@ class UserMixin:
             }
         )
         result = self.private_request(f"friendships/destroy/{user_id}/", data)
-        if self.user_id in self._users_following:
-            self._users_following[self.user_id].pop(user_id, None)
+        following_cache = self._users_following.get(self.user_id)
+        if following_cache is not None:
+            following_cache.pop(user_id, None)
+            self._relationships_changed(self._users_following, self.user_id)
         return result["friendship_status"]["following"] is False
 
     def user_block(self, user_id: str, surface: UserBlockSurface = "profile") -> bool:
@@ -1596,8 +1866,10 @@ class UserMixin:
         user_id = str(user_id)
         data = self.with_action_data({"user_id": str(user_id)})
         result = self.private_request(f"friendships/remove_follower/{user_id}/", data)
-        if self.user_id in self._users_followers:
-            self._users_followers[self.user_id].pop(user_id, None)
+        followers_cache = self._users_followers.get(self.user_id)
+        if followers_cache is not None:
+            followers_cache.pop(user_id, None)
+            self._relationships_changed(self._users_followers, self.user_id)
         return result["friendship_status"]["followed_by"] is False
 
     def mute_posts_from_follow(self, user_id: str, revert: bool = False) -> bool:
@@ -1922,7 +2194,7 @@ class UserMixin:
         assert result.get("status", "") == "ok"
 
         creator_info = result.get("user", {}).pop("creator_info", {})
-        user = extract_user_short(result.get("user", {}))
+        user = self._extract(extract_user_short, result.get("user", {}))
         return (user, creator_info)
 
     def user_guides_v1(self, user_id: int) -> List[Guide]:
@@ -1931,7 +2203,7 @@ class UserMixin:
         """
         user_id = int(user_id)
         result = self.private_request(f"guides/user/{user_id}/")
-        return [extract_guide_v1(item) for item in (result.get("guides") or [])]
+        return [self._extract(extract_guide_v1, item) for item in (result.get("guides") or [])]
 
     def chaining(self, user_id: str) -> dict:
         """
@@ -2563,7 +2835,8 @@ class UserMixin:
         if not data.get("user"):
             raise UserNotFound("User not found")
         edges = json_value(data, "user", "edge_chaining", "edges", default=[])
-        res = [extract_user_short(e["node"]) for e in edges if "node" in e]
+        res = [self._extract(extract_user_short, e["node"]) for e in edges if "node" in e]
+        self._index_usernames(res)
         if not res and getattr(self, "num_retry", None) is not None and self.num_retry < 4:
             raise RelatedProfileRequired
         return res
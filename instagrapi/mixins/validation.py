@@ -0,0 +1,41 @@
+from typing import Callable
+
+from instagrapi.utils.validation import check_validation_mode, validation_mode
+
+
+class ValidationMixin:
+    """
+    Validation mode of the models built from this client's responses
+    """
+
+    validation: str = "strict"
+
+    def set_validation(self, mode: str = "strict") -> bool:
+        """
+        Set how the extractors build models from this client's responses
+
+        Parameters
+        ----------
+        mode: str
+            ``"strict"`` (default) validates every field, ``"trusted"`` skips
+            URL parsing (URLs stay plain, unnormalized strings) and the
+            ``BaseModel.__init__`` overhead of user, media, story, location
+            and comment models, for bulk dumps of data Instagram itself returned;
+            ``"lazy"`` validates like ``"strict"`` but private API medias decode
+            their nested models (resources, usertags, clips_metadata...) on first access
+
+        Returns
+        -------
+        bool
+            A boolean value
+        """
+        self.validation = check_validation_mode(mode)
+        return True
+
+    def _extract(self, extract: Callable, *args, **kwargs):
+        """``extract(*args, **kwargs)`` building its models in this client's validation mode"""
+        token = validation_mode.set(self.validation)
+        try:
+            return extract(*args, **kwargs)
+        finally:
+            validation_mode.reset(token)
@@ -1,17 +1,28 @@
 from datetime import datetime
-from typing import Dict, List, Literal, Optional, Union
+from typing import Annotated, Dict, List, Literal, Optional, Union
 
+import pydantic
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     FilePath,
-    HttpUrl,
+    PlainSerializer,
     ValidationError,
     field_validator,
 )
 
 
+def _serialize_url(value, info):
+    # Models built in "trusted" validation mode keep URLs as plain strings
+    if info.mode == "json" or isinstance(value, str):
+        return str(value)
+    return value
+
+
+HttpUrl = Annotated[pydantic.HttpUrl, PlainSerializer(_serialize_url)]
+
+
 class TypesBaseModel(BaseModel):
     model_config = ConfigDict(coerce_numbers_to_str=True)  # (jarrodnorwell) fixed city_id issue
 
@@ -0,0 +1,257 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+def approximate_size(obj: Any, _seen: set = None) -> int:
+    """Rough deep size of ``obj`` in bytes (containers, pydantic models and plain objects are followed)"""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        return size + sum(approximate_size(k, seen) + approximate_size(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(approximate_size(item, seen) for item in obj)
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        return size + approximate_size(attrs, seen)
+    return size
+
+
+# Approximate size of one ``pk -> UserShort`` pair of a followers/following dict
+RELATIONSHIP_ENTRY_SIZE = 2560
+
+
+def relationship_size(users: dict) -> int:
+    """Estimated size of a followers/following dict, without walking its (up to millions of) users"""
+    return sys.getsizeof(users) + len(users) * RELATIONSHIP_ENTRY_SIZE
+
+
+class LRUCache(MutableMapping):
+    """
+    Thread-safe mapping with LRU eviction and per-entry expiry
+
+    Entries past their TTL behave as missing. When the cache holds more than
+    ``maxsize`` entries, or the approximate size of its values exceeds
+    ``max_bytes``, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of entries, None for no limit, 0 disables the cache
+    ttl: float, optional
+        Seconds an entry stays valid, None for no expiry
+    max_bytes: int, optional
+        Maximum approximate size of the cached values; values are weighed with
+        ``weigher`` (``approximate_size`` by default) when they are stored
+    weigher: Callable, optional
+        Function returning the weight of a value
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        weigher: Callable[[Any], int] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.weigher = weigher or approximate_size
+        self.weight = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, expires_at, weight)
+        self._lock = threading.RLock()
+
+    def _live(self, key, touch: bool = False):
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            return _MISSING
+        if touch:
+            self._data.move_to_end(key)
+        return entry[0]
+
+    def _remove(self, key):
+        entry = self._data.pop(key)
+        self.weight -= entry[2]
+        return entry[0]
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self.maxsize is not None and len(self._data) > self.maxsize)
+            or (self.max_bytes is not None and self.weight > self.max_bytes)
+        ):
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._live(key, touch=True)
+            if value is _MISSING:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return self._live(key) is not _MISSING
+
+    def set(self, key, value, ttl: Optional[float] = _MISSING) -> None:
+        """Store ``value``; ``ttl`` overrides the cache TTL for this entry"""
+        ttl = self.ttl if ttl is _MISSING else ttl
+        if self.maxsize == 0:
+            return
+        weight = self.weigher(value) if self.max_bytes is not None else 0
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            expires_at = None if ttl is None else time.monotonic() + ttl
+            self._data[key] = (value, expires_at, weight)
+            self.weight += weight
+            self._evict()
+
+    def __setitem__(self, key, value) -> None:
+        self.set(key, value)
+
+    def reweigh(self, key) -> None:
+        """Weigh the value of ``key`` again after it was changed in place, keeping its expiry"""
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._live(key) is _MISSING:
+                return
+            value, expires_at, weight = self._data[key]
+            new_weight = self.weigher(value)
+            self._data[key] = (value, expires_at, new_weight)
+            self.weight += new_weight - weight
+            self._evict()
+
+    def __delitem__(self, key) -> None:
+        with self._lock:
+            if self._live(key) is _MISSING:
+                raise KeyError(key)
+            self._remove(key)
+
+    def pop(self, key, default=_MISSING):
+        with self._lock:
+            if self._live(key) is _MISSING:
+                if default is _MISSING:
+                    raise KeyError(key)
+                return default
+            return self._remove(key)
+
+    def __iter__(self):
+        with self._lock:
+            keys = [key for key in list(self._data) if self._live(key) is not _MISSING]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for key in list(self._data) if self._live(key) is not _MISSING)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.weight = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "weight": self.weight,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self._data)})"
+
+
+MiB = 1024 * 1024
+
+# Entity cache name -> LRUCache arguments
+DEFAULT_CACHE_CONFIG: Dict[str, dict] = {
+    "users": {"maxsize": 10000, "ttl": 3600, "max_bytes": 64 * MiB},  # user_pk -> User
+    "user_shorts": {"maxsize": 20000, "ttl": 3600, "max_bytes": 32 * MiB},  # user_pk -> UserShort
+    "usernames": {"maxsize": 100000, "ttl": 86400},  # username -> user_pk
+    "user_usernames": {"maxsize": 100000, "ttl": 86400},  # user_pk -> username, reverse of "usernames"
+    # user_pk -> {user_pk: UserShort}
+    "following": {"maxsize": 100, "ttl": 900, "max_bytes": 128 * MiB, "weigher": relationship_size},
+    "followers": {"maxsize": 100, "ttl": 900, "max_bytes": 128 * MiB, "weigher": relationship_size},
+    "medias": {"maxsize": 10000, "ttl": 900, "max_bytes": 128 * MiB},  # media_pk -> Media
+    "stories": {"maxsize": 5000, "ttl": 600, "max_bytes": 32 * MiB},  # story_pk -> Story
+    "failures": {"maxsize": 10000, "ttl": 300},  # (namespace, key) -> not found / private / unavailable error
+}
+
+
+class EntityCaches:
+    """
+    The entity caches of a client (users, usernames, followers, medias, stories...)
+
+    Every ``Client`` gets its own instance; pass one instance to several
+    clients (``Client(cache=caches)``) to share cached objects on purpose.
+
+    Parameters
+    ----------
+    config: dict, optional
+        Entity cache name to ``LRUCache`` arguments, merged over ``DEFAULT_CACHE_CONFIG``;
+        e.g. ``{"medias": {"maxsize": 1000, "ttl": 60}}``. ``False`` instead
+        of a dict disables one cache
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        unknown = set(config) - set(DEFAULT_CACHE_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown caches: {', '.join(sorted(unknown))}")
+        self.config = {}
+        for name, defaults in DEFAULT_CACHE_CONFIG.items():
+            options = config.get(name, {})
+            options = {"maxsize": 0} if options is False else {**defaults, **options}
+            self.config[name] = options
+            setattr(self, name, LRUCache(**options))
+
+    def caches(self) -> Dict[str, LRUCache]:
+        return {name: getattr(self, name) for name in DEFAULT_CACHE_CONFIG}
+
+    def clear(self) -> None:
+        for cache in self.caches().values():
+            cache.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {name: cache.stats() for name, cache in self.caches().items()}
+
+
+def build_entity_caches(cache=None) -> EntityCaches:
+    if cache is None or cache is True:
+        return EntityCaches()
+    if cache is False:
+        return EntityCaches({name: False for name in DEFAULT_CACHE_CONFIG})
+    if isinstance(cache, EntityCaches):
+        return cache
+    if isinstance(cache, dict):
+        return EntityCaches(cache)
+    raise TypeError(f"Unsupported cache: {cache!r}")
@@ -0,0 +1,280 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+# Namespace -> seconds a stored entity stays valid
+DEFAULT_BACKEND_TTL: Dict[str, Optional[float]] = {
+    "users": 86400,
+    "usernames": 7 * 86400,
+    "medias": 86400,
+    "stories": 3600,
+    "hashtags": 86400,
+    "follow_snapshots": None,
+    "checkpoints": None,
+}
+
+
+class CacheBackend(ABC):
+    """
+    Storage for serialized entities that outlives a process
+
+    Values are JSON strings (``Client`` stores ``model.model_dump_json()``)
+    keyed by ``(namespace, key)``; every entry records when it was stored and
+    when it expires, expired entries read as missing. Subclasses implement
+    ``_get``, ``_set``, ``delete`` and ``clear``.
+
+    Parameters
+    ----------
+    ttl: dict, optional
+        Namespace to TTL in seconds (None for no expiry), merged over ``DEFAULT_BACKEND_TTL``
+    """
+
+    def __init__(self, ttl: Optional[Dict[str, Optional[float]]] = None):
+        self.ttl = {**DEFAULT_BACKEND_TTL, **(ttl or {})}
+
+    def ttl_for(self, namespace: str) -> Optional[float]:
+        return self.ttl.get(namespace)
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        entry = self._get(namespace, key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(namespace, key)
+            return None
+        return value
+
+    def set(self, namespace: str, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store ``value``; ``ttl`` defaults to the namespace TTL"""
+        ttl = self.ttl_for(namespace) if ttl is None else ttl
+        now = time.time()
+        self._set(namespace, key, value, now, None if ttl is None else now + ttl)
+
+    def set_many(self, namespace: str, items: Dict[str, str], ttl: Optional[float] = None) -> None:
+        """Store several values of one namespace, in one transaction where the backend supports it"""
+        ttl = self.ttl_for(namespace) if ttl is None else ttl
+        now = time.time()
+        self._set_many(namespace, items, now, None if ttl is None else now + ttl)
+
+    def _set_many(self, namespace: str, items: Dict[str, str], stored_at: float, expires_at: Optional[float]) -> None:
+        for key, value in items.items():
+            self._set(namespace, key, value, stored_at, expires_at)
+
+    @abstractmethod
+    def _get(self, namespace: str, key: str):
+        """``(value, expires_at)`` of the stored entry, None when missing"""
+
+    @abstractmethod
+    def _set(self, namespace: str, key: str, value: str, stored_at: float, expires_at: Optional[float]) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop every entry of ``namespace``, or of all namespaces when None"""
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Process-local backend, mostly useful for tests and as a reference implementation"""
+
+    def __init__(self, ttl: Optional[Dict[str, Optional[float]]] = None):
+        super().__init__(ttl)
+        self.data: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, namespace, key):
+        with self._lock:
+            entry = self.data.get((namespace, key))
+        return None if entry is None else (entry[0], entry[2])
+
+    def _set(self, namespace, key, value, stored_at, expires_at):
+        with self._lock:
+            self.data[(namespace, key)] = (value, stored_at, expires_at)
+
+    def _set_many(self, namespace, items, stored_at, expires_at):
+        with self._lock:
+            for key, value in items.items():
+                self.data[(namespace, key)] = (value, stored_at, expires_at)
+
+    def delete(self, namespace, key):
+        with self._lock:
+            self.data.pop((namespace, key), None)
+
+    def clear(self, namespace=None):
+        with self._lock:
+            if namespace is None:
+                self.data = {}
+            else:
+                self.data = {k: v for k, v in self.data.items() if k[0] != namespace}
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Entities in one SQLite file, shared by the threads and processes of a node
+
+    The database runs in WAL mode so readers do not block the writer; each
+    thread uses its own connection.
+
+    Parameters
+    ----------
+    path: str | Path
+        Database file, created on first use
+    ttl: dict, optional
+        Namespace TTL overrides
+    timeout: float
+        Seconds to wait for a lock held by another process
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[Dict[str, Optional[float]]] = None,
+        timeout: float = 30.0,
+    ):
+        super().__init__(ttl)
+        self.path = str(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entities ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, expires_at REAL, PRIMARY KEY (namespace, key))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _get(self, namespace, key):
+        return (
+            self._connection()
+            .execute("SELECT value, expires_at FROM entities WHERE namespace = ? AND key = ?", (namespace, key))
+            .fetchone()
+        )
+
+    def _set(self, namespace, key, value, stored_at, expires_at):
+        self._set_many(namespace, {key: value}, stored_at, expires_at)
+
+    def _set_many(self, namespace, items, stored_at, expires_at):
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entities (namespace, key, value, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                [(namespace, key, value, stored_at, expires_at) for key, value in items.items()],
+            )
+
+    def delete(self, namespace, key):
+        with self._connection() as connection:
+            connection.execute("DELETE FROM entities WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def clear(self, namespace=None):
+        with self._connection() as connection:
+            if namespace is None:
+                connection.execute("DELETE FROM entities")
+            else:
+                connection.execute("DELETE FROM entities WHERE namespace = ?", (namespace,))
+
+    def purge_expired(self) -> int:
+        """Delete expired entries, return how many were removed"""
+        with self._connection() as connection:
+            cursor = connection.execute("DELETE FROM entities WHERE expires_at <= ?", (time.time(),))
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+class FileCacheBackend(CacheBackend):
+    """
+    Simple key-value store with one JSON file per entity under ``directory``
+
+    Files are written to a temporary name and renamed into place, so
+    concurrent processes never read a partial entry.
+
+    Parameters
+    ----------
+    directory: str | Path
+        Root directory, created on first use
+    ttl: dict, optional
+        Namespace TTL overrides
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl: Optional[Dict[str, Optional[float]]] = None):
+        super().__init__(ttl)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, namespace: str, key: str) -> Path:
+        digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+        return self.directory / namespace / digest[:2] / f"{digest}.json"
+
+    def _get(self, namespace, key):
+        try:
+            entry = json.loads(self._path(namespace, key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key:  # hash collision
+            return None
+        return entry["value"], entry.get("expires_at")
+
+    def _set(self, namespace, key, value, stored_at, expires_at):
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"key": key, "value": value, "stored_at": stored_at, "expires_at": expires_at}
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def delete(self, namespace, key):
+        self._path(namespace, key).unlink(missing_ok=True)
+
+    def clear(self, namespace=None):
+        roots = [self.directory / namespace] if namespace else [p for p in self.directory.iterdir() if p.is_dir()]
+        for root in roots:
+            for path in root.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+
+def build_cache_backend(backend=None) -> Optional[CacheBackend]:
+    if backend is None:
+        return None
+    if isinstance(backend, CacheBackend):
+        return backend
+    if isinstance(backend, (str, Path)):
+        path = str(backend)
+        if path.endswith((".db", ".sqlite", ".sqlite3")):
+            return SQLiteCacheBackend(path)
+        return FileCacheBackend(path)
+    raise TypeError(f"Unsupported cache backend: {backend!r}")
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Union
+
+from instagrapi.utils.cache_backends import CacheBackend, build_cache_backend
+
+
+class Checkpoint:
+    """
+    Progress of one paginated crawl, persisted so it can resume after a crash
+
+    ``iter_paginated(..., checkpoint=...)`` records the cursor of the current
+    page, the number of items yielded and the keys of the last
+    ``dedup_window`` items, then saves them after every page and whenever
+    iteration stops. A resumed crawl starts from the saved cursor and skips
+    items it has already yielded; only a hard kill in the middle of a page
+    can re-emit that page's items.
+
+    Parameters
+    ----------
+    store: CacheBackend | str | Path
+        Where to persist: a cache backend, a ``.db``/``.sqlite`` path or a directory
+    endpoint: str
+        Name of the crawled list, e.g. ``"user_followers_v1"``
+    params: dict, optional
+        Arguments identifying the crawl (user id, tab, order...)
+    dedup_window: int
+        Number of recent item keys kept to skip items a resumed page repeats
+    """
+
+    namespace = "checkpoints"
+
+    def __init__(
+        self,
+        store: Union[CacheBackend, str, Path],
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        dedup_window: int = 1000,
+    ):
+        self.store = build_cache_backend(store)
+        if self.store is None:
+            raise ValueError("Checkpoint requires a store")
+        self.endpoint = endpoint
+        self.params = params or {}
+        digest = hashlib.sha1(
+            json.dumps(self.params, sort_keys=True, default=str).encode(), usedforsecurity=False
+        ).hexdigest()
+        self.key = f"{endpoint}:{digest[:16]}"
+        self.dedup_window = dedup_window
+        self.reset(persist=False)
+        self.load()
+
+    def reset(self, persist: bool = True) -> None:
+        """Forget the progress, the next crawl starts from the first page"""
+        self.started = False
+        self.done = False
+        self.cursor = None
+        self.yielded = 0
+        self._recent = deque()
+        self._recent_keys = set()
+        if persist:
+            self.store.delete(self.namespace, self.key)
+
+    def load(self) -> bool:
+        data = self.store.get(self.namespace, self.key)
+        if not data:
+            return False
+        try:
+            state = json.loads(data)
+        except ValueError:
+            return False
+        self.started = True
+        self.done = bool(state.get("done"))
+        self.cursor = state.get("cursor")
+        self.yielded = int(state.get("yielded") or 0)
+        for key in state.get("recent") or []:
+            self.remember(key)
+        return True
+
+    def save(self) -> None:
+        state = {
+            "endpoint": self.endpoint,
+            "params": self.params,
+            "cursor": self.cursor,
+            "yielded": self.yielded,
+            "done": self.done,
+            "recent": list(self._recent),
+            "updated_at": time.time(),
+        }
+        self.store.set(self.namespace, self.key, json.dumps(state, default=str))
+
+    def seen(self, key: Hashable) -> bool:
+        return key in self._recent_keys
+
+    def remember(self, key: Hashable) -> None:
+        if self.dedup_window <= 0 or key in self._recent_keys:
+            return
+        self._recent.append(key)
+        self._recent_keys.add(key)
+        if len(self._recent) > self.dedup_window:
+            self._recent_keys.discard(self._recent.popleft())
+
+    def __repr__(self) -> str:
+        return f"Checkpoint(key={self.key!r}, cursor={self.cursor!r}, yielded={self.yielded}, done={self.done})"
+
+
+def build_checkpoint(checkpoint, endpoint: str, default_store=None, **params) -> Optional[Checkpoint]:
+    """
+    Checkpoint for ``endpoint`` from the ``checkpoint`` argument of an ``iter_*`` method
+
+    None/False disables checkpointing, True uses ``default_store`` (the
+    client cache backend), a ``Checkpoint`` is used as is and a store
+    (backend instance or path) gets a checkpoint keyed by ``endpoint`` and ``params``.
+    """
+    if checkpoint is None or checkpoint is False:
+        return None
+    if isinstance(checkpoint, Checkpoint):
+        return checkpoint
+    if checkpoint is True:
+        if default_store is None:
+            raise ValueError("checkpoint=True requires a cache backend, see Client.set_cache_backend")
+        checkpoint = default_store
+    return Checkpoint(checkpoint, endpoint, params)
@@ -0,0 +1,214 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple, Type
+
+from instagrapi.exceptions import CircuitOpenError, ClientThrottledError, PleaseWaitFewMinutes, RateLimitError
+from instagrapi.utils.retry import retry_after_seconds
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_TRIP_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    ClientThrottledError,
+    PleaseWaitFewMinutes,
+    RateLimitError,
+)
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "opened_at", "open_until", "cooldown", "probes")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.outcomes = deque()  # (monotonic time, failed)
+        self.opened_at = None
+        self.open_until = 0.0
+        self.cooldown = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Fail fast while Instagram throttles an endpoint family
+
+    Outcomes are tracked per ``(endpoint family, proxy)``. When at least
+    ``min_requests`` calls in the last ``window`` seconds were seen and the
+    share of throttling responses (``ClientThrottledError``,
+    ``PleaseWaitFewMinutes``, ``RateLimitError``) reaches ``failure_ratio``,
+    the circuit opens: calls raise ``CircuitOpenError`` locally until the
+    cool-down ends. Then up to ``half_open_probes`` requests are let through;
+    a successful probe closes the circuit, a throttled one reopens it with a
+    doubled cool-down (up to ``max_cooldown``) and any other error leaves it
+    half-open for the next probe. A ``Retry-After`` header on
+    the tripping response extends the cool-down.
+
+    One breaker may be shared by several clients, which then share circuits
+    for the same proxy.
+
+    Parameters
+    ----------
+    failure_ratio: float
+        Share of throttled calls in the window that opens the circuit
+    min_requests: int
+        Minimum number of calls in the window before the ratio is considered
+    window: float
+        Seconds of history used for the ratio
+    cooldown: float
+        Seconds the circuit stays open the first time
+    max_cooldown: float
+        Upper bound for the doubled cool-down after failed probes
+    half_open_probes: int
+        Concurrent probe requests allowed once the cool-down ended
+    trip_exceptions: tuple
+        Exception classes counted as failures
+    """
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        min_requests: int = 3,
+        window: float = 60.0,
+        cooldown: float = 60.0,
+        max_cooldown: float = 900.0,
+        half_open_probes: int = 1,
+        trip_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_TRIP_EXCEPTIONS,
+    ):
+        if not 0 < failure_ratio <= 1:
+            raise ValueError("failure_ratio must be in (0, 1]")
+        self.failure_ratio = failure_ratio
+        self.min_requests = max(1, int(min_requests))
+        self.window = float(window)
+        self.cooldown = float(cooldown)
+        self.max_cooldown = max(float(max_cooldown), self.cooldown)
+        self.half_open_probes = max(1, int(half_open_probes))
+        self.trip_exceptions = tuple(trip_exceptions)
+        self.circuits: Dict[Tuple[str, Optional[str]], _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, family: str, proxy: Optional[str]) -> _Circuit:
+        key = (family, proxy or None)
+        circuit = self.circuits.get(key)
+        if circuit is None:
+            circuit = self.circuits[key] = _Circuit()
+        return circuit
+
+    @staticmethod
+    def _deadline(circuit: _Circuit) -> float:
+        # open_until is monotonic, expose wall-clock time to callers
+        return time.time() + max(0.0, circuit.open_until - time.monotonic())
+
+    def before(self, family: str, proxy: Optional[str] = None) -> None:
+        """Raise ``CircuitOpenError`` if a request for ``family`` through ``proxy`` must not be sent now"""
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(family, proxy)
+            if circuit.state == OPEN and now >= circuit.open_until:
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.state == CLOSED:
+                return
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_probes:
+                circuit.probes += 1
+                return
+            state = circuit.state
+            retry_at = self._deadline(circuit)
+        raise CircuitOpenError(
+            f"Circuit for {family} is {state}, retry after {retry_at - time.time():.0f} seconds",
+            family=family,
+            proxy=proxy,
+            retry_at=retry_at,
+        )
+
+    def record(self, family: str, proxy: Optional[str] = None, exc: BaseException = None) -> None:
+        """Record the outcome of a request let through by ``before``"""
+        if isinstance(exc, CircuitOpenError):
+            return
+        failed = isinstance(exc, self.trip_exceptions)
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(family, proxy)
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if failed:
+                    self._open(circuit, now, exc, min(self.max_cooldown, max(self.cooldown, circuit.cooldown * 2)))
+                elif exc is None:
+                    self._close(circuit)
+                # other errors say nothing about throttling: free the slot for the next probe
+                return
+            if circuit.state == OPEN:
+                return  # a request started before the circuit opened
+            circuit.outcomes.append((now, failed))
+            while circuit.outcomes and now - circuit.outcomes[0][0] > self.window:
+                circuit.outcomes.popleft()
+            total = len(circuit.outcomes)
+            if failed and total >= self.min_requests:
+                failures = sum(1 for _, outcome in circuit.outcomes if outcome)
+                if failures / total >= self.failure_ratio:
+                    self._open(circuit, now, exc, self.cooldown)
+
+    def _open(self, circuit: _Circuit, now: float, exc: BaseException, cooldown: float) -> None:
+        retry_after = retry_after_seconds(getattr(exc, "response", None))
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.cooldown = cooldown
+        circuit.open_until = now + max(cooldown, retry_after or 0.0)
+        circuit.outcomes.clear()
+
+    @staticmethod
+    def _close(circuit: _Circuit) -> None:
+        circuit.state = CLOSED
+        circuit.cooldown = 0.0
+        circuit.probes = 0
+        circuit.outcomes.clear()
+
+    def state(self, family: str, proxy: Optional[str] = None) -> str:
+        """``"closed"``, ``"open"`` or ``"half_open"``; an open circuit whose cool-down ended reports half_open"""
+        with self._lock:
+            circuit = self.circuits.get((family, proxy or None))
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() >= circuit.open_until:
+                return HALF_OPEN
+            return circuit.state
+
+    def is_open(self, family: str, proxy: Optional[str] = None) -> bool:
+        return self.state(family, proxy) == OPEN
+
+    def snapshot(self) -> Dict[Tuple[str, Optional[str]], dict]:
+        """State of every known circuit, for schedulers routing work to other accounts or proxies"""
+        now = time.monotonic()
+        result = {}
+        with self._lock:
+            for key, circuit in self.circuits.items():
+                state = circuit.state
+                if state == OPEN and now >= circuit.open_until:
+                    state = HALF_OPEN
+                result[key] = {
+                    "state": state,
+                    "requests": len(circuit.outcomes),
+                    "failures": sum(1 for _, failed in circuit.outcomes if failed),
+                    "retry_at": self._deadline(circuit) if state == OPEN else None,
+                }
+        return result
+
+    def reset(self, family: str = None, proxy: Optional[str] = None) -> None:
+        """Close one circuit, or every circuit when ``family`` is None"""
+        with self._lock:
+            if family is None:
+                self.circuits = {}
+            else:
+                self.circuits.pop((family, proxy or None), None)
+
+
+def build_circuit_breaker(breaker=None) -> Optional[CircuitBreaker]:
+    if breaker is None or breaker is False:
+        return None
+    if breaker is True:
+        return CircuitBreaker()
+    if isinstance(breaker, CircuitBreaker):
+        return breaker
+    if isinstance(breaker, dict):
+        return CircuitBreaker(**breaker)
+    raise TypeError(f"Unsupported circuit breaker: {breaker!r}")
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+
+_MISSING = object()
+
+
+def _request_local_state(obj) -> threading.local:
+    state = obj.__dict__.get("_request_local")
+    if state is None:
+        # dict.setdefault is atomic, so concurrent first uses agree on one object
+        state = obj.__dict__.setdefault("_request_local", threading.local())
+    return state
+
+
+def _is_request_local(obj, state) -> bool:
+    return bool(getattr(state, "depth", 0) or obj.__dict__.get("thread_safe"))
+
+
+class RequestLocal:
+    """
+    Client attribute that becomes per-thread inside ``request_local_scope``
+    or when the client runs with ``thread_safe=True``
+
+    Otherwise reads and writes go to the instance as a plain attribute
+    would, so single-threaded code sees no difference. Per-thread values keep
+    per-call results such as ``last_json`` from leaking between concurrent
+    requests.
+    """
+
+    def __init__(self, default=None):
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.shared_name = f"_shared_{name}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        state = _request_local_state(obj)
+        if _is_request_local(obj, state):
+            value = getattr(state, "values", {}).get(self.name, _MISSING)
+            if value is not _MISSING:
+                return value
+            return self.default
+        return obj.__dict__.get(self.shared_name, self.default)
+
+    def __set__(self, obj, value):
+        state = _request_local_state(obj)
+        if _is_request_local(obj, state):
+            if not hasattr(state, "values"):
+                state.values = {}
+            state.values[self.name] = value
+        else:
+            obj.__dict__[self.shared_name] = value
+
+
+@contextmanager
+def request_local_scope(obj):
+    """Make ``RequestLocal`` attributes of ``obj`` per-thread for the current thread"""
+    state = _request_local_state(obj)
+    depth = getattr(state, "depth", 0)
+    saved = getattr(state, "values", None)
+    if not depth:
+        state.values = {}
+    state.depth = depth + 1
+    try:
+        yield state.values
+    finally:
+        state.depth = depth
+        if not depth:
+            state.values = {} if saved is None else saved
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error", "owner", "waiters")
+
+    def __init__(self, owner: int):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.owner = owner
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one
+
+    The first caller of ``do`` for a key runs the function; callers arriving
+    while it is in flight wait for it and get the same result (or exception).
+    Nothing is cached once the call finished. A thread calling ``do`` again
+    for a key it is already running runs the function itself instead of
+    waiting on itself.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.shared = 0  # calls answered by another caller's flight
+
+    def do(self, key, fn, *args, **kwargs):
+        """Return ``(result, shared)``, ``shared`` is True when another caller ran ``fn``"""
+        me = threading.get_ident()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight(me)
+                leader = True
+            elif flight.owner == me:
+                flight, leader = None, False
+            else:
+                flight.waiters += 1
+                self.shared += 1
+                leader = False
+        if flight is None:
+            return fn(*args, **kwargs), False
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+        try:
+            flight.result = fn(*args, **kwargs)
+            return flight.result, False
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+class _AsyncFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    ``SingleFlight`` for coroutines running on one event loop
+
+    The call runs in a task of its own that every caller awaits, so a
+    cancelled caller (the first one included) only stops waiting; the call
+    is cancelled when no caller is left waiting for it.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self.shared = 0
+
+    def _landed(self, key, flight: _AsyncFlight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            flight.task.exception()  # retrieved, even when every caller was cancelled
+
+    async def do(self, key, fn, *args, **kwargs):
+        """Return ``(result, shared)``, ``shared`` is True when another caller started the call"""
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if shared:
+            self.shared += 1
+        else:
+            flight = self._flights[key] = _AsyncFlight(asyncio.ensure_future(fn(*args, **kwargs)))
+            flight.task.add_done_callback(lambda _: self._landed(key, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
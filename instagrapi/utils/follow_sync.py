@@ -0,0 +1,119 @@
+import json
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterable, List, Optional
+
+from instagrapi.types import UserShort
+
+_MAGIC = b"IGFS1"
+
+
+def _packed(pks: Iterable) -> array:
+    return array("Q", sorted({int(pk) for pk in pks}))
+
+
+class FollowSnapshot:
+    """
+    The pks of a follower or following list as of the last sync
+
+    Pks are kept in a sorted ``array`` (8 bytes each) and serialized with
+    ``dumps`` as zlib-compressed deltas, a few bytes per account.
+
+    Parameters
+    ----------
+    user_id: str
+        Owner of the list
+    kind: str
+        ``"followers"`` or ``"following"``
+    pks: Iterable, optional
+        Known pks
+    synced_at: float, optional
+        Time of the last sync
+    full_synced_at: float, optional
+        Time of the last full sync (the only kind that detects removals)
+    """
+
+    __slots__ = ("user_id", "kind", "pks", "synced_at", "full_synced_at")
+
+    def __init__(
+        self,
+        user_id: str,
+        kind: str = "followers",
+        pks: Iterable = (),
+        synced_at: Optional[float] = None,
+        full_synced_at: Optional[float] = None,
+    ):
+        self.user_id = str(user_id)
+        self.kind = kind
+        self.pks = pks if isinstance(pks, array) else _packed(pks)
+        self.synced_at = synced_at
+        self.full_synced_at = full_synced_at
+
+    def __len__(self) -> int:
+        return len(self.pks)
+
+    def __contains__(self, pk) -> bool:
+        pk = int(pk)
+        i = bisect_left(self.pks, pk)
+        return i < len(self.pks) and self.pks[i] == pk
+
+    def __iter__(self):
+        return (str(pk) for pk in self.pks)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FollowSnapshot):
+            return NotImplemented
+        return (self.user_id, self.kind, self.pks) == (other.user_id, other.kind, other.pks)
+
+    def __repr__(self) -> str:
+        return f"FollowSnapshot(user_id={self.user_id!r}, kind={self.kind!r}, size={len(self)})"
+
+    def merged(self, added: Iterable, removed: Iterable = (), synced_at: float = None, full: bool = False):
+        """New snapshot with ``added`` pks included and ``removed`` pks dropped"""
+        removed = {int(pk) for pk in removed}
+        pks = _packed([*(pk for pk in self.pks if pk not in removed), *added])
+        synced_at = time.time() if synced_at is None else synced_at
+        return FollowSnapshot(self.user_id, self.kind, pks, synced_at, synced_at if full else self.full_synced_at)
+
+    def dumps(self) -> bytes:
+        header = {
+            "user_id": self.user_id,
+            "kind": self.kind,
+            "synced_at": self.synced_at,
+            "full_synced_at": self.full_synced_at,
+        }
+        deltas = array("Q", (b - a for a, b in zip((0, *self.pks), self.pks)))
+        if sys.byteorder == "big":
+            deltas.byteswap()
+        return _MAGIC + zlib.compress(json.dumps(header).encode() + b"\n" + deltas.tobytes(), 9)
+
+    @classmethod
+    def loads(cls, data: bytes) -> "FollowSnapshot":
+        if not data.startswith(_MAGIC):
+            raise ValueError("Not a FollowSnapshot")
+        try:
+            header, _, body = zlib.decompress(data[len(_MAGIC) :]).partition(b"\n")
+            header = json.loads(header)
+            deltas = array("Q")
+            deltas.frombytes(body)
+            if sys.byteorder == "big":
+                deltas.byteswap()
+            return cls(pks=array("Q", accumulate(deltas)), **header)
+        except (zlib.error, TypeError, OverflowError) as e:
+            raise ValueError(f"Corrupt FollowSnapshot: {e}") from e
+
+
+@dataclass
+class FollowDelta:
+    """Result of ``Client.user_followers_delta`` / ``user_following_delta``"""
+
+    added: List[UserShort]  # newest first
+    removed: List[str]  # only known after a full sync
+    snapshot: FollowSnapshot
+    full: bool = False  # whether the whole list was walked
+    pages: int = 0
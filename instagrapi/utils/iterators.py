@@ -1,40 +1,252 @@
-from collections.abc import Callable, Iterator, Sequence
-from typing import TypeVar
+import contextvars
+import queue
+import threading
+from collections.abc import Callable, Collection, Hashable, Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Optional, TypeVar, Union
+
+from instagrapi.utils.checkpoints import Checkpoint
 
 T = TypeVar("T")
 Cursor = str | None
 PageFetcher = Callable[[Cursor, int], tuple[Sequence[T], Cursor]]
 
+_ITEM, _DONE, _ERROR = range(3)
+_UNLOADED = object()
+
+
+def _timestamp(value: Union[datetime, float, None]) -> Optional[float]:
+    if value is None or isinstance(value, float):
+        return value
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class TimeWindow:
+    """
+    Page filter keeping items with ``since <= taken_at < until`` that pass ``predicate``
+
+    On a newest-first listing (``ordered``) it also tells ``iter_paginated``
+    when older pages cannot contain matches: after the first page made only
+    of items older than ``since``, or, when ``pinned`` (a callable returning
+    the pks of pinned items, or None if unknown) is given, at the first item
+    older than ``since`` that is not pinned. ``pinned`` is called at most
+    once, when the first older item shows up.
+
+    ``since`` and ``until`` take datetimes (naive ones are local time) or unix timestamps.
+    """
+
+    def __init__(
+        self,
+        since: Union[datetime, float, None] = None,
+        until: Union[datetime, float, None] = None,
+        predicate: Optional[Callable[[T], bool]] = None,
+        ordered: bool = True,
+        pinned: Optional[Callable[[], Optional[Iterable]]] = None,
+    ):
+        self.since = _timestamp(since)
+        self.until = _timestamp(until)
+        self.predicate = predicate
+        self.ordered = ordered
+        self.pinned = pinned
+        self._pinned_pks = _UNLOADED
+
+    def pinned_pks(self) -> Optional[Collection[str]]:
+        if self._pinned_pks is _UNLOADED:
+            pks = self.pinned() if self.pinned else None
+            self._pinned_pks = None if pks is None else {str(pk) for pk in pks}
+        return self._pinned_pks
+
+    def apply(self, items: Sequence[T]) -> tuple[list[T], bool]:
+        """Items of the page inside the window and whether the listing is exhausted"""
+        kept, exhausted, older = [], False, 0
+        for item in items:
+            taken_at = item.taken_at.timestamp()
+            if self.since is not None and taken_at < self.since:
+                older += 1
+                if self.ordered and not exhausted:
+                    pinned = self.pinned_pks()
+                    exhausted = pinned is not None and str(item.pk) not in pinned
+                continue
+            if self.until is not None and taken_at >= self.until:
+                continue
+            if self.predicate is not None and not self.predicate(item):
+                continue
+            kept.append(item)
+        if self.ordered and items and older == len(items):
+            exhausted = True
+        return kept, exhausted
+
+
+def iter_prefetched(iterable: Iterable[T], buffer: int = 1) -> Iterator[T]:
+    """
+    Consume ``iterable`` in a background thread, keeping up to ``buffer`` items ready
+
+    Exceptions raised by ``iterable`` are re-raised to the consumer at the
+    same position. When the consumer stops early (``break``, ``close()`` or
+    garbage collection) the thread finishes the item it is producing and exits.
+    """
+    if buffer < 1:
+        raise ValueError("buffer must be >= 1")
+    ready: queue.Queue = queue.Queue(maxsize=buffer)
+    stop = threading.Event()
+
+    def put(kind: int, value=None) -> bool:
+        ready.put((kind, value))
+        return not stop.is_set()
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put(_ITEM, item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_ERROR, e)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    # the producer sees the consumer's context variables (the client's validation mode...)
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(produce,), name="instagrapi-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = ready.get()
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                return
+    finally:
+        stop.set()
+        # Free the queue so a producer blocked on put() sees the stop flag
+        while True:
+            try:
+                ready.get_nowait()
+            except queue.Empty:
+                break
 
-def iter_paginated(
-    fetch_page: PageFetcher[T],
-    amount: int = 0,
-    page_size: int = 0,
-    initial_cursor: Cursor = None,
-) -> Iterator[T]:
-    amount = int(amount)
-    page_size = int(page_size)
-    cursor = initial_cursor
-    yielded = 0
 
+def _iter_pages(
+    fetch_page: PageFetcher[T],
+    amount: int,
+    page_size: int,
+    cursor: Cursor,
+    window: Optional[TimeWindow] = None,
+) -> Iterator[tuple[Cursor, Sequence[T], Cursor]]:
+    fetched = 0
     while True:
         page_amount = page_size
         if amount:
-            remaining = amount - yielded
+            remaining = amount - fetched
             if remaining <= 0:
                 return
-            page_amount = min(page_size, remaining) if page_size else remaining
+            # a window filters pages, so the requests keep their full size
+            if window is None:
+                page_amount = min(page_size, remaining) if page_size else remaining
 
         items, next_cursor = fetch_page(cursor, page_amount)
         if not items:
             return
-
-        for item in items:
-            if amount and yielded >= amount:
-                return
-            yield item
-            yielded += 1
+        if window is not None:
+            items, exhausted = window.apply(items)
+            if exhausted:
+                next_cursor = None
+        if amount:
+            items = items[: amount - fetched]
+        yield cursor, items, next_cursor
+        fetched += len(items)
 
         if not next_cursor or next_cursor == cursor:
             return
         cursor = next_cursor
+
+
+def _item_key(item) -> str:
+    if isinstance(item, dict):
+        # raw GraphQL nodes, possibly wrapped in an edge
+        node = item.get("node", item)
+        key = node.get("pk") or node.get("id")
+    else:
+        key = getattr(item, "pk", None) or getattr(item, "id", None)
+    return str(item if key is None else key)
+
+
+def _iter_checkpointed(pages, checkpoint: Checkpoint, item_key: Callable, amount: int) -> Iterator:
+    try:
+        for cursor, items, next_cursor in pages:
+            checkpoint.started = True
+            checkpoint.cursor = cursor
+            for item in items:
+                if amount and checkpoint.yielded >= amount:
+                    # keep the page cursor, a larger amount resumes mid-page
+                    return
+                key = item_key(item)
+                if checkpoint.seen(key):
+                    continue
+                checkpoint.remember(key)
+                checkpoint.yielded += 1
+                yield item
+            checkpoint.cursor = next_cursor
+            checkpoint.save()
+            if amount and checkpoint.yielded >= amount:
+                return
+        checkpoint.done = True
+    finally:
+        checkpoint.save()
+
+
+def iter_paginated(
+    fetch_page: PageFetcher[T],
+    amount: int = 0,
+    page_size: int = 0,
+    initial_cursor: Cursor = None,
+    prefetch: int = 0,
+    checkpoint: Optional[Checkpoint] = None,
+    item_key: Callable[[T], Hashable] = None,
+    window: Optional[TimeWindow] = None,
+) -> Iterator[T]:
+    """
+    Yield the items of cursor-paginated ``fetch_page(cursor, page_amount)`` calls
+
+    With ``prefetch`` set, up to that many following pages are fetched in a
+    background thread while the consumer handles the current one; stopping
+    early wastes at most ``prefetch + 1`` page requests.
+
+    With a ``checkpoint`` the crawl resumes from the saved cursor, counts
+    ``amount`` across runs and skips items already yielded (matched by
+    ``item_key``, the ``pk`` or ``id`` of the item by default); a finished
+    crawl yields nothing until ``checkpoint.reset()``.
+
+    A ``window`` filters every page before ``amount`` is applied and ends
+    the crawl once it reports the listing exhausted.
+    """
+    amount, page_size = int(amount), int(page_size)
+    limit = amount
+    if checkpoint is not None:
+        if checkpoint.done or (amount and checkpoint.yielded >= amount):
+            return
+        if checkpoint.started:
+            initial_cursor = checkpoint.cursor
+        if amount:
+            # a resumed page repeats skipped items, count the limit in yielded items instead;
+            # requests keep their full size, a page trimmed by the fetcher would checkpoint
+            # the next page's cursor past the items it dropped
+            amount = 0
+    pages = _iter_pages(fetch_page, amount, page_size, initial_cursor, window)
+    if prefetch:
+        pages = iter_prefetched(pages, int(prefetch))
+    try:
+        if checkpoint is None:
+            for _, items, _ in pages:
+                yield from items
+        else:
+            yield from _iter_checkpointed(pages, checkpoint, item_key or _item_key, limit)
+    finally:
+        pages.close()
@@ -0,0 +1,133 @@
+import threading
+import typing
+from typing import Any, Callable, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+_lazy_classes: Dict[type, type] = {}  # model class -> lazy subclass
+_eager_classes: Dict[type, type] = {}  # lazy subclass -> model class
+_lazy_classes_lock = threading.Lock()
+_object_setattr = object.__setattr__
+
+
+def _pending(obj: BaseModel) -> Dict[str, Callable[[], Any]]:
+    private = object.__getattribute__(obj, "__pydantic_private__")
+    return (private or {}).get("_pending") or {}
+
+
+def _decode(obj: BaseModel, name: str, decode: Callable[[], Any]) -> Any:
+    # validated like an assignment, so raw sub-dicts become their models
+    obj.__pydantic_validator__.validate_assignment(obj, name, decode())
+    return obj.__dict__[name]
+
+
+def materialize(obj: M) -> M:
+    """Decode every field ``obj`` still keeps raw, return ``obj``"""
+    pending = _pending(obj)
+    if pending:
+        for name, decode in pending.items():
+            if name not in obj.__dict__:
+                _decode(obj, name, decode)
+        # decoded fields were appended, dumps follow the field order like eager models
+        values = obj.__dict__
+        _object_setattr(obj, "__dict__", {name: values[name] for name in type(obj).model_fields if name in values})
+        # dropped rather than cleared: copies may share the mapping, and a decoded
+        # model has no private state, like the eager one it compares equal to
+        _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def is_lazy(obj: Any) -> bool:
+    """Whether ``obj`` is a model built by ``lazy_model``"""
+    return type(obj) in _eager_classes
+
+
+def eager_copy(obj: M) -> M:
+    """Plain instance of the model class of a lazy ``obj``, every field decoded"""
+    materialize(obj)
+    cls = _eager_classes.get(type(obj), type(obj))
+    new = cls.__new__(cls)
+    _object_setattr(new, "__dict__", dict(obj.__dict__))
+    _object_setattr(new, "__pydantic_extra__", obj.__pydantic_extra__)
+    _object_setattr(new, "__pydantic_fields_set__", set(obj.__pydantic_fields_set__))
+    _object_setattr(new, "__pydantic_private__", None)
+    return new
+
+
+def _unpickle_eager(obj: M) -> M:
+    return obj
+
+
+def _materialized(method: Callable) -> Callable:
+    def wrapper(self, *args, **kwargs):
+        return method(materialize(self), *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def _lazy_getattr(self, name: str) -> Any:
+    decode = _pending(self).get(name)
+    if decode is None:
+        return BaseModel.__getattr__(self, name)
+    return _decode(self, name, decode)
+
+
+def _lazy_eq(self, other: Any) -> bool:
+    if is_lazy(other):
+        materialize(other)
+    return BaseModel.__eq__(materialize(self), other)
+
+
+def _lazy_class(cls: Type[M]) -> Type[M]:
+    """Subclass of ``cls`` decoding pending fields on access, equal to (and pickled as) ``cls``"""
+    lazy = _lazy_classes.get(cls)
+    if lazy is not None:
+        return lazy
+    with _lazy_classes_lock:
+        lazy = _lazy_classes.get(cls)
+        if lazy is None:
+            namespace = {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "__getattr__": _lazy_getattr,
+                "__eq__": _lazy_eq,
+                "__hash__": cls.__hash__,
+                "__reduce_ex__": lambda self, protocol: (_unpickle_eager, (eager_copy(self),)),
+                "__copy__": lambda self: eager_copy(self),
+                "__deepcopy__": _materialized(cls.__deepcopy__),
+            }
+            for name in ("model_dump", "model_dump_json", "__iter__", "__repr_args__"):
+                namespace[name] = _materialized(getattr(cls, name))
+            lazy = type(cls.__name__, (cls,), namespace)
+            # BaseModel.__eq__ compares the generic origin (or the class) of both sides
+            lazy.__pydantic_generic_metadata__ = {**cls.__pydantic_generic_metadata__, "origin": cls}
+            _eager_classes[lazy] = cls
+            _lazy_classes[cls] = lazy
+    return lazy
+
+
+def _placeholder(cls: Type[BaseModel], name: str) -> Any:
+    annotation = cls.model_fields[name].annotation
+    return [] if typing.get_origin(annotation) in (list, typing.List) else None
+
+
+def lazy_model(cls: Type[M], data: dict, decoders: Dict[str, Callable[[], Any]]) -> M:
+    """
+    ``cls`` instance from ``data`` whose ``decoders`` fields are decoded on first access
+
+    The other fields are validated now. Each decoder returns the raw value
+    of its field (a dict, a list of models...) and runs at most once, when
+    the field is read, or for all pending fields together when the model is
+    dumped, compared, printed, copied or pickled. The instance is a
+    subclass of ``cls`` that compares equal to an eager ``cls(**data)``.
+    """
+    lazy = _lazy_class(cls)
+    instance = lazy(**{**data, **{name: _placeholder(cls, name) for name in decoders}})
+    for name in decoders:
+        del instance.__dict__[name]
+    _object_setattr(instance, "__pydantic_private__", {"_pending": dict(decoders)})
+    return instance
@@ -1,3 +1,6 @@
+import random
+from datetime import timedelta
+
 DEFAULT_LOG_TEXT_LIMIT = 512
 
 
@@ -7,3 +10,52 @@ def truncate_log_text(text, limit: int = DEFAULT_LOG_TEXT_LIMIT) -> str:
         return text
     omitted = len(text) - limit
     return f"{text[:limit]}... [truncated {omitted} chars; total {len(text)}]"
+
+
+def should_log_body(status_code, sample_rate: float = 0.0) -> bool:
+    """Body excerpts are logged for every error response and a ``sample_rate`` fraction of the rest"""
+    try:
+        if int(status_code) >= 400:
+            return True
+    except (TypeError, ValueError):
+        pass
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def request_log_record(response, sample_rate: float = 0.0, body_limit: int = DEFAULT_LOG_TEXT_LIMIT, **fields) -> dict:
+    """
+    Build the structured record attached to sampled request logs
+
+    Parameters
+    ----------
+    response:
+        ``requests`` or ``httpx`` response
+    sample_rate: float
+        Fraction of successful responses whose body excerpt is included
+    body_limit: int
+        Maximum number of body characters to include
+    fields:
+        Extra fields (username, device, ...) copied into the record
+
+    Returns
+    -------
+    dict
+        Record with ``method``, ``url``, ``status``, ``elapsed_ms`` and optionally ``body``
+    """
+    request = getattr(response, "request", None)
+    record = dict(
+        fields,
+        method=getattr(request, "method", None),
+        url=str(response.url),
+        status=response.status_code,
+        elapsed_ms=None,
+    )
+    try:
+        elapsed = response.elapsed
+    except (AttributeError, RuntimeError):
+        elapsed = None
+    if isinstance(elapsed, timedelta):
+        record["elapsed_ms"] = round(elapsed.total_seconds() * 1000, 1)
+    if should_log_body(response.status_code, sample_rate):
+        record["body"] = truncate_log_text(response.text, body_limit)
+    return record
@@ -0,0 +1,239 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Union
+
+DEFAULT_FAMILY = "default"
+PUBLIC_FAMILY = "public"
+GRAPHQL_FAMILY = "graphql"
+PRIVATE_GRAPHQL_FAMILY = "private:graphql"
+
+
+def endpoint_family(endpoint: Optional[str], channel: str = "private") -> str:
+    """Map an endpoint to the pacing family it is budgeted under.
+
+    Private endpoints are grouped by their first path segment (e.g.
+    ``feed/user/1/`` and ``/v1/feed/timeline/`` are both ``private:feed``),
+    public and GraphQL traffic is budgeted per channel.
+    """
+    if channel != "private":
+        return channel
+    path = (endpoint or "").strip("/")
+    if path.startswith("v1/"):
+        path = path[3:]
+    segment = path.split("/", 1)[0].split("?", 1)[0]
+    return f"private:{segment}" if segment else "private"
+
+
+class RequestPacer(ABC):
+    """Base class for request pacers.
+
+    A pacer is consulted by the private, public and GraphQL senders right
+    before a request goes out. ``reserve`` books a slot for one request and
+    returns how many seconds the caller has to wait before sending it;
+    ``acquire`` does the same and sleeps for that long (async senders
+    ``await asyncio.sleep`` on the reserved delay instead).
+    """
+
+    @abstractmethod
+    def reserve(self, family: str = DEFAULT_FAMILY) -> float:
+        """Book a slot for one request of ``family``, return the seconds to wait before sending it"""
+
+    def acquire(self, family: str = DEFAULT_FAMILY) -> float:
+        delay = self.reserve(family)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def reset(self) -> None:
+        pass
+
+
+class LegacyPacer(RequestPacer):
+    """Compatibility preset that reproduces the historic fixed sleeps.
+
+    * private requests sleep ``client.request_timeout`` before every call;
+    * public requests keep a 1 second gap after the previous response and
+      then sleep ``client.request_timeout``;
+    * public GraphQL requests only keep the 1 second gap.
+
+    ``request_timeout`` and ``last_response_ts`` are read from the client on
+    every call so ``set_retry_config`` keeps working as before.
+    """
+
+    min_interval = 1.0
+
+    def __init__(self, client):
+        self.client = client
+        self.next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, family: str = DEFAULT_FAMILY) -> float:
+        delay = 0.0
+        if family in (PUBLIC_FAMILY, GRAPHQL_FAMILY):
+            last_response_ts = getattr(self.client, "last_response_ts", 0)
+            if last_response_ts and (time.time() - last_response_ts) < self.min_interval:
+                delay += self.min_interval
+            if family == GRAPHQL_FAMILY:
+                return delay
+        request_timeout = getattr(self.client, "request_timeout", 0)
+        if not request_timeout:
+            return delay
+        with self._lock:
+            # Concurrent callers are queued one ``request_timeout`` apart
+            now = time.monotonic()
+            self.next_slot = max(now, self.next_slot) + request_timeout
+            return delay + self.next_slot - now
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    ``rate`` tokens are added per second up to ``burst``. With ``burst=1``
+    the bucket degrades into a leaky bucket that spaces requests evenly at
+    ``1 / rate`` seconds.
+    """
+
+    def __init__(self, rate: float, burst: float = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take ``tokens`` from the bucket and return how long to wait before using them"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+Budget = Union[Tuple[float, float], Dict[str, float]]
+
+
+class TokenBucketPacer(RequestPacer):
+    """Pace requests with one token bucket per endpoint family.
+
+    Requests only wait when their family (or the optional account-wide
+    bucket) has run out of tokens, so an account far below its budget is
+    not slowed down at all.
+
+    Parameters
+    ----------
+    rate: float
+        Default refill rate, in requests per second, for families without
+        an explicit budget
+    burst: float
+        Default bucket size (how many requests may go out back-to-back)
+    budgets: dict, optional
+        Per-family budgets, ``{"private:friendships": (0.05, 2), "public": {"rate": 0.5, "burst": 5}}``.
+        A family also matches a budget registered for its channel prefix,
+        e.g. ``"private"`` covers every ``private:*`` family without its own entry
+    total_rate: float, optional
+        Account-wide refill rate shared by every family
+    total_burst: float, optional
+        Account-wide bucket size, defaults to ``burst``
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: float = 5,
+        budgets: Optional[Dict[str, Budget]] = None,
+        total_rate: Optional[float] = None,
+        total_burst: Optional[float] = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.budgets = {family: self._parse_budget(budget) for family, budget in (budgets or {}).items()}
+        self.total = TokenBucket(total_rate, total_burst or burst) if total_rate else None
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _parse_budget(budget: Budget) -> Tuple[float, float]:
+        if isinstance(budget, dict):
+            return float(budget["rate"]), float(budget.get("burst", 1))
+        rate, burst = budget
+        return float(rate), float(burst)
+
+    def budget_for(self, family: str) -> Tuple[float, float]:
+        if family in self.budgets:
+            return self.budgets[family]
+        channel = family.split(":", 1)[0]
+        if channel in self.budgets:
+            return self.budgets[channel]
+        return self.rate, self.burst
+
+    def bucket(self, family: str) -> TokenBucket:
+        bucket = self.buckets.get(family)
+        if bucket is None:
+            with self._lock:
+                bucket = self.buckets.get(family)
+                if bucket is None:
+                    bucket = self.buckets[family] = TokenBucket(*self.budget_for(family))
+        return bucket
+
+    def reserve(self, family: str = DEFAULT_FAMILY) -> float:
+        delay = self.bucket(family).reserve()
+        if self.total is not None:
+            delay = max(delay, self.total.reserve())
+        return delay
+
+    def reset(self) -> None:
+        with self._lock:
+            self.buckets = {}
+        if self.total is not None:
+            self.total = TokenBucket(self.total.rate, self.total.burst)
+
+
+class NoopPacer(RequestPacer):
+    """Never waits. Useful in tests or when pacing is done elsewhere."""
+
+    def reserve(self, family: str = DEFAULT_FAMILY) -> float:
+        return 0.0
+
+
+PACER_PRESETS = ("legacy", "balanced", "none")
+
+
+def build_pacer(pacer: Union[None, str, RequestPacer], client=None) -> RequestPacer:
+    """Resolve a pacer preset name (or instance) to a pacer
+
+    * ``None`` / ``"legacy"`` -- historic fixed sleeps (``LegacyPacer``)
+    * ``"balanced"`` -- token buckets, 1 req/s with bursts of 5 per family
+      and a stricter budget for relationship mutations
+    * ``"none"`` -- no pacing at all
+    """
+    if isinstance(pacer, RequestPacer):
+        return pacer
+    if pacer in (None, "legacy"):
+        return LegacyPacer(client)
+    if pacer == "balanced":
+        return TokenBucketPacer(
+            rate=1.0,
+            burst=5,
+            budgets={"private:friendships": (0.2, 2), PUBLIC_FAMILY: (0.5, 3), GRAPHQL_FAMILY: (0.5, 3)},
+        )
+    if pacer == "none":
+        return NoopPacer()
+    raise ValueError(f"Unknown pacer preset {pacer!r}, expected one of {PACER_PRESETS} or a RequestPacer")
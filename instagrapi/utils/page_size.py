@@ -0,0 +1,167 @@
+import threading
+from typing import Dict, Optional, Tuple, Type
+
+from instagrapi.exceptions import (
+    ClientBadRequestError,
+    ClientGraphqlError,
+    ClientIncompleteReadError,
+    ClientJSONDecodeError,
+    ClientRequestTimeout,
+)
+
+DEFAULT_SHRINK_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    ClientBadRequestError,
+    ClientGraphqlError,
+    ClientIncompleteReadError,
+    ClientJSONDecodeError,
+    ClientRequestTimeout,
+)
+
+
+class PageSizer:
+    """
+    Learn the largest page size every list endpoint accepts
+
+    ``size()`` starts at the caller's default. Each full page with more
+    results to come multiplies the size by ``growth`` (the caller's maximum
+    still applies). A page shorter than requested while more remain reveals
+    a server cap, which becomes the size and the ceiling. A request failing
+    with one of ``shrink_exceptions`` (bad request, GraphQL error, truncated
+    or timed out response) multiplies the size by ``backoff`` for the retry.
+    Once a smaller page succeeds, the failed size is remembered as too large
+    and later growth only probes halfway towards it. An error that persists
+    down to a page of one item had nothing to do with the size: the state
+    from before the first failure is restored. After ``reprobe_after`` full
+    pages the learned limits are forgotten, so a transient failure does not
+    pin the size forever.
+
+    The learned state is plain data: ``snapshot()`` and ``restore()``
+    round-trip it, and the client keeps it in its settings under
+    ``"page_sizes"``. One sizer may be shared by several clients.
+
+    Parameters
+    ----------
+    growth: float
+        Factor applied to the size after a full page
+    backoff: float
+        Factor applied to the size after a failed request
+    reprobe_after: int
+        Full pages after which the learned cap and failed size are forgotten
+    shrink_exceptions: tuple
+        Exception classes that mean the page was too large
+    """
+
+    def __init__(
+        self,
+        growth: float = 2.0,
+        backoff: float = 0.5,
+        reprobe_after: int = 100,
+        shrink_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_SHRINK_EXCEPTIONS,
+    ):
+        if growth <= 1:
+            raise ValueError("growth must be > 1")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be in (0, 1)")
+        self.growth = growth
+        self.backoff = backoff
+        self.reprobe_after = int(reprobe_after)
+        self.shrink_exceptions = tuple(shrink_exceptions)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, dict] = {}
+        # endpoint -> (state before the first failure, smallest failed size), until a retry succeeds
+        self._probes: Dict[str, Tuple[Optional[dict], int]] = {}
+
+    def size(self, endpoint: str, default: int, maximum: int) -> int:
+        """Page size to request from ``endpoint`` next"""
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            size = state["size"] if state else default
+        return max(1, min(int(size), int(maximum)))
+
+    def record(self, endpoint: str, requested: int, received: int, has_more: bool) -> None:
+        """Report a successful page of ``received`` items for a ``requested`` size"""
+        with self._lock:
+            probe = self._probes.pop(endpoint, None)
+            if probe is not None and endpoint in self._endpoints:
+                # a smaller page went through, the failed size was too large indeed
+                state = self._endpoints[endpoint]
+                state["failed"] = min(probe[1], state.get("failed") or probe[1])
+            if requested <= 0 or not has_more:
+                # the last page is short by nature, it tells nothing about limits
+                return
+            state = self._endpoints.setdefault(endpoint, {"size": requested})
+            if received < requested:
+                if received > 0:
+                    state["cap"] = received
+                    state["size"] = received
+                state["good"] = 0
+                return
+            state["good"] = state.get("good", 0) + 1
+            if self.reprobe_after and state["good"] >= self.reprobe_after:
+                state.pop("cap", None)
+                state.pop("failed", None)
+                state["good"] = 0
+            target = max(int(requested * self.growth), requested + 1)
+            if state.get("failed"):
+                target = min(target, (requested + state["failed"]) // 2)
+            if state.get("cap"):
+                target = min(target, state["cap"])
+            state["size"] = max(state["size"], target)
+
+    def failed(self, endpoint: str, requested: int, exc: BaseException) -> bool:
+        """Report a failed request, return True when it shrank the page size for a retry"""
+        with self._lock:
+            if requested <= 1 or not isinstance(exc, self.shrink_exceptions):
+                probe = self._probes.pop(endpoint, None)
+                if probe is not None:
+                    # the smaller pages failed too, the size was not the cause
+                    if probe[0] is None:
+                        self._endpoints.pop(endpoint, None)
+                    else:
+                        self._endpoints[endpoint] = probe[0]
+                return False
+            state = self._endpoints.get(endpoint)
+            before, failed = self._probes.get(endpoint, (state and dict(state), requested))
+            self._probes[endpoint] = (before, min(requested, failed))
+            state = self._endpoints.setdefault(endpoint, {"size": requested})
+            state["size"] = max(1, int(requested * self.backoff))
+            state["good"] = 0
+        return True
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {endpoint: dict(state) for endpoint, state in self._endpoints.items()}
+
+    def restore(self, state: Optional[Dict[str, dict]]) -> None:
+        endpoints = {}
+        for endpoint, values in (state or {}).items():
+            try:
+                endpoints[endpoint] = {key: int(value) for key, value in values.items() if value is not None}
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if endpoints[endpoint].get("size", 0) < 1:
+                del endpoints[endpoint]
+        with self._lock:
+            self._endpoints = endpoints
+            self._probes.clear()
+
+    def reset(self, endpoint: str = None) -> None:
+        with self._lock:
+            if endpoint is None:
+                self._endpoints.clear()
+                self._probes.clear()
+            else:
+                self._endpoints.pop(endpoint, None)
+                self._probes.pop(endpoint, None)
+
+
+def build_page_sizer(sizer=None) -> Optional[PageSizer]:
+    if sizer is None or sizer is False:
+        return None
+    if sizer is True:
+        return PageSizer()
+    if isinstance(sizer, PageSizer):
+        return sizer
+    if isinstance(sizer, dict):
+        return PageSizer(**sizer)
+    raise TypeError(f"Unsupported page sizer: {sizer!r}")
@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` shared between sessions that remembers when it was last used"""
+
+    def __init__(self, *args, manager: "ConnectionPoolManager" = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manager = manager
+        self.last_used = time.monotonic()
+
+    def send(self, request, *args, **kwargs):
+        self.last_used = time.monotonic()
+        if self.manager is not None:
+            self.manager.maybe_evict_idle()
+        return super().send(request, *args, **kwargs)
+
+
+class ConnectionPoolManager:
+    """
+    Keep-alive connection pools shared by many ``Client`` instances
+
+    By default every ``Client`` mounts its own ``HTTPAdapter`` on each of its
+    three sessions, so a worker running many accounts keeps many idle TLS
+    connections to the same hosts and pays a handshake per account. Passing one
+    manager to every client (``Client(pool_manager=manager)``) makes the clients
+    share adapters keyed by ``(proxy, retry settings)``; inside an adapter
+    ``urllib3`` keeps one pool per host, so connections are effectively pooled per
+    ``(host, proxy)``. Cookies and headers stay on each client's own session.
+
+    Parameters
+    ----------
+    pool_connections: int
+        Number of per-host pools each adapter keeps
+    pool_maxsize: int
+        Maximum number of connections kept alive per pool
+    pool_block: bool
+        When True ``pool_maxsize`` is a hard cap on concurrent connections per pool,
+        otherwise extra connections are opened and discarded after use
+    max_idle: float
+        Seconds after which the connections of an unused adapter are closed; ``0`` disables eviction
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        max_idle: float = 300,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_idle = max_idle
+        self.adapters: Dict[Tuple[Optional[str], Hashable], PooledHTTPAdapter] = {}
+        self._last_eviction = time.monotonic()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _retry_key(max_retries) -> Hashable:
+        if max_retries is None or isinstance(max_retries, int):
+            return max_retries or 0
+        return (
+            max_retries.total,
+            tuple(sorted(max_retries.status_forcelist or ())),
+            max_retries.backoff_factor,
+            tuple(sorted(getattr(max_retries, "allowed_methods", None) or ())),
+        )
+
+    def adapter(self, max_retries=None, proxy: Optional[str] = None) -> PooledHTTPAdapter:
+        """Return the shared adapter for ``proxy`` and retry settings, creating it on first use"""
+        key = (proxy or None, self._retry_key(max_retries))
+        self.maybe_evict_idle()
+        with self._lock:
+            adapter = self.adapters.get(key)
+            if adapter is None:
+                adapter = self.adapters[key] = PooledHTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                    max_retries=0 if max_retries is None else max_retries,
+                    manager=self,
+                )
+            return adapter
+
+    def mount(self, session, max_retries=None, proxy: Optional[str] = None) -> PooledHTTPAdapter:
+        """Mount the shared adapter on ``session`` for http and https"""
+        adapter = self.adapter(max_retries, proxy)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return adapter
+
+    def maybe_evict_idle(self) -> int:
+        """Run ``evict_idle`` at most every ``max_idle / 2`` seconds"""
+        if not self.max_idle or time.monotonic() - self._last_eviction < self.max_idle / 2:
+            return 0
+        return self.evict_idle()
+
+    def evict_idle(self, max_idle: Optional[float] = None) -> int:
+        """Close the connections of adapters unused for ``max_idle`` seconds
+
+        Adapters stay registered and reopen connections on the next request.
+        Returns the number of adapters whose pools were closed.
+        """
+        max_idle = self.max_idle if max_idle is None else max_idle
+        now = self._last_eviction = time.monotonic()
+        evicted = 0
+        with self._lock:
+            for adapter in self.adapters.values():
+                if now - adapter.last_used >= max_idle:
+                    adapter.close()
+                    evicted += 1
+        return evicted
+
+    def close(self) -> None:
+        """Close every shared pool"""
+        with self._lock:
+            for adapter in self.adapters.values():
+                adapter.close()
+            self.adapters = {}
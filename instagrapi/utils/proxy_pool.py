@@ -0,0 +1,253 @@
+import threading
+import time
+from typing import Dict, Hashable, Iterable, Optional, Tuple, Type
+
+import requests
+
+from instagrapi.exceptions import (
+    ClientConnectionError,
+    ClientIncompleteReadError,
+    ClientRequestTimeout,
+    ClientThrottledError,
+    PleaseWaitFewMinutes,
+    ProxyAddressIsBlocked,
+    RateLimitError,
+)
+
+# Failures that say something about the proxy (and not about the request)
+DEFAULT_ERROR_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    ClientConnectionError,
+    ClientRequestTimeout,
+    ClientIncompleteReadError,
+    ClientThrottledError,
+    PleaseWaitFewMinutes,
+    RateLimitError,
+    ProxyAddressIsBlocked,
+    requests.ConnectionError,
+)
+# Failures that take the proxy out of rotation right away
+DEFAULT_DEMOTE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    ProxyAddressIsBlocked,
+    ClientConnectionError,
+    requests.ConnectionError,
+)
+
+
+class _ProxyHealth:
+    __slots__ = ("latency", "error_rate", "requests", "failures", "demotions", "demoted_until", "accounts")
+
+    def __init__(self):
+        self.latency = None  # EWMA of response time, seconds
+        self.error_rate = 0.0  # EWMA of failures, 0..1
+        self.requests = 0
+        self.failures = 0
+        self.demotions = 0
+        self.demoted_until = 0.0
+        self.accounts = 0
+
+
+class ProxyPool:
+    """
+    Pool of proxies with health scoring and sticky per-account assignment
+
+    Every outcome reported by a client updates an exponentially weighted
+    moving average of the proxy latency and error rate. Each account key
+    (usually the username) keeps its proxy while it is healthy; new accounts
+    get the proxy with the best ``score`` weighted by how many accounts
+    already use it. A proxy is demoted (skipped by ``assign``) for
+    ``cooldown`` seconds, doubled on every repeated demotion up to
+    ``max_cooldown``, on ``ProxyAddressIsBlocked`` or a connection error, or
+    once its error rate reaches ``max_error_rate``; accounts using it are
+    moved by ``rotate``.
+
+    One pool may be shared by many clients.
+
+    Parameters
+    ----------
+    proxies: Iterable[str]
+        Proxy DSNs, as accepted by ``Client.set_proxy``
+    alpha: float
+        EWMA weight of the newest sample
+    cooldown: float
+        Seconds a demoted proxy is skipped the first time
+    max_cooldown: float
+        Upper bound for the doubled cool-down
+    max_error_rate: float
+        Error rate EWMA that demotes a proxy (after ``min_requests`` requests)
+    min_requests: int
+        Requests seen before ``max_error_rate`` applies
+    initial_latency: float
+        Latency assumed for proxies without samples
+    error_penalty: float
+        How much the error rate inflates the score: ``latency * (1 + error_penalty * error_rate)``
+    error_exceptions: tuple
+        Exception classes counted as proxy failures; other exceptions count as successes
+    demote_exceptions: tuple
+        Exception classes that demote the proxy immediately
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[str] = (),
+        alpha: float = 0.3,
+        cooldown: float = 300.0,
+        max_cooldown: float = 3600.0,
+        max_error_rate: float = 0.5,
+        min_requests: int = 5,
+        initial_latency: float = 1.0,
+        error_penalty: float = 4.0,
+        error_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_ERROR_EXCEPTIONS,
+        demote_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_DEMOTE_EXCEPTIONS,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.cooldown = float(cooldown)
+        self.max_cooldown = max(float(max_cooldown), self.cooldown)
+        self.max_error_rate = max_error_rate
+        self.min_requests = max(1, int(min_requests))
+        self.initial_latency = float(initial_latency)
+        self.error_penalty = error_penalty
+        self.error_exceptions = tuple(error_exceptions)
+        self.demote_exceptions = tuple(demote_exceptions)
+        self.proxies: Dict[str, _ProxyHealth] = {}
+        self.assignments: Dict[Hashable, str] = {}
+        self._lock = threading.Lock()
+        for dsn in proxies:
+            self.add(dsn)
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def add(self, dsn: str) -> None:
+        assert isinstance(dsn, str) and dsn, f'Proxy must been string (URL), but now "{dsn}" ({type(dsn)})'
+        with self._lock:
+            self.proxies.setdefault(dsn, _ProxyHealth())
+
+    def remove(self, dsn: str) -> None:
+        """Drop ``dsn``; accounts assigned to it get a new proxy on their next ``assign``"""
+        with self._lock:
+            self.proxies.pop(dsn, None)
+            self.assignments = {key: value for key, value in self.assignments.items() if value != dsn}
+
+    def _score(self, health: _ProxyHealth) -> float:
+        latency = self.initial_latency if health.latency is None else health.latency
+        return latency * (1 + self.error_penalty * health.error_rate)
+
+    def score(self, dsn: str) -> float:
+        """Lower is better"""
+        with self._lock:
+            return self._score(self.proxies[dsn])
+
+    def is_demoted(self, dsn: str) -> bool:
+        with self._lock:
+            health = self.proxies.get(dsn)
+            return health is None or health.demoted_until > time.monotonic()
+
+    def _pick(self, exclude: Optional[str] = None) -> Optional[str]:
+        now = time.monotonic()
+        candidates = [(dsn, health) for dsn, health in self.proxies.items() if dsn != exclude]
+        healthy = [item for item in candidates if item[1].demoted_until <= now]
+        if healthy:
+            return min(healthy, key=lambda item: self._score(item[1]) * (1 + item[1].accounts))[0]
+        if candidates:
+            # Everything is demoted: use the proxy that recovers first
+            return min(candidates, key=lambda item: item[1].demoted_until)[0]
+        return exclude if exclude in self.proxies else None
+
+    def _assign(self, key: Hashable, dsn: Optional[str]) -> Optional[str]:
+        previous = self.assignments.pop(key, None)
+        if previous in self.proxies:
+            self.proxies[previous].accounts -= 1
+        if dsn is not None:
+            self.assignments[key] = dsn
+            self.proxies[dsn].accounts += 1
+        return dsn
+
+    def assign(self, key: Hashable) -> Optional[str]:
+        """Return the proxy of account ``key``, choosing one if it has none or its proxy was demoted"""
+        with self._lock:
+            dsn = self.assignments.get(key)
+            health = self.proxies.get(dsn)
+            if health is not None and health.demoted_until <= time.monotonic():
+                return dsn
+            return self._assign(key, self._pick(exclude=dsn))
+
+    def rotate(self, key: Hashable, current: Optional[str] = None) -> Optional[str]:
+        """
+        Move account ``key`` away from ``current`` (its assigned proxy by default)
+
+        When the account was already moved (e.g. by another thread) the new
+        assignment is returned unchanged.
+        """
+        with self._lock:
+            dsn = self.assignments.get(key)
+            if current is not None and dsn is not None and dsn != current:
+                return dsn
+            return self._assign(key, self._pick(exclude=dsn or current))
+
+    def release(self, key: Hashable) -> None:
+        with self._lock:
+            self._assign(key, None)
+
+    def record(self, dsn: str, latency: float = None, exc: BaseException = None) -> bool:
+        """
+        Record the outcome of one request sent through ``dsn``
+
+        Returns True when the proxy was demoted by this outcome.
+        """
+        failed = isinstance(exc, self.error_exceptions)
+        now = time.monotonic()
+        with self._lock:
+            health = self.proxies.get(dsn)
+            if health is None:
+                return False
+            alpha = self.alpha
+            health.requests += 1
+            health.error_rate = (1 - alpha) * health.error_rate + (alpha if failed else 0.0)
+            if failed:
+                health.failures += 1
+            elif latency is not None:
+                health.latency = latency if health.latency is None else (1 - alpha) * health.latency + alpha * latency
+            if health.demoted_until > now:
+                return False
+            if isinstance(exc, self.demote_exceptions) or (
+                failed and health.requests >= self.min_requests and health.error_rate >= self.max_error_rate
+            ):
+                cooldown = min(self.max_cooldown, self.cooldown * 2**health.demotions)
+                health.demotions += 1
+                health.demoted_until = now + cooldown
+                return True
+            if not failed and health.demotions:
+                health.demotions = 0
+            return False
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Health of every proxy, best first"""
+        now = time.monotonic()
+        with self._lock:
+            items = sorted(self.proxies.items(), key=lambda item: self._score(item[1]))
+            return {
+                dsn: {
+                    "score": self._score(health),
+                    "latency": health.latency,
+                    "error_rate": health.error_rate,
+                    "requests": health.requests,
+                    "failures": health.failures,
+                    "accounts": health.accounts,
+                    "demoted_for": max(0.0, health.demoted_until - now),
+                }
+                for dsn, health in items
+            }
+
+
+def build_proxy_pool(pool=None) -> Optional[ProxyPool]:
+    if pool is None:
+        return None
+    if isinstance(pool, ProxyPool):
+        return pool
+    if isinstance(pool, dict):
+        return ProxyPool(**pool)
+    if isinstance(pool, (list, tuple)):
+        return ProxyPool(pool)
+    raise TypeError(f"Unsupported proxy pool: {pool!r}")
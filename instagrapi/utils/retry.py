@@ -0,0 +1,191 @@
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple, Type, Union
+
+from instagrapi.exceptions import ClientIncompleteReadError, ClientRequestTimeout
+
+Budget = Tuple[int, float]
+
+# Exceptions retried by ``private_request`` by default: (retries, base delay in seconds)
+DEFAULT_RETRY_BUDGETS: Dict[Type[BaseException], Budget] = {
+    ClientRequestTimeout: (1, 4.0),
+    ClientIncompleteReadError: (1, 2.0),
+}
+
+
+def _budget(value: Union[Budget, dict, int], base_delay: float) -> Budget:
+    if isinstance(value, dict):
+        return int(value.get("retries", 0)), float(value.get("base_delay", base_delay))
+    if isinstance(value, int):
+        return value, base_delay
+    retries, delay = value
+    return int(retries), float(delay)
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Parse the ``Retry-After`` header (delta seconds or HTTP date) of ``response``"""
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("Retry-After")
+    except AttributeError:
+        return None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Retry decisions shared by the private, public and GraphQL request paths
+
+    Delays use exponential backoff with full jitter
+    (``uniform(0, min(max_delay, base_delay * 2 ** attempt))``) so retries
+    from many clients spread out, a ``Retry-After`` header on the failed
+    response takes precedence, and ``max_total_delay`` caps the time one call
+    may spend waiting for retries.
+
+    Parameters
+    ----------
+    budgets: dict, optional
+        Exception class to ``(retries, base_delay)`` (or ``{"retries", "base_delay"}``);
+        the most specific class in the exception MRO wins. Exceptions without a
+        budget are not retried by ``private_request``
+    base_delay: float
+        Base delay for budgets that only give a retry count
+    max_delay: float
+        Cap for one backoff delay
+    max_total_delay: float
+        Cap for the sum of delays of one call; a retry that would exceed it is not attempted
+    jitter: bool
+        Use full jitter, otherwise sleep the whole backoff
+    respect_retry_after: bool
+        Honour ``Retry-After`` response headers
+    """
+
+    def __init__(
+        self,
+        budgets: Dict[Type[BaseException], Union[Budget, dict, int]] = None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        max_total_delay: float = 120.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        self.max_total_delay = float(max_total_delay)
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        budgets = DEFAULT_RETRY_BUDGETS if budgets is None else budgets
+        self.budgets = {cls: _budget(value, self.base_delay) for cls, value in budgets.items()}
+        self._metrics = Counter()
+        self._lock = threading.Lock()
+
+    def budget_for(self, exc: BaseException) -> Optional[Budget]:
+        entry = self._budget_entry(exc)
+        return entry[1] if entry else None
+
+    def _budget_entry(self, exc: BaseException) -> Optional[Tuple[type, Budget]]:
+        for cls in type(exc).__mro__:
+            if cls in self.budgets:
+                return cls, self.budgets[cls]
+        return None
+
+    def backoff(self, attempt: int, base_delay: float = None) -> float:
+        """Delay before retry number ``attempt`` (0-based)"""
+        base_delay = self.base_delay if base_delay is None else base_delay
+        # An explicit base delay larger than max_delay (public retries_timeout) still applies
+        cap = min(max(self.max_delay, base_delay), base_delay * (2**attempt))
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def begin(self, retries: int = None, base_delay: float = None) -> "RetryState":
+        """
+        Start tracking the retries of one call
+
+        ``retries``/``base_delay`` override the per-class budgets for every
+        exception, which is how ``public_request(retries_count=..., retries_timeout=...)``
+        keeps its meaning.
+        """
+        return RetryState(self, retries, base_delay)
+
+    def record(self, exc: BaseException, delay: Optional[float]) -> None:
+        name = type(exc).__name__
+        with self._lock:
+            if delay is None:
+                self._metrics["giveups"] += 1
+                self._metrics[f"giveups.{name}"] += 1
+            else:
+                self._metrics["retries"] += 1
+                self._metrics[f"retries.{name}"] += 1
+                self._metrics["delay"] += delay
+
+    def metrics(self) -> dict:
+        """Counters of retries, give-ups and total delay, overall and per exception class"""
+        with self._lock:
+            return dict(self._metrics)
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+
+class RetryState:
+    """Retry bookkeeping for one call, created by ``RetryPolicy.begin``"""
+
+    def __init__(self, policy: RetryPolicy, retries: int = None, base_delay: float = None):
+        self.policy = policy
+        self.override = (
+            None if retries is None else (int(retries), policy.base_delay if base_delay is None else base_delay)
+        )
+        self.attempts = Counter()
+        self.total_delay = 0.0
+
+    def next_delay(self, exc: BaseException) -> Optional[float]:
+        """Seconds to wait before retrying after ``exc``, or None to give up"""
+        policy = self.policy
+        if self.override:
+            key, budget = None, self.override
+            max_total_delay = max(policy.max_total_delay, budget[0] * budget[1])
+        else:
+            entry = policy._budget_entry(exc)
+            if entry is None:
+                return None  # not a retryable exception
+            key, budget = entry
+            max_total_delay = policy.max_total_delay
+        retries, base_delay = budget
+        delay = None
+        if self.attempts[key] < retries:
+            if policy.respect_retry_after:
+                delay = retry_after_seconds(getattr(exc, "response", None))
+            if delay is None:
+                delay = policy.backoff(self.attempts[key], base_delay)
+            delay = min(delay, max(policy.max_delay, base_delay))
+            if self.total_delay + delay > max_total_delay:
+                delay = None
+        policy.record(exc, delay)
+        if delay is not None:
+            self.attempts[key] += 1
+            self.total_delay += delay
+        return delay
+
+
+def build_retry_policy(policy=None) -> RetryPolicy:
+    if policy is None:
+        return RetryPolicy()
+    if isinstance(policy, RetryPolicy):
+        return policy
+    if isinstance(policy, dict):
+        return RetryPolicy(**policy)
+    raise TypeError(f"Unsupported retry policy: {policy!r}")
@@ -0,0 +1,219 @@
+import datetime
+import decimal
+import enum
+import threading
+import uuid
+from copy import deepcopy
+from typing import Any, Dict, Type, TypeVar
+
+import pydantic_core
+from pydantic import AnyUrl, BaseModel, ConfigDict
+
+from instagrapi.utils.lazy import eager_copy, is_lazy
+
+T = TypeVar("T")
+
+# Values that are never mutated in place, shared between a model and its copies
+_ATOMIC = {
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    uuid.UUID,
+    frozenset,
+    pydantic_core.Url,
+}
+
+_object_setattr = object.__setattr__
+
+
+def _is_atomic(obj: Any) -> bool:
+    cls = type(obj)
+    if cls in _ATOMIC:
+        return True
+    if isinstance(obj, (enum.Enum, AnyUrl)):
+        _ATOMIC.add(cls)
+        return True
+    return False
+
+
+def _frozen_error(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is a shared cache snapshot and cannot be modified, use copy_model() first")
+
+
+class FrozenList(list):
+    """``list`` that refuses in-place modification"""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen_error
+    append = extend = insert = pop = remove = clear = sort = reverse = _frozen_error
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return FrozenList(deepcopy(item, memo) for item in self)
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+class FrozenDict(dict):
+    """``dict`` that refuses in-place modification"""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _frozen_error
+    pop = popitem = clear = update = setdefault = _frozen_error
+
+    def __hash__(self):
+        return hash(tuple(self.items()))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return FrozenDict((key, deepcopy(value, memo)) for key, value in self.items())
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+_frozen_classes: Dict[type, type] = {}  # model class -> frozen subclass
+_thawed_classes: Dict[type, type] = {}  # frozen subclass -> model class
+_frozen_classes_lock = threading.Lock()
+
+
+def _restore_frozen(model: BaseModel) -> BaseModel:
+    return freeze(model)
+
+
+def _frozen_class(cls: Type[BaseModel]) -> Type[BaseModel]:
+    """Frozen subclass of ``cls`` that compares equal to (and pickles as) ``cls``"""
+    frozen = _frozen_classes.get(cls)
+    if frozen is not None:
+        return frozen
+    with _frozen_classes_lock:
+        frozen = _frozen_classes.get(cls)
+        if frozen is None:
+            frozen = type(
+                cls.__name__,
+                (cls,),
+                {
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                    "model_config": ConfigDict(frozen=True),
+                    "__reduce__": lambda self: (_restore_frozen, (copy_model(self),)),
+                },
+            )
+            # BaseModel.__eq__ compares the generic origin (or the class) of both sides,
+            # pointing it at ``cls`` makes frozen and regular instances interchangeable
+            frozen.__pydantic_generic_metadata__ = {**cls.__pydantic_generic_metadata__, "origin": cls}
+            _thawed_classes[frozen] = cls
+            _frozen_classes[cls] = frozen
+    return frozen
+
+
+def is_frozen(obj: Any) -> bool:
+    """Whether ``obj`` is a snapshot returned by ``freeze``"""
+    cls = type(obj)
+    return cls in _thawed_classes or cls is FrozenList or cls is FrozenDict
+
+
+def _rebuild(obj: BaseModel, cls: type, convert) -> BaseModel:
+    atomic = _ATOMIC
+    new = cls.__new__(cls)
+    _object_setattr(
+        new,
+        "__dict__",
+        {key: value if type(value) in atomic else convert(value) for key, value in obj.__dict__.items()},
+    )
+    extra = obj.__pydantic_extra__
+    _object_setattr(
+        new, "__pydantic_extra__", None if extra is None else {key: convert(value) for key, value in extra.items()}
+    )
+    _object_setattr(new, "__pydantic_fields_set__", set(obj.__pydantic_fields_set__))
+    private = obj.__pydantic_private__
+    _object_setattr(new, "__pydantic_private__", None if private is None else dict(private))
+    return new
+
+
+def copy_model(obj: T) -> T:
+    """
+    Independent copy of a model graph, much cheaper than ``copy.deepcopy``
+
+    Models, lists, dicts, tuples and sets are rebuilt; strings, numbers, dates,
+    URLs and other immutable values are shared; anything else is deep-copied.
+    Copies of ``freeze`` snapshots are regular, mutable objects.
+
+    Parameters
+    ----------
+    obj: Any
+        A pydantic model, container or value
+
+    Returns
+    -------
+    Any
+        The copy
+    """
+    if _is_atomic(obj):
+        return obj
+    if isinstance(obj, BaseModel):
+        cls = type(obj)
+        return _rebuild(obj, _thawed_classes.get(cls, cls), copy_model)
+    if isinstance(obj, list):
+        return [copy_model(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: copy_model(value) for key, value in obj.items()}
+    if type(obj) is tuple:
+        return tuple(copy_model(item) for item in obj)
+    if isinstance(obj, set):
+        return {copy_model(item) for item in obj}
+    return deepcopy(obj)
+
+
+def freeze(obj: T) -> T:
+    """
+    Deep, read-only snapshot of a model graph, safe to share without copying
+
+    Models become instances of a frozen subclass (assignment raises
+    ``ValidationError``), lists and dicts become ``FrozenList`` and
+    ``FrozenDict``, sets become frozensets. Snapshots compare equal to the
+    original objects; ``copy_model`` turns one back into a mutable object.
+    Freezing a snapshot returns it unchanged.
+
+    Parameters
+    ----------
+    obj: Any
+        A pydantic model, container or value
+
+    Returns
+    -------
+    Any
+        The snapshot
+    """
+    if _is_atomic(obj) or is_frozen(obj):
+        return obj
+    if isinstance(obj, BaseModel):
+        if is_lazy(obj):
+            obj = eager_copy(obj)
+        return _rebuild(obj, _frozen_class(type(obj)), freeze)
+    if isinstance(obj, list):
+        return FrozenList(freeze(item) for item in obj)
+    if isinstance(obj, dict):
+        return FrozenDict((key, freeze(value)) for key, value in obj.items())
+    if type(obj) is tuple:
+        return tuple(freeze(item) for item in obj)
+    if isinstance(obj, set):
+        return frozenset(freeze(item) for item in obj)
+    return obj
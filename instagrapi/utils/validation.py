@@ -1,6 +1,116 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import SchemaError, SchemaValidator
+
 from instagrapi.exceptions import ValidationError
 
+M = TypeVar("M", bound=BaseModel)
+_object_setattr = object.__setattr__
+# instance slots written by _TrustedBuilder, as laid out by pydantic 2.x (pinned in pyproject.toml)
+_MODEL_SLOTS = ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+_CAN_ASSEMBLE = set(_MODEL_SLOTS) <= set(getattr(BaseModel, "__slots__", ()))
+
+VALIDATION_MODES = ("strict", "trusted", "lazy")
+# Mode used by the extractors, set by Client._extract around each extractor call
+validation_mode: ContextVar[str] = ContextVar("instagrapi_validation_mode", default="strict")
+
 
 def vassert(pred, message):
     if not pred:
         raise ValidationError(message)
+
+
+def check_validation_mode(mode: str) -> str:
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Unsupported validation mode: {mode!r}, expected one of {', '.join(VALIDATION_MODES)}")
+    return mode
+
+
+def _trust_urls(schema):
+    """Copy of a core schema where URL fields accept any string as is"""
+    if isinstance(schema, dict):
+        if schema.get("type") == "url" or (
+            schema.get("type") == "function-wrap" and schema.get("schema", {}).get("type") == "url"
+        ):
+            return {"type": "str"}
+        return {key: _trust_urls(value) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_trust_urls(value) for value in schema]
+    return schema
+
+
+class _TrustedBuilder:
+    """
+    Builds ``model`` instances without parsing their URLs
+
+    The model's field schema is compiled once with URL fields accepting any
+    string; everything else (coercions, defaults, nested models, field
+    validators) is validated as usual. URLs keep the received string,
+    unnormalized. The instance is assembled like ``model_construct`` does,
+    without its per-call inspection of default factories. Models whose
+    schema or instance layout does not match what pydantic 2.x produces are
+    built by ``model(**data)``.
+    """
+
+    def __init__(self, model: Type[M]):
+        self.model = model
+        self.validator = None
+        try:
+            fields, config = self._fields_schema(model)
+            if fields is not None:
+                self.validator = SchemaValidator(_trust_urls(fields), config)
+        except (AttributeError, KeyError, TypeError, SchemaError):
+            pass  # core schema laid out differently than expected: keep the regular path
+
+    @staticmethod
+    def _fields_schema(model: Type[M]):
+        if not _CAN_ASSEMBLE or model.__private_attributes__:
+            return None, None
+        schema = model.__pydantic_core_schema__
+        definitions = None
+        if schema["type"] == "definitions":
+            schema, definitions = schema["schema"], schema["definitions"]
+        if schema["type"] != "model" or schema["schema"]["type"] != "model-fields":
+            # model validators: keep the regular path
+            return None, None
+        fields = schema["schema"]
+        if definitions is not None:
+            fields = {"type": "definitions", "schema": fields, "definitions": definitions}
+        return fields, schema.get("config")
+
+    def __call__(self, data: dict) -> M:
+        if self.validator is None:
+            return self.model(**data)
+        values, extra, fields_set = self.validator.validate_python(data)
+        instance = self.model.__new__(self.model)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+        _object_setattr(instance, "__pydantic_extra__", extra)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
+
+
+@lru_cache(maxsize=None)
+def trusted_builder(model: Type[M]) -> _TrustedBuilder:
+    return _TrustedBuilder(model)
+
+
+def build_model(model: Type[M], data: dict) -> M:
+    """``model(**data)``, built by ``trusted_builder`` in ``"trusted"`` validation mode"""
+    if validation_mode.get() == "trusted":
+        return trusted_builder(model)(data)
+    return model(**data)
+
+
+@contextmanager
+def model_validation(mode: str):
+    """Build models in ``mode`` inside the block, e.g. when calling extractors directly"""
+    token = validation_mode.set(check_validation_mode(mode))
+    try:
+        yield
+    finally:
+        validation_mode.reset(token)
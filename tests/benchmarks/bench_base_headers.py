@@ -0,0 +1,38 @@
+"""
+Microbenchmark for ``PrivateRequestMixin.base_headers``
+
+Compares the cached header template against rebuilding it on every access
+(the behaviour before the cache was introduced)::
+
+    python -m tests.benchmarks.bench_base_headers
+"""
+
+import timeit
+
+from instagrapi import Client
+
+
+def make_client() -> Client:
+    client = Client()
+    client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+    client.set_ig_u_rur("RVA,1,1:abc")
+    client.mid = "YRwa1QABBAF-ZA-1tPmnd0bEniTe"
+    return client
+
+
+def rebuild(client: Client) -> dict:
+    client.invalidate_base_headers()
+    return client.base_headers
+
+
+def main(number: int = 20000) -> None:
+    client = make_client()
+    cached = min(timeit.repeat(lambda: client.base_headers, number=number, repeat=5))
+    rebuilt = min(timeit.repeat(lambda: rebuild(client), number=number, repeat=5))
+    print(f"rebuilt: {rebuilt / number * 1e6:.2f} us/call")
+    print(f"cached:  {cached / number * 1e6:.2f} us/call")
+    print(f"speedup: {rebuilt / cached:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
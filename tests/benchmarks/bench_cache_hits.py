@@ -0,0 +1,80 @@
+"""
+Microbenchmark for entity cache hits (``Client.media_info`` / ``user_info``...)
+
+Compares the ``copy.deepcopy`` every hit used to pay with the
+``copy_model`` default and the copy-free ``cache_hits="frozen"`` mode::
+
+    python -m tests.benchmarks.bench_cache_hits
+"""
+
+import timeit
+from copy import deepcopy
+
+from instagrapi import Client
+from instagrapi.extractors import extract_media_v1
+
+
+def make_media(resources: int = 10):
+    return extract_media_v1(
+        {
+            "pk": "1",
+            "id": "1_2",
+            "code": "abc",
+            "taken_at": 1710000000,
+            "media_type": 8,
+            "caption": {"text": "caption #tag @first"},
+            "user": {"pk": "2", "username": "example", "profile_pic_url": "https://example.com/profile.jpg"},
+            "image_versions2": {"candidates": [{"url": "https://example.com/x.jpg", "width": 100, "height": 100}]},
+            "carousel_media": [
+                {
+                    "pk": str(10 + i),
+                    "id": f"{10 + i}_2",
+                    "media_type": 1,
+                    "image_versions2": {
+                        "candidates": [
+                            {"url": f"https://example.com/{i}_{size}.jpg", "width": size, "height": size}
+                            for size in (1080, 640, 320)
+                        ]
+                    },
+                    "usertags": {
+                        "in": [
+                            {
+                                "user": {
+                                    "pk": str(100 + n),
+                                    "username": f"user{n}",
+                                    "profile_pic_url": f"https://example.com/{n}.jpg",
+                                },
+                                "position": [0.25, 0.75],
+                            }
+                            for n in range(3)
+                        ]
+                    },
+                }
+                for i in range(resources)
+            ],
+        }
+    )
+
+
+def make_client(mode: str) -> Client:
+    client = Client(cache_hits=mode)
+    client._cache_put(client._medias_cache, "1", make_media())
+    return client
+
+
+def main(number: int = 2000) -> None:
+    results = {}
+    for mode in ("deepcopy", "copy", "frozen"):
+        client = make_client(mode)
+        assert client.media_info("1") == make_media()
+        results[mode] = min(timeit.repeat(lambda: client.media_info("1"), number=number, repeat=5)) / number
+    media = make_media()
+    print(
+        f"bare deepcopy:       {min(timeit.repeat(lambda: deepcopy(media), number=number, repeat=5)) / number * 1e6:.2f} us"
+    )
+    for mode, seconds in results.items():
+        print(f"cache_hits={mode!r:<11} {seconds * 1e6:.2f} us/hit ({results['deepcopy'] / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
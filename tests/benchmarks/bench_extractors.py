@@ -0,0 +1,190 @@
+"""
+Microbenchmark for the media and story extractors on a 200-item feed page
+
+The extractors used to ``deepcopy`` every payload before reading it; they now
+build shallow field dicts and leave the payload untouched. The benchmark
+times a page through the extractors as they are and with the deepcopy they
+used to pay on top::
+
+    python -m tests.benchmarks.bench_extractors
+    python -m tests.benchmarks.bench_extractors feed_user.json  # recorded {"items": [...]} responses
+
+Without arguments the page is built from payloads shaped like ``feed/user/``
+(private) and profile timeline (GraphQL) responses, including the nested
+blocks the extractors never read.
+"""
+
+import json
+import sys
+import timeit
+from copy import deepcopy
+
+from instagrapi.extractors import extract_media_gql, extract_media_v1, extract_story_v1
+
+PAGE = 200
+
+
+def _user(pk):
+    return {
+        "pk": str(pk),
+        "pk_id": str(pk),
+        "username": f"user{pk}",
+        "full_name": f"User {pk}",
+        "is_private": False,
+        "is_verified": pk % 7 == 0,
+        "profile_pic_id": f"{pk}_{pk}",
+        "profile_pic_url": f"https://scontent.cdninstagram.com/v/t51.2885-19/{pk}.jpg?stp=dst-jpg_s150x150",
+        "friendship_status": {"following": False, "is_bestie": False, "is_restricted": False},
+        "account_badges": [],
+        "has_anonymous_profile_picture": False,
+        "fan_club_info": {"fan_club_id": None, "is_fan_club_referral_eligible": None},
+        "latest_reel_media": 1710000000,
+    }
+
+
+def _candidates(name, sizes):
+    return [
+        {
+            "width": size,
+            "height": size * 5 // 4,
+            "url": f"https://scontent.cdninstagram.com/v/t51.2885-15/{name}_{size}.jpg?stp=dst-jpg_e35&_nc_ht=x&oh=00_AbC",
+            "scans_profile": "e35",
+            "estimated_scans_sizes": [size * 10, size * 20, size * 30],
+        }
+        for size in sizes
+    ]
+
+
+SIZES = (1080, 750, 640, 480, 320, 240, 150, 1440)
+
+
+def make_v1_item(i):
+    pk = 3300000000000000000 + i
+    item = {
+        "pk": str(pk),
+        "id": f"{pk}_42",
+        "code": f"C{i:09d}",
+        "taken_at": 1710000000 - i * 3600,
+        "media_type": 8 if i % 4 == 0 else (2 if i % 4 == 1 else 1),
+        "product_type": "carousel_container" if i % 4 == 0 else ("clips" if i % 4 == 1 else "feed"),
+        "user": _user(42),
+        "caption": {
+            "pk": str(pk + 1),
+            "user_id": "42",
+            "text": "Caption text #tag @mention " * 5,
+            "type": 1,
+            "created_at": 1710000000,
+            "user": _user(42),
+        },
+        "like_count": 1000 + i,
+        "comment_count": 10 + i,
+        "has_liked": False,
+        "image_versions2": {"candidates": _candidates(pk, SIZES)},
+        "original_width": 1080,
+        "original_height": 1350,
+        "location": {"pk": 100 + i, "name": "Somewhere", "lng": 1.5, "lat": 2.5, "address": "", "city": ""},
+        "usertags": {"in": [{"user": _user(500 + n), "position": [0.1 * n, 0.2 * n]} for n in range(3)]},
+        "comments": [
+            {"pk": str(pk + 10 + n), "text": "nice", "user": _user(900 + n), "created_at": 1710000000} for n in range(3)
+        ],
+        "clips_metadata": {
+            "music_info": None,
+            "original_sound_info": {"audio_asset_id": str(pk), "ig_artist": _user(42), "progressive_download_url": "x"},
+            "audio_ranking_info": {"best_audio_cluster_id": str(pk)},
+            "breaking_content_info": None,
+        },
+        "sharing_friction_info": {"should_have_sharing_friction": False, "bloks_app_url": None},
+        "coauthor_producers": [],
+        "sponsor_tags": [],
+    }
+    if item["media_type"] == 2:
+        item["video_versions"] = [
+            {"type": t, "width": w, "height": w * 16 // 9, "url": f"https://scontent.cdninstagram.com/{pk}_{w}.mp4"}
+            for t, w in ((101, 720), (102, 480), (103, 360))
+        ]
+        item["video_duration"] = 12.5
+        item["play_count"] = 5000
+    if item["media_type"] == 8:
+        item["carousel_media"] = [
+            {
+                "pk": str(pk + 100 + n),
+                "id": f"{pk + 100 + n}_42",
+                "media_type": 1,
+                "image_versions2": {"candidates": _candidates(pk + 100 + n, SIZES)},
+                "usertags": {"in": [{"user": _user(700 + n), "position": [0.5, 0.5]}]},
+                "original_width": 1080,
+                "original_height": 1350,
+            }
+            for n in range(5)
+        ]
+    return item
+
+
+def make_gql_node(i):
+    pk = 3300000000000000000 + i
+    return {
+        "__typename": "GraphSidecar" if i % 4 == 0 else "GraphImage",
+        "id": str(pk),
+        "shortcode": f"C{i:09d}",
+        "taken_at_timestamp": 1710000000 - i * 3600,
+        "owner": {"id": "42", "username": "user42", "profile_pic_url": "https://example.com/42.jpg"},
+        "display_url": f"https://scontent.cdninstagram.com/{pk}.jpg",
+        "display_resources": [
+            {"src": f"https://scontent.cdninstagram.com/{pk}_{w}.jpg", "config_width": w, "config_height": w}
+            for w in (640, 750, 1080)
+        ],
+        "dimensions": {"height": 1350, "width": 1080},
+        "edge_media_to_caption": {"edges": [{"node": {"text": "Caption text #tag @mention " * 5}}]},
+        "edge_media_to_comment": {"count": 10 + i},
+        "edge_media_preview_like": {"count": 1000 + i},
+        "edge_media_to_tagged_user": {
+            "edges": [
+                {"node": {"user": {"id": str(500 + n), "username": f"user{500 + n}"}, "x": 0.1, "y": 0.2}}
+                for n in range(3)
+            ]
+        },
+        "edge_sidecar_to_children": {
+            "edges": [
+                {
+                    "node": {
+                        "__typename": "GraphImage",
+                        "id": str(pk + 100 + n),
+                        "display_url": f"https://scontent.cdninstagram.com/{pk + 100 + n}.jpg",
+                        "dimensions": {"height": 1350, "width": 1080},
+                    }
+                }
+                for n in range(5 if i % 4 == 0 else 0)
+            ]
+        },
+        "accessibility_caption": "Photo by user42",
+        "is_video": False,
+    }
+
+
+def make_story_item(i):
+    item = make_v1_item(i * 4 + 1)
+    item.update({"media_type": 2, "product_type": "story", "reel_mentions": [], "story_feed_media": []})
+    return item
+
+
+def bench(label, extract, items, number=5):
+    plain = min(timeit.repeat(lambda: [extract(item) for item in items], number=number, repeat=3)) / number
+    copied = min(timeit.repeat(lambda: [extract(deepcopy(item)) for item in items], number=number, repeat=3)) / number
+    print(f"{label:<28} {plain * 1e3:8.2f} ms   with deepcopy {copied * 1e3:8.2f} ms   x{copied / plain:.2f}")
+
+
+def main(argv):
+    print(f"{'page of ' + str(PAGE):<28} {'extract':>11}   {'(previous behaviour)':>25}")
+    if argv:
+        with open(argv[0]) as fp:
+            data = json.load(fp)
+        items = data.get("items", data) if isinstance(data, dict) else data
+        bench(f"recorded v1 ({len(items)})", extract_media_v1, items)
+        return
+    bench("extract_media_v1", extract_media_v1, [make_v1_item(i) for i in range(PAGE)])
+    bench("extract_media_gql", extract_media_gql, [make_gql_node(i) for i in range(PAGE)])
+    bench("extract_story_v1", extract_story_v1, [make_story_item(i) for i in range(PAGE)])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
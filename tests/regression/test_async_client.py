@@ -0,0 +1,181 @@
+import asyncio
+import sys
+
+from instagrapi.async_client import AsyncClient
+from instagrapi.exceptions import ClientThrottledError, LoginRequired, UserNotFound
+from instagrapi.utils.pacing import NoopPacer
+from tests.helpers import *
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional extra
+    httpx = None
+
+
+def _user_payload(pk="1", username="example"):
+    return {
+        "user": {
+            "pk": pk,
+            "username": username,
+            "full_name": "",
+            "is_private": False,
+            "profile_pic_url": "https://example.com/pic.jpg",
+            "is_verified": False,
+            "media_count": 0,
+            "follower_count": 0,
+            "following_count": 0,
+            "is_business": False,
+        }
+    }
+
+
+@unittest.skipIf(httpx is None, "httpx (instagrapi[async]) is not installed")
+class AsyncClientRegressionTestCase(unittest.IsolatedAsyncioTestCase):
+    def make_client(self, handler, **http_options):
+        client = Client(pacer=NoopPacer())
+        client.request_log = Mock()
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        self.requests = []
+
+        def record(request):
+            self.requests.append(request)
+            return handler(request)
+
+        return AsyncClient(client, http_options={"transport": httpx.MockTransport(record), **http_options})
+
+    async def test_private_request_signs_post_and_reuses_sync_headers(self):
+        acl = self.make_client(lambda request: httpx.Response(200, json={"status": "ok", "x": 1}))
+        async with acl:
+            result = await acl.private_request("feed/timeline/", data={"reason": "pull_to_refresh"})
+        self.assertEqual(result, {"status": "ok", "x": 1})
+        self.assertEqual(acl.last_json, result)
+        request = self.requests[0]
+        self.assertEqual(str(request.url), "https://i.instagram.com/api/v1/feed/timeline/")
+        self.assertTrue(request.content.startswith(b"signed_body=SIGNATURE."))
+        self.assertEqual(request.headers["Content-Type"], "application/x-www-form-urlencoded; charset=UTF-8")
+        self.assertEqual(request.headers["User-Agent"], acl.client.user_agent)
+        self.assertEqual(request.headers["Authorization"], acl.client.authorization)
+
+    async def test_get_params_are_encoded_like_requests(self):
+        acl = self.make_client(lambda request: httpx.Response(200, json=_user_payload()))
+        async with acl:
+            user = await acl.user_info_v1("1")
+        self.assertEqual(user.username, "example")
+        self.assertEqual(self.requests[0].url.params["is_app_start"], "False")
+        self.assertNotIn("Content-Type", self.requests[0].headers)
+
+    async def test_errors_are_classified_like_sync_client(self):
+        acl = self.make_client(lambda request: httpx.Response(403, json={"message": "login_required"}))
+        with self.assertRaises(LoginRequired):
+            await acl.private_request("feed/timeline/")
+
+        acl = self.make_client(lambda request: httpx.Response(429, json={"message": "slow down"}))
+        with self.assertRaises(ClientThrottledError):
+            await acl.private_request("feed/timeline/")
+
+        acl = self.make_client(lambda request: httpx.Response(404, json={"message": "nope"}))
+        with self.assertRaises(UserNotFound):
+            await acl.user_info_v1("1")
+
+    async def test_user_info_shares_cache_with_sync_client(self):
+        acl = self.make_client(lambda request: httpx.Response(200, json=_user_payload("7", "cached")))
+        async with acl:
+            first = await acl.user_info("7")
+            second = await acl.user_info_by_username("cached")
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(len(self.requests), 1)
+        self.assertIn("7", acl.client._users_cache)
+
+    async def test_requests_run_concurrently(self):
+        in_flight = peak = 0
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return httpx.Response(200, json=_user_payload(request.url.path.split("/")[-3]))
+
+        acl = self.make_client(slow)
+        async with acl:
+            users = await asyncio.gather(*(acl.user_info_v1(str(pk)) for pk in range(10)))
+        self.assertEqual(peak, 10)
+        self.assertEqual([user.pk for user in users], [str(pk) for pk in range(10)])
+
+    async def test_concurrent_errors_keep_their_own_payload(self):
+        async def handler(request):
+            pk = request.url.path.split("/")[-3]
+            await asyncio.sleep(0.01 * (5 - int(pk)))
+            if int(pk) % 2:
+                return httpx.Response(404, json={"message": "not found", "status": "fail", "marker": pk})
+            return httpx.Response(200, json=_user_payload(pk))
+
+        acl = self.make_client(handler)
+        async with acl:
+            results = await asyncio.gather(
+                *(acl.user_info_v1(str(pk)) for pk in range(5)),
+                return_exceptions=True,
+            )
+        for pk, result in enumerate(results):
+            if pk % 2:
+                self.assertIsInstance(result, UserNotFound)
+                self.assertEqual((result.user_id, result.marker), (str(pk), str(pk)))
+            else:
+                self.assertEqual(result.pk, str(pk))
+
+    async def test_mid_and_cookies_are_written_back_to_sync_client(self):
+        acl = self.make_client(
+            lambda request: httpx.Response(
+                200,
+                json={"status": "ok"},
+                headers={"ig-set-x-mid": "MID123", "set-cookie": "csrftoken=abc; Domain=.instagram.com; Path=/"},
+            )
+        )
+        async with acl:
+            await acl.private_request("feed/timeline/")
+        self.assertEqual(acl.client.mid, "MID123")
+        self.assertEqual(acl.client.private.cookies.get("csrftoken"), "abc")
+
+    async def test_public_graphql_request_returns_data(self):
+        acl = self.make_client(lambda request: httpx.Response(200, json={"status": "ok", "data": {"user": {"id": 1}}}))
+        acl.client.request_timeout = 0
+        async with acl:
+            data = await acl.public_graphql_request({"id": 1}, query_hash="abc")
+        self.assertEqual(data, {"user": {"id": 1}})
+        self.assertEqual(self.requests[0].url.params["query_hash"], "abc")
+
+    async def test_http_options_timeout_applies_to_requests(self):
+        acl = self.make_client(lambda request: httpx.Response(200, json={"status": "ok"}), timeout=7)
+        async with acl:
+            await acl.private_request("feed/timeline/")
+            await acl.public_request("https://www.instagram.com/")
+        for request in self.requests:
+            self.assertEqual(request.extensions["timeout"]["read"], 7)
+
+    async def test_request_after_handled_exception_goes_through_the_circuit_breaker(self):
+        responses = iter(
+            [httpx.Response(403, json={"message": "login_required"}), httpx.Response(200, json={"status": "ok"})]
+        )
+        acl = self.make_client(lambda request: next(responses))
+        acl.client.handle_exception = Mock()
+        with mock.patch.object(acl, "_call_guarded", wraps=acl._call_guarded) as call_guarded:
+            async with acl:
+                self.assertEqual(await acl.private_request("feed/timeline/"), {"status": "ok"})
+        self.assertEqual(call_guarded.call_count, 2)
+        acl.client.handle_exception.assert_called_once()
+
+
+class AsyncClientOptionalDependencyTestCase(unittest.TestCase):
+    def test_missing_httpx_has_clear_error(self):
+        acl = AsyncClient(Client())
+        with mock.patch.dict(sys.modules, {"httpx": None}):
+            with self.assertRaises(RuntimeError) as ctx:
+                asyncio.run(acl.private_request("feed/timeline/"))
+        self.assertIn("pip install instagrapi[async]", str(ctx.exception))
+
+    def test_async_extra_is_optional(self):
+        pyproject = Path("pyproject.toml").read_text()
+        required_dependencies, optional_dependencies = pyproject.split("[project.optional-dependencies]", 1)
+        self.assertNotIn("httpx", required_dependencies)
+        self.assertIn('"httpx>=0.27,<1"', optional_dependencies)
@@ -0,0 +1,79 @@
+from tests.helpers import *
+
+
+class BaseHeadersCacheRegressionTestCase(unittest.TestCase):
+    def test_static_headers_are_built_once(self):
+        client = Client()
+        client.invalidate_base_headers()
+        with mock.patch.object(client, "_build_static_base_headers", wraps=client._build_static_base_headers) as build:
+            first = client.base_headers
+            second = client.base_headers
+        build.assert_called_once_with()
+        self.assertNotEqual(first["X-Pigeon-Session-Id"], second["X-Pigeon-Session-Id"])
+        self.assertEqual(first["User-Agent"], second["User-Agent"])
+
+    def test_returned_headers_can_be_mutated(self):
+        client = Client()
+        headers = client.base_headers
+        headers["X-IG-Device-ID"] = "changed"
+        headers.pop("User-Agent")
+        self.assertEqual(client.base_headers["X-IG-Device-ID"], client.uuid)
+        self.assertEqual(client.base_headers["User-Agent"], client.user_agent)
+
+    def test_setters_refresh_cached_headers(self):
+        client = Client()
+        client.base_headers
+        client.set_locale("ru_RU")
+        headers = client.base_headers
+        self.assertEqual(headers["X-IG-App-Locale"], "ru_RU")
+        self.assertEqual(headers["X-IG-App-Startup-Country"], "RU")
+        self.assertEqual(headers["Accept-Language"], "ru-RU, en-US")
+
+        client.set_uuids({"uuid": "00000000-0000-4000-8000-000000000000"})
+        self.assertEqual(client.base_headers["X-IG-Device-ID"], "00000000-0000-4000-8000-000000000000")
+
+        client.set_ig_www_claim("hmac.claim")
+        self.assertEqual(client.base_headers["X-IG-WWW-Claim"], "hmac.claim")
+
+    def test_direct_attribute_changes_and_login_refresh_cached_headers(self):
+        client = Client()
+        self.assertNotIn("IG-U-DS-USER-ID", client.base_headers)
+        client.mid = "MID123"
+        client.authorization_data = {"ds_user_id": "42", "sessionid": "42%3Aabc"}
+        headers = client.base_headers
+        self.assertEqual(headers["X-MID"], "MID123")
+        self.assertEqual(headers["IG-INTENDED-USER-ID"], "42")
+        self.assertEqual(headers["IG-U-DS-USER-ID"], "42")
+        self.assertTrue(headers["IG-U-RUR"].startswith("RVA,42,"))
+        self.assertTrue(
+            headers["IG-U-SHBTS"].endswith(":01f7ace11925d0388080078d0282b75b8059844855da27e23c90a362270fddfb3fae7e28")
+        )
+
+        client.set_ig_u_rur("RVA,42,1:custom")
+        self.assertEqual(client.base_headers["IG-U-RUR"], "RVA,42,1:custom")
+
+    def test_invalidate_base_headers_forces_rebuild(self):
+        client = Client()
+        client.base_headers
+        with mock.patch.object(client, "_build_static_base_headers", wraps=client._build_static_base_headers) as build:
+            self.assertTrue(client.invalidate_base_headers())
+            client.base_headers
+            client.base_headers
+        build.assert_called_once_with()
+
+    def test_header_order_is_stable(self):
+        client = Client()
+        client.authorization_data = {"ds_user_id": "42", "sessionid": "42%3Aabc"}
+        keys = list(client.base_headers)
+        self.assertEqual(
+            keys[:5],
+            [
+                "X-IG-App-Locale",
+                "X-IG-Device-Locale",
+                "X-IG-Mapped-Locale",
+                "X-Pigeon-Session-Id",
+                "X-Pigeon-Rawclienttime",
+            ],
+        )
+        self.assertEqual(keys[-1], "IG-U-RUR")
+        self.assertEqual(keys, list(client.base_headers))
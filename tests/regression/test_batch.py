@@ -0,0 +1,124 @@
+from instagrapi.exceptions import UserNotFound
+from instagrapi.utils.concurrency import request_local_scope
+from instagrapi.utils.pacing import NoopPacer
+from tests.helpers import *
+
+
+def _json_response(payload):
+    response = Mock()
+    response.headers = {}
+    response.status_code = 200
+    response.url = "https://i.instagram.com/api/v1/test/"
+    response.text = json.dumps(payload)
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload
+    return response
+
+
+class BatchRegressionTestCase(unittest.TestCase):
+    def make_client(self, pacer=None):
+        client = Client(pacer=pacer or NoopPacer())
+        client.request_log = Mock()
+        return client
+
+    def test_run_many_returns_results_in_order(self):
+        client = self.make_client()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def work(value, delay=0):
+            barrier.wait()
+            time.sleep(delay)
+            return value * 2
+
+        results = client.run_many(
+            [(work, (1,), {"delay": 0.05}), (work, (2,)), lambda: work(3, 0.01)],
+            max_concurrency=3,
+        )
+        self.assertEqual(results, [2, 4, 6])
+
+    def test_run_many_resolves_method_names(self):
+        client = self.make_client()
+        with mock.patch.object(client, "user_info", side_effect=lambda pk: f"user-{pk}") as user_info:
+            results = client.run_many([("user_info", ["1"]), ("user_info", ("2",))])
+        self.assertEqual(results, ["user-1", "user-2"])
+        self.assertEqual(user_info.call_count, 2)
+        with self.assertRaises(ValueError):
+            client.run_many([("user_info", (), {}, "extra")])
+        with self.assertRaises(TypeError):
+            client.run_many([("private_requests_count", ())])
+
+    def test_run_many_runs_the_client_thread_safe(self):
+        client = self.make_client()
+        headers = dict(client.private.headers)
+
+        def get():
+            client.private_request("test/", headers={"X-Batch": "1"})
+            return client.thread_safe
+
+        with mock.patch.object(client.private, "get", return_value=_json_response({"status": "ok"})):
+            self.assertEqual(client.run_many([get, get]), [True, True])
+        self.assertFalse(client.thread_safe)
+        # per-request headers did not leak into the shared session
+        self.assertEqual(dict(client.private.headers), headers)
+        client.set_thread_safe()
+        client.run_many([lambda: None])
+        self.assertTrue(client.thread_safe)
+
+    def test_run_many_gathers_exceptions_per_call(self):
+        client = self.make_client()
+
+        def fail():
+            raise UserNotFound("nope")
+
+        results = client.run_many([lambda: 1, fail, lambda: 3])
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], UserNotFound)
+        self.assertEqual(results[2], 3)
+
+        with self.assertRaises(UserNotFound):
+            client.run_many([lambda: 1, fail], return_exceptions=False)
+
+    def test_run_many_keeps_last_json_per_worker(self):
+        client = self.make_client()
+        client.last_json = {"before": True}
+
+        def fake_get(url, **kwargs):
+            pk = url.rstrip("/").split("/")[-2]
+            time.sleep(0.01)
+            return _json_response({"status": "ok", "pk": pk})
+
+        def call(pk):
+            result = client.private_request(f"users/{pk}/info/")
+            time.sleep(0.01)
+            return result["pk"], client.last_json["pk"], client.last_response.json()["pk"]
+
+        with mock.patch.object(client.private, "get", side_effect=fake_get):
+            results = client.run_many([(call, (str(pk),)) for pk in range(8)], max_concurrency=4)
+        self.assertEqual(results, [(str(pk), str(pk), str(pk)) for pk in range(8)])
+        self.assertEqual(client.last_json, {"before": True})
+
+    def test_run_many_consults_the_shared_pacer(self):
+        pacer = Mock(spec=NoopPacer)
+        client = self.make_client(pacer)
+        with mock.patch.object(client.private, "get", return_value=_json_response({"status": "ok"})):
+            client.run_many([("private_request", ("feed/timeline/",))] * 5, max_concurrency=5)
+        self.assertEqual(pacer.acquire.call_count, 5)
+
+    def test_post_content_type_is_request_local(self):
+        client = self.make_client()
+        with mock.patch.object(client.private, "post", return_value=_json_response({"status": "ok"})) as post:
+            client.private_request("friendships/create/1/", data={"user_id": "1"})
+        self.assertNotIn("Content-Type", client.private.headers)
+        self.assertEqual(
+            post.call_args.kwargs["headers"]["Content-Type"], "application/x-www-form-urlencoded; charset=UTF-8"
+        )
+
+    def test_request_local_scope_is_reentrant(self):
+        client = self.make_client()
+        client.last_json = {"shared": 1}
+        with request_local_scope(client):
+            client.last_json = {"outer": 1}
+            with request_local_scope(client):
+                self.assertEqual(client.last_json, {"outer": 1})
+            self.assertEqual(client.last_json, {"outer": 1})
+        self.assertEqual(client.last_json, {"shared": 1})
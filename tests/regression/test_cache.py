@@ -0,0 +1,223 @@
+import sys
+
+from instagrapi.exceptions import MediaUnavailable, PrivateAccount, UserNotFound
+from instagrapi.extractors import extract_user_v1
+from instagrapi.utils.cache import (
+    RELATIONSHIP_ENTRY_SIZE,
+    EntityCaches,
+    LRUCache,
+    approximate_size,
+    build_entity_caches,
+    relationship_size,
+)
+from tests.helpers import *
+
+
+def _user(pk, username="example"):
+    return extract_user_v1(
+        {
+            "pk": pk,
+            "username": username,
+            "full_name": "",
+            "is_private": False,
+            "profile_pic_url": "https://example.com/pic.jpg",
+            "is_verified": False,
+            "media_count": 0,
+            "follower_count": 0,
+            "following_count": 0,
+            "is_business": False,
+        }
+    )
+
+
+class LRUCacheRegressionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("instagrapi.utils.cache.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache["a"], 1)  # "b" is now the oldest
+        cache["c"] = 3
+        self.assertEqual(sorted(cache), ["a", "c"])
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_entries_expire_after_ttl(self):
+        cache = LRUCache(ttl=10)
+        cache["a"] = 1
+        cache.set("b", 2, ttl=None)
+        self.now += 10
+        self.assertNotIn("a", cache)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache["b"], 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_memory_weighted_eviction(self):
+        cache = LRUCache(max_bytes=100, weigher=len)
+        cache["a"] = "x" * 40
+        cache["b"] = "x" * 40
+        cache["c"] = "x" * 40
+        self.assertEqual(sorted(cache), ["b", "c"])
+        self.assertEqual(cache.weight, 80)
+        cache.pop("b")
+        self.assertEqual(cache.weight, 40)
+
+    def test_reweigh_after_in_place_change_keeps_expiry(self):
+        cache = LRUCache(ttl=10, max_bytes=100, weigher=len)
+        cache["a"] = ["x"] * 40
+        cache["b"] = ["x"] * 40
+        self.now += 5
+        cache["a"].extend(["x"] * 30)
+        cache.reweigh("a")
+        self.assertEqual(cache.weight, 70)
+        self.assertEqual(list(cache), ["a"])  # "b" was evicted for the grown "a"
+        self.now += 5
+        self.assertNotIn("a", cache)
+
+    def test_zero_maxsize_disables_cache(self):
+        cache = LRUCache(maxsize=0)
+        cache["a"] = 1
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.pop("a", None), None)
+
+    def test_mapping_interface(self):
+        cache = LRUCache()
+        cache["a"] = 1
+        self.assertEqual(cache, {"a": 1})
+        del cache["a"]
+        with self.assertRaises(KeyError):
+            cache["a"]
+
+    def test_approximate_size_follows_models(self):
+        user = _user("1")
+        self.assertGreater(approximate_size(user), approximate_size(user.__dict__))
+
+    def test_relationship_size_does_not_walk_the_users(self):
+        users = {str(pk): _user(str(pk)) for pk in range(3)}
+        self.assertEqual(relationship_size(users), sys.getsizeof(users) + 3 * RELATIONSHIP_ENTRY_SIZE)
+        self.assertEqual(EntityCaches().followers.weigher, relationship_size)
+
+
+class EntityCachesRegressionTestCase(unittest.TestCase):
+    def test_unfollow_reweighs_the_cached_following(self):
+        client = Client()
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        client._users_following[client.user_id] = {str(pk): _user(str(pk)) for pk in range(3)}
+        weight = client._users_following.weight
+        with mock.patch.object(client, "private_request", return_value={"friendship_status": {"following": False}}):
+            self.assertTrue(client.user_unfollow("2"))
+        self.assertEqual(list(client._users_following[client.user_id]), ["0", "1"])
+        self.assertEqual(client._users_following.weight, weight - RELATIONSHIP_ENTRY_SIZE)
+
+    def test_config_is_merged_over_defaults(self):
+        caches = EntityCaches({"medias": {"maxsize": 5, "ttl": 1}, "stories": False})
+        self.assertEqual(caches.medias.maxsize, 5)
+        self.assertEqual(caches.medias.ttl, 1)
+        self.assertEqual(caches.users.maxsize, 10000)
+        self.assertEqual(caches.stories.maxsize, 0)
+        with self.assertRaises(ValueError):
+            EntityCaches({"unknown": {}})
+        with self.assertRaises(TypeError):
+            build_entity_caches("yes")
+
+    def test_clients_do_not_share_caches_by_default(self):
+        first, second = Client(), Client()
+        first._users_cache["1"] = _user("1")
+        self.assertNotIn("1", second._users_cache)
+        self.assertIsNot(first._medias_cache, second._medias_cache)
+
+    def test_clients_can_share_caches_explicitly(self):
+        caches = EntityCaches()
+        first, second = Client(cache=caches), Client(cache=caches)
+        first._users_cache["1"] = _user("1")
+        self.assertIn("1", second._users_cache)
+        self.assertIs(second.cache, caches)
+
+    def test_user_info_without_cache(self):
+        client = Client(cache=False)
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        with mock.patch.object(client, "user_info_v1", side_effect=lambda pk: _user(pk)) as user_info_v1:
+            self.assertEqual(client.user_info("5").pk, "5")
+            self.assertEqual(client.user_info("5").pk, "5")
+        self.assertEqual(user_info_v1.call_count, 2)
+        with mock.patch.object(client, "user_info_by_username_v1", return_value=_user("5")) as by_username:
+            self.assertEqual(client.user_info_by_username("example").pk, "5")
+        by_username.assert_called_once_with("example")
+
+    def test_user_info_expires(self):
+        client = Client(cache={"users": {"ttl": 60}})
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        now = [1000.0]
+        with mock.patch("instagrapi.utils.cache.time.monotonic", side_effect=lambda: now[0]):
+            with mock.patch.object(client, "user_info_v1", side_effect=lambda pk: _user(pk)) as user_info_v1:
+                client.user_info("5")
+                client.user_info("5")
+                now[0] += 60
+                client.user_info("5")
+        self.assertEqual(user_info_v1.call_count, 2)
+
+
+class NegativeCacheRegressionTestCase(unittest.TestCase):
+    def make_client(self, **kwargs):
+        client = Client(**kwargs)
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        return client
+
+    def test_not_found_user_fails_locally_until_ttl(self):
+        client = self.make_client(cache={"failures": {"ttl": 60}})
+        now = [1000.0]
+        with (
+            mock.patch("instagrapi.utils.cache.time.monotonic", side_effect=lambda: now[0]),
+            mock.patch.object(client, "user_info_v1", side_effect=UserNotFound(user_id="5")) as private,
+            mock.patch.object(client, "_user_info_public", side_effect=UserNotFound(user_id="5")) as public,
+        ):
+            for _ in range(3):
+                with self.assertRaises(UserNotFound) as ctx:
+                    client.user_info("5")
+            self.assertEqual(ctx.exception.user_id, "5")
+            self.assertEqual((private.call_count, public.call_count), (1, 1))
+            now[0] += 60
+            with self.assertRaises(UserNotFound):
+                client.user_info("5")
+        self.assertEqual((private.call_count, public.call_count), (2, 2))
+
+    def test_private_and_unavailable_results_are_remembered(self):
+        client = self.make_client()
+        with (
+            mock.patch.object(client, "user_info_by_username_v1", side_effect=PrivateAccount()) as by_username,
+            mock.patch.object(client, "_user_info_by_username_public", side_effect=PrivateAccount()),
+        ):
+            for _ in range(2):
+                with self.assertRaises(PrivateAccount):
+                    client.user_info_by_username("Example")
+        with mock.patch.object(client, "_media_info_public", side_effect=MediaUnavailable()):
+            with mock.patch.object(client, "media_info_v1", side_effect=MediaUnavailable()) as media_info_v1:
+                for _ in range(2):
+                    with self.assertRaises(MediaUnavailable):
+                        client.media_info("1")
+        self.assertEqual((by_username.call_count, media_info_v1.call_count), (1, 1))
+
+    def test_transient_errors_are_not_remembered(self):
+        client = self.make_client()
+        with mock.patch.object(client, "user_info_v1", side_effect=ClientConnectionError("reset")) as private:
+            with mock.patch.object(client, "_user_info_public", side_effect=ClientConnectionError("reset")):
+                for _ in range(2):
+                    with self.assertRaises(ClientConnectionError):
+                        client.user_info("5")
+        self.assertEqual(private.call_count, 2)
+
+    def test_bypassing_the_cache_refreshes_a_remembered_failure(self):
+        client = self.make_client()
+        with mock.patch.object(client, "user_info_v1", side_effect=UserNotFound()):
+            with mock.patch.object(client, "_user_info_public", side_effect=UserNotFound()):
+                with self.assertRaises(UserNotFound):
+                    client.user_info("5")
+        with mock.patch.object(client, "user_info_v1", side_effect=lambda pk: _user(pk)):
+            self.assertEqual(client.user_info("5", use_cache=False).pk, "5")
+        self.assertEqual(client.user_info("5").pk, "5")
+        self.assertNotIn(("users", "5"), client._failures_cache)
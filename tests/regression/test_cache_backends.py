@@ -0,0 +1,289 @@
+import tempfile
+
+from instagrapi.extractors import extract_media_v1, extract_user_v1
+from instagrapi.types import Hashtag
+from instagrapi.utils.cache_backends import (
+    CacheBackend,
+    FileCacheBackend,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    build_cache_backend,
+)
+from tests.helpers import *
+
+
+def _user(pk, username="example"):
+    return extract_user_v1(
+        {
+            "pk": pk,
+            "username": username,
+            "full_name": "",
+            "is_private": False,
+            "profile_pic_url": "https://example.com/pic.jpg",
+            "is_verified": False,
+            "media_count": 0,
+            "follower_count": 0,
+            "following_count": 0,
+            "is_business": False,
+        }
+    )
+
+
+def _album(pk="1"):
+    return extract_media_v1(
+        {
+            "pk": pk,
+            "id": f"{pk}_2",
+            "code": "abc",
+            "taken_at": 1710000000,
+            "media_type": 8,
+            "user": {"pk": "2", "username": "example", "profile_pic_url": "https://example.com/profile.jpg"},
+            "image_versions2": {"candidates": [{"url": "https://example.com/x.jpg", "width": 100, "height": 100}]},
+            "carousel_media": [
+                {
+                    "pk": "10",
+                    "id": "10_2",
+                    "media_type": 1,
+                    "image_versions2": {
+                        "candidates": [{"url": "https://example.com/one.jpg", "width": 100, "height": 100}]
+                    },
+                    "usertags": {
+                        "in": [
+                            {
+                                "user": {
+                                    "pk": "100",
+                                    "username": "first",
+                                    "profile_pic_url": "https://example.com/first.jpg",
+                                },
+                                "position": [0.25, 0.75],
+                            }
+                        ]
+                    },
+                }
+            ],
+        }
+    )
+
+
+class CacheBackendContractMixin:
+    def make_backend(self, **kwargs):
+        raise NotImplementedError
+
+    def test_set_get_delete_clear(self):
+        backend = self.make_backend()
+        backend.set("users", "1", '{"pk": "1"}')
+        backend.set("medias", "1", '{"pk": "m"}')
+        self.assertEqual(backend.get("users", "1"), '{"pk": "1"}')
+        self.assertIsNone(backend.get("users", "2"))
+        backend.delete("users", "1")
+        self.assertIsNone(backend.get("users", "1"))
+        backend.set("users", "1", "1")
+        backend.clear("users")
+        self.assertIsNone(backend.get("users", "1"))
+        self.assertEqual(backend.get("medias", "1"), '{"pk": "m"}')
+        backend.clear()
+        self.assertIsNone(backend.get("medias", "1"))
+
+    def test_entries_expire(self):
+        backend = self.make_backend(ttl={"users": 10})
+        with mock.patch("instagrapi.utils.cache_backends.time.time", return_value=1000.0):
+            backend.set("users", "1", "a")
+            backend.set("users", "2", "b", ttl=100)
+        with mock.patch("instagrapi.utils.cache_backends.time.time", return_value=1010.0):
+            self.assertIsNone(backend.get("users", "1"))
+            self.assertEqual(backend.get("users", "2"), "b")
+
+    def test_set_many(self):
+        backend = self.make_backend(ttl={"usernames": 10})
+        with mock.patch("instagrapi.utils.cache_backends.time.time", return_value=1000.0):
+            backend.set_many("usernames", {"first": "1", "second": "2"})
+            self.assertEqual(backend.get("usernames", "second"), "2")
+        with mock.patch("instagrapi.utils.cache_backends.time.time", return_value=1010.0):
+            self.assertIsNone(backend.get("usernames", "first"))
+
+
+class MemoryCacheBackendRegressionTestCase(CacheBackendContractMixin, unittest.TestCase):
+    def make_backend(self, **kwargs):
+        return MemoryCacheBackend(**kwargs)
+
+
+class SQLiteCacheBackendRegressionTestCase(CacheBackendContractMixin, unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "cache.db"
+
+    def make_backend(self, **kwargs):
+        backend = SQLiteCacheBackend(self.path, **kwargs)
+        self.addCleanup(backend.close)
+        return backend
+
+    def test_file_is_shared_between_instances(self):
+        writer, reader = self.make_backend(), self.make_backend()
+        writer.set("users", "1", "a")
+        self.assertEqual(reader.get("users", "1"), "a")
+
+    def test_connections_are_per_thread(self):
+        backend = self.make_backend()
+        backend.set("users", "1", "a")
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(backend.get("users", "1")))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, ["a"])
+
+    def test_purge_expired(self):
+        backend = self.make_backend(ttl={"users": 10})
+        with mock.patch("instagrapi.utils.cache_backends.time.time", return_value=1000.0):
+            backend.set("users", "1", "a")
+        with mock.patch("instagrapi.utils.cache_backends.time.time", return_value=2000.0):
+            self.assertEqual(backend.purge_expired(), 1)
+
+
+class FileCacheBackendRegressionTestCase(CacheBackendContractMixin, unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def make_backend(self, **kwargs):
+        return FileCacheBackend(self.tmp.name, **kwargs)
+
+    def test_build_cache_backend_from_path(self):
+        self.assertIsInstance(build_cache_backend(self.tmp.name), FileCacheBackend)
+        backend = build_cache_backend(str(Path(self.tmp.name) / "cache.sqlite"))
+        self.addCleanup(backend.close)
+        self.assertIsInstance(backend, SQLiteCacheBackend)
+        self.assertIsNone(build_cache_backend(None))
+        with self.assertRaises(TypeError):
+            build_cache_backend(1)
+
+    def test_incomplete_backend_cannot_be_created(self):
+        class Incomplete(CacheBackend):
+            def _get(self, namespace, key):
+                return None
+
+            def _set(self, namespace, key, value, stored_at, expires_at):
+                pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class ClientCacheBackendRegressionTestCase(unittest.TestCase):
+    def make_client(self, backend):
+        client = Client(cache_backend=backend)
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        return client
+
+    def test_models_round_trip(self):
+        backend = MemoryCacheBackend()
+        media = _album()
+        client = self.make_client(backend)
+        client._cache_store("medias", media.pk, media)
+        self.assertEqual(client._cache_load("medias", media.pk, Media), media)
+
+    def test_warm_backend_skips_requests_in_another_client(self):
+        backend = MemoryCacheBackend()
+        first = self.make_client(backend)
+        with mock.patch.object(first, "media_info_v1", return_value=_album("7")) as media_info_v1:
+            first.media_info("7")
+        with mock.patch.object(first, "user_info_v1", return_value=_user("5", "someone")):
+            first.user_info("5")
+        media_info_v1.assert_called_once_with("7")
+
+        second = self.make_client(backend)
+        with mock.patch.object(second, "media_info_v1") as media_info_v1:
+            with mock.patch.object(second, "user_info_v1") as user_info_v1:
+                with mock.patch.object(second, "user_info_by_username_v1") as by_username:
+                    self.assertEqual(second.media_info("7").resources[0].usertags[0].user.pk, "100")
+                    self.assertEqual(second.user_info_by_username("someone").pk, "5")
+        media_info_v1.assert_not_called()
+        user_info_v1.assert_not_called()
+        by_username.assert_not_called()
+        self.assertIn("7", second._medias_cache)
+
+    def test_use_cache_false_refreshes_backend(self):
+        backend = MemoryCacheBackend()
+        client = self.make_client(backend)
+        client._cache_store("users", "5", _user("5", "old"))
+        with mock.patch.object(client, "user_info_v1", return_value=_user("5", "new")) as user_info_v1:
+            self.assertEqual(client.user_info("5", use_cache=False).username, "new")
+        user_info_v1.assert_called_once_with("5")
+        self.assertEqual(client._cache_load("users", "5", User).username, "new")
+
+    def test_hashtag_info_uses_backend(self):
+        client = self.make_client(MemoryCacheBackend())
+        hashtag = Hashtag(id="1", name="python", media_count=10)
+        with mock.patch.object(client, "hashtag_info_v1", return_value=hashtag) as hashtag_info_v1:
+            client.hashtag_info("python")
+            self.assertEqual(client.hashtag_info("python"), hashtag)
+        hashtag_info_v1.assert_called_once_with("python")
+
+    def test_incompatible_entry_is_dropped(self):
+        backend = MemoryCacheBackend()
+        backend.set("users", "5", '{"unexpected": true}')
+        client = self.make_client(backend)
+        self.assertIsNone(client._cache_load("users", "5", User))
+        self.assertIsNone(backend.get("users", "5"))
+
+    def test_backend_errors_do_not_break_lookups(self):
+        backend = MemoryCacheBackend()
+        backend.get = Mock(side_effect=OSError("disk full"))
+        backend.set = Mock(side_effect=OSError("disk full"))
+        client = self.make_client(backend)
+        with mock.patch.object(client, "user_info_v1", return_value=_user("5")):
+            self.assertEqual(client.user_info("5").pk, "5")
+
+
+class UsernameIndexRegressionTestCase(unittest.TestCase):
+    def make_client(self, backend=None):
+        client = Client(cache_backend=backend)
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        return client
+
+    def test_follower_pages_populate_persistent_index(self):
+        backend = MemoryCacheBackend()
+        client = self.make_client(backend)
+        page = {"users": [{"pk": "5", "username": "Someone"}, {"pk": "6", "username": "other"}]}
+        with mock.patch.object(client, "private_request", return_value=page):
+            client.user_followers_v1_chunk("1")
+        self.assertEqual(backend.get("usernames", "someone"), '"5"')
+
+        second = self.make_client(backend)
+        with mock.patch.object(second, "user_info_by_username") as user_info_by_username:
+            self.assertEqual(second.user_id_from_username("@someone"), "5")
+            self.assertEqual(second.user_id_from_username("other"), "6")
+        user_info_by_username.assert_not_called()
+
+    def test_renamed_user_invalidates_index_entry(self):
+        backend = MemoryCacheBackend()
+        client = self.make_client(backend)
+        client._index_usernames([_user("5", "old")])
+        with (
+            mock.patch.object(client, "user_info_v1", return_value=_user("5", "new")) as user_info_v1,
+            mock.patch.object(client, "user_info_by_username_v1", return_value=_user("6", "old")) as by_username,
+        ):
+            self.assertEqual(client.user_info_by_username("old").pk, "6")
+            self.assertEqual(client.user_info_by_username("new").pk, "5")
+        user_info_v1.assert_called_once_with("5")
+        by_username.assert_called_once_with("old")
+        self.assertEqual(client._usernames_cache["old"], "6")
+        self.assertEqual(backend.get("usernames", "old"), '"6"')
+
+    def test_rename_drops_the_old_username(self):
+        backend = MemoryCacheBackend()
+        client = self.make_client(backend)
+        client._index_usernames([_user("5", "old")])
+        client._index_usernames([_user("5", "new")])
+        self.assertNotIn("old", client._usernames_cache)
+        self.assertIsNone(backend.get("usernames", "old"))
+        with mock.patch.object(client, "user_info_by_username", return_value=_user("6", "old")) as by_username:
+            self.assertEqual(client.user_id_from_username("old"), "6")
+        by_username.assert_called_once_with("old")
+
+        # an entry another client persisted is dropped as well
+        second = self.make_client(backend)
+        backend.set("usernames", "taken", '"7"')
+        self.assertEqual(second.user_id_from_username("taken"), "7")
+        second._index_usernames([_user("7", "renamed")])
+        self.assertIsNone(backend.get("usernames", "taken"))
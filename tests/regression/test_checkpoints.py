@@ -0,0 +1,105 @@
+from instagrapi.utils.cache_backends import MemoryCacheBackend
+from instagrapi.utils.checkpoints import Checkpoint, build_checkpoint
+from instagrapi.utils.iterators import iter_paginated
+from tests.helpers import *
+from tests.regression.test_iterators import FakePages
+
+
+class CheckpointRegressionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.store = MemoryCacheBackend()
+
+    def checkpoint(self, **params):
+        return Checkpoint(self.store, "numbers", params or {"user_id": "1"})
+
+    def test_resumes_after_an_error(self):
+        seen = []
+        with self.assertRaises(ClientConnectionError):
+            for item in iter_paginated(FakePages(fail_at=6), page_size=3, checkpoint=self.checkpoint()):
+                seen.append(item)
+        pages = FakePages()
+        seen.extend(iter_paginated(pages, page_size=3, checkpoint=self.checkpoint()))
+        self.assertEqual(seen, list(range(10)))
+        self.assertEqual(pages.calls[0], ("6", 3))
+
+    def test_resume_mid_page_skips_yielded_items(self):
+        iterator = iter_paginated(FakePages(), page_size=4, checkpoint=self.checkpoint())
+        seen = [next(iterator) for _ in range(6)]
+        iterator.close()
+        pages = FakePages()
+        seen.extend(iter_paginated(pages, page_size=4, checkpoint=self.checkpoint()))
+        self.assertEqual(seen, list(range(10)))
+        # the interrupted page is fetched again, its first items are skipped
+        self.assertEqual(pages.calls[0], ("4", 4))
+
+    def test_amount_counts_across_runs(self):
+        iterator = iter_paginated(FakePages(), amount=5, page_size=2, checkpoint=self.checkpoint())
+        seen = [next(iterator) for _ in range(3)]
+        iterator.close()
+        pages = FakePages()
+        seen.extend(iter_paginated(pages, amount=5, page_size=2, checkpoint=self.checkpoint()))
+        self.assertEqual(seen, [0, 1, 2, 3, 4])
+        self.assertEqual(pages.calls, [("2", 2), ("4", 2)])
+        self.assertEqual(list(iter_paginated(pages, amount=5, page_size=2, checkpoint=self.checkpoint())), [])
+
+    def test_amount_ending_mid_page_resumes_in_that_page(self):
+        calls = []
+
+        def trimming_pages(cursor, page_amount):
+            # 10-item pages trimmed to page_amount, the cursor still points after the full page
+            calls.append((cursor, page_amount))
+            start = int(cursor or 0)
+            items = list(range(start, min(start + 10, 30)))
+            if page_amount:
+                items = items[:page_amount]
+            return items, str(start + 10) if start + 10 < 30 else None
+
+        seen = list(iter_paginated(trimming_pages, amount=5, checkpoint=self.checkpoint()))
+        seen.extend(iter_paginated(trimming_pages, amount=12, checkpoint=self.checkpoint()))
+        self.assertEqual(seen, list(range(12)))
+        self.assertEqual(calls, [(None, 0), (None, 0), ("10", 0)])
+
+    def test_finished_crawl_until_reset(self):
+        self.assertEqual(len(list(iter_paginated(FakePages(), page_size=4, checkpoint=self.checkpoint()))), 10)
+        checkpoint = self.checkpoint()
+        self.assertTrue(checkpoint.done)
+        self.assertEqual(list(iter_paginated(FakePages(), page_size=4, checkpoint=checkpoint)), [])
+        checkpoint.reset()
+        self.assertFalse(self.checkpoint().started)
+        self.assertEqual(len(list(iter_paginated(FakePages(), page_size=4, checkpoint=checkpoint))), 10)
+
+    def test_params_select_the_checkpoint(self):
+        list(iter_paginated(FakePages(), page_size=4, checkpoint=self.checkpoint(user_id="1")))
+        self.assertFalse(self.checkpoint(user_id="2").started)
+
+    def test_build_checkpoint(self):
+        self.assertIsNone(build_checkpoint(None, "numbers"))
+        self.assertIsNone(build_checkpoint(False, "numbers"))
+        checkpoint = self.checkpoint()
+        self.assertIs(build_checkpoint(checkpoint, "numbers"), checkpoint)
+        self.assertIs(build_checkpoint(True, "numbers", self.store).store, self.store)
+        with self.assertRaises(ValueError):
+            build_checkpoint(True, "numbers")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "crawl.db"
+            built = build_checkpoint(str(path), "numbers", user_id="1")
+            built.save()
+            self.assertTrue(Checkpoint(str(path), "numbers", {"user_id": "1"}).started)
+
+    def test_client_iterator_resumes(self):
+        client = Client()
+        client.set_cache_backend(MemoryCacheBackend())
+        pages = {"": ([UserShort(pk="1"), UserShort(pk="2")], "next"), "next": ([UserShort(pk="3")], None)}
+        calls = []
+
+        def fetch_chunk(user_id, max_amount, max_id):
+            calls.append(max_id)
+            return pages[max_id]
+
+        with mock.patch.object(client, "user_followers_v1_chunk", side_effect=fetch_chunk):
+            iterator = client.iter_user_followers_v1("1", checkpoint=True)
+            first = next(iterator)
+            iterator.close()
+            rest = list(client.iter_user_followers_v1("1", checkpoint=True))
+        self.assertEqual([user.pk for user in [first, *rest]], ["1", "2", "3"])
+        self.assertEqual(calls, ["", "", "next"])
@@ -0,0 +1,125 @@
+from instagrapi.exceptions import CircuitOpenError, ClientNotFoundError, ClientThrottledError, PleaseWaitFewMinutes
+from instagrapi.utils.circuit import CircuitBreaker, build_circuit_breaker
+from instagrapi.utils.pacing import NoopPacer
+from tests.helpers import *
+
+
+def _response(status_code=200, headers=None, payload=None):
+    response = Mock()
+    response.headers = headers or {}
+    response.status_code = status_code
+    response.url = "https://i.instagram.com/api/v1/test/"
+    response.text = json.dumps(payload or {})
+    response.json.return_value = payload or {"status": "ok"}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+class CircuitBreakerRegressionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("instagrapi.utils.circuit.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def trip(self, breaker, family="private:feed", proxy=None, failures=3):
+        for _ in range(failures):
+            breaker.before(family, proxy)
+            breaker.record(family, proxy, ClientThrottledError("slow down"))
+
+    def test_opens_after_failure_ratio_and_fails_fast(self):
+        breaker = CircuitBreaker(failure_ratio=0.5, min_requests=4, cooldown=30)
+        breaker.before("private:feed")
+        breaker.record("private:feed")
+        self.trip(breaker, failures=2)
+        self.assertEqual(breaker.state("private:feed"), "closed")  # 2 of 3, below min_requests
+        self.trip(breaker, failures=1)
+        self.assertEqual(breaker.state("private:feed"), "open")
+
+        with self.assertRaises(CircuitOpenError) as ctx:
+            breaker.before("private:feed")
+        self.assertEqual(ctx.exception.family, "private:feed")
+        self.assertAlmostEqual(ctx.exception.retry_at, time.time() + 30, delta=2)
+        breaker.before("private:users")  # other families are not affected
+
+    def test_circuits_are_keyed_by_proxy(self):
+        breaker = CircuitBreaker(min_requests=1)
+        self.trip(breaker, proxy="http://proxy-a", failures=1)
+        self.assertTrue(breaker.is_open("private:feed", "http://proxy-a"))
+        self.assertFalse(breaker.is_open("private:feed", "http://proxy-b"))
+        breaker.before("private:feed", "http://proxy-b")
+
+    def test_half_open_probe_closes_or_reopens_with_longer_cooldown(self):
+        breaker = CircuitBreaker(min_requests=1, cooldown=10, max_cooldown=25)
+        self.trip(breaker, failures=1)
+        self.now += 10
+        self.assertEqual(breaker.state("private:feed"), "half_open")
+        breaker.before("private:feed")  # the probe
+        with self.assertRaises(CircuitOpenError):
+            breaker.before("private:feed")  # only one probe at a time
+        breaker.record("private:feed", exc=PleaseWaitFewMinutes("wait"))
+        self.assertEqual(breaker.state("private:feed"), "open")
+        self.now += 19
+        self.assertEqual(breaker.state("private:feed"), "open")  # cool-down doubled to 20
+        self.now += 1
+        breaker.before("private:feed")
+        breaker.record("private:feed")
+        self.assertEqual(breaker.state("private:feed"), "closed")
+
+    def test_half_open_probe_failing_otherwise_stays_half_open(self):
+        breaker = CircuitBreaker(min_requests=1, cooldown=10)
+        self.trip(breaker, failures=1)
+        self.now += 10
+        breaker.before("private:feed")
+        breaker.record("private:feed", exc=ClientNotFoundError("nope"))
+        self.assertEqual(breaker.state("private:feed"), "half_open")
+        breaker.before("private:feed")  # the slot was freed for another probe
+        breaker.record("private:feed", exc=PleaseWaitFewMinutes("wait"))
+        self.assertEqual(breaker.state("private:feed"), "open")
+
+    def test_retry_after_extends_cooldown(self):
+        breaker = CircuitBreaker(min_requests=1, cooldown=10)
+        breaker.before("public")
+        breaker.record("public", exc=ClientThrottledError(response=_response(429, {"Retry-After": "120"})))
+        self.now += 60
+        self.assertTrue(breaker.is_open("public"))
+        snapshot = breaker.snapshot()[("public", None)]
+        self.assertEqual(snapshot["state"], "open")
+        self.assertAlmostEqual(snapshot["retry_at"], time.time() + 60, delta=2)
+
+    def test_other_errors_do_not_trip(self):
+        breaker = CircuitBreaker(min_requests=1)
+        breaker.before("private:feed")
+        breaker.record("private:feed", exc=ClientNotFoundError("nope"))
+        self.assertEqual(breaker.state("private:feed"), "closed")
+
+    def test_build_circuit_breaker(self):
+        self.assertIsNone(build_circuit_breaker(None))
+        self.assertIsInstance(build_circuit_breaker(True), CircuitBreaker)
+        self.assertEqual(build_circuit_breaker({"cooldown": 5}).cooldown, 5)
+        with self.assertRaises(TypeError):
+            build_circuit_breaker("on")
+
+    def test_private_request_fails_fast_while_open(self):
+        client = Client(pacer=NoopPacer(), circuit_breaker={"min_requests": 2, "cooldown": 60})
+        client.request_log = Mock()
+        with mock.patch.object(client.private, "get", return_value=_response(429)) as get:
+            for _ in range(2):
+                with self.assertRaises(ClientThrottledError):
+                    client.private_request("feed/timeline/")
+            with self.assertRaises(CircuitOpenError):
+                client.private_request("feed/timeline/")
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(client.circuit_breaker.state("private:feed"), "open")
+
+    def test_public_request_does_not_retry_open_circuit(self):
+        client = Client(pacer=NoopPacer(), circuit_breaker={"min_requests": 1})
+        with mock.patch.object(client, "_send_public_request", side_effect=ClientThrottledError("slow")) as send:
+            with mock.patch("instagrapi.mixins.public.time.sleep") as sleep:
+                with self.assertRaises(CircuitOpenError):
+                    client.public_request("https://www.instagram.com/", retries_count=3)
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(sleep.call_count, 1)
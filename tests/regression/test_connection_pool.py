@@ -0,0 +1,66 @@
+from instagrapi.utils.pool import ConnectionPoolManager, PooledHTTPAdapter
+from tests.helpers import *
+
+
+class ConnectionPoolRegressionTestCase(unittest.TestCase):
+    def test_clients_share_adapters_but_not_sessions(self):
+        manager = ConnectionPoolManager(pool_connections=4, pool_maxsize=8)
+        first = Client(pool_manager=manager)
+        second = Client(pool_manager=manager)
+
+        self.assertIsInstance(first.private.adapters["https://"], PooledHTTPAdapter)
+        self.assertIs(first.private.adapters["https://"], second.private.adapters["https://"])
+        self.assertIs(first.public.adapters["https://"], second.public.adapters["https://"])
+        self.assertIs(first.graphql.adapters["https://"], second.graphql.adapters["https://"])
+        self.assertIsNot(first.private, second.private)
+        self.assertIsNot(first.private.cookies, second.private.cookies)
+        self.assertEqual(first.private.adapters["https://"]._pool_maxsize, 8)
+        self.assertEqual(first.private.adapters["https://"]._pool_connections, 4)
+
+    def test_adapters_are_keyed_by_proxy(self):
+        manager = ConnectionPoolManager()
+        first = Client(pool_manager=manager, proxy="http://127.0.0.1:8080")
+        second = Client(pool_manager=manager, proxy="http://127.0.0.1:8081")
+        third = Client(pool_manager=manager, proxy="http://127.0.0.1:8080")
+
+        self.assertIsNot(first.private.adapters["https://"], second.private.adapters["https://"])
+        self.assertIs(first.private.adapters["https://"], third.private.adapters["https://"])
+
+        second.set_proxy("http://127.0.0.1:8080")
+        self.assertIs(first.private.adapters["https://"], second.private.adapters["https://"])
+        self.assertIsNotNone(second.private.adapters["https://"].max_retries)
+
+    def test_retry_settings_are_part_of_the_key(self):
+        manager = ConnectionPoolManager()
+        first = Client(pool_manager=manager)
+        second = Client(pool_manager=manager, session_retry_total=7)
+
+        self.assertIsNot(first.private.adapters["https://"], second.private.adapters["https://"])
+        self.assertEqual(second.private.adapters["https://"].max_retries.total, 7)
+
+    def test_default_client_keeps_private_adapters(self):
+        first = Client()
+        second = Client()
+        self.assertIsNot(first.private.adapters["https://"], second.private.adapters["https://"])
+        self.assertNotIsInstance(first.private.adapters["https://"], PooledHTTPAdapter)
+
+    def test_evict_idle_closes_unused_pools(self):
+        manager = ConnectionPoolManager(max_idle=60)
+        adapter = manager.adapter(proxy="http://127.0.0.1:8080")
+        busy = manager.adapter(proxy="http://127.0.0.1:8081")
+        adapter.last_used -= 120
+        with mock.patch.object(adapter, "close") as close, mock.patch.object(busy, "close") as busy_close:
+            self.assertEqual(manager.evict_idle(), 1)
+        close.assert_called_once_with()
+        busy_close.assert_not_called()
+        self.assertIs(manager.adapter(proxy="http://127.0.0.1:8080"), adapter)
+
+    def test_eviction_runs_opportunistically(self):
+        manager = ConnectionPoolManager(max_idle=10)
+        manager._last_eviction -= 4
+        with mock.patch.object(manager, "evict_idle") as evict_idle:
+            manager.maybe_evict_idle()
+            evict_idle.assert_not_called()
+            manager._last_eviction -= 2
+            manager.maybe_evict_idle()
+            evict_idle.assert_called_once_with()
@@ -1,3 +1,6 @@
+from copy import deepcopy
+
+from instagrapi.extractors import extract_highlight_v1, extract_media_gql, extract_media_v1, extract_story_gql
 from tests.helpers import *
 
 
@@ -7,6 +10,88 @@ class ExtractorsRegressionTestCase(unittest.TestCase):
         self.assertIsNone(resource.thumbnail_url)
         self.assertEqual(resource.pk, "1")
 
+    def test_extractors_leave_the_payload_untouched(self):
+        user = {"pk": "42", "username": "user42", "profile_pic_url": "https://example.com/42.jpg"}
+        candidates = [
+            {"width": 150, "height": 150, "url": "https://example.com/150.jpg"},
+            {"width": 1080, "height": 1350, "url": "https://example.com/1080.jpg"},
+        ]
+        child = {"pk": "2", "id": "2_42", "media_type": 1, "image_versions2": {"candidates": candidates}}
+        media_v1 = {
+            "pk": "1",
+            "id": "1_42",
+            "code": "C1",
+            "taken_at": 1710000000,
+            "media_type": 8,
+            "product_type": "carousel_container",
+            "user": user,
+            "caption": {"text": "hello"},
+            "like_count": 1,
+            "image_versions2": {
+                "candidates": candidates,
+                "scrubber_spritesheet_info_candidates": {"default": {"sprite_urls": [], "video_length": 1.0}},
+            },
+            "location": {"pk": 1, "name": "Somewhere", "lng": 1.5, "lat": 2.5},
+            "usertags": {"in": [{"user": user, "position": [0.5, 0.5]}]},
+            "carousel_media": [child, dict(child, pk="3", id="3_42")],
+        }
+        media_gql = {
+            "__typename": "GraphSidecar",
+            "id": "1",
+            "shortcode": "C1",
+            "taken_at_timestamp": 1710000000,
+            "owner": {"id": "42", "username": "user42"},
+            "display_resources": [{"src": "https://example.com/1.jpg", "config_width": 640, "config_height": 640}],
+            "edge_media_to_caption": {"edges": [{"node": {"text": "hello"}}]},
+            "edge_media_preview_like": {"count": 1},
+            "edge_sidecar_to_children": {
+                "edges": [{"node": {"__typename": "GraphImage", "id": "2", "display_url": "https://example.com/2.jpg"}}]
+            },
+        }
+        story_v1 = dict(
+            media_v1,
+            media_type=1,
+            product_type="story",
+            reel_mentions=[{"user": user, "x": 0.5, "y": 0.5, "width": 0.1, "height": 0.1, "rotation": 0}],
+            story_feed_media=[{"media_id": "5_42", "x": 0.5, "y": 0.5, "width": 0.1, "height": 0.1, "rotation": 0}],
+        )
+        story_v1.pop("carousel_media")
+        story_gql = {
+            "id": "1",
+            "taken_at_timestamp": 1710000000,
+            "owner": {"id": "42", "username": "user42"},
+            "is_video": False,
+            "display_resources": [{"src": "https://example.com/1.jpg", "config_width": 640, "config_height": 640}],
+            "tappable_objects": [
+                {"__typename": "GraphTappableMention", "username": "user42", "x": 0.5, "y": 0.5},
+                {"__typename": "GraphTappableFeedMedia", "media": {"id": "5", "shortcode": "C5"}, "x": 0.5, "y": 0.5},
+            ],
+        }
+        highlight_v1 = {
+            "id": "highlight:1",
+            "title": "Title",
+            "created_at": 1710000000,
+            "latest_reel_media": 1710000000,
+            "is_pinned_highlight": False,
+            "media_count": 1,
+            "user": user,
+            "cover_media": {"cropped_image_version": {"url": "https://example.com/cover.jpg"}},
+            "items": [story_v1],
+        }
+        cases = [
+            (extract_media_v1, media_v1),
+            (extract_media_gql, media_gql),
+            (extract_story_v1, story_v1),
+            (extract_story_gql, story_gql),
+            (extract_highlight_v1, highlight_v1),
+        ]
+        for extract, payload in cases:
+            with self.subTest(extract=extract.__name__):
+                snapshot = deepcopy(payload)
+                first = extract(payload)
+                self.assertEqual(payload, snapshot)
+                self.assertEqual(extract(payload), first)
+
 
 class DirectExtractorRegressionTestCase(unittest.TestCase):
     def test_xma_share_without_target_url_is_ignored(self):
@@ -0,0 +1,104 @@
+import base64
+
+from instagrapi.types import UserShort
+from instagrapi.utils.cache_backends import MemoryCacheBackend
+from instagrapi.utils.follow_sync import FollowSnapshot
+from tests.helpers import *
+
+
+def _pages(pks, page_size=3):
+    """Fake user_followers_v1_chunk serving ``pks`` newest first"""
+
+    def fetch_chunk(user_id, max_amount=0, max_id="", order=None):
+        start = int(max_id or 0)
+        end = start + page_size
+        users = [UserShort(pk=str(pk), username=f"user{pk}") for pk in pks[start:end]]
+        return users, str(end) if end < len(pks) else None
+
+    return fetch_chunk
+
+
+class FollowSnapshotRegressionTestCase(unittest.TestCase):
+    def test_round_trip_and_membership(self):
+        snapshot = FollowSnapshot("1", "followers", ["30", "10", "20", "10"], synced_at=5.0)
+        self.assertEqual(list(snapshot), ["10", "20", "30"])
+        self.assertIn("20", snapshot)
+        self.assertNotIn("25", snapshot)
+        restored = FollowSnapshot.loads(snapshot.dumps())
+        self.assertEqual(restored, snapshot)
+        self.assertEqual(restored.synced_at, 5.0)
+        with self.assertRaises(ValueError):
+            FollowSnapshot.loads(b"garbage")
+        with self.assertRaises(ValueError):
+            FollowSnapshot.loads(snapshot.dumps()[:-4])
+
+    def test_serialized_form_is_compact(self):
+        pks = range(45000000000, 45000000000 + 200000 * 37, 37)
+        data = FollowSnapshot("1", pks=pks).dumps()
+        self.assertLess(len(data) / 200000, 1)
+
+    def test_merged(self):
+        snapshot = FollowSnapshot("1", pks=["1", "2", "3"], full_synced_at=1.0)
+        merged = snapshot.merged(["4"], ["2"], synced_at=2.0)
+        self.assertEqual(list(merged), ["1", "3", "4"])
+        self.assertEqual((merged.synced_at, merged.full_synced_at), (2.0, 1.0))
+        self.assertEqual(list(snapshot), ["1", "2", "3"])
+
+
+class FollowDeltaRegressionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+
+    def sync(self, pks, **kwargs):
+        with mock.patch.object(self.client, "user_followers_v1_chunk", side_effect=_pages(pks)) as fetch_chunk:
+            delta = self.client.user_followers_delta("1", **kwargs)
+        return delta, fetch_chunk
+
+    def test_first_sync_walks_everything(self):
+        delta, fetch_chunk = self.sync(list(range(10, 0, -1)))
+        self.assertTrue(delta.full)
+        self.assertEqual(len(delta.added), 10)
+        self.assertEqual(delta.pages, 4)
+        self.assertEqual(len(delta.snapshot), 10)
+        self.assertEqual(fetch_chunk.call_args.kwargs["order"], "date_followed_latest")
+
+    def test_incremental_sync_stops_at_known_followers(self):
+        snapshot = FollowSnapshot("1", pks=range(1, 101))
+        delta, fetch_chunk = self.sync([102, 101, *range(100, 0, -1)], snapshot=snapshot, overlap=3)
+        self.assertFalse(delta.full)
+        self.assertEqual([user.pk for user in delta.added], ["102", "101"])
+        self.assertEqual(delta.removed, [])
+        self.assertEqual(fetch_chunk.call_count, 2)
+        self.assertEqual(len(delta.snapshot), 102)
+
+    def test_full_sync_reports_removed(self):
+        snapshot = FollowSnapshot("1", pks=range(1, 8))
+        delta, _ = self.sync([9, 8, 7, 5, 4, 3, 2, 1], snapshot=snapshot, full=True)
+        self.assertEqual([user.pk for user in delta.added], ["9", "8"])
+        self.assertEqual(delta.removed, ["6"])
+        self.assertNotIn("6", delta.snapshot)
+        self.assertIsNotNone(delta.snapshot.full_synced_at)
+
+    def test_count_mismatch_falls_back_to_full_sync(self):
+        snapshot = FollowSnapshot("1", pks=range(1, 11))
+        delta, _ = self.sync([11, 10, 9, 8, 7, 6, 4, 3, 2, 1], snapshot=snapshot, overlap=2, expected_count=10)
+        self.assertTrue(delta.full)
+        self.assertEqual([user.pk for user in delta.added], ["11"])
+        self.assertEqual(delta.removed, ["5"])
+        self.assertEqual(len(delta.snapshot), 10)
+
+    def test_snapshot_persists_in_cache_backend(self):
+        self.client.set_cache_backend(MemoryCacheBackend())
+        self.sync([3, 2, 1])
+        delta, fetch_chunk = self.sync([4, 3, 2, 1], overlap=2)
+        self.assertFalse(delta.full)
+        self.assertEqual([user.pk for user in delta.added], ["4"])
+        fetch_chunk.assert_called_once()
+
+    def test_corrupt_stored_snapshot_falls_back_to_full_sync(self):
+        self.client.set_cache_backend(MemoryCacheBackend())
+        self.client._cache_store("follow_snapshots", "followers:1", base64.b64encode(b"IGFS1corrupt").decode())
+        delta, _ = self.sync([3, 2, 1])
+        self.assertTrue(delta.full)
+        self.assertEqual(len(delta.snapshot), 3)
@@ -0,0 +1,227 @@
+from instagrapi.utils.iterators import TimeWindow, iter_paginated, iter_prefetched
+from tests.helpers import *
+
+
+class FakePages:
+    """fetch_page over ``total`` numbered items, recording every call"""
+
+    def __init__(self, total=10, fail_at=None):
+        self.total = total
+        self.fail_at = fail_at
+        self.calls = []
+        self.requested = threading.Event()
+
+    def __call__(self, cursor, page_amount):
+        start = int(cursor or 0)
+        self.calls.append((cursor, page_amount))
+        if len(self.calls) > 1:
+            self.requested.set()
+        if self.fail_at is not None and start >= self.fail_at:
+            raise ClientConnectionError("boom")
+        end = min(start + page_amount, self.total)
+        return list(range(start, end)), str(end) if end < self.total else None
+
+
+def _prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "instagrapi-prefetch"]
+
+
+class IterPaginatedRegressionTestCase(unittest.TestCase):
+    def tearDown(self):
+        for thread in _prefetch_threads():
+            thread.join(timeout=2)
+        self.assertEqual(_prefetch_threads(), [])
+
+    def test_prefetch_yields_the_same_items(self):
+        for amount in (0, 7):
+            sync_pages, pages = FakePages(), FakePages()
+            expected = list(iter_paginated(sync_pages, amount=amount, page_size=3))
+            self.assertEqual(list(iter_paginated(pages, amount=amount, page_size=3, prefetch=2)), expected)
+            self.assertEqual(pages.calls, sync_pages.calls)
+
+    def test_next_page_is_fetched_while_consumer_works(self):
+        pages = FakePages()
+        iterator = iter_paginated(pages, page_size=3, prefetch=1)
+        self.assertEqual(next(iterator), 0)
+        self.assertTrue(pages.requested.wait(timeout=2))
+        iterator.close()
+
+    def test_buffer_is_bounded(self):
+        pages = FakePages(total=100)
+        iterator = iter_paginated(pages, page_size=1, prefetch=2)
+        next(iterator)
+        deadline = time.monotonic() + 2
+        while len(pages.calls) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        # one page being consumed, two buffered, one blocked on the full buffer
+        self.assertEqual(len(pages.calls), 4)
+        iterator.close()
+
+    def test_early_stop_cancels_background_fetching(self):
+        pages = FakePages(total=1000)
+        for item in iter_paginated(pages, page_size=2, prefetch=1):
+            if item == 3:
+                break
+        for thread in _prefetch_threads():
+            thread.join(timeout=2)
+        self.assertLessEqual(len(pages.calls), 4)
+
+    def test_errors_surface_after_earlier_items(self):
+        seen = []
+        with self.assertRaises(ClientConnectionError):
+            for item in iter_paginated(FakePages(fail_at=4), page_size=2, prefetch=3):
+                seen.append(item)
+        self.assertEqual(seen, [0, 1, 2, 3])
+
+    def test_iter_prefetched_rejects_empty_buffer(self):
+        with self.assertRaises(ValueError):
+            next(iter_prefetched([1], buffer=0))
+
+    def test_client_iterators_accept_prefetch(self):
+        client = Client()
+        pages = {"": ([UserShort(pk="1"), UserShort(pk="2")], "next"), "next": ([UserShort(pk="3")], None)}
+        with mock.patch.object(
+            client, "user_followers_v1_chunk", side_effect=lambda user_id, max_amount, max_id: pages[max_id]
+        ):
+            users = list(client.iter_user_followers_v1("1", prefetch=1))
+        self.assertEqual([user.pk for user in users], ["1", "2", "3"])
+
+
+class ClientIteratorsRegressionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+
+    def two_pages(self, first_cursor):
+        pages = {first_cursor: ([UserShort(pk="1"), UserShort(pk="2")], "next"), "next": ([UserShort(pk="3")], None)}
+        calls = []
+
+        def fetch_chunk(*args, **kwargs):
+            cursor = [*args, *kwargs.values()][-1]
+            calls.append(cursor)
+            return pages[cursor]
+
+        return fetch_chunk, calls
+
+    def test_iterators_stream_every_page(self):
+        cases = [
+            ("iter_user_followers_gql", ("1",), "user_followers_gql_chunk", None),
+            ("iter_direct_threads", (), "direct_threads_chunk", None),
+            ("iter_media_comments_gql", ("1",), "media_comments_gql_chunk", ""),
+            ("iter_story_viewers", ("1",), "story_viewers_chunk", ""),
+            ("iter_usertag_medias", ("1",), "usertag_medias_paginated_v1", ""),
+            ("iter_location_medias", (1,), "location_medias_v1_chunk", None),
+            ("iter_collection_medias", ("liked",), "collection_medias_v1_chunk", ""),
+            ("iter_archive_medias", (), "archive_medias_paginated_v1", ""),
+        ]
+        for method, args, chunk, first_cursor in cases:
+            with self.subTest(method=method):
+                fetch_chunk, calls = self.two_pages(first_cursor)
+                with (
+                    mock.patch.object(self.client, chunk, side_effect=fetch_chunk),
+                    mock.patch.object(self.client, "media_pk", side_effect=str),
+                ):
+                    iterator = getattr(self.client, method)(*args)
+                    self.assertEqual(calls, [])
+                    self.assertEqual(next(iterator).pk, "1")
+                    self.assertEqual(calls, [first_cursor])
+                    self.assertEqual([item.pk for item in iterator], ["2", "3"])
+                self.assertEqual(calls, [first_cursor, "next"])
+
+    def test_iter_media_likers_gql_is_single_page(self):
+        likers = [{"pk": "1"}, {"pk": "2"}, {"pk": "3"}]
+        with mock.patch.object(self.client, "media_likers_gql_chunk", return_value=likers) as fetch_chunk:
+            self.assertEqual(list(self.client.iter_media_likers_gql("1", amount=2)), likers[:2])
+        fetch_chunk.assert_called_once_with("1")
+
+    def test_insights_media_feed_pages(self):
+        def page(edges, end_cursor, has_next_page):
+            top_posts = {"edges": edges, "page_info": {"end_cursor": end_cursor, "has_next_page": has_next_page}}
+            return {
+                "data": {"shadow_instagram_user": {"business_manager": {"top_posts_unit": {"top_posts": top_posts}}}}
+            }
+
+        responses = [page([{"node": {"id": "1"}}], "c1", True), page([{"node": {"id": "2"}}], "c2", False)]
+        with mock.patch.object(self.client, "private_request", side_effect=responses * 2) as private_request:
+            edges = list(self.client.iter_insights_media_feed(sleep=0))
+            self.assertEqual(self.client.insights_media_feed_all(sleep=0), edges)
+        self.assertEqual([edge["node"]["id"] for edge in edges], ["1", "2"])
+        self.assertEqual(private_request.call_count, 4)
+
+
+def _media(pk, day):
+    return types.SimpleNamespace(pk=str(pk), taken_at=datetime(2024, 1, day, tzinfo=UTC()))
+
+
+class DayPages:
+    """fetch_page over medias newest first, ``pinned`` medias heading the first page"""
+
+    def __init__(self, days, pinned=(), per_page=3):
+        self.medias = [*pinned, *(_media(100 + day, day) for day in days)]
+        self.per_page = per_page
+        self.calls = 0
+
+    def __call__(self, cursor, page_amount):
+        self.calls += 1
+        start = int(cursor or 0)
+        end = start + self.per_page
+        return self.medias[start:end], str(end) if end < len(self.medias) else None
+
+
+class TimeWindowRegressionTestCase(unittest.TestCase):
+    since = datetime(2024, 1, 20, tzinfo=UTC())
+
+    def days(self, medias):
+        return [media.taken_at.day for media in medias]
+
+    def test_stops_after_a_page_older_than_since(self):
+        pages = DayPages(range(28, 0, -1))
+        medias = list(iter_paginated(pages, window=TimeWindow(since=self.since)))
+        self.assertEqual(self.days(medias), list(range(28, 19, -1)))
+        # 9 matching medias fill three pages, the fourth is entirely older
+        self.assertEqual(pages.calls, 4)
+
+    def test_pinned_medias_do_not_end_the_crawl(self):
+        pinned = [_media(1, 2), _media(2, 3)]
+        window = TimeWindow(since=self.since, pinned=lambda: ["1", "2"])
+        pages = DayPages(range(28, 0, -1), pinned=pinned)
+        medias = list(iter_paginated(pages, window=window))
+        self.assertEqual(self.days(medias), list(range(28, 19, -1)))
+        # the first non-pinned older media ends the crawl on its own page
+        self.assertEqual(pages.calls, 4)
+        pages = DayPages(range(21, 0, -1), pinned=pinned)
+        window = TimeWindow(since=self.since, pinned=lambda: ["1", "2"])
+        self.assertEqual(self.days(iter_paginated(pages, window=window)), [21, 20])
+        self.assertEqual(pages.calls, 2)
+
+    def test_until_predicate_and_amount(self):
+        window = TimeWindow(
+            since=self.since.timestamp(),
+            until=datetime(2024, 1, 27, tzinfo=UTC()),
+            predicate=lambda m: m.taken_at.day % 2,
+        )
+        pages = DayPages(range(28, 0, -1))
+        medias = list(iter_paginated(pages, amount=2, window=window))
+        self.assertEqual(self.days(medias), [25, 23])
+
+    def test_unordered_listing_is_only_filtered(self):
+        pages = DayPages([1, 2, 3, 25, 4, 5, 26])
+        medias = list(iter_paginated(pages, window=TimeWindow(since=self.since, ordered=False)))
+        self.assertEqual(self.days(medias), [25, 26])
+        self.assertEqual(pages.calls, 3)
+
+    def test_iter_user_medias_uses_pinned_medias(self):
+        client = Client()
+        pages = DayPages(range(28, 0, -1), pinned=[_media(1, 2)])
+        with (
+            mock.patch.object(
+                client,
+                "user_medias_paginated",
+                side_effect=lambda user_id, amount, end_cursor: pages(end_cursor, amount),
+            ),
+            mock.patch.object(client, "user_pinned_medias", return_value=[_media(1, 2)]) as user_pinned_medias,
+        ):
+            medias = list(client.iter_user_medias("1", since=self.since))
+        self.assertEqual(self.days(medias), list(range(28, 19, -1)))
+        user_pinned_medias.assert_called_once_with("1")
@@ -0,0 +1,79 @@
+import pickle
+from copy import deepcopy
+
+from instagrapi.extractors import extract_direct_message, extract_media_v1
+from instagrapi.types import Media, SharedMediaImageVersions
+from instagrapi.utils.lazy import is_lazy, materialize
+from instagrapi.utils.snapshot import copy_model, freeze, is_frozen
+from instagrapi.utils.validation import model_validation
+from tests.helpers import *
+from tests.regression.test_validation import CORPUS
+
+MEDIA_V1 = dict(
+    CORPUS[0][1],
+    sponsor_tags=[{"sponsor": {"pk": 8, "username": "brand"}}],
+    clips_metadata={"audio_type": "original_sounds"},
+)
+NESTED = ("resources", "usertags", "sponsor_tags", "coauthor_producers", "clips_metadata", "image_versions2")
+
+
+class LazyModelsRegressionTestCase(unittest.TestCase):
+    def lazy(self):
+        return extract_media_v1(deepcopy(MEDIA_V1), lazy=True)
+
+    def test_nested_models_are_decoded_on_first_access(self):
+        media = self.lazy()
+        self.assertIsInstance(media, Media)
+        self.assertTrue(is_lazy(media))
+        self.assertEqual((media.pk, media.like_count, media.caption_text), (3300000000000000001, 7, "hello #tag"))
+        for name in NESTED:
+            self.assertNotIn(name, media.__dict__)
+        with mock.patch("instagrapi.extractors.extract_resource_v1", wraps=extract_resource_v1) as extract:
+            self.assertEqual([resource.pk for resource in media.resources], ["2", "3"])
+            self.assertEqual(len(media.resources), 2)
+        self.assertEqual(extract.call_count, 2)  # decoded once
+        self.assertIsInstance(media.image_versions2, SharedMediaImageVersions)
+        self.assertEqual(media.usertags[0].user.pk, "7")
+        self.assertNotIn("sponsor_tags", media.__dict__)
+
+    def test_lazy_media_is_interchangeable_with_the_eager_one(self):
+        eager = extract_media_v1(deepcopy(MEDIA_V1))
+        self.assertFalse(is_lazy(eager))
+        self.assertEqual(self.lazy(), eager)
+        self.assertEqual(eager, self.lazy())
+        self.assertEqual(self.lazy().model_dump(), eager.model_dump())
+        self.assertEqual(self.lazy().model_dump_json(), eager.model_dump_json())
+        self.assertEqual(self.lazy().model_fields_set, eager.model_fields_set)
+        self.assertEqual(repr(self.lazy()), repr(eager))
+        self.assertEqual(materialize(self.lazy()).__dict__, eager.__dict__)
+        restored = pickle.loads(pickle.dumps(self.lazy()))
+        self.assertIs(type(restored), Media)
+        self.assertEqual(restored, eager)
+        for copy in (self.lazy().model_copy(), deepcopy(self.lazy()), copy_model(self.lazy())):
+            self.assertEqual(copy, eager)
+        frozen = freeze(self.lazy())
+        self.assertTrue(is_frozen(frozen))
+        self.assertEqual(frozen, eager)
+
+    def test_assigned_fields_are_not_overwritten(self):
+        media = self.lazy()
+        media.usertags = []
+        self.assertEqual(materialize(media).usertags, [])
+        self.assertEqual(len(media.resources), 2)
+
+    def test_lazy_validation_mode(self):
+        with model_validation("lazy"):
+            self.assertTrue(is_lazy(extract_media_v1(deepcopy(MEDIA_V1))))
+            # medias embedded in other models stay eager, their parent serializes them
+            message = extract_direct_message(
+                {
+                    "item_id": "1",
+                    "user_id": "2",
+                    "timestamp": 1761953663000000,
+                    "item_type": "media_share",
+                    "media_share": deepcopy(MEDIA_V1),
+                }
+            )
+        self.assertFalse(is_lazy(message.media_share))
+        self.assertEqual(message.model_dump()["media_share"]["resources"][0]["pk"], "2")
+        self.assertEqual(Client(validation="lazy").validation, "lazy")
@@ -0,0 +1,133 @@
+from instagrapi.utils.pacing import (
+    GRAPHQL_FAMILY,
+    PUBLIC_FAMILY,
+    LegacyPacer,
+    NoopPacer,
+    RequestPacer,
+    TokenBucket,
+    TokenBucketPacer,
+    build_pacer,
+    endpoint_family,
+)
+from tests.helpers import *
+
+
+def _json_response(payload=None):
+    response = Mock()
+    response.headers = {"Content-Length": "0"}
+    response.raw.tell.return_value = 0
+    response.status_code = 200
+    response.url = "https://i.instagram.com/api/v1/test/"
+    response.text = "{}"
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload or {"status": "ok"}
+    return response
+
+
+class PacingRegressionTestCase(unittest.TestCase):
+    def test_endpoint_family_groups_private_endpoints_by_first_segment(self):
+        self.assertEqual(endpoint_family("feed/user/1/"), "private:feed")
+        self.assertEqual(endpoint_family("/v1/feed/timeline/"), "private:feed")
+        self.assertEqual(endpoint_family("friendships/create/1/"), "private:friendships")
+        self.assertEqual(endpoint_family("https://www.instagram.com/", PUBLIC_FAMILY), PUBLIC_FAMILY)
+
+    def test_default_client_uses_legacy_pacer(self):
+        client = Client()
+        self.assertIsInstance(client.pacer, LegacyPacer)
+        self.assertIs(client.pacer.client, client)
+
+    def test_legacy_pacer_sleeps_request_timeout_for_private_requests(self):
+        client = Client()
+        client.request_timeout = 3
+        with mock.patch("instagrapi.utils.pacing.time.sleep") as sleep:
+            client.pacer.acquire("private:feed")
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args.args[0], 3)
+
+    def test_legacy_pacer_queues_concurrent_private_requests(self):
+        client = Client()
+        client.request_timeout = 2
+        with mock.patch("instagrapi.utils.pacing.time.monotonic", return_value=100.0):
+            delays = [client.pacer.reserve("private:feed") for _ in range(3)]
+        self.assertEqual(delays, [2.0, 4.0, 6.0])
+
+    def test_legacy_pacer_keeps_public_gap(self):
+        client = Client()
+        client.request_timeout = 0
+        client.last_response_ts = time.time()
+        with mock.patch("instagrapi.utils.pacing.time.sleep") as sleep:
+            client.pacer.acquire(PUBLIC_FAMILY)
+            client.pacer.acquire(GRAPHQL_FAMILY)
+        self.assertEqual(sleep.call_args_list, [mock.call(1.0), mock.call(1.0)])
+
+    def test_token_bucket_waits_only_after_burst_is_spent(self):
+        bucket = TokenBucket(rate=2, burst=3)
+        with mock.patch("instagrapi.utils.pacing.time.monotonic", return_value=bucket.updated_at):
+            delays = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 0.5)
+        self.assertAlmostEqual(delays[4], 1.0)
+
+    def test_token_bucket_refills_over_time(self):
+        bucket = TokenBucket(rate=1, burst=1)
+        start = bucket.updated_at
+        with mock.patch("instagrapi.utils.pacing.time.monotonic", side_effect=[start, start + 1.5]):
+            self.assertEqual(bucket.reserve(), 0.0)
+            self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_token_bucket_pacer_uses_family_and_channel_budgets(self):
+        pacer = TokenBucketPacer(rate=1, burst=5, budgets={"private:friendships": (0.1, 1), "public": {"rate": 2}})
+        self.assertEqual(pacer.budget_for("private:friendships"), (0.1, 1.0))
+        self.assertEqual(pacer.budget_for("public"), (2.0, 1.0))
+        self.assertEqual(pacer.budget_for("private:feed"), (1, 5))
+        self.assertIs(pacer.bucket("private:feed"), pacer.bucket("private:feed"))
+
+    def test_token_bucket_pacer_respects_total_budget(self):
+        pacer = TokenBucketPacer(rate=100, burst=100, total_rate=1, total_burst=1)
+        with mock.patch("instagrapi.utils.pacing.time.sleep") as sleep:
+            self.assertEqual(pacer.acquire("private:feed"), 0.0)
+            pacer.acquire("private:users")
+        self.assertEqual(sleep.call_count, 1)
+        self.assertGreater(sleep.call_args.args[0], 0.9)
+
+    def test_build_pacer_presets(self):
+        self.assertIsInstance(build_pacer("balanced"), TokenBucketPacer)
+        self.assertIsInstance(build_pacer("none"), NoopPacer)
+        pacer = NoopPacer()
+        self.assertIs(build_pacer(pacer), pacer)
+        with self.assertRaises(ValueError):
+            build_pacer("fast")
+
+    def test_pacer_without_reserve_cannot_be_created(self):
+        class Incomplete(RequestPacer):
+            def reset(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_private_request_consults_pacer_instead_of_sleeping(self):
+        pacer = Mock(spec=NoopPacer)
+        client = Client(pacer=pacer)
+        client.request_timeout = 5
+        client.request_log = Mock()
+        with mock.patch.object(client.private, "get", return_value=_json_response()):
+            with mock.patch("instagrapi.mixins.private.time.sleep") as sleep:
+                client.private_request("feed/timeline/")
+        pacer.acquire.assert_called_once_with("private:feed")
+        sleep.assert_not_called()
+
+    def test_login_requests_skip_pacing(self):
+        pacer = Mock(spec=NoopPacer)
+        client = Client(pacer=pacer)
+        client.request_log = Mock()
+        with mock.patch.object(client.private, "post", return_value=_json_response()):
+            client._send_private_request("accounts/login/", data={"a": 1}, login=True)
+        pacer.acquire.assert_not_called()
+
+    def test_public_request_consults_pacer(self):
+        pacer = Mock(spec=NoopPacer)
+        client = Client(pacer=pacer)
+        with mock.patch.object(client.public, "get", return_value=_json_response()):
+            client._send_public_request("https://www.instagram.com/api/test/", return_json=True)
+        pacer.acquire.assert_called_once_with(PUBLIC_FAMILY)
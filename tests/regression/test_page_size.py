@@ -0,0 +1,166 @@
+from instagrapi.exceptions import ClientBadRequestError, ClientThrottledError
+from instagrapi.utils.page_size import PageSizer, build_page_sizer
+from tests.helpers import *
+
+
+class PageSizerRegressionTestCase(unittest.TestCase):
+    def test_grows_on_full_pages_up_to_maximum(self):
+        sizer = PageSizer()
+        sizes = []
+        for _ in range(4):
+            size = sizer.size("followers", 12, 50)
+            sizes.append(size)
+            sizer.record("followers", size, size, has_more=True)
+        self.assertEqual(sizes, [12, 24, 48, 50])
+
+    def test_short_page_reveals_the_server_cap(self):
+        sizer = PageSizer()
+        sizer.record("followers", 200, 200, has_more=True)
+        sizer.record("followers", 400, 250, has_more=True)
+        self.assertEqual(sizer.size("followers", 200, 1000), 250)
+        sizer.record("followers", 250, 250, has_more=True)
+        self.assertEqual(sizer.size("followers", 200, 1000), 250)
+        # the last page is short by nature
+        sizer.record("followers", 250, 3, has_more=False)
+        self.assertEqual(sizer.size("followers", 200, 1000), 250)
+
+    def test_failure_backs_off_and_growth_probes_below_it(self):
+        sizer = PageSizer()
+        self.assertTrue(sizer.failed("insights", 400, ClientBadRequestError("too large")))
+        self.assertEqual(sizer.size("insights", 200, 500), 200)
+        sizer.record("insights", 200, 200, has_more=True)
+        self.assertEqual(sizer.size("insights", 200, 500), 300)
+        sizer.record("insights", 300, 300, has_more=True)
+        self.assertEqual(sizer.size("insights", 200, 500), 350)
+        # throttling is not about the page size
+        self.assertFalse(sizer.failed("insights", 350, ClientThrottledError()))
+        self.assertEqual(sizer.size("insights", 200, 500), 350)
+
+    def test_failure_is_remembered_once_a_smaller_page_succeeds(self):
+        sizer = PageSizer()
+        sizer.record("insights", 400, 400, has_more=True)
+        before = sizer.snapshot()
+        self.assertTrue(sizer.failed("insights", 800, ClientBadRequestError("bad request")))
+        self.assertNotIn("failed", sizer.snapshot()["insights"])
+        # the error persists down to one item: not a size problem, nothing is learned
+        for size in (400, 200, 100, 50, 25, 12, 6, 3):
+            self.assertEqual(sizer.size("insights", 200, 1000), size)
+            self.assertTrue(sizer.failed("insights", size, ClientBadRequestError("bad request")))
+        self.assertFalse(sizer.failed("insights", 1, ClientBadRequestError("bad request")))
+        self.assertEqual(sizer.snapshot(), before)
+
+        self.assertTrue(sizer.failed("insights", 800, ClientBadRequestError("too large")))
+        self.assertTrue(sizer.failed("insights", 400, ClientBadRequestError("too large")))
+        sizer.record("insights", 200, 200, has_more=True)
+        self.assertEqual(sizer.snapshot()["insights"]["failed"], 400)
+
+    def test_learned_limits_are_reprobed(self):
+        sizer = PageSizer(reprobe_after=2)
+        sizer.record("followers", 200, 100, has_more=True)
+        sizer.record("followers", 100, 100, has_more=True)
+        self.assertEqual(sizer.size("followers", 200, 1000), 100)
+        sizer.record("followers", 100, 100, has_more=True)
+        self.assertEqual(sizer.size("followers", 200, 1000), 200)
+
+    def test_snapshot_round_trip(self):
+        sizer = PageSizer()
+        sizer.record("followers", 12, 12, has_more=True)
+        sizer.failed("insights", 400, ClientBadRequestError("too large"))
+        restored = PageSizer()
+        restored.restore(json.loads(json.dumps(sizer.snapshot())))
+        self.assertEqual(restored.snapshot(), sizer.snapshot())
+        restored.restore({"broken": "x", "zero": {"size": 0}})
+        self.assertEqual(restored.snapshot(), {})
+
+    def test_build_page_sizer(self):
+        sizer = PageSizer()
+        self.assertIsNone(build_page_sizer(None))
+        self.assertIsNone(build_page_sizer(False))
+        self.assertIs(build_page_sizer(sizer), sizer)
+        self.assertIsInstance(build_page_sizer(True), PageSizer)
+        self.assertEqual(build_page_sizer({"growth": 1.5}).growth, 1.5)
+        with self.assertRaises(TypeError):
+            build_page_sizer("fast")
+        with self.assertRaises(ValueError):
+            PageSizer(growth=1)
+
+
+class ClientPageSizingRegressionTestCase(unittest.TestCase):
+    def followers_page(self, variables, query_hash=None):
+        first = variables["first"]
+        self.requested.append(first)
+        edges = [{"node": {"pk": str(i), "id": str(i), "username": f"user{i}"}} for i in range(min(first, 30))]
+        return {
+            "user": {
+                "edge_followed_by": {
+                    "edges": edges,
+                    "page_info": {"has_next_page": True, "end_cursor": "next"},
+                }
+            }
+        }
+
+    def fetch(self, client, requests_count=3):
+        with (
+            mock.patch.object(client, "public_graphql_request", side_effect=self.followers_page),
+            mock.patch.object(client, "inject_sessionid_to_public"),
+        ):
+            for _ in range(requests_count):
+                client.user_followers_gql_chunk("1", max_amount=1)
+
+    def test_fixed_page_size_without_sizer(self):
+        self.requested = []
+        self.fetch(Client())
+        self.assertEqual(self.requested, [12, 12, 12])
+
+    def test_sizer_learns_and_persists_in_settings(self):
+        self.requested = []
+        client = Client(page_sizer=True)
+        self.fetch(client)
+        # 12 and 24 were honoured, 48 came back with the server cap of 30
+        self.assertEqual(self.requested, [12, 24, 48])
+        settings = client.get_settings()
+        self.assertEqual(settings["page_sizes"]["user_followers_gql"]["size"], 30)
+        self.requested = []
+        self.fetch(Client(settings=settings, page_sizer=True), requests_count=1)
+        self.assertEqual(self.requested, [30])
+
+    def test_rejected_page_size_is_retried_smaller(self):
+        client = Client(page_sizer=True)
+        client.page_sizer.record("user_followers_v1", 200, 200, has_more=True)
+        counts = []
+
+        def private_request(endpoint, params=None):
+            counts.append(params["count"])
+            if params["count"] > 300:
+                raise ClientBadRequestError("count too large")
+            return {"users": [], "next_max_id": None}
+
+        with mock.patch.object(client, "private_request", side_effect=private_request):
+            self.assertEqual(client.user_followers_v1_chunk("1"), ([], None))
+        self.assertEqual(counts, [400, 200])
+        self.assertEqual(client.page_sizer.size("user_followers_v1", 200, 1000), 200)
+
+    def test_error_unrelated_to_the_size_leaves_the_sizer_unchanged(self):
+        client = Client(page_sizer=True)
+        client.page_sizer.record("user_followers_v1", 200, 200, has_more=True)
+        before = client.page_sizer.snapshot()
+
+        def private_request(endpoint, params=None):
+            raise ClientBadRequestError("invalid user")
+
+        with mock.patch.object(client, "private_request", side_effect=private_request):
+            with self.assertRaises(ClientBadRequestError):
+                client.user_followers_v1_chunk("1")
+        self.assertEqual(client.page_sizer.snapshot(), before)
+        self.assertEqual(client.get_settings()["page_sizes"], before)
+
+    def test_rejected_minimal_page_size_is_raised(self):
+        client = Client(page_sizer=True)
+
+        def private_request(endpoint, params=None):
+            raise ClientBadRequestError("bad request")
+
+        with mock.patch.object(client, "private_request", side_effect=private_request) as request:
+            with self.assertRaises(ClientBadRequestError):
+                client.user_followers_v1_chunk("1", max_amount=1)
+        self.assertEqual(request.call_count, 1)
@@ -0,0 +1,169 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from instagrapi.exceptions import ClientNotFoundError
+from instagrapi.extractors import extract_user_v1
+from instagrapi.utils.concurrency import AsyncSingleFlight, SingleFlight
+from instagrapi.utils.pacing import NoopPacer
+from tests.helpers import *
+
+WORKERS = 8
+
+
+def _user(pk, username="example"):
+    return extract_user_v1(
+        {
+            "pk": pk,
+            "username": username,
+            "full_name": "",
+            "is_private": False,
+            "profile_pic_url": "https://example.com/pic.jpg",
+            "is_verified": False,
+            "media_count": 0,
+            "follower_count": 0,
+            "following_count": 0,
+            "is_business": False,
+        }
+    )
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+class SingleFlightRegressionTestCase(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"value": 1}
+
+        with ThreadPoolExecutor(WORKERS) as executor:
+            futures = [executor.submit(flight.do, "key", fetch) for _ in range(WORKERS)]
+            _wait_for(lambda: flight.shared == WORKERS - 1)
+            release.set()
+            results = [future.result() for future in futures]
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(shared for _, shared in results), [False] + [True] * (WORKERS - 1))
+        self.assertTrue(all(value is results[0][0] for value, _ in results))
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_exception_is_shared_and_not_remembered(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise ClientNotFoundError("gone")
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(flight.do, "key", fail) for _ in range(2)]
+            _wait_for(lambda: flight.shared == 1)
+            release.set()
+            for future in futures:
+                self.assertIsInstance(future.exception(), ClientNotFoundError)
+        self.assertEqual(flight.do("key", lambda: "fresh"), ("fresh", False))
+
+    def test_reentrant_call_does_not_wait_on_itself(self):
+        flight = SingleFlight()
+        result = flight.do("key", lambda: flight.do("key", lambda: "inner")[0] + "-outer")
+        self.assertEqual(result, ("inner-outer", False))
+
+    def test_async_single_flight(self):
+        async def main():
+            flight = AsyncSingleFlight()
+            calls = []
+
+            async def fetch():
+                calls.append(1)
+                await asyncio.sleep(0.01)
+                return "value"
+
+            results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(WORKERS)))
+            return flight, calls, results
+
+        flight, calls, results = asyncio.run(main())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([value for value, _ in results], ["value"] * WORKERS)
+        self.assertEqual(flight.shared, WORKERS - 1)
+
+    def test_async_leader_cancellation_does_not_cancel_waiters(self):
+        async def main():
+            flight = AsyncSingleFlight()
+            calls = []
+
+            async def fetch():
+                calls.append(1)
+                await asyncio.sleep(0.02)
+                return "value"
+
+            leader = asyncio.ensure_future(flight.do("key", fetch))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do("key", fetch))
+            await asyncio.sleep(0)
+            leader.cancel()
+            result = await waiter
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+
+            # a flight nobody waits for any more is cancelled
+            lonely = asyncio.ensure_future(flight.do("other", fetch))
+            await asyncio.sleep(0)
+            lonely.cancel()
+            await asyncio.sleep(0.01)
+            return calls, result, flight.in_flight()
+
+        calls, result, in_flight = asyncio.run(main())
+        self.assertEqual(result, ("value", True))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(in_flight, 0)
+
+
+class ClientRequestCoalescingRegressionTestCase(unittest.TestCase):
+    def make_client(self):
+        client = Client(pacer=NoopPacer())
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        return client
+
+    def run_user_info(self, client, pk):
+        release = threading.Event()
+        calls = []
+
+        def user_info_v1(user_id):
+            calls.append(user_id)
+            release.wait(5)
+            return _user(user_id)
+
+        client._users_cache.pop(pk, None)
+        with mock.patch.object(client, "user_info_v1", side_effect=user_info_v1):
+            with ThreadPoolExecutor(WORKERS) as executor:
+                futures = [executor.submit(client.user_info, pk) for _ in range(WORKERS)]
+                _wait_for(lambda: len(calls) >= 1)
+                if client.request_coalescing:
+                    _wait_for(lambda: client._inflight.shared >= WORKERS - 1)
+                release.set()
+                users = [future.result() for future in futures]
+        client._users_cache.pop(pk, None)
+        return calls, users
+
+    def test_concurrent_user_info_sends_one_request(self):
+        client = self.make_client()
+        calls, users = self.run_user_info(client, "9911001")
+        self.assertEqual(calls, ["9911001"])
+        self.assertEqual({user.pk for user in users}, {"9911001"})
+        self.assertEqual(len({id(user) for user in users}), WORKERS)  # every caller gets its own copy
+
+    def test_coalescing_can_be_disabled(self):
+        client = self.make_client()
+        self.assertTrue(client.set_request_coalescing(False))
+        calls, users = self.run_user_info(client, "9911002")
+        self.assertGreater(len(calls), 1)
+        self.assertEqual(len(users), WORKERS)
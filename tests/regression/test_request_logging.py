@@ -4,6 +4,16 @@ from instagrapi.mixins.public import JSONDecodeError as PublicJSONDecodeError
 from tests.helpers import *
 
 
+class _TrackedText:
+    def __init__(self, text):
+        self.text = text
+        self.reads = 0
+
+    def __get__(self, response, owner=None):
+        self.reads += 1
+        return self.text
+
+
 def _html_response(body: str, json_error):
     response = Mock()
     response.headers = {"Content-Length": "0"}
@@ -54,3 +64,89 @@ class RequestLoggingRegressionTestCase(unittest.TestCase):
         self.assertTrue(logged_body.startswith("<html>"))
         self.assertIn("truncated", logged_body)
         self.assertNotEqual(logged_body, long_body)
+
+    def _json_response(self, status_code=200, body='{"status": "ok"}'):
+        response = Mock()
+        response.status_code = status_code
+        response.url = "https://i.instagram.com/api/v1/friendships/1/followers/"
+        response.request.method = "GET"
+        response.elapsed = timedelta(milliseconds=250)
+        response.headers = {}
+        response.text = body
+        response.json.return_value = {"status": "ok"}
+        return response
+
+    def test_private_request_skips_body_decode_when_debug_is_disabled(self):
+        client = Client()
+        client.request_timeout = 0
+        client.logger = logging.getLogger("instagrapi.test.quiet")
+        client.logger.setLevel(logging.INFO)
+        text = _TrackedText('{"status": "ok"}')
+        response_class = type("Response", (), {"text": text})
+        response = response_class()
+        response.status_code = 200
+        response.url = "https://i.instagram.com/api/v1/test/"
+        response.headers = {}
+        response.raise_for_status = lambda: None
+        response.json = lambda: {"status": "ok"}
+
+        with mock.patch.object(client.private, "get", return_value=response), mock.patch.object(client, "request_log"):
+            client._send_private_request("test/")
+        self.assertEqual(text.reads, 0)
+
+        client.logger.setLevel(logging.DEBUG)
+        with mock.patch.object(client.private, "get", return_value=response), mock.patch.object(client, "request_log"):
+            client._send_private_request("test/")
+        self.assertEqual(text.reads, 1)
+
+    def test_request_log_is_skipped_when_info_is_disabled(self):
+        client = Client()
+        client.private_request_logger = Mock()
+        client.private_request_logger.isEnabledFor.return_value = False
+        client.request_log(self._json_response())
+        client.private_request_logger.info.assert_not_called()
+
+    def test_request_log_keeps_plain_format_by_default(self):
+        client = Client()
+        client.private_request_logger = Mock()
+        response = self._json_response()
+        client.request_log(response)
+        args = client.private_request_logger.info.call_args.args
+        self.assertEqual(
+            args[0] % args[1:],
+            f"None [200] GET {response.url} ("
+            + "{app_version}, {manufacturer} {model})".format(**client.device_settings),
+        )
+
+    def test_sampled_request_log_includes_body_only_for_errors_or_samples(self):
+        client = Client()
+        client.private_request_logger = Mock()
+        client.set_request_log_sampling(sample_rate=0.25, body_limit=10)
+
+        with mock.patch("instagrapi.utils.logging.random.random", return_value=0.5):
+            client.request_log(self._json_response())
+        record = client.private_request_logger.info.call_args.kwargs["extra"]["request"]
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["method"], "GET")
+        self.assertEqual(record["elapsed_ms"], 250.0)
+        self.assertEqual(record["app_version"], client.device_settings["app_version"])
+        self.assertNotIn("body", record)
+
+        with mock.patch("instagrapi.utils.logging.random.random", return_value=0.1):
+            client.request_log(self._json_response())
+        record = client.private_request_logger.info.call_args.kwargs["extra"]["request"]
+        self.assertTrue(record["body"].startswith('{"status":'))
+        self.assertIn("truncated", record["body"])
+
+        client.set_request_log_sampling(sample_rate=0)
+        client.request_log(self._json_response(429, '{"message": "Please wait a few minutes"}'))
+        record = client.private_request_logger.info.call_args.kwargs["extra"]["request"]
+        self.assertEqual(record["status"], 429)
+        self.assertIn("Please wait", record["body"])
+
+    def test_request_log_sampling_validates_rate(self):
+        client = Client()
+        with self.assertRaises(ValueError):
+            client.set_request_log_sampling(sample_rate=1.5)
+        self.assertTrue(client.set_request_log_sampling(False))
+        self.assertFalse(client.request_log_sampling)
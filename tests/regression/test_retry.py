@@ -0,0 +1,113 @@
+from email.utils import formatdate
+
+from instagrapi.exceptions import ClientIncompleteReadError, ClientRequestTimeout, ClientThrottledError
+from instagrapi.utils.pacing import NoopPacer
+from instagrapi.utils.retry import RetryPolicy, build_retry_policy, retry_after_seconds
+from tests.helpers import *
+
+
+def _response(status_code=200, headers=None, payload=None):
+    response = Mock()
+    response.headers = headers or {}
+    response.status_code = status_code
+    response.url = "https://i.instagram.com/api/v1/test/"
+    response.text = json.dumps(payload or {})
+    response.json.return_value = payload or {"status": "ok"}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+class RetryPolicyRegressionTestCase(unittest.TestCase):
+    def test_backoff_uses_full_jitter_under_exponential_cap(self):
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+        with mock.patch("instagrapi.utils.retry.random.uniform", side_effect=lambda a, b: b) as uniform:
+            self.assertEqual([policy.backoff(attempt) for attempt in range(6)], [1, 2, 4, 8, 10, 10])
+        self.assertEqual(uniform.call_args_list[0], mock.call(0, 1))
+        self.assertEqual(RetryPolicy(jitter=False, base_delay=3).backoff(1), 6)
+
+    def test_retry_after_header_wins(self):
+        self.assertEqual(retry_after_seconds(_response(headers={"Retry-After": "7"})), 7.0)
+        self.assertAlmostEqual(
+            retry_after_seconds(_response(headers={"Retry-After": formatdate(time.time() + 30, usegmt=True)})),
+            30,
+            delta=2,
+        )
+        self.assertIsNone(retry_after_seconds(_response(headers={"Retry-After": "soon"})))
+
+        policy = RetryPolicy(budgets={ClientThrottledError: (2, 1.0)})
+        retry = policy.begin()
+        exc = ClientThrottledError(response=_response(429, {"Retry-After": "5"}))
+        self.assertEqual(retry.next_delay(exc), 5.0)
+
+    def test_per_class_budgets_and_total_cap(self):
+        policy = RetryPolicy(
+            budgets={ClientRequestTimeout: (1, 1.0), ClientError: (3, 1.0)}, max_total_delay=10, jitter=False
+        )
+        retry = policy.begin()
+        self.assertEqual(retry.next_delay(ClientRequestTimeout()), 1.0)
+        self.assertIsNone(retry.next_delay(ClientRequestTimeout()))
+        self.assertEqual(retry.next_delay(ClientThrottledError()), 1.0)
+        self.assertEqual(retry.next_delay(ClientThrottledError()), 2.0)
+        self.assertEqual(retry.next_delay(ClientThrottledError()), 4.0)
+        self.assertIsNone(retry.next_delay(ClientThrottledError()))
+
+        capped = RetryPolicy(budgets={ClientError: (5, 4.0)}, max_total_delay=10, jitter=False).begin()
+        self.assertEqual(capped.next_delay(ClientError()), 4.0)
+        self.assertIsNone(capped.next_delay(ClientError()))  # 4 + 8 > 10
+
+        self.assertIsNone(policy.begin().next_delay(ValueError()))
+
+    def test_metrics_count_retries_and_giveups(self):
+        policy = RetryPolicy(jitter=False)
+        retry = policy.begin()
+        retry.next_delay(ClientIncompleteReadError())
+        retry.next_delay(ClientIncompleteReadError())
+        metrics = policy.metrics()
+        self.assertEqual(metrics["retries"], 1)
+        self.assertEqual(metrics["retries.ClientIncompleteReadError"], 1)
+        self.assertEqual(metrics["giveups.ClientIncompleteReadError"], 1)
+        self.assertEqual(metrics["delay"], 2.0)
+        policy.reset_metrics()
+        self.assertEqual(policy.metrics(), {})
+
+    def test_build_retry_policy(self):
+        policy = RetryPolicy()
+        self.assertIs(build_retry_policy(policy), policy)
+        self.assertEqual(build_retry_policy({"max_delay": 5}).max_delay, 5)
+        with self.assertRaises(TypeError):
+            build_retry_policy("fast")
+
+    def test_private_request_retries_timeout_with_jittered_backoff(self):
+        client = Client(pacer=NoopPacer())
+        client.request_log = Mock()
+        responses = [_response(408), _response(200, payload={"status": "ok"})]
+        with mock.patch.object(client.private, "get", side_effect=responses) as get:
+            with mock.patch("instagrapi.mixins.private.time.sleep") as sleep:
+                self.assertEqual(client.private_request("feed/timeline/"), {"status": "ok"})
+        self.assertEqual(get.call_count, 2)
+        sleep.assert_called_once()
+        self.assertLessEqual(sleep.call_args.args[0], 4.0)
+        self.assertEqual(client.retry_policy.metrics()["retries.ClientRequestTimeout"], 1)
+
+    def test_private_request_honours_retry_after_for_configured_429(self):
+        client = Client(pacer=NoopPacer(), retry_policy=RetryPolicy(budgets={ClientThrottledError: (1, 30.0)}))
+        client.request_log = Mock()
+        responses = [_response(429, {"Retry-After": "3"}), _response(200, payload={"status": "ok"})]
+        with mock.patch.object(client.private, "get", side_effect=responses):
+            with mock.patch("instagrapi.mixins.private.time.sleep") as sleep:
+                client.private_request("feed/timeline/")
+        sleep.assert_called_once_with(3.0)
+
+    def test_public_request_spreads_retries(self):
+        client = Client(pacer=NoopPacer())
+        with mock.patch.object(client, "_send_public_request", side_effect=ClientThrottledError("slow")) as send:
+            with mock.patch("instagrapi.mixins.public.time.sleep") as sleep:
+                with self.assertRaises(ClientThrottledError):
+                    client.public_request("https://www.instagram.com/", retries_count=3, retries_timeout=2)
+        self.assertEqual(send.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertLessEqual(sleep.call_args_list[0].args[0], 2)
+        self.assertLessEqual(sleep.call_args_list[1].args[0], 4)
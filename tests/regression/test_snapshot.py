@@ -0,0 +1,72 @@
+import pickle
+from copy import deepcopy
+
+from pydantic import ValidationError
+
+from instagrapi.types import Media
+from instagrapi.utils.snapshot import FrozenDict, FrozenList, copy_model, freeze, is_frozen
+from tests.helpers import *
+from tests.regression.test_cache_backends import _album
+
+
+class SnapshotRegressionTestCase(unittest.TestCase):
+    def test_copy_model_is_equal_and_independent(self):
+        media = _album()
+        copy = copy_model(media)
+        self.assertEqual(copy, media)
+        self.assertEqual(copy.model_dump(), deepcopy(media).model_dump())
+        self.assertIsNot(copy.resources, media.resources)
+        copy.resources[0].usertags[0].user.username = "changed"
+        copy.resources.clear()
+        self.assertEqual(media.resources[0].usertags[0].user.username, "first")
+        self.assertIs(copy.taken_at, media.taken_at)  # immutable values are shared
+
+    def test_frozen_snapshot_rejects_changes(self):
+        media = _album()
+        frozen = freeze(media)
+        self.assertTrue(is_frozen(frozen))
+        self.assertIsInstance(frozen, Media)
+        self.assertIsInstance(frozen.resources, FrozenList)
+        self.assertEqual(frozen, media)
+        self.assertEqual(media, frozen)
+        self.assertEqual(frozen.model_dump_json(), media.model_dump_json())
+        with self.assertRaises(ValidationError):
+            frozen.caption_text = "changed"
+        with self.assertRaises(ValidationError):
+            frozen.resources[0].usertags[0].user.username = "changed"
+        with self.assertRaises(TypeError):
+            frozen.resources.append(frozen.resources[0])
+        with self.assertRaises(TypeError):
+            FrozenDict(a=1)["b"] = 2
+        self.assertIs(freeze(frozen), frozen)
+
+    def test_frozen_snapshot_thaws_copies_and_pickles(self):
+        frozen = freeze(_album())
+        thawed = copy_model(frozen)
+        self.assertIs(type(thawed), Media)
+        self.assertFalse(is_frozen(thawed.resources))
+        thawed.caption_text = "changed"
+        for restored in (pickle.loads(pickle.dumps(frozen)), deepcopy(frozen)):
+            self.assertTrue(is_frozen(restored))
+            self.assertEqual(restored, frozen)
+
+    def test_client_cache_hit_modes(self):
+        client = Client()
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        with mock.patch.object(client, "media_info_v1", return_value=_album()):
+            first, second = client.media_info("1"), client.media_info("1")
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertFalse(is_frozen(first))
+
+        client = Client(cache_hits="frozen")
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        with mock.patch.object(client, "media_info_v1", return_value=_album()) as media_info_v1:
+            first, second = client.media_info("1"), client.media_info("1")
+        media_info_v1.assert_called_once()
+        self.assertIs(first, second)
+        self.assertIs(client._medias_cache["1"], first)
+        self.assertTrue(is_frozen(first))
+
+        with self.assertRaises(ValueError):
+            client.set_cache_hits("shared")
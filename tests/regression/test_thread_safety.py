@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from instagrapi.utils.pacing import NoopPacer
+from tests.helpers import *
+
+CONTENT_TYPE = "application/x-www-form-urlencoded; charset=UTF-8"
+
+
+def _json_response(url, payload, mid=None):
+    response = Mock()
+    response.headers = {"ig-set-x-mid": mid} if mid else {}
+    response.status_code = 200
+    response.url = url
+    response.text = json.dumps(payload)
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload
+    return response
+
+
+class ThreadSafeClientRegressionTestCase(unittest.TestCase):
+    def make_client(self, **kwargs):
+        client = Client(pacer=NoopPacer(), **kwargs)
+        client.request_log = Mock()
+        client.authorization_data = {"ds_user_id": "1", "sessionid": "1%3Aabc"}
+        return client
+
+    def test_thread_safe_flag(self):
+        self.assertFalse(Client().thread_safe)
+        client = Client(thread_safe=True)
+        self.assertTrue(client.thread_safe)
+        self.assertTrue(client.set_thread_safe(False))
+        self.assertFalse(client.thread_safe)
+
+    def test_last_json_is_thread_local(self):
+        client = self.make_client(thread_safe=True)
+        client.last_json = {"main": True}
+        seen = []
+
+        def worker():
+            seen.append(dict(client.last_json))
+            client.last_json = {"worker": True}
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [{}])
+        self.assertEqual(client.last_json, {"main": True})
+
+    def test_session_headers_are_not_mutated_per_request(self):
+        client = self.make_client(thread_safe=True)
+        before = dict(client.private.headers)
+        response = _json_response("https://i.instagram.com/api/v1/test/", {"status": "ok"})
+        with mock.patch.object(client.private, "post", return_value=response) as post:
+            client.private_request("test/", data={"a": 1}, headers={"X-FB-Friendly-Name": "Test"})
+        self.assertEqual(dict(client.private.headers), before)
+        headers = post.call_args.kwargs["headers"]
+        self.assertEqual(headers["Content-Type"], CONTENT_TYPE)
+        self.assertEqual(headers["X-FB-Friendly-Name"], "Test")
+        self.assertEqual(headers["User-Agent"], client.user_agent)
+        self.assertEqual(headers["Authorization"], client.authorization)
+
+        with mock.patch.object(client.public, "get", return_value=response) as get:
+            response.raw.tell.return_value = 0
+            client._send_public_request("https://www.instagram.com/api/test/", headers={"X-Test": "1"})
+        self.assertNotIn("X-Test", client.public.headers)
+        self.assertEqual(get.call_args.kwargs["headers"], {"X-Test": "1"})
+
+        with mock.patch.object(client.private, "post", return_value=response) as post:
+            client.private_graphql_request({"fb_api_req_friendly_name": "Query"})
+        self.assertNotIn("X-FB-Friendly-Name", client.private.headers)
+        self.assertEqual(post.call_args.kwargs["headers"]["X-FB-Friendly-Name"], "Query")
+
+    def test_concurrent_requests_stress(self):
+        client = self.make_client(thread_safe=True)
+        threads, calls = 8, 50
+        errors = []
+
+        def fake_send(method):
+            def send(url, **kwargs):
+                headers = kwargs["headers"]
+                if method == "POST" and headers.get("Content-Type") != CONTENT_TYPE:
+                    errors.append(f"POST without Content-Type: {url}")
+                if method == "GET" and headers.get("Content-Type") is not None:
+                    errors.append(f"GET with Content-Type: {url}")
+                if headers.get("X-Call") != url.rstrip("/").rsplit("/", 1)[-1]:
+                    errors.append(f"headers of another call on {url}")
+                time.sleep(random.random() / 1000)
+                return _json_response(url, {"status": "ok", "call": url}, mid=f"mid-{url[-6:]}")
+
+            return send
+
+        def worker(index):
+            mismatches = 0
+            for call in range(calls):
+                name = f"{index}-{call}"
+                data = {"a": 1} if call % 2 else None
+                result = client.private_request(f"test/{name}/", data=data, headers={"X-Call": name})
+                time.sleep(random.random() / 1000)
+                if result["call"] != client.last_json["call"] or not client.last_response.url.endswith(f"/{name}/"):
+                    mismatches += 1
+            return mismatches
+
+        with (
+            mock.patch.object(client.private, "get", side_effect=fake_send("GET")),
+            mock.patch.object(client.private, "post", side_effect=fake_send("POST")),
+        ):
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                mismatches = list(executor.map(worker, range(threads)))
+
+        self.assertEqual(errors, [])
+        self.assertEqual(mismatches, [0] * threads)
+        self.assertEqual(client.private_requests_count, threads * calls)
+        self.assertTrue(client.mid.startswith("mid-"))
+        self.assertNotIn("Content-Type", client.private.headers)
@@ -21,9 +21,32 @@ class UtilsPackageRegressionTestCase(unittest.TestCase):
             "instagrapi.utils.auth": ["gen_token", "generate_signature", "generate_jazoest"],
             "instagrapi.utils.ids": ["InstagramIdCodec"],
             "instagrapi.utils.logging": ["truncate_log_text"],
+            "instagrapi.utils.pacing": ["LegacyPacer", "TokenBucketPacer", "build_pacer"],
+            "instagrapi.utils.retry": ["RetryPolicy", "build_retry_policy", "retry_after_seconds"],
+            "instagrapi.utils.cache": ["EntityCaches", "LRUCache", "build_entity_caches"],
+            "instagrapi.utils.cache_backends": [
+                "CacheBackend",
+                "FileCacheBackend",
+                "SQLiteCacheBackend",
+                "build_cache_backend",
+            ],
+            "instagrapi.utils.follow_sync": ["FollowDelta", "FollowSnapshot"],
+            "instagrapi.utils.checkpoints": ["Checkpoint", "build_checkpoint"],
+            "instagrapi.utils.circuit": ["CircuitBreaker", "build_circuit_breaker"],
+            "instagrapi.utils.lazy": ["eager_copy", "is_lazy", "lazy_model", "materialize"],
+            "instagrapi.utils.page_size": ["PageSizer", "build_page_sizer"],
+            "instagrapi.utils.proxy_pool": ["ProxyPool", "build_proxy_pool"],
+            "instagrapi.utils.snapshot": ["FrozenDict", "FrozenList", "copy_model", "freeze", "is_frozen"],
             "instagrapi.utils.serialization": ["InstagrapiJSONEncoder", "dumps", "json_value"],
             "instagrapi.utils.timing": ["date_time_original", "random_delay"],
-            "instagrapi.utils.validation": ["vassert"],
+            "instagrapi.utils.validation": [
+                "VALIDATION_MODES",
+                "build_model",
+                "model_validation",
+                "trusted_builder",
+                "validation_mode",
+                "vassert",
+            ],
             "instagrapi.utils.video": ["analyze_video_for_upload", "read_video_metadata"],
         }
         for module_name, names in expected.items():
@@ -0,0 +1,191 @@
+import warnings
+from copy import deepcopy
+
+from pydantic import HttpUrl
+
+from instagrapi.extractors import (
+    extract_comment,
+    extract_location,
+    extract_media_gql,
+    extract_media_v1,
+    extract_story_gql,
+    extract_user_short,
+    extract_user_v1,
+)
+from instagrapi.utils.validation import (
+    _TrustedBuilder,
+    build_model,
+    model_validation,
+    trusted_builder,
+    validation_mode,
+)
+from tests.helpers import *
+
+CDN = "https://scontent.cdninstagram.com/v/t51.2885-15"
+
+
+def _user(pk):
+    return {
+        "pk": pk,
+        "username": f"user{pk}",
+        "full_name": f"User {pk}",
+        "is_private": False,
+        "profile_pic_url": f"{CDN}/{pk}.jpg?stp=dst-jpg_s150x150&_nc_ht=scontent.cdninstagram.com",
+        "friendship_status": {"following": True, "is_bestie": False},
+        "latest_reel_media": 1710000000,
+    }
+
+
+def _candidates(pk):
+    return [{"width": w, "height": w, "url": f"{CDN}/{pk}_{w}.jpg?oh=00_AbC"} for w in (150, 1080, 640)]
+
+
+CORPUS = [
+    (
+        extract_media_v1,
+        {
+            "pk": 3300000000000000001,
+            "id": "3300000000000000001_42",
+            "code": "C1",
+            "taken_at": 1710000000,
+            "media_type": 8,
+            "product_type": "carousel_container",
+            "user": _user(42),
+            "caption": {"text": "hello #tag"},
+            "like_count": 7,
+            "image_versions2": {"candidates": _candidates(1)},
+            "location": {"pk": 1, "name": "Somewhere", "lng": 1.5, "lat": 2.5, "external_id": "12"},
+            "usertags": {"in": [{"user": _user(7), "position": [0.5, 0.25]}]},
+            "carousel_media": [
+                {"pk": 2, "id": "2_42", "media_type": 1, "image_versions2": {"candidates": _candidates(2)}},
+                {
+                    "pk": 3,
+                    "id": "3_42",
+                    "media_type": 2,
+                    "image_versions2": {"candidates": _candidates(3)},
+                    "video_versions": [{"width": 720, "height": 1280, "url": f"{CDN}/3.mp4?efg=x"}],
+                },
+            ],
+        },
+    ),
+    (
+        extract_media_gql,
+        {
+            "__typename": "GraphVideo",
+            "id": "3300000000000000004",
+            "shortcode": "C4",
+            "taken_at_timestamp": 1710000000,
+            "owner": {"id": "42", "username": "user42", "profile_pic_url": f"{CDN}/42.jpg"},
+            "display_resources": [
+                {"src": f"{CDN}/4_{w}.jpg", "config_width": w, "config_height": w} for w in (640, 1080)
+            ],
+            "video_url": f"{CDN}/4.mp4",
+            "video_view_count": 12,
+            "edge_media_to_caption": {"edges": [{"node": {"text": "hello"}}]},
+            "edge_media_preview_like": {"count": 3},
+        },
+    ),
+    (extract_user_short, _user(5)),
+    (
+        extract_user_v1,
+        {
+            **_user(6),
+            "media_count": 1,
+            "follower_count": 2,
+            "following_count": 3,
+            "biography": "bio",
+            "external_url": "https://example.com/link",
+            "is_business": False,
+            "is_verified": False,
+            "hd_profile_pic_versions": [{"url": f"{CDN}/6_320.jpg"}, {"url": f"{CDN}/6_640.jpg"}],
+        },
+    ),
+    (
+        extract_story_gql,
+        {
+            "id": "3300000000000000008",
+            "taken_at_timestamp": 1710000000,
+            "owner": {"id": "42", "username": "user42", "profile_pic_url": f"{CDN}/42.jpg"},
+            "is_video": False,
+            "display_url": f"{CDN}/8.jpg",
+            "story_cta_url": "https://example.com/swipe",
+        },
+    ),
+    (extract_location, {"pk": 9, "name": "Somewhere", "address_json": '{"city_name": "Town"}'}),
+    (
+        extract_comment,
+        {
+            "pk": 10,
+            "text": "nice",
+            "user": {"pk": 11, "username": "user11", "profile_pic_url": f"{CDN}/11.jpg"},
+            "created_at_utc": 1710000000,
+            "content_type": "comment",
+            "status": "Active",
+        },
+    ),
+]
+
+
+class ValidationModeRegressionTestCase(unittest.TestCase):
+    def extract(self, extract, payload, mode):
+        with model_validation(mode):
+            return extract(deepcopy(payload))
+
+    def test_trusted_mode_yields_equal_field_values(self):
+        for extract, payload in CORPUS:
+            with self.subTest(extract=extract.__name__):
+                strict = self.extract(extract, payload, "strict")
+                trusted = self.extract(extract, payload, "trusted")
+                self.assertIs(type(trusted), type(strict))
+                self.assertEqual(trusted.model_fields_set, strict.model_fields_set)
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error")
+                    self.assertEqual(trusted.model_dump(mode="json"), strict.model_dump(mode="json"))
+                    self.assertEqual(trusted.model_dump_json(), strict.model_dump_json())
+
+    def test_trusted_mode_keeps_urls_as_strings(self):
+        payload = dict(CORPUS[0][1])
+        strict = self.extract(extract_media_v1, payload, "strict")
+        trusted = self.extract(extract_media_v1, payload, "trusted")
+        self.assertIsInstance(strict.user.profile_pic_url, HttpUrl)
+        self.assertIsInstance(trusted.user.profile_pic_url, str)
+        self.assertIsInstance(trusted.resources[1].video_url, str)
+        self.assertEqual(trusted.resources[1].video_url, str(strict.resources[1].video_url))
+        # trusted models still validate everything but URLs
+        with model_validation("trusted"), self.assertRaises(ValidationError):
+            build_model(UserShort, {"pk": "1", "is_private": "maybe"})
+
+    def test_client_methods_scope_the_mode(self):
+        client = Client(validation="trusted")
+        self.assertEqual(client.validation, "trusted")
+        payload = {"status": "ok", "user": deepcopy(CORPUS[3][1])}
+        with mock.patch.object(client, "private_request", return_value=payload):
+            self.assertIsInstance(client.user_info_v1("6").profile_pic_url, str)
+            # the mode does not outlive the call
+            self.assertEqual(validation_mode.get(), "strict")
+            with self.assertRaises(ValidationError):
+                extract_user_short(dict(_user(5), profile_pic_url="not a url"))
+            client.set_validation("strict")
+            self.assertIsInstance(client.user_info_v1("6").profile_pic_url, HttpUrl)
+        with self.assertRaises(ValueError):
+            client.set_validation("fast")
+
+    def test_extract_runs_in_the_client_mode(self):
+        client = Client(validation="trusted")
+        self.assertEqual(client._extract(validation_mode.get), "trusted")
+        self.assertEqual(validation_mode.get(), "strict")
+        with model_validation("lazy"):
+            self.assertEqual(client._extract(validation_mode.get), "trusted")
+            self.assertEqual(validation_mode.get(), "lazy")
+
+    def test_trusted_builder_falls_back_when_pydantic_internals_differ(self):
+        payload = {"pk": "5", "username": "user5", "profile_pic_url": f"{CDN}/5.jpg"}
+        with mock.patch("instagrapi.utils.validation._CAN_ASSEMBLE", False):
+            builder = _TrustedBuilder(UserShort)
+        self.assertIsNone(builder.validator)
+        self.assertIsInstance(builder(payload).profile_pic_url, HttpUrl)
+        with mock.patch.object(_TrustedBuilder, "_fields_schema", side_effect=KeyError("schema")):
+            self.assertIsNone(_TrustedBuilder(UserShort).validator)
+
+    def test_trusted_builder_is_compiled_once(self):
+        self.assertIs(trusted_builder(Media), trusted_builder(Media))